@@ -0,0 +1,5 @@
+"""
+Static site and data build pipeline for the ICE detention facilities map
+
+Run ``python3 -m sitegen --help`` for the available build stages.
+"""
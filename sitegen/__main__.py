@@ -0,0 +1,9 @@
+#!/usr/bin/env python3
+"""
+Entry point for ``python3 -m sitegen``
+"""
+
+from .cli import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Benchmarks for the input formats
+
+    python3 -m sitegen bench
+    python3 -m sitegen bench --data big.json --csv big.csv --repeat 3
+
+Times every loader on the same facilities and checks that the JSON
+snapshot and the CSV produce the same facility table first, so a bulk
+import can pick whichever input is faster without changing the output.
+
+Also compares the forms of the monthly TypeScript module: size, gzipped
+size and, when Node.js is installed, the time to parse and evaluate its
+data expression. sitegen/formats.py then reports how every monthly data
+format's served size weighs against its decode time per connection class.
+Both time JavaScript with the same Node.js harness (NODE_BENCH).
+"""
+
+import gzip
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .data import (
+    build_facility_table, iter_column_records, iter_facilities, load_facilities_data, read_facility_columns,
+)
+
+
+def best_of(run: Callable[[], Any], repeat: int) -> Tuple[float, Any]:
+    """Fastest wall time of ``repeat`` runs in milliseconds, and the last result"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = run()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best, result
+
+
+def loaders(json_path: str, csv_path: str) -> Dict[str, Callable[[], List[Dict[str, Any]]]]:
+    """Every way to get facility records, by name"""
+    return {
+        'json.load': lambda: load_facilities_data(json_path)['facilities'],
+        'json stream': lambda: list(iter_facilities(json_path)),
+        'csv columns': lambda: read_facility_columns(csv_path),
+        'csv records': lambda: list(iter_column_records(read_facility_columns(csv_path))),
+    }
+
+
+def bench_loaders(json_path: str, csv_path: str, repeat: int = 5) -> List[Tuple[str, float, int]]:
+    """(loader, best ms, rows) for every loader; raises ValueError if the
+    two inputs are out of sync"""
+    json_table = build_facility_table(iter_facilities(json_path))
+    csv_table = build_facility_table(iter_column_records(read_facility_columns(csv_path)))
+    if json_table != csv_table:
+        raise ValueError(f"{csv_path} is out of sync with {json_path}; rebuild it with `python3 -m sitegen data`")
+
+    results = []
+    for name, run in loaders(json_path, csv_path).items():
+        elapsed, records = best_of(run, repeat)
+        rows = len(records['name']) if isinstance(records, dict) else len(records)
+        results.append((name, elapsed, rows))
+    return results
+
+
+ESBUILD = os.path.join('node_modules', '.bin', 'esbuild')
+MONTHLY_DATA_UTILS = os.path.join('src', 'utils', 'monthlyDataUtils.ts')
+
+# The one Node.js harness every benchmark runs. Each candidate file
+# (`name:decoder=path`) is decoded `repeat` times and its best time is added
+# to its name's total:
+#   parse   compile and evaluate a JavaScript expression; a unique trailing
+#           comment per run keeps V8's compilation cache from answering
+#   module  parse, then decodeMonthlyData from `utils` (monthlyDataUtils.ts
+#           bundled to ESM), as the module does on import
+#   json    JSON.parse
+#   binary  read every month's column of monthly.bin, like fetchMonthColumn
+#           in monthlyRangeLoader.ts
+NODE_BENCH = r"""
+import fs from 'fs';
+import vm from 'vm';
+import { pathToFileURL } from 'url';
+
+const [repeat, utilsPath, ...candidates] = process.argv.slice(1);
+const utils = utilsPath ? await import(pathToFileURL(utilsPath).href) : null;
+
+const parse = (text, run) => new vm.Script(`(${text})//${run}`).runInThisContext();
+
+const decoders = {
+  parse,
+  module: (text, run) => utils.decodeMonthlyData(parse(text, run)),
+  json: text => JSON.parse(text),
+  binary: bytes => {
+    const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+    const valueSize = view.getUint16(6, true);
+    const facilityCount = view.getUint32(8, true);
+    const monthCount = view.getUint32(12, true);
+    const table = 32 + 4 * facilityCount + 7 * monthCount;
+    const columns = [];
+    for (let m = 0; m < monthCount; m++) {
+      const offset = view.getUint32(table + 8 * m, true);
+      const populations = valueSize === 2 ? new Uint16Array(facilityCount) : new Uint32Array(facilityCount);
+      for (let i = 0; i < facilityCount; i++) {
+        populations[i] = valueSize === 2
+          ? view.getUint16(offset + 2 * i, true)
+          : view.getUint32(offset + 4 * i, true);
+      }
+      columns.push(populations);
+    }
+    return columns;
+  },
+};
+
+const times = {};
+let run = 0;
+for (const candidate of candidates) {
+  const [part, path] = candidate.split('=');
+  const [name, decoder] = part.split(':');
+  const input = decoder === 'binary' ? fs.readFileSync(path) : fs.readFileSync(path, 'utf8');
+  let best = Infinity;
+  for (let i = 0; i < Number(repeat); i++) {
+    const start = process.hrtime.bigint();
+    decoders[decoder](input, run++);
+    best = Math.min(best, Number(process.hrtime.bigint() - start) / 1e6);
+  }
+  times[name] = (times[name] ?? 0) + best;
+}
+console.log(JSON.stringify(times));
+"""
+
+
+def bundle_data_utils(directory: str) -> Optional[str]:
+    """monthlyDataUtils.ts bundled to an ES module in ``directory``, or None
+    without the project's esbuild"""
+    if not (os.path.exists(ESBUILD) and os.path.exists(MONTHLY_DATA_UTILS)):
+        return None
+    path = os.path.join(directory, 'monthlyDataUtils.mjs')
+    result = subprocess.run([ESBUILD, MONTHLY_DATA_UTILS, '--bundle', '--format=esm', f'--outfile={path}',
+                             '--log-level=error'], capture_output=True)
+    return path if result.returncode == 0 else None
+
+
+def node_bench(candidates: List[Tuple[str, str, bytes]], repeat: int,
+               utils: Optional[str] = None) -> Optional[Dict[str, float]]:
+    """Best decode time in ms per name of (name, decoder, content) candidates
+    (summed over a name's files), or None without Node.js; the ``module``
+    decoder needs ``utils`` from bundle_data_utils"""
+    node = shutil.which('node')
+    if node is None:
+        return None
+    with tempfile.TemporaryDirectory() as directory:
+        arguments = []
+        for k, (name, decoder, content) in enumerate(candidates):
+            path = os.path.join(directory, str(k))
+            with open(path, 'wb') as f:
+                f.write(content)
+            arguments.append(f'{name}:{decoder}={path}')
+        output = subprocess.run([node, '--input-type=module', '-e', NODE_BENCH, str(repeat), utils or '',
+                                 *arguments], check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def bench_module_formats(monthly: Dict[str, Any], repeat: int = 20) -> List[Tuple[str, int, int, Optional[float]]]:
+    """(codec/format, bytes, gzipped bytes, best parse ms or None) for every
+    form of the monthly TypeScript module"""
+    from . import config
+    from .export import module_expression, monthly_module_payload, render_monthly_ts_module
+
+    forms = [(codec, module_format) for codec in config.MONTHLY_SERIES_CODECS
+             for module_format in config.MONTHLY_MODULE_FORMATS]
+    payloads = {codec: monthly_module_payload(monthly, codec) for codec in config.MONTHLY_SERIES_CODECS}
+    times = node_bench([(str(k), 'parse', module_expression(payloads[codec], module_format).encode('utf-8'))
+                        for k, (codec, module_format) in enumerate(forms)], repeat)
+
+    results = []
+    for k, (codec, module_format) in enumerate(forms):
+        module = render_monthly_ts_module(monthly, codec, module_format).encode('utf-8')
+        results.append((f'{codec}/{module_format}', len(module), len(gzip.compress(module, 9)),
+                        times[str(k)] if times else None))
+    return results
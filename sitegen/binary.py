@@ -0,0 +1,204 @@
+"""
+HTTP Range-friendly binary layout of the monthly populations
+
+One immutable file holds every month as a dense column of populations (one
+value per facility, in the monthly data's facility order). Each column
+starts at a header-declared byte offset aligned to ``alignment`` bytes, so
+a client fetches exactly the month on screen with a single
+``Range: bytes=<offset>-<offset + length - 1>`` request.
+
+Layout (little-endian):
+
+    0   4   magic b'ICMB'
+    4   2   version
+    6   2   bytes per value (2 or 4, whichever fits the largest population)
+    8   4   facility count F
+    12  4   month count M
+    16  4   alignment
+    20  4   header length (offset of the first column)
+    24  8   reserved
+    32      F x u32 facility ids
+            M x 7 bytes ASCII month ('YYYY-MM')
+            M x (u32 offset, u32 length) column table
+            zero padding up to the header length
+            M columns of F values, each padded to the alignment
+
+The same offset table is written as a small JSON sidecar so the client
+needs one request for the table and one per month; the build adds the
+file's content hash to it for cache busting. Appending months keeps
+the existing columns' bytes (append_monthly_binary).
+"""
+
+import struct
+from typing import Dict, List, Any, Optional, Tuple
+
+MAGIC = b'ICMB'
+BINARY_VERSION = 1
+PREAMBLE = struct.Struct('<4sHHIIII8x')
+COLUMN_ENTRY = struct.Struct('<II')
+MONTH_LABEL_SIZE = 7
+
+DEFAULT_ALIGNMENT = 64
+
+
+def _align(n: int, alignment: int) -> int:
+    """Round n up to a multiple of alignment"""
+    return -(-n // alignment) * alignment
+
+
+def _value_size(series: List[List[int]], start: int = 0) -> int:
+    """Bytes per value that fit every population from month ``start`` on"""
+    largest = max((value for values in series for value in values[start:]), default=0)
+    return 2 if largest <= 0xFFFF else 4
+
+
+def _column(series: List[List[int]], m: int, value_size: int, column_stride: int) -> bytes:
+    """One month's populations, padded to the column stride"""
+    values = [values[m] if m < len(values) else 0 for values in series]
+    column = struct.pack(f"<{len(values)}{'H' if value_size == 2 else 'I'}", *values)
+    return column + bytes(column_stride - len(column))
+
+
+def _assemble(monthly: Dict[str, Any], value_size: int, alignment: int, columns: bytes) -> Tuple[bytes, Dict[str, Any]]:
+    """Header and offset table for every month of the monthly data, followed by its packed columns"""
+    months = monthly['meta']['m']
+    ids = [facility['i'] for facility in monthly['facilities']]
+    column_length = len(ids) * value_size
+    column_stride = _align(column_length, alignment)
+    table_size = 4 * len(ids) + MONTH_LABEL_SIZE * len(months) + COLUMN_ENTRY.size * len(months)
+    header_length = _align(PREAMBLE.size + table_size, alignment)
+    offsets = [header_length + m * column_stride for m in range(len(months))]
+
+    header = bytearray(PREAMBLE.pack(MAGIC, BINARY_VERSION, value_size, len(ids), len(months),
+                                     alignment, header_length))
+    header += struct.pack(f'<{len(ids)}I', *ids)
+    for month in months:
+        label = month.encode('ascii')
+        if len(label) != MONTH_LABEL_SIZE:
+            raise ValueError(f"Month label {month!r} is not YYYY-MM")
+        header += label
+    for offset in offsets:
+        header += COLUMN_ENTRY.pack(offset, column_length)
+    header += bytes(header_length - len(header))
+
+    content = bytes(header) + columns
+    table = {
+        'v': BINARY_VERSION,
+        'size': len(content),
+        'valueSize': value_size,
+        'alignment': alignment,
+        'months': months,
+        'ids': ids,
+        'offsets': offsets,
+        'length': column_length,
+    }
+    if 'g' in monthly['meta']:
+        # Tile -> column index ranges for curve-ordered exports (see sitegen/spatial.py)
+        table['tiles'] = monthly['meta']['g']
+    return content, table
+
+
+def build_monthly_binary(monthly: Dict[str, Any],
+                         alignment: int = DEFAULT_ALIGNMENT) -> Tuple[bytes, Dict[str, Any]]:
+    """Pack the monthly data into the binary layout; returns (content, offset table)"""
+    if alignment <= 0 or alignment & (alignment - 1):
+        raise ValueError(f"Alignment must be a power of two, got {alignment}")
+
+    series = [monthly['data'].get(str(facility['i']), []) for facility in monthly['facilities']]
+    value_size = _value_size(series)
+    column_stride = _align(len(series) * value_size, alignment)
+    columns = b''.join(_column(series, m, value_size, column_stride) for m in range(len(monthly['meta']['m'])))
+    return _assemble(monthly, value_size, alignment, columns)
+
+
+def append_monthly_binary(content: bytes, monthly: Dict[str, Any]) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+    """Extend a binary monthly file with the months the monthly data has after
+    its own; returns (content, offset table), or None when a new population
+    needs wider values than the file uses
+
+    The header grows with the month list, so the file is rewritten, but the
+    existing columns are carried over byte for byte rather than re-encoded.
+    """
+    header = read_header(content)
+    ids = [facility['i'] for facility in monthly['facilities']]
+    known = len(header['months'])
+    if header['ids'] != ids or monthly['meta']['m'][:known] != header['months']:
+        raise ValueError("Binary monthly file is not an earlier version of the monthly data")
+
+    series = [monthly['data'].get(str(facility_id), []) for facility_id in ids]
+    value_size, alignment = header['valueSize'], header['alignment']
+    if _value_size(series, known) > value_size:
+        return None
+    column_stride = _align(len(ids) * value_size, alignment)
+    start = header['headerLength']
+    columns = content[start:start + known * column_stride]
+    columns += b''.join(_column(series, m, value_size, column_stride)
+                        for m in range(known, len(monthly['meta']['m'])))
+    return _assemble(monthly, value_size, alignment, columns)
+
+
+def read_header(content: bytes) -> Dict[str, Any]:
+    """Parse the header of a binary monthly file"""
+    if len(content) < PREAMBLE.size:
+        raise ValueError("Binary monthly file is truncated")
+    magic, version, value_size, facility_count, month_count, alignment, header_length = \
+        PREAMBLE.unpack_from(content)
+    if magic != MAGIC or version != BINARY_VERSION:
+        raise ValueError(f"Not a version {BINARY_VERSION} binary monthly file")
+
+    position = PREAMBLE.size
+    ids = list(struct.unpack_from(f'<{facility_count}I', content, position))
+    position += 4 * facility_count
+    months = []
+    for _ in range(month_count):
+        months.append(content[position:position + MONTH_LABEL_SIZE].decode('ascii'))
+        position += MONTH_LABEL_SIZE
+    columns = [COLUMN_ENTRY.unpack_from(content, position + COLUMN_ENTRY.size * m) for m in range(month_count)]
+
+    return {
+        'valueSize': value_size,
+        'alignment': alignment,
+        'headerLength': header_length,
+        'ids': ids,
+        'months': months,
+        'offsets': [offset for offset, _ in columns],
+        'lengths': [length for _, length in columns],
+    }
+
+
+def read_month(content: bytes, header: Dict[str, Any], month: str) -> List[int]:
+    """Populations of every facility in one month"""
+    m = header['months'].index(month)
+    offset, length = header['offsets'][m], header['lengths'][m]
+    value_format = 'H' if header['valueSize'] == 2 else 'I'
+    return list(struct.unpack_from(f"<{length // header['valueSize']}{value_format}", content, offset))
+
+
+def verify_monthly_binary(content: bytes, table: Dict[str, Any], monthly: Dict[str, Any], start: int = 0):
+    """Check alignment, the offset table and every value from month ``start``
+    on against the source
+
+    Raises ValueError on the first mismatch.
+    """
+    header = read_header(content)
+    alignment = header['alignment']
+    if header['headerLength'] % alignment:
+        raise ValueError(f"Header length {header['headerLength']} is not {alignment}-byte aligned")
+    if header['offsets'] != table['offsets'] or header['months'] != table['months'] or header['ids'] != table['ids']:
+        raise ValueError("Offset table does not match the file header")
+
+    previous_end = header['headerLength']
+    for month, offset, length in zip(header['months'], header['offsets'], header['lengths']):
+        if offset % alignment:
+            raise ValueError(f"Column {month} at offset {offset} is not {alignment}-byte aligned")
+        if offset < previous_end or offset + length > len(content):
+            raise ValueError(f"Column {month} at offset {offset} overlaps or runs past the file")
+        previous_end = offset + length
+
+    for m, month in enumerate(header['months'][start:], start):
+        values = read_month(content, header, month)
+        for facility_id, value in zip(header['ids'], values):
+            series = monthly['data'].get(str(facility_id), [])
+            expected = series[m] if m < len(series) else 0
+            if value != expected:
+                raise ValueError(f"Facility {facility_id} in {month}: stored {value}, expected {expected}")
@@ -0,0 +1,80 @@
+"""
+Persistent cache of parsed and normalized source data
+
+Parsing facilities.json and the monthly files and normalizing them is the
+fixed cost of every invocation. The result is pickled into a
+``.sitegen-cache`` directory next to the source, keyed by the source's
+content digest and CACHE_SCHEMA_VERSION, so a warm start only hashes the
+file. Bump the schema version whenever the shape of a cached value
+changes; stale entries are then simply never read again.
+
+The cache holds pickles, so it must stay a local, trusted directory.
+"""
+
+import os
+import pickle
+import tempfile
+from typing import Any, Callable
+
+from . import config
+from .manifest import file_digest
+
+CACHE_SCHEMA_VERSION = 1
+
+
+def cache_path(source_path: str, kind: str, digest: str) -> str:
+    """Cache file for a value derived from a source with the given digest"""
+    directory = os.path.join(os.path.dirname(source_path) or '.', config.CACHE_DIR_NAME)
+    name = f"{os.path.basename(source_path)}.{kind}.v{CACHE_SCHEMA_VERSION}.{digest}.pickle"
+    return os.path.join(directory, name)
+
+
+def _prune(source_path: str, kind: str, keep: str):
+    """Remove older entries (other digests or schema versions) for the same source and kind"""
+    directory, name = os.path.split(keep)
+    prefix = f"{os.path.basename(source_path)}.{kind}.v"
+    for entry in os.listdir(directory):
+        if entry.startswith(prefix) and entry != name and entry.endswith('.pickle'):
+            try:
+                os.remove(os.path.join(directory, entry))
+            except OSError:
+                pass
+
+
+def load_cached(source_path: str, kind: str, build: Callable[[], Any], enabled: bool = True) -> Any:
+    """Value derived from a source file; ``build`` reads the source on a miss
+
+    ``kind`` names the derived value (and any option it depends on).
+    Unreadable or corrupt cache entries count as misses; failing to write
+    one never fails the build.
+    """
+    if not enabled:
+        return build()
+
+    path = cache_path(source_path, kind, file_digest(source_path))
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        pass
+
+    value = build()
+    tmp_path = None
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # A unique sibling per writer, so concurrent misses never share a file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        tmp_path = None
+        _prune(source_path, kind, path)
+    except (OSError, pickle.PicklingError):
+        pass
+    finally:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    return value
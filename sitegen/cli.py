@@ -0,0 +1,295 @@
+"""
+Command line interface for the build pipeline
+
+    python3 -m sitegen build                      # every stage
+    python3 -m sitegen pages --only stewart-detention-center
+    python3 -m sitegen pages --since public/.sitegen-manifest.json
+    python3 -m sitegen watch                      # rebuild on change
+    python3 -m sitegen ingest 2025-10 trac-2025-10.csv
+    python3 -m sitegen source trac-snapshot.csv   # regenerate all data from raw
+    python3 -m sitegen diff old.json new.json -o changes.json
+    python3 -m sitegen build --data new.json --changes changes.json
+
+Only argparse is imported up front; stage modules are imported by the
+handler that needs them.
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import List, Optional
+
+from . import config
+
+
+def _context(args: argparse.Namespace, incremental: bool = False):
+    """Create the build context for parsed arguments"""
+    from .diff import load_changes
+    from .stages import BuildContext
+    from .writer import OutputWriter
+    return BuildContext(data_path=args.data, out_dir=args.out, manifest_path=args.since,
+                        incremental=incremental, writer=OutputWriter(workers=args.writers),
+                        facility_order=args.facility_order, changes=load_changes(args.changes),
+                        cache=not args.no_cache, stream=args.stream)
+
+
+def _scheduler(ctx, args: argparse.Namespace):
+    """Build the stage graph for parsed arguments"""
+    from .scheduler import Scheduler
+    from .stages import stage_graph
+
+    return Scheduler(stage_graph(ctx, only=getattr(args, 'only', None), limit=args.limit,
+                                 force=getattr(args, 'force', False), series_codec=args.series_codec,
+                                 module_format=args.module_format))
+
+
+def _run(targets: Optional[List[str]], args: argparse.Namespace, ctx=None) -> int:
+    """Run the target stages (and their dependencies) and report what was written"""
+    try:
+        ctx = ctx or _context(args)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    try:
+        scheduler = _scheduler(ctx, args)
+        elapsed_ms = scheduler.run(ctx, targets, jobs=args.jobs)
+        ctx.finish()
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    finally:
+        ctx.writer.close()
+
+    if args.verbose:
+        for name, duration in scheduler.durations.items():
+            print(f"  {name}: {duration:.1f} ms")
+        for name in scheduler.skipped:
+            print(f"  {name}: unchanged")
+        for path in ctx.written:
+            print(f"  - {path}")
+    stats = ctx.writer.stats()
+    print(f"✅ {', '.join(targets) if targets else 'build'}: {len(ctx.written)} written, "
+          f"{ctx.skipped} up to date ({elapsed_ms:.1f} ms, critical path {scheduler.critical_path():.1f} ms)")
+    if stats['files']:
+        print(f"   {stats['bytes'] / 1024:.0f} KB in {stats['files']} files at {stats['mb_per_s']:.1f} MB/s")
+    return 0
+
+
+def _watch(args: argparse.Namespace) -> int:
+    """Rebuild changed outputs whenever data files or templates change"""
+    from .watch import watch
+
+    ctx = _context(args, incremental=True)
+    watch(ctx, _scheduler(ctx, args), jobs=args.jobs, interval=args.interval, debounce=args.debounce)
+    return 0
+
+
+def _ingest(args: argparse.Namespace) -> int:
+    """Append one month to the monthly datasets, then rebuild what reads them"""
+    from .ingest import INGEST_STAGES, ingest_month, load_month_records
+
+    try:
+        populations, changes = ingest_month(args.month, load_month_records(args.file), check_only=args.check)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    populated = sum(1 for population in populations.values() if population)
+    print(f"{'✅ valid' if args.check else '📥 appended'}: {args.month}, {populated} facilities, "
+          f"{sum(populations.values())} detained")
+    if args.check:
+        return 0
+
+    # Incremental by default; the change set limits the rebuild to the new month
+    if args.since is None:
+        args.since = os.path.join(args.out, config.MANIFEST_JSON)
+    try:
+        ctx = _context(args)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    ctx.changes = changes
+    return _run(INGEST_STAGES, args, ctx)
+
+
+def _source(args: argparse.Namespace) -> int:
+    """Regenerate every dataset and data export from a raw source snapshot"""
+    from datetime import datetime
+
+    from .source import SOURCE_STAGES, read_source, source_datasets, write_source_datasets
+
+    try:
+        accumulator = read_source(args.file)
+        datasets = source_datasets(accumulator, datetime.now().isoformat(), snapshot_path=args.data)
+        if not args.check:
+            write_source_datasets(datasets)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    print(f"{'✅ valid' if args.check else '📥 loaded'}: {accumulator.rows} rows, "
+          f"{len(accumulator.facilities)} facilities, {len(accumulator.months)} months")
+    if args.check:
+        return 0
+
+    ctx = _context(args)
+    ctx.preload(datasets[0][1]['facilities'], next(data for path, data, _ in datasets
+                                                   if path == ctx.monthly_path))
+    return _run(SOURCE_STAGES, args, ctx)
+
+
+def _diff(args: argparse.Namespace) -> int:
+    """Write the change set between two datasets"""
+    import json
+
+    from .diff import diff_files, summarize
+
+    try:
+        changes = diff_files(args.old, args.new)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    text = json.dumps(changes, indent=2) + '\n'
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+    print(f"🔍 {summarize(changes)}", file=sys.stderr)
+    return 0
+
+
+def _bench(args: argparse.Namespace) -> int:
+    """Time the facility loaders on the snapshot and its CSV, and report how
+    the monthly data formats compare"""
+    from .bench import bench_loaders
+
+    csv_path = args.csv or os.path.join(args.out, config.FACILITIES_CSV)
+    try:
+        results = bench_loaders(args.data, csv_path, repeat=args.repeat)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    fastest = min(elapsed for _, elapsed, _ in results)
+    for name, elapsed, rows in results:
+        print(f"  {name:<12} {elapsed:9.1f} ms  {rows} rows  x{elapsed / fastest:.1f}")
+
+    import json
+
+    from .bench import bench_module_formats
+
+    with open(config.MONTHLY_OPTIMIZED_JSON, 'r') as f:
+        monthly = json.load(f)
+    print("monthly module (codec/format):")
+    for name, size, gzipped, parse_ms in bench_module_formats(monthly, repeat=max(args.repeat, 20)):
+        parse = f"{parse_ms:7.2f} ms parse" if parse_ms is not None else "  (no node for parse times)"
+        print(f"  {name:<14} {size / 1024:6.1f} KB  {gzipped / 1024:5.1f} KB gz  {parse}")
+
+    from .formats import CPU_SLOWDOWN, compare_formats
+    from .ids import extend_facility_index, load_facility_index
+
+    facility_ids = extend_facility_index(load_facility_index(config.FACILITY_INDEX_JSON), monthly)
+    report = compare_formats(monthly, facility_ids)
+    timing = 'measured in Node.js' if report['decodeTimes'] == 'measured' else 'modelled, no Node.js or esbuild'
+    print(f"monthly data formats (as served, {report['compression']}; decode times {timing}):")
+    for name, entry in report['formats'].items():
+        print(f"  {name:<14} {entry['served'] / 1024:6.1f} KB  {entry['decodeMs']:7.2f} ms decode")
+    print(f"best per connection (transfer + {CPU_SLOWDOWN}x decode):")
+    for profile, entry in report['profiles'].items():
+        print(f"  {profile:<8} {entry['downlinkMbps']:5} Mbit/s  {entry['best']}")
+    if report['neverWins']:
+        print(f"  never best: {', '.join(report['neverWins'])}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the argument parser with one subcommand per stage"""
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--data', default=config.FACILITIES_JSON, help='facilities JSON snapshot')
+    common.add_argument('--out', default=config.OUTPUT_DIR, help='output directory')
+    common.add_argument('--since', metavar='MANIFEST',
+                        help='only rebuild outputs whose inputs changed since this manifest (created if missing)')
+    common.add_argument('--changes', metavar='CHANGESET',
+                        help='only regenerate the pages a change set from `diff` touches')
+    common.add_argument('--limit', type=int, default=config.TOP_FACILITY_PAGES,
+                        help='number of top facilities that get their own page')
+    common.add_argument('--series-codec', choices=config.MONTHLY_SERIES_CODECS, default=config.MONTHLY_SERIES_CODEC,
+                        help='encoding of the monthly series in the TypeScript module')
+    common.add_argument('--module-format', choices=config.MONTHLY_MODULE_FORMATS,
+                        default=config.MONTHLY_MODULE_FORMAT,
+                        help='embed the monthly data as a JSON.parse string or an object literal')
+    common.add_argument('--facility-order', choices=config.FACILITY_ORDERS, default=config.FACILITY_ORDER,
+                        help='order facilities in the exports along a space-filling curve')
+    common.add_argument('--no-cache', action='store_true',
+                        help='parse the sources again instead of using the parsed-data cache')
+    common.add_argument('--stream', action='store_true',
+                        help='read the snapshot record by record where possible (very large snapshots)')
+    common.add_argument('-j', '--jobs', type=int, default=None,
+                        help='worker threads for independent stages (default: CPU count)')
+    common.add_argument('--writers', type=int, default=4, help='background threads writing outputs')
+    common.add_argument('-v', '--verbose', action='store_true', help='list every file written')
+
+    parser = argparse.ArgumentParser(prog='python3 -m sitegen', description='Build static pages and data exports')
+    subparsers = parser.add_subparsers(dest='command', metavar='command')
+    subparsers.required = True
+
+    subparsers.add_parser('build', parents=[common], help='run every stage')
+
+    pages = subparsers.add_parser('pages', parents=[common], help='individual facility pages')
+    pages.add_argument('--only', metavar='SLUG', action='append',
+                       help='render only this facility page (repeatable)')
+
+    subparsers.add_parser('index', parents=[common], help='facilities directory: index, per-state and paginated pages')
+    subparsers.add_parser('stats', parents=[common], help='statistics page')
+    subparsers.add_parser('sitemap', parents=[common], help='sitemap.xml')
+    subparsers.add_parser('search', parents=[common], help='search index for facility names and locations')
+    subparsers.add_parser('data', parents=[common], help='facilities.csv and monthly TypeScript module')
+    subparsers.add_parser('ranks', parents=[common], help='per-month rank and percentile tables')
+    subparsers.add_parser('binary', parents=[common], help='Range-friendly binary monthly file and offset table')
+    subparsers.add_parser('sqlite', parents=[common], help='indexed SQLite database with full-text search')
+    subparsers.add_parser('geo', parents=[common], help='newline-delimited GeoJSON and FlatGeobuf with spatial index')
+
+    compress = subparsers.add_parser('compress', parents=[common], help='precompress outputs')
+    compress.add_argument('--force', action='store_true', help='recompress even if up to date')
+
+    ingest = subparsers.add_parser('ingest', parents=[common],
+                                   help='append a new month to the monthly data and rebuild what it affects')
+    ingest.add_argument('month', help='the new month, YYYY-MM')
+    ingest.add_argument('file', help='facility populations for the month (facilities.csv columns, or JSON)')
+    ingest.add_argument('--check', action='store_true', help='only validate the month')
+
+    source = subparsers.add_parser('source', parents=[common],
+                                   help='regenerate the snapshot, monthly datasets and data exports from a raw source')
+    source.add_argument('file', help='long-format CSV or NDJSON: one row per facility and month')
+    source.add_argument('--check', action='store_true', help='only validate the source')
+
+    diff = subparsers.add_parser('diff', help='change set between two snapshots or two optimized monthly files')
+    diff.add_argument('old')
+    diff.add_argument('new')
+    diff.add_argument('-o', '--output', help='write the change set here instead of stdout')
+
+    bench = subparsers.add_parser('bench', parents=[common],
+                                  help='time the facility loaders and compare the monthly data formats')
+    bench.add_argument('--csv', help='CSV to compare with --data (default: facilities.csv in --out)')
+    bench.add_argument('--repeat', type=int, default=5, help='runs per loader (the fastest counts)')
+
+    watch = subparsers.add_parser('watch', parents=[common], help='rebuild changed outputs on file changes')
+    watch.add_argument('--interval', type=float, default=0.05, help='polling interval in seconds')
+    watch.add_argument('--debounce', type=float, default=0.1, help='quiet period before rebuilding, in seconds')
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
+    """Parse arguments and run the requested stage(s)"""
+    args = build_parser().parse_args(argv)
+    if args.command == 'watch':
+        sys.exit(_watch(args))
+    if args.command == 'ingest':
+        sys.exit(_ingest(args))
+    if args.command == 'source':
+        sys.exit(_source(args))
+    if args.command == 'diff':
+        sys.exit(_diff(args))
+    if args.command == 'bench':
+        sys.exit(_bench(args))
+    sys.exit(_run(None if args.command == 'build' else [args.command], args))
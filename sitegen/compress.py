@@ -0,0 +1,66 @@
+"""
+Precompression of build outputs (gzip, plus brotli when installed)
+"""
+
+import gzip
+import os
+from typing import Callable, List
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = ('.html', '.xml', '.csv', '.json', '.geojsonl', '.txt')
+
+
+def _is_fresh(source: str, target: str) -> bool:
+    """Whether a compressed sibling is newer than its source"""
+    return os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(source)
+
+
+def _write_file(path: str, content: bytes):
+    """Default writer: plain synchronous write"""
+    with open(path, 'wb') as f:
+        f.write(content)
+
+
+def compressed_paths(path: str) -> List[str]:
+    """The compressed siblings compress_file keeps for a file"""
+    return [path + '.gz'] + ([path + '.br'] if brotli is not None else [])
+
+
+def compress_file(path: str, force: bool = False,
+                  write: Callable[[str, bytes], None] = _write_file) -> List[str]:
+    """Write .gz (and .br) siblings for one file, returning paths written"""
+    written = []
+    data = None
+
+    gz_path = path + '.gz'
+    if force or not _is_fresh(path, gz_path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        # mtime=0 keeps the archives byte-for-byte reproducible
+        write(gz_path, gzip.compress(data, compresslevel=9, mtime=0))
+        written.append(gz_path)
+
+    if brotli is not None:
+        br_path = path + '.br'
+        if force or not _is_fresh(path, br_path):
+            if data is None:
+                with open(path, 'rb') as f:
+                    data = f.read()
+            write(br_path, brotli.compress(data))
+            written.append(br_path)
+
+    return written
+
+
+def compressible_outputs(out_dir: str, relpaths: List[str]) -> List[str]:
+    """Filter build outputs down to existing text files worth compressing"""
+    paths = []
+    for relpath in relpaths:
+        path = os.path.join(out_dir, relpath)
+        if relpath.endswith(COMPRESSIBLE_EXTENSIONS) and os.path.exists(path):
+            paths.append(path)
+    return paths
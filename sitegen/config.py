@@ -0,0 +1,52 @@
+"""
+Shared paths and constants for the build pipeline
+"""
+
+# Source data
+FACILITIES_JSON = 'src/data/facilities.json'
+MONTHLY_JSON = 'src/data/facilities_monthly.json'
+MONTHLY_OPTIMIZED_JSON = 'src/data/facilities_monthly_optimized.json'
+MONTHLY_ULTRA_JSON = 'src/data/facilities_monthly_ultra.json'
+MONTHLY_TS_MODULE = 'src/data/monthlyFacilitiesData.ts'
+MONTHLY_RANKS_TS_MODULE = 'src/data/monthlyRanks.ts'
+# Persisted facility id <-> dense index mapping (see sitegen/ids.py)
+FACILITY_INDEX_JSON = 'src/data/facility_index.json'
+
+# Output locations
+OUTPUT_DIR = 'public'
+FACILITIES_DIR = 'facilities'
+FACILITIES_CSV = 'facilities.csv'
+SITEMAP_XML = 'sitemap.xml'
+SEARCH_INDEX_JSON = 'search-index.json'
+MONTHLY_BINARY = 'monthly.bin'
+MONTHLY_BINARY_INDEX = 'monthly-index.json'
+FACILITIES_TILES_JSON = 'facilities-tiles.json'
+FACILITIES_SQLITE = 'facilities.sqlite'
+FACILITIES_GEOJSONL = 'facilities.geojsonl'
+FACILITIES_FGB = 'facilities.fgb'
+MANIFEST_JSON = '.sitegen-manifest.json'
+
+# Parsed-data cache, created next to each source file (see sitegen/cache.py)
+CACHE_DIR_NAME = '.sitegen-cache'
+
+SITE_URL = 'https://ice-locator-mcp.vercel.app'
+
+# Number of facilities (by population) that get their own page
+TOP_FACILITY_PAGES = 30
+
+# Facilities per page of the paginated directory
+DIRECTORY_PAGE_SIZE = 48
+
+# Encoding of the monthly series embedded in the TypeScript module
+MONTHLY_SERIES_CODECS = ['none', 'delta']
+MONTHLY_SERIES_CODEC = 'delta'
+
+# How the TypeScript module embeds that data: an object literal, or a
+# JSON.parse('...') string (much cheaper for engines to parse)
+MONTHLY_MODULE_FORMATS = ['literal', 'json']
+MONTHLY_MODULE_FORMAT = 'json'
+
+# Order of facilities in the exports: as in the source files, or along a
+# space-filling curve (see sitegen/spatial.py)
+FACILITY_ORDERS = ['source', 'hilbert', 'zorder']
+FACILITY_ORDER = 'source'
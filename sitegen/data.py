@@ -0,0 +1,255 @@
+"""
+Loading and normalizing facility data for the build stages
+"""
+
+import csv
+import heapq
+import json
+from array import array
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Any, TextIO
+
+from .config import FACILITIES_JSON
+
+# Characters read per refill of the streaming loader's buffer
+STREAM_CHUNK_SIZE = 1 << 16
+
+# Typed-array codes of the numeric snapshot columns; other columns stay str
+NUMERIC_COLUMNS = {'latitude': 'd', 'longitude': 'd', 'population_count': 'q'}
+
+_WHITESPACE = ' \t\n\r'
+_DELIMITERS = ',]}' + _WHITESPACE
+
+
+def load_facilities_data(path: str = FACILITIES_JSON) -> Dict[str, Any]:
+    """Load facilities data from JSON file"""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+class _JsonStream:
+    """Sliding text buffer over a JSON file, decoded one value at a time"""
+
+    def __init__(self, f: TextIO, chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Read another chunk, dropping consumed text; False at end of file"""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        self.eof = not chunk
+        return bool(chunk)
+
+    def peek(self) -> str:
+        """Next non-whitespace character, without consuming it ('' at end of file)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of chars"""
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Expected one of {chars!r} in JSON stream, found {char or 'end of file'!r}")
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next complete value"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number cut off by the end of the buffer decodes as a shorter
+            # number; only trust scalars followed by a delimiter
+            if (self.buffer[self.pos] not in '{["' and not self.eof
+                    and (end == len(self.buffer) or self.buffer[end] not in _DELIMITERS) and self._fill()):
+                continue
+            self.pos = end
+            return value
+
+
+def iter_facilities(path: str = FACILITIES_JSON, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """Facility records of a snapshot, decoded one at a time
+
+    Walks the top-level object (or a bare array of records) with the stdlib
+    decoder over a sliding buffer, so memory holds one chunk and one record
+    rather than the whole tree. Other top-level values such as ``metadata``
+    are decoded and dropped.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        stream = _JsonStream(f, chunk_size)
+        if stream.expect('{[') == '[':
+            yield from _iter_array_items(stream)
+            return
+        if stream.peek() == '}':
+            return
+        while True:
+            key = stream.value()
+            stream.expect(':')
+            if key == 'facilities':
+                stream.expect('[')
+                yield from _iter_array_items(stream)
+            else:
+                stream.value()
+            if stream.expect(',}') == '}':
+                return
+
+
+def _iter_array_items(stream: _JsonStream) -> Iterator[Any]:
+    """Items of an array whose '[' was just consumed"""
+    if stream.peek() == ']':
+        stream.pos += 1
+        return
+    while True:
+        yield stream.value()
+        if stream.expect(',]') == ']':
+            return
+
+
+def facility_slug(name: str) -> str:
+    """Create URL-friendly name for a facility page"""
+    return name.lower().replace(' ', '-').replace('/', '-').replace(',', '').replace('(', '').replace(')', '')
+
+
+def facility_state(address: str) -> str:
+    """Extract the state code from a facility address"""
+    return address.split(', ')[-2] if ', ' in address else 'Unknown'
+
+
+def facility_city(address: str) -> str:
+    """Extract the locality from a facility address
+
+    Addresses are "[Facility name, ]City, ST, ZIP", so the locality is the
+    component before the state.
+    """
+    parts = address.split(', ')
+    return parts[-3] if len(parts) >= 3 else parts[0]
+
+
+def read_facility_columns(path: str) -> Dict[str, Any]:
+    """A facilities.csv as columns: typed arrays for NUMERIC_COLUMNS, lists
+    of str for the rest
+
+    Each column is extracted and converted in one C-level pass (itemgetter,
+    map) instead of building a dict per record.
+    """
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows = list(reader)
+
+    columns: Dict[str, Any] = {}
+    for index, name in enumerate(header):
+        column = list(map(itemgetter(index), rows))
+        code = NUMERIC_COLUMNS.get(name)
+        if code == 'd':
+            columns[name] = array('d', map(float, column))
+        elif code == 'q':
+            columns[name] = array('q', map(int, column))
+        else:
+            columns[name] = list(column)
+    return columns
+
+
+def iter_column_records(columns: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Records of a columnar table, shaped like snapshot facility records"""
+    names = list(columns)
+    for row in zip(*columns.values()):
+        yield dict(zip(names, row))
+
+
+def load_facility_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Facility records of a snapshot (JSON, streamed) or a facilities.csv (columnar)"""
+    if path.endswith('.csv'):
+        return iter_column_records(read_facility_columns(path))
+    return iter_facilities(path)
+
+
+def build_facility_table(facilities: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Normalize raw facility records into the table every stage renders from
+
+    Records are sorted by population (descending) and annotated with their
+    rank, page slug and state so that no stage has to re-derive them.
+    Several facilities share a name (e.g. county jails in different states);
+    later duplicates get the state appended so every page has its own URL.
+    """
+    return _annotate(sorted(facilities, key=lambda x: x['population_count'], reverse=True))
+
+
+def top_facility_table(facilities: Iterable[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+    """The first ``limit`` rows of build_facility_table(facilities), keeping
+    only ``limit`` records in memory
+
+    A facility's rank and slug depend only on the facilities ranked above
+    it, and heapq.nlargest breaks ties in input order exactly like the
+    stable sort, so the rows are identical.
+    """
+    return _annotate(heapq.nlargest(limit, facilities, key=lambda x: x['population_count']))
+
+
+def _annotate(sorted_facilities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Table rows for facilities already in population order"""
+    table = []
+    seen_slugs = set()
+    for rank, facility in enumerate(sorted_facilities):
+        record = dict(facility)
+        record['rank'] = rank + 1
+        record['state'] = facility_state(facility['address'])
+
+        slug = facility_slug(facility['name'])
+        if slug in seen_slugs:
+            slug = f"{slug}-{record['state'].lower()}"
+        if slug in seen_slugs:
+            slug = f"{slug}-{record['rank']}"
+        seen_slugs.add(slug)
+        record['slug'] = slug
+
+        table.append(record)
+
+    return table
+
+
+def group_by_state(table: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Group facility records by state, preserving table (population) order"""
+    states: Dict[str, List[Dict[str, Any]]] = {}
+    for facility in table:
+        states.setdefault(facility['state'], []).append(facility)
+    return states
+
+
+def compute_aggregates(table: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Totals, per-state breakdown and state grouping shared by the directory
+    and statistics pages"""
+    total_facilities = len(table)
+    total_population = sum(f['population_count'] for f in table)
+
+    by_state = group_by_state(table)
+    states = {}
+    for state, facilities_in_state in by_state.items():
+        states[state] = {
+            'count': len(facilities_in_state),
+            'population': sum(f['population_count'] for f in facilities_in_state),
+        }
+
+    return {
+        'total_facilities': total_facilities,
+        'total_population': total_population,
+        'avg_population': total_population / total_facilities if total_facilities else 0.0,
+        'states': states,
+        'by_state': by_state,
+    }
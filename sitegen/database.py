@@ -0,0 +1,152 @@
+"""
+SQLite export of the facilities and their monthly populations
+
+One self-contained database answers ad-hoc questions without loading the
+JSON files, e.g. the largest facilities in Texas in June 2024::
+
+    SELECT f.name, p.population
+    FROM populations p JOIN facilities f ON f.id = p.facility_id
+    WHERE p.month = '2024-06' AND f.state = 'TX'
+    ORDER BY p.population DESC LIMIT 10;
+
+or a full-text search over names and addresses::
+
+    SELECT f.name, f.address FROM facilities_fts
+    JOIN facilities f ON f.id = facilities_fts.rowid
+    WHERE facilities_fts MATCH 'processing AND tx';
+
+Tables:
+
+    facilities      one row per facility: the monthly data's id, the
+                    snapshot's population, rank, slug and state (facilities
+                    only in the monthly data have no rank or slug)
+    populations     (month, facility_id, population) for every non-zero
+                    monthly population, clustered on (month, facility_id)
+    facilities_fts  FTS5 index over name and address (external content)
+    meta            schema version, months and latest month
+
+The database is built in memory and copied out with Connection.backup
+(Connection.serialize needs Python 3.11), then returned as bytes so the
+file is written atomically like every other output.
+"""
+
+import os
+import sqlite3
+import tempfile
+from typing import Dict, List, Any, Tuple
+
+from .data import facility_city, facility_state
+
+SQLITE_SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE facilities (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    address TEXT NOT NULL,
+    city TEXT NOT NULL,
+    state TEXT NOT NULL,
+    latitude REAL NOT NULL,
+    longitude REAL NOT NULL,
+    population_count INTEGER NOT NULL,
+    rank INTEGER,
+    slug TEXT UNIQUE
+);
+CREATE TABLE populations (
+    month TEXT NOT NULL,
+    facility_id INTEGER NOT NULL REFERENCES facilities (id),
+    population INTEGER NOT NULL,
+    PRIMARY KEY (month, facility_id)
+) WITHOUT ROWID;
+CREATE INDEX populations_facility ON populations (facility_id, month);
+CREATE INDEX facilities_state ON facilities (state, population_count DESC);
+CREATE INDEX facilities_population ON facilities (population_count DESC);
+CREATE VIRTUAL TABLE facilities_fts USING fts5 (name, address, content='facilities', content_rowid='id');
+"""
+
+
+def facility_rows(table: List[Dict[str, Any]], monthly: Dict[str, Any]) -> List[tuple]:
+    """Rows of the facilities table; snapshot facilities are matched to
+    monthly ids by (name, address)
+
+    A few facilities are listed twice under the same name and address;
+    their ids are handed out in the monthly data's order.
+    """
+    ids: Dict[Tuple[str, str], List[int]] = {}
+    for facility in monthly['facilities']:
+        ids.setdefault((facility['n'], facility['a']), []).append(facility['i'])
+    next_id = max((facility['i'] for facility in monthly['facilities']), default=0) + 1
+
+    rows = []
+    listed = set()
+    for facility in table:
+        matches = ids.get((facility['name'], facility['address']))
+        if matches:
+            facility_id = matches.pop(0)
+        else:
+            facility_id, next_id = next_id, next_id + 1
+        listed.add(facility_id)
+        rows.append((facility_id, facility['name'], facility['address'], facility_city(facility['address']),
+                     facility['state'], facility['latitude'], facility['longitude'],
+                     facility['population_count'], facility['rank'], facility['slug']))
+
+    # Facilities the snapshot no longer lists keep their latest monthly population
+    for facility in monthly['facilities']:
+        if facility['i'] in listed:
+            continue
+        series = monthly['data'].get(str(facility['i']), [])
+        rows.append((facility['i'], facility['n'], facility['a'], facility_city(facility['a']),
+                     facility_state(facility['a']), facility['lat'], facility['lng'],
+                     series[-1] if series else 0, None, None))
+    return rows
+
+
+def population_rows(monthly: Dict[str, Any]) -> List[tuple]:
+    """(month, facility_id, population) for every non-zero population, in
+    primary key order"""
+    months = monthly['meta']['m']
+    ids = sorted(facility['i'] for facility in monthly['facilities'])
+    rows = []
+    for m, month in enumerate(months):
+        for facility_id in ids:
+            series = monthly['data'].get(str(facility_id), [])
+            if m < len(series) and series[m]:
+                rows.append((month, facility_id, series[m]))
+    return rows
+
+
+def build_database(table: List[Dict[str, Any]], monthly: Dict[str, Any]) -> bytes:
+    """The SQLite database file for the facility table and monthly data"""
+    connection = sqlite3.connect(':memory:')
+    try:
+        try:
+            connection.executescript(SCHEMA)
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"SQLite {sqlite3.sqlite_version} cannot build the database: {e}") from None
+
+        months = monthly['meta']['m']
+        with connection:
+            connection.executemany('INSERT INTO meta VALUES (?, ?)', [
+                ('schema_version', str(SQLITE_SCHEMA_VERSION)),
+                ('months', ','.join(months)),
+                ('latest_month', monthly['meta']['l']),
+            ])
+            connection.executemany('INSERT INTO facilities VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                                   facility_rows(table, monthly))
+            connection.executemany('INSERT INTO populations VALUES (?, ?, ?)', population_rows(monthly))
+            connection.execute("INSERT INTO facilities_fts (facilities_fts) VALUES ('rebuild')")
+            connection.execute('ANALYZE')
+        # Drop the free pages left by the FTS rebuild before copying
+        connection.execute('VACUUM')
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'facilities.sqlite')
+            target = sqlite3.connect(path)
+            try:
+                connection.backup(target)
+            finally:
+                target.close()
+            with open(path, 'rb') as f:
+                return f.read()
+    finally:
+        connection.close()
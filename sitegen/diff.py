@@ -0,0 +1,184 @@
+"""
+Change sets between two datasets
+
+Compares two facilities.json snapshots, or two optimized monthly files, and
+describes what changed in a JSON-serializable change set. Builds given a
+change set (``--changes``) regenerate only the outputs it touches.
+
+Snapshots have no facility ids, so facilities are matched by
+(name, address) and reported by the slug of their page. Monthly files are
+matched by facility id. Population columns are compared as whole arrays
+first; facilities and months are only walked one by one when the arrays
+differ.
+
+Snapshot change set::
+
+    {"v": 1, "kind": "snapshot",
+     "added": [slug], "removed": [slug], "moved": [slug],
+     "population": [{"slug", "old", "new"}],
+     "facilities": [slug],        # facility pages to regenerate
+     "states": [state],           # state directory pages
+     "pages": [page],             # paginated directory pages
+     "index": bool, "stats": bool}
+
+Monthly change set::
+
+    {"v": 1, "kind": "monthly",
+     "base": digest,              # content digest of the old file
+     "months_added": [month], "months_removed": [month],
+     "added": [id], "removed": [id], "moved": [id],
+     "changed": {id: [month]},
+     "keys": [[name, address]]}   # facility pages whose rank history changed
+"""
+
+import json
+from array import array
+from typing import Dict, List, Any, Optional, Tuple
+
+from . import config
+from .data import build_facility_table, compute_aggregates
+from .manifest import file_digest
+
+CHANGESET_VERSION = 1
+
+
+def _identity(facility: Dict[str, Any]) -> Tuple[str, str]:
+    return facility['name'], facility['address']
+
+
+def _changed_positions(old: array, new: array) -> List[int]:
+    """Positions where two equal-length arrays differ (one C-level compare when equal)"""
+    if old == new:
+        return []
+    return [k for k, (a, b) in enumerate(zip(old, new)) if a != b]
+
+
+def diff_snapshots(old_facilities: List[Dict[str, Any]], new_facilities: List[Dict[str, Any]],
+                   page_size: int = config.DIRECTORY_PAGE_SIZE) -> Dict[str, Any]:
+    """Change set between two facilities.json facility lists"""
+    old_table = build_facility_table(old_facilities)
+    new_table = build_facility_table(new_facilities)
+    old_by_key = {_identity(facility): facility for facility in old_table}
+    new_by_key = {_identity(facility): facility for facility in new_table}
+
+    common = [key for key in new_by_key if key in old_by_key]
+    added = [new_by_key[key]['slug'] for key in new_by_key if key not in old_by_key]
+    removed = [old_by_key[key]['slug'] for key in old_by_key if key not in new_by_key]
+
+    old_populations = array('q', (old_by_key[key]['population_count'] for key in common))
+    new_populations = array('q', (new_by_key[key]['population_count'] for key in common))
+    population = [{'slug': new_by_key[common[k]]['slug'], 'old': old_populations[k], 'new': new_populations[k]}
+                  for k in _changed_positions(old_populations, new_populations)]
+    moved = [new_by_key[key]['slug'] for key in common
+             if (old_by_key[key]['latitude'], old_by_key[key]['longitude'])
+             != (new_by_key[key]['latitude'], new_by_key[key]['longitude'])]
+
+    # A facility page changes with any field of its record, rank and slug included
+    facilities = added + [new_by_key[key]['slug'] for key in common if old_by_key[key] != new_by_key[key]]
+
+    old_aggregates = compute_aggregates(old_table)
+    new_aggregates = compute_aggregates(new_table)
+    states = sorted(state for state in set(old_aggregates['by_state']) | set(new_aggregates['by_state'])
+                    if old_aggregates['by_state'].get(state) != new_aggregates['by_state'].get(state))
+
+    old_page_count = max(1, -(-len(old_table) // page_size))
+    new_page_count = max(1, -(-len(new_table) // page_size))
+    pages = [page for page in range(1, new_page_count + 1)
+             if old_page_count != new_page_count
+             or old_table[(page - 1) * page_size:page * page_size] != new_table[(page - 1) * page_size:page * page_size]]
+
+    return {
+        'v': CHANGESET_VERSION,
+        'kind': 'snapshot',
+        'added': added,
+        'removed': removed,
+        'moved': moved,
+        'population': population,
+        'facilities': facilities,
+        'states': states,
+        'pages': pages,
+        'index': old_page_count != new_page_count or old_aggregates['states'] != new_aggregates['states'],
+        'stats': old_table != new_table,
+    }
+
+
+def diff_monthly(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Change set between two optimized monthly datasets"""
+    from .ranks import compute_month_ranks, rank_histories
+
+    old_months, new_months = old['meta']['m'], new['meta']['m']
+    old_facilities = {facility['i']: facility for facility in old['facilities']}
+    new_facilities = {facility['i']: facility for facility in new['facilities']}
+    common = [facility_id for facility_id in new_facilities if facility_id in old_facilities]
+
+    # Compare the months both files have, as one flat facility-major array each
+    shared = [month for month in new_months if month in set(old_months)]
+    old_index = {month: m for m, month in enumerate(old_months)}
+    new_index = {month: m for m, month in enumerate(new_months)}
+
+    def matrix(monthly: Dict[str, Any], index: Dict[str, int]) -> array:
+        values = array('q')
+        for facility_id in common:
+            series = monthly['data'].get(str(facility_id), [])
+            values.extend(series[index[month]] if index[month] < len(series) else 0 for month in shared)
+        return values
+
+    changed: Dict[str, List[str]] = {}
+    for k in _changed_positions(matrix(old, old_index), matrix(new, new_index)):
+        facility_id, month = common[k // len(shared)], shared[k % len(shared)]
+        changed.setdefault(str(facility_id), []).append(month)
+
+    # Rank tables shift for every facility in a changed month, so compare the
+    # histories the pages render rather than guessing who moved
+    old_histories = rank_histories(compute_month_ranks(old), old)
+    new_histories = rank_histories(compute_month_ranks(new), new)
+    keys = [list(key) for key, history in new_histories.items() if old_histories.get(key) != history]
+
+    return {
+        'v': CHANGESET_VERSION,
+        'kind': 'monthly',
+        'months_added': [month for month in new_months if month not in old_index],
+        'months_removed': [month for month in old_months if month not in new_index],
+        'added': [facility_id for facility_id in new_facilities if facility_id not in old_facilities],
+        'removed': [facility_id for facility_id in old_facilities if facility_id not in new_facilities],
+        'moved': [facility_id for facility_id in common
+                  if (old_facilities[facility_id]['lat'], old_facilities[facility_id]['lng'])
+                  != (new_facilities[facility_id]['lat'], new_facilities[facility_id]['lng'])],
+        'changed': changed,
+        'keys': keys,
+    }
+
+
+def diff_files(old_path: str, new_path: str) -> Dict[str, Any]:
+    """Change set between two snapshot or two monthly files (detected from the content)"""
+    with open(old_path, 'r') as f:
+        old = json.load(f)
+    with open(new_path, 'r') as f:
+        new = json.load(f)
+    if 'meta' in old and 'meta' in new:
+        # Outputs built from the old file can then be extended rather than rebuilt
+        return {**diff_monthly(old, new), 'base': file_digest(old_path)}
+    if 'metadata' in old and 'metadata' in new:
+        return diff_snapshots(old['facilities'], new['facilities'])
+    raise ValueError(f"{old_path} and {new_path} are not two snapshots or two optimized monthly files")
+
+
+def load_changes(path: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Load a change set written by ``python3 -m sitegen diff``"""
+    if path is None:
+        return None
+    with open(path, 'r') as f:
+        changes = json.load(f)
+    if changes.get('v') != CHANGESET_VERSION or changes.get('kind') not in ('snapshot', 'monthly'):
+        raise ValueError(f"{path} is not a version {CHANGESET_VERSION} change set")
+    return changes
+
+
+def summarize(changes: Dict[str, Any]) -> str:
+    """One-line description of a change set"""
+    if changes['kind'] == 'snapshot':
+        return (f"{len(changes['added'])} added, {len(changes['removed'])} removed, {len(changes['moved'])} moved, "
+                f"{len(changes['population'])} population changes; {len(changes['facilities'])} facility pages, "
+                f"{len(changes['states'])} state pages, {len(changes['pages'])} directory pages touched")
+    return (f"{len(changes['months_added'])} months added, {len(changes['months_removed'])} removed, "
+            f"{len(changes['changed'])} facilities changed; {len(changes['keys'])} facility pages touched")
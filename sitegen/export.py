@@ -0,0 +1,94 @@
+"""
+Data exports derived from the canonical source files
+"""
+
+import csv
+import io
+import json
+from typing import Dict, Iterable, Iterator, List, Any, Optional
+
+TS_MODULE_HEADER = """import type { OptimizedMonthlyData } from '../utils/monthlyDataUtils';
+
+export const monthlyFacilitiesData: OptimizedMonthlyData =
+"""
+
+# Delta-encoded series are decoded once when the module is first imported
+ENCODED_TS_MODULE_HEADER = """import { decodeMonthlyData, type OptimizedMonthlyData } from '../utils/monthlyDataUtils';
+
+export const monthlyFacilitiesData: OptimizedMonthlyData = decodeMonthlyData(
+"""
+
+CSV_COLUMNS = ['name', 'latitude', 'longitude', 'address', 'population_count']
+
+# Rows rendered per chunk of the streaming CSV writer
+CSV_BATCH_ROWS = 1024
+
+
+def monthly_module_payload(monthly: Dict[str, Any], series_codec: str = 'none',
+                           facility_ids: Optional[List[int]] = None) -> str:
+    """JSON embedded in the monthly TypeScript module: the optimized monthly
+    data with series indexed by dense facility index (see sitegen/ids.py),
+    its month-major layout and per-month color scales (meta.s), optionally
+    delta encoded (see sitegen/series.py)
+
+    ``facility_ids`` is the persisted id mapping; without it indices follow
+    id order.
+    """
+    from .ids import dense_monthly, extend_facility_index
+    from .scales import month_scales
+    from .series import encode_monthly, month_csr
+
+    csr = month_csr(monthly)
+    if facility_ids is None:
+        facility_ids = extend_facility_index([], monthly)
+    monthly = dense_monthly(dict(monthly, meta=dict(monthly['meta'], s=month_scales(csr))), facility_ids)
+    if series_codec == 'delta':
+        return json.dumps(encode_monthly(monthly, csr), separators=(',', ':'))
+    return json.dumps(dict(monthly, csr=csr), separators=(',', ':'))
+
+
+def js_string_literal(text: str) -> str:
+    """Single-quoted JavaScript string literal of ASCII text (json.dumps output)"""
+    return "'" + text.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+def module_expression(payload: str, module_format: str = 'json') -> str:
+    """JavaScript expression evaluating to the payload
+
+    'json' wraps it in JSON.parse('...'): engines scan a string literal and
+    run the JSON parser far faster than they parse an object literal of the
+    same size, and bundlers pass the string through untouched. 'literal'
+    embeds the object literal itself.
+    """
+    if module_format == 'json':
+        return f"JSON.parse({js_string_literal(payload)})"
+    return payload
+
+
+def render_monthly_ts_module(monthly: Dict[str, Any], series_codec: str = 'none',
+                             module_format: str = 'json', facility_ids: Optional[List[int]] = None) -> str:
+    """Render the TypeScript module that embeds the monthly data (see
+    monthly_module_payload and module_expression)"""
+    expression = module_expression(monthly_module_payload(monthly, series_codec, facility_ids), module_format)
+    if series_codec == 'delta':
+        return ENCODED_TS_MODULE_HEADER + expression + ');\n'
+    return TS_MODULE_HEADER + expression + ';\n'
+
+
+def iter_facilities_csv(table: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """public/facilities.csv from the facility table, CSV_BATCH_ROWS rows per chunk"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC, lineterminator='\n')
+    buffer.write(','.join(CSV_COLUMNS) + '\n')
+    for count, facility in enumerate(table, start=1):
+        writer.writerow([facility[column] for column in CSV_COLUMNS])
+        if count % CSV_BATCH_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def render_facilities_csv(table: Iterable[Dict[str, Any]]) -> str:
+    """Render public/facilities.csv from the facility table"""
+    return ''.join(iter_facilities_csv(table))
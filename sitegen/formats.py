@@ -0,0 +1,165 @@
+"""
+Report comparing the monthly data formats by transfer and decode cost
+
+    python3 -m sitegen bench
+
+Compares the monthly data formats the build can write, each as it is
+served:
+
+    module/<codec>  src/data/monthlyFacilitiesData.ts for every series codec,
+                    exactly as `data` renders it; bundled into the app and
+                    compressed with it
+    binary          public/monthly.bin, served raw so Range requests address
+                    its bytes, plus the precompressed monthly-index.json
+                    (populations only: facility records come from elsewhere)
+
+The decode time is what the client pays before the data is usable: for a
+module, evaluating its data expression and decodeMonthlyData (the module
+runs it on import); for monthly.bin, reading every month's column. It is
+measured with the Node.js harness in sitegen/bench.py, running the real
+decodeMonthlyData from src/utils/monthlyDataUtils.ts bundled by the
+project's esbuild. Without Node.js or esbuild a cost model calibrated on
+V8 estimates it, and the report says the times are modelled.
+
+For each connection class browsers report (navigator.connection
+.effectiveType) the report names the format with the lowest ``transfer +
+CPU_SLOWDOWN * decode`` time. Decode times depend on the machine, so this
+is a report for choosing the build options by hand; nothing is selected
+automatically.
+"""
+
+import gzip
+import json
+import tempfile
+from typing import Dict, List, Any, Optional, Tuple
+
+from . import config
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+# Representative downlink of each effectiveType, in Mbit/s
+NETWORK_PROFILES = {'slow-2g': 0.05, '2g': 0.25, '3g': 0.7, '4g': 10.0}
+
+# Decode times are measured on a build machine; phones are several times slower
+CPU_SLOWDOWN = 4
+
+# Decode runs per format (the fastest counts)
+FORMAT_BENCH_REPEAT = 20
+
+# Cost model for machines without Node.js or esbuild, calibrated on V8 (Node 20):
+# module data expressions compiled and evaluated, JSON.parse of a fetched
+# file, base64 varint series decoding and values read into typed arrays
+MODEL_MODULE_CHARS_PER_MS = 100_000
+MODEL_JSON_BYTES_PER_MS = 150_000
+MODEL_VARINT_CHARS_PER_MS = 35_000
+MODEL_TYPED_VALUES_PER_MS = 200_000
+
+class Part:
+    """One file of a candidate format, as served and as decoded"""
+
+    def __init__(self, content: bytes, decoder: str, compressed: bool, model_ms: float,
+                 bench_input: Optional[bytes] = None):
+        self.content = content
+        # Harness decoder and its input (the file itself unless given)
+        self.decoder = decoder
+        self.bench_input = content if bench_input is None else bench_input
+        # Whether the host serves the file compressed
+        self.compressed = compressed
+        # Estimated V8 decode time, for machines without Node.js or esbuild
+        self.model_ms = model_ms
+
+
+def compress(content: bytes) -> Tuple[str, bytes]:
+    """(encoding, bytes) as a static host would serve the file"""
+    if brotli is not None:
+        return 'br', brotli.compress(content)
+    return 'gzip', gzip.compress(content, compresslevel=9, mtime=0)
+
+
+def candidate_formats(monthly: Dict[str, Any], facility_ids: Optional[List[int]] = None,
+                      module_format: str = config.MONTHLY_MODULE_FORMAT) -> Dict[str, List[Part]]:
+    """name -> parts of every monthly format the build can write"""
+    from .binary import build_monthly_binary
+    from .export import module_expression, monthly_module_payload, render_monthly_ts_module
+
+    candidates = {}
+    for codec in config.MONTHLY_SERIES_CODECS:
+        payload = monthly_module_payload(monthly, codec, facility_ids)
+        expression = module_expression(payload, module_format)
+        model_ms = len(expression) / MODEL_MODULE_CHARS_PER_MS
+        if codec == 'delta':
+            model_ms += sum(len(blob) for blob in json.loads(payload)['data']) / MODEL_VARINT_CHARS_PER_MS
+        module = render_monthly_ts_module(monthly, codec, module_format, facility_ids)
+        candidates[f'module/{codec}'] = [Part(module.encode('utf-8'), 'module', True, model_ms,
+                                              bench_input=expression.encode('utf-8'))]
+
+    content, table = build_monthly_binary(monthly)
+    index = json.dumps(table, separators=(',', ':')).encode('utf-8')
+    values = len(table['ids']) * len(table['months'])
+    candidates['binary'] = [Part(content, 'binary', False, values / MODEL_TYPED_VALUES_PER_MS),
+                            Part(index, 'json', True, len(index) / MODEL_JSON_BYTES_PER_MS)]
+    return candidates
+
+
+def node_decode_times(candidates: Dict[str, List[Part]], repeat: int) -> Optional[Dict[str, float]]:
+    """Best decode time of every candidate in ms, measured with the real
+    decoder; None without Node.js or esbuild to bundle it"""
+    from .bench import bundle_data_utils, node_bench
+
+    with tempfile.TemporaryDirectory() as directory:
+        utils = bundle_data_utils(directory)
+        if utils is None:
+            return None
+        return node_bench([(name, part.decoder, part.bench_input) for name, parts in candidates.items()
+                           for part in parts], repeat, utils)
+
+
+def model_decode_times(candidates: Dict[str, List[Part]]) -> Dict[str, float]:
+    """Estimated V8 decode time of every candidate in ms"""
+    return {name: sum(part.model_ms for part in parts) for name, parts in candidates.items()}
+
+
+def transfer_ms(served: int, downlink_mbps: float) -> float:
+    """Time to download ``served`` bytes at a downlink speed"""
+    return served * 8 / (downlink_mbps * 1000)
+
+
+def compare_formats(monthly: Dict[str, Any], facility_ids: Optional[List[int]] = None,
+                    repeat: int = FORMAT_BENCH_REPEAT) -> Dict[str, Any]:
+    """Measure every candidate and report the cheapest per connection class
+
+    Returns {"decodeTimes": "measured" | "modelled", "compression": "br" | "gzip",
+    "formats": {name: {"bytes", "served", "decodeMs"}},
+    "profiles": {effectiveType: {"downlinkMbps", "best"}},
+    "neverWins": [name]}; ``served`` counts raw-served files at full size.
+    """
+    candidates = candidate_formats(monthly, facility_ids)
+    decode_times = node_decode_times(candidates, repeat)
+    timing = 'measured'
+    if decode_times is None:
+        decode_times, timing = model_decode_times(candidates), 'modelled'
+
+    formats = {}
+    encoding = compress(b'')[0]
+    for name, parts in candidates.items():
+        served = sum(len(compress(part.content)[1]) if part.compressed else len(part.content) for part in parts)
+        formats[name] = {'bytes': sum(len(part.content) for part in parts), 'served': served,
+                         'decodeMs': decode_times[name]}
+
+    profiles = {}
+    for profile, downlink in NETWORK_PROFILES.items():
+        cost = {name: transfer_ms(entry['served'], downlink) + CPU_SLOWDOWN * entry['decodeMs']
+                for name, entry in formats.items()}
+        profiles[profile] = {'downlinkMbps': downlink, 'best': min(cost, key=cost.get)}
+
+    winners = {entry['best'] for entry in profiles.values()}
+    return {
+        'decodeTimes': timing,
+        'compression': encoding,
+        'formats': formats,
+        'profiles': profiles,
+        'neverWins': [name for name in formats if name not in winners],
+    }
@@ -0,0 +1,421 @@
+"""
+Standard geospatial exports of the facilities
+
+Two files carry every facility as a point feature with its id, name,
+address, state, latest population and one property per month:
+
+- facilities.geojsonl: newline-delimited GeoJSON (one Feature per line),
+  which GIS tools read as a stream
+- facilities.fgb: FlatGeobuf, with a packed Hilbert R-tree so a reader
+  fetches the header and index and then only the features inside a
+  bounding box (over HTTP Range requests, like monthly.bin)
+
+Both list the features in the Hilbert order of the index, so nearby
+facilities are nearby in the files.
+
+FlatGeobuf layout (little-endian, see https://flatgeobuf.org):
+
+    8 bytes     magic b'fgb\\x03fgb\\x00'
+    u32 + n     size-prefixed Header FlatBuffer (columns, extent, CRS)
+    40 x nodes  packed R-tree, root level first; a node is its bounding box
+                (4 x f64) and the index of its first child node, or for a
+                leaf the byte offset of its feature in the feature section
+    features    size-prefixed Feature FlatBuffers: a Point geometry and the
+                properties, encoded as (u16 column, value) pairs
+
+Only the FlatBuffers constructs these two tables need are implemented,
+along with a reader used to verify every build.
+"""
+
+import json
+import math
+import struct
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+
+from .data import facility_state
+from .spatial import hilbert_index
+
+MAGIC = b'fgb\x03fgb\x00'
+INDEX_NODE_SIZE = 16
+NODE_ITEM = struct.Struct('<ddddQ')
+HILBERT_BITS = 16
+
+GEOMETRY_POINT = 1
+EPSG_WGS84 = 4326
+
+# FlatGeobuf ColumnType values
+COLUMN_INT = 5
+COLUMN_STRING = 11
+
+# Features per chunk of the GeoJSON stream
+GEOJSON_BATCH_FEATURES = 256
+
+Box = Tuple[float, float, float, float]
+
+
+def facility_features(monthly: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Point features of the monthly data's facilities, in Hilbert order
+
+    A feature is ``{'id', 'coordinates': (lng, lat), 'properties'}``;
+    ``population`` is the latest month's value.
+    """
+    months = monthly['meta']['m']
+    features = []
+    for facility in monthly['facilities']:
+        series = monthly['data'].get(str(facility['i']), [])
+        series = series + [0] * (len(months) - len(series))
+        properties = {
+            'id': facility['i'],
+            'name': facility['n'],
+            'address': facility['a'],
+            'state': facility_state(facility['a']),
+            'population': series[-1] if series else 0,
+        }
+        properties.update(zip(months, series))
+        features.append({'id': facility['i'], 'coordinates': (facility['lng'], facility['lat']),
+                         'properties': properties})
+    return hilbert_sort(features)
+
+
+def extent(features: List[Dict[str, Any]]) -> Box:
+    """(min x, min y, max x, max y) of the feature coordinates"""
+    xs = [feature['coordinates'][0] for feature in features]
+    ys = [feature['coordinates'][1] for feature in features]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def hilbert_sort(features: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Features along a Hilbert curve over their extent (the R-tree's leaf order)"""
+    if not features:
+        return features
+    min_x, min_y, max_x, max_y = extent(features)
+    cells = (1 << HILBERT_BITS) - 1
+    width = (max_x - min_x) or 1.0
+    height = (max_y - min_y) or 1.0
+
+    def key(feature: Dict[str, Any]) -> int:
+        x, y = feature['coordinates']
+        return hilbert_index(int(cells * (x - min_x) / width), int(cells * (y - min_y) / height), HILBERT_BITS)
+
+    return sorted(features, key=key)
+
+
+def geojson_feature(feature: Dict[str, Any]) -> Dict[str, Any]:
+    """GeoJSON Feature object of a point feature"""
+    return {
+        'type': 'Feature',
+        'id': feature['id'],
+        'geometry': {'type': 'Point', 'coordinates': list(feature['coordinates'])},
+        'properties': feature['properties'],
+    }
+
+
+def iter_geojson_lines(features: List[Dict[str, Any]]) -> Iterator[str]:
+    """Newline-delimited GeoJSON, in chunks of GEOJSON_BATCH_FEATURES lines"""
+    for start in range(0, len(features), GEOJSON_BATCH_FEATURES):
+        batch = features[start:start + GEOJSON_BATCH_FEATURES]
+        yield ''.join(json.dumps(geojson_feature(feature), separators=(',', ':')) + '\n' for feature in batch)
+
+
+class _FlatBuffer:
+    """Forward-writing encoder for size-prefixed FlatBuffers
+
+    A table is a list of ``(slot, kind, value)`` fields; ``kind`` is a
+    struct format for scalars, or 'string', 'doubles', 'bytes', 'table' or
+    'tables'. Each vtable is written just before its table and every child
+    right after it, so all offsets point forward. Alignment is relative to
+    the start of the buffer, size prefix included.
+    """
+
+    _REFERENCES = ('string', 'doubles', 'bytes', 'table', 'tables')
+
+    def __init__(self):
+        self.buf = bytearray(8)
+
+    def _pad(self, alignment: int, extra: int = 0):
+        """Pad so that the buffer length plus ``extra`` is aligned"""
+        self.buf += bytes(-(len(self.buf) + extra) % alignment)
+
+    def finish(self, fields: List[Tuple[int, str, Any]]) -> bytes:
+        root = self.table(fields)
+        struct.pack_into('<I', self.buf, 4, root - 4)
+        self._pad(8)
+        struct.pack_into('<I', self.buf, 0, len(self.buf) - 4)
+        return bytes(self.buf)
+
+    def table(self, fields: List[Tuple[int, str, Any]]) -> int:
+        """Write a table and its children; returns the table position"""
+        fields = [field for field in fields if field[2] is not None]
+        sizes = {slot: 4 if kind in self._REFERENCES else struct.calcsize(kind) for slot, kind, _ in fields}
+        slots = max((slot for slot, _, _ in fields), default=-1) + 1
+
+        self._pad(2)
+        vtable = len(self.buf)
+        self.buf += bytes(4 + 2 * slots)
+        self._pad(max([4] + list(sizes.values())))
+        table = len(self.buf)
+
+        # soffset first, then the fields largest first so each stays aligned
+        offsets = {}
+        cursor = 4
+        for slot, _, _ in sorted(fields, key=lambda field: -sizes[field[0]]):
+            cursor += -cursor % sizes[slot]
+            offsets[slot] = cursor
+            cursor += sizes[slot]
+        self.buf += bytes(cursor)
+
+        struct.pack_into('<i', self.buf, table, table - vtable)
+        struct.pack_into(f'<HH{slots}H', self.buf, vtable, 4 + 2 * slots, cursor,
+                         *(offsets.get(slot, 0) for slot in range(slots)))
+        for slot, kind, value in fields:
+            position = table + offsets[slot]
+            if kind in self._REFERENCES:
+                struct.pack_into('<I', self.buf, position, self._child(kind, value) - position)
+            else:
+                struct.pack_into(f'<{kind}', self.buf, position, value)
+        return table
+
+    def _child(self, kind: str, value: Any) -> int:
+        """Write a referenced string, vector or table; returns its position"""
+        if kind == 'table':
+            return self.table(value)
+        if kind == 'doubles':
+            self._pad(8, extra=4)
+            position = len(self.buf)
+            self.buf += struct.pack(f'<I{len(value)}d', len(value), *value)
+            return position
+
+        self._pad(4)
+        position = len(self.buf)
+        if kind == 'string':
+            data = value.encode('utf-8')
+            self.buf += struct.pack('<I', len(data)) + data + b'\0'
+        elif kind == 'bytes':
+            self.buf += struct.pack('<I', len(value)) + value
+        else:
+            self.buf += struct.pack('<I', len(value)) + bytes(4 * len(value))
+            for k, fields in enumerate(value):
+                slot = position + 4 + 4 * k
+                struct.pack_into('<I', self.buf, slot, self.table(fields) - slot)
+        return position
+
+
+def feature_columns(features: List[Dict[str, Any]]) -> List[Tuple[str, int]]:
+    """(name, FlatGeobuf column type) of every property, in property order"""
+    if not features:
+        return []
+    return [(name, COLUMN_STRING if isinstance(value, str) else COLUMN_INT)
+            for name, value in features[0]['properties'].items()]
+
+
+def encode_properties(properties: Dict[str, Any], columns: List[Tuple[str, int]]) -> bytes:
+    """FlatGeobuf property bytes: (u16 column index, value) per property"""
+    encoded = bytearray()
+    for index, (name, column_type) in enumerate(columns):
+        value = properties[name]
+        if column_type == COLUMN_STRING:
+            data = value.encode('utf-8')
+            encoded += struct.pack('<HI', index, len(data)) + data
+        else:
+            encoded += struct.pack('<Hi', index, value)
+    return bytes(encoded)
+
+
+def level_bounds(count: int, node_size: int = INDEX_NODE_SIZE) -> List[Tuple[int, int]]:
+    """(first node, end node) of each R-tree level, leaves first"""
+    n = count
+    level_counts = [n]
+    while True:
+        n = -(-n // node_size)
+        level_counts.append(n)
+        if n == 1:
+            break
+    bounds = []
+    end = sum(level_counts)
+    for level_count in level_counts:
+        bounds.append((end - level_count, end))
+        end -= level_count
+    return bounds
+
+
+def build_rtree(boxes: List[Box], offsets: List[int], node_size: int = INDEX_NODE_SIZE) -> bytes:
+    """Packed R-tree over leaf boxes already in Hilbert order"""
+    bounds = level_bounds(len(boxes), node_size)
+    nodes: List[Optional[Tuple[float, float, float, float, int]]] = [None] * bounds[0][1]
+    leaf_start = bounds[0][0]
+    for k, (box, offset) in enumerate(zip(boxes, offsets)):
+        nodes[leaf_start + k] = (*box, offset)
+
+    for (child_start, child_end), (start, _) in zip(bounds, bounds[1:]):
+        for k, first in enumerate(range(child_start, child_end, node_size)):
+            children = nodes[first:min(first + node_size, child_end)]
+            nodes[start + k] = (min(child[0] for child in children), min(child[1] for child in children),
+                                max(child[2] for child in children), max(child[3] for child in children), first)
+    return b''.join(NODE_ITEM.pack(*node) for node in nodes)
+
+
+def build_flatgeobuf(features: List[Dict[str, Any]], name: str = 'facilities') -> bytes:
+    """FlatGeobuf file of Hilbert-ordered point features"""
+    if not features:
+        raise ValueError("FlatGeobuf export needs at least one feature")
+    columns = feature_columns(features)
+
+    encoded = []
+    for feature in features:
+        geometry = [(1, 'doubles', list(feature['coordinates']))]
+        encoded.append(_FlatBuffer().finish([
+            (0, 'table', geometry),
+            (1, 'bytes', encode_properties(feature['properties'], columns)),
+        ]))
+    offsets = []
+    position = 0
+    for feature in encoded:
+        offsets.append(position)
+        position += len(feature)
+
+    boxes = [feature['coordinates'] * 2 for feature in features]
+    header = _FlatBuffer().finish([
+        (0, 'string', name),
+        (1, 'doubles', list(extent(features))),
+        (2, 'B', GEOMETRY_POINT),
+        (7, 'tables', [[(0, 'string', column), (1, 'B', column_type)] for column, column_type in columns]),
+        (8, 'Q', len(features)),
+        (9, 'H', INDEX_NODE_SIZE),
+        (10, 'table', [(1, 'i', EPSG_WGS84)]),
+    ])
+    return MAGIC + header + build_rtree(boxes, offsets) + b''.join(encoded)
+
+
+def _field(buf: bytes, table: int, slot: int) -> Optional[int]:
+    """Position of a table field, or None when it is absent"""
+    vtable = table - struct.unpack_from('<i', buf, table)[0]
+    vtable_size = struct.unpack_from('<H', buf, vtable)[0]
+    if 4 + 2 * slot >= vtable_size:
+        return None
+    offset = struct.unpack_from('<H', buf, vtable + 4 + 2 * slot)[0]
+    return table + offset if offset else None
+
+
+def _deref(buf: bytes, position: int) -> int:
+    return position + struct.unpack_from('<I', buf, position)[0]
+
+
+def _vector(buf: bytes, table: int, slot: int) -> Tuple[int, int]:
+    """(first element position, length) of a vector field"""
+    position = _field(buf, table, slot)
+    if position is None:
+        return 0, 0
+    vector = _deref(buf, position)
+    return vector + 4, struct.unpack_from('<I', buf, vector)[0]
+
+
+def _string(buf: bytes, table: int, slot: int) -> Optional[str]:
+    start, length = _vector(buf, table, slot)
+    return buf[start:start + length].decode('utf-8') if start else None
+
+
+def read_flatgeobuf_header(content: bytes) -> Dict[str, Any]:
+    """Parse the header of a FlatGeobuf file written by build_flatgeobuf"""
+    if content[:len(MAGIC)] != MAGIC:
+        raise ValueError("Not a FlatGeobuf file")
+    size = struct.unpack_from('<I', content, len(MAGIC))[0]
+    buf = content[len(MAGIC):len(MAGIC) + 4 + size]
+    root = _deref(buf, 4)
+
+    columns = []
+    start, length = _vector(buf, root, 7)
+    for k in range(length):
+        column = _deref(buf, start + 4 * k)
+        type_field = _field(buf, column, 1)
+        columns.append((_string(buf, column, 0), buf[type_field] if type_field else 0))
+    envelope_start, envelope_length = _vector(buf, root, 1)
+    count_field = _field(buf, root, 8)
+    node_size_field = _field(buf, root, 9)
+
+    count = struct.unpack_from('<Q', buf, count_field)[0] if count_field else 0
+    node_size = struct.unpack_from('<H', buf, node_size_field)[0] if node_size_field else INDEX_NODE_SIZE
+    index_start = len(MAGIC) + 4 + size
+    index_size = NODE_ITEM.size * level_bounds(count, node_size)[0][1] if count and node_size else 0
+    return {
+        'name': _string(buf, root, 0),
+        'envelope': list(struct.unpack_from(f'<{envelope_length}d', buf, envelope_start)),
+        'columns': columns,
+        'count': count,
+        'nodeSize': node_size,
+        'indexStart': index_start,
+        'featuresStart': index_start + index_size,
+    }
+
+
+def search_rtree(content: bytes, header: Dict[str, Any], box: Box) -> List[int]:
+    """Feature offsets (relative to the feature section) of the leaves
+    intersecting a box, in file order"""
+    bounds = level_bounds(header['count'], header['nodeSize'])
+    leaf_start = bounds[0][0]
+    node_size = header['nodeSize']
+    min_x, min_y, max_x, max_y = box
+
+    found = []
+    # (first node, level): the children of an internal node are the (up to)
+    # node_size nodes from its offset on, all on the level below
+    stack = [(0, len(bounds) - 1)]
+    while stack:
+        node, level = stack.pop()
+        level_end = bounds[level][1]
+        for k in range(node, min(node + node_size, level_end)):
+            x0, y0, x1, y1, offset = NODE_ITEM.unpack_from(content, header['indexStart'] + NODE_ITEM.size * k)
+            if x1 < min_x or y1 < min_y or x0 > max_x or y0 > max_y:
+                continue
+            if k >= leaf_start:
+                found.append(offset)
+            else:
+                stack.append((offset, level - 1))
+    return sorted(found)
+
+
+def read_feature(content: bytes, header: Dict[str, Any], offset: int) -> Dict[str, Any]:
+    """Decode the feature at an offset of the feature section"""
+    start = header['featuresStart'] + offset
+    size = struct.unpack_from('<I', content, start)[0]
+    buf = content[start:start + 4 + size]
+    root = _deref(buf, 4)
+
+    geometry = _deref(buf, _field(buf, root, 0))
+    xy_start, _ = _vector(buf, geometry, 1)
+    coordinates = struct.unpack_from('<2d', buf, xy_start)
+
+    properties = {}
+    position, length = _vector(buf, root, 1)
+    end = position + length
+    while position < end:
+        index = struct.unpack_from('<H', buf, position)[0]
+        name, column_type = header['columns'][index]
+        if column_type == COLUMN_STRING:
+            data_length = struct.unpack_from('<I', buf, position + 2)[0]
+            properties[name] = buf[position + 6:position + 6 + data_length].decode('utf-8')
+            position += 6 + data_length
+        else:
+            properties[name] = struct.unpack_from('<i', buf, position + 2)[0]
+            position += 6
+    return {'coordinates': coordinates, 'properties': properties}
+
+
+def verify_flatgeobuf(content: bytes, features: List[Dict[str, Any]]):
+    """Check that the whole extent returns every feature unchanged and that
+    each feature's own point finds it
+
+    Raises ValueError on the first mismatch.
+    """
+    header = read_flatgeobuf_header(content)
+    if header['count'] != len(features):
+        raise ValueError(f"FlatGeobuf header lists {header['count']} features, expected {len(features)}")
+
+    offsets = search_rtree(content, header, (-math.inf, -math.inf, math.inf, math.inf))
+    if len(offsets) != len(features):
+        raise ValueError(f"FlatGeobuf index returns {len(offsets)} of {len(features)} features")
+    for offset, feature in zip(offsets, features):
+        decoded = read_feature(content, header, offset)
+        if decoded['properties'] != feature['properties'] or decoded['coordinates'] != tuple(feature['coordinates']):
+            raise ValueError(f"FlatGeobuf feature {feature['id']} does not round-trip")
+        if offset not in search_rtree(content, header, feature['coordinates'] * 2):
+            raise ValueError(f"FlatGeobuf index does not find feature {feature['id']} at its own point")
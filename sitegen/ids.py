@@ -0,0 +1,62 @@
+"""
+Stable dense facility indices
+
+Facility ids are sparse (92, 146, ...), so data keyed by id can only be
+reached through a hash lookup on its string form. The exported monthly
+module instead gives every facility a dense index ``x`` and stores the
+series as an array indexed by it, so a facility's series is one array
+offset away.
+
+The id <-> index mapping is persisted in src/data/facility_index.json as
+``{"v": 1, "ids": [id, ...]}`` (the position of an id is its index) and
+only ever grows: known ids keep their index across exports, new ids are
+appended in id order, and ids no longer in the data keep their slot, whose
+series is then empty.
+"""
+
+import json
+import os
+from typing import Dict, List, Any
+
+FACILITY_INDEX_VERSION = 1
+
+
+def load_facility_index(path: str) -> List[int]:
+    """Facility ids by dense index (empty when the mapping does not exist yet)"""
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r') as f:
+        index = json.load(f)
+    if index.get('v') != FACILITY_INDEX_VERSION:
+        raise ValueError(f"{path} is not a version {FACILITY_INDEX_VERSION} facility index")
+    ids = index['ids']
+    if len(set(ids)) != len(ids):
+        raise ValueError(f"{path} lists a facility id twice")
+    return ids
+
+
+def extend_facility_index(ids: List[int], monthly: Dict[str, Any]) -> List[int]:
+    """The mapping with every facility of the monthly data in it"""
+    known = set(ids)
+    new_ids = sorted({facility['i'] for facility in monthly['facilities']} - known)
+    return ids + new_ids
+
+
+def render_facility_index(ids: List[int]) -> str:
+    """JSON text of the persisted mapping"""
+    return json.dumps({'v': FACILITY_INDEX_VERSION, 'ids': ids}, separators=(',', ':')) + '\n'
+
+
+def dense_monthly(monthly: Dict[str, Any], ids: List[int]) -> Dict[str, Any]:
+    """Monthly data with a dense index ``x`` on every facility and ``data``
+    as a list of series indexed by it"""
+    positions = {facility_id: x for x, facility_id in enumerate(ids)}
+    missing = [facility['i'] for facility in monthly['facilities'] if facility['i'] not in positions]
+    if missing:
+        raise ValueError(f"Facility ids {missing} have no dense index")
+
+    facilities = [dict(facility, x=positions[facility['i']]) for facility in monthly['facilities']]
+    data: List[List[int]] = [[] for _ in ids]
+    for facility in monthly['facilities']:
+        data[positions[facility['i']]] = monthly['data'].get(str(facility['i']), [])
+    return dict(monthly, facilities=facilities, data=data)
@@ -0,0 +1,218 @@
+"""
+Append-only ingestion of one new month of facility populations
+
+A month arrives as a CSV in the facilities.csv layout (``name``,
+``address`` and ``population_count`` columns, plus an optional ``id``) or
+as a JSON snapshot shaped like facilities.json. After validation it is
+appended as one more column to each monthly dataset (the JSON files
+themselves are rewritten whole):
+
+- optimized: ``meta.m``/``meta.l`` and one more value in every series
+- ultra: ``meta.m``/``meta.l`` and ``[id, month, population]`` triplets
+  for the new month's non-zero populations, after the existing ones
+- full: ``available_months``/``latest_month`` and a ``monthly_population``
+  entry for each non-zero population
+
+Facilities are matched by id when the input has one, otherwise by
+(name, address). A month must come after the latest month already in the
+data, and every facility must already exist; adding facilities is a full
+re-export.
+
+The rebuild that follows is driven by a monthly change set (see
+sitegen/diff.py): months already in the rank tables and in monthly.bin keep
+their bytes and only the new column is computed, and only the pages of
+facilities populated in the new month are re-rendered. The embedded data
+module, the SQLite database and the geo exports hold every month per
+facility and are still regenerated.
+"""
+
+import csv
+import json
+import os
+import re
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+
+from . import config
+from .manifest import file_digest
+
+MONTH_PATTERN = re.compile(r'^\d{4}-(0[1-9]|1[0-2])$')
+
+# Stages that read the monthly data; the rest of the site does not change
+INGEST_STAGES = ['data', 'ranks', 'binary', 'sqlite', 'geo', 'pages', 'sitemap', 'compress']
+
+# Problems listed in a validation error before the rest are summarized
+MAX_REPORTED_PROBLEMS = 10
+
+
+def load_month_records(path: str) -> List[Dict[str, Any]]:
+    """Facility records of a month file (CSV or facilities.json-style JSON)"""
+    with open(path, 'r', newline='') as f:
+        if path.endswith('.json'):
+            data = json.load(f)
+            return data['facilities'] if isinstance(data, dict) else data
+        return list(csv.DictReader(f))
+
+
+def _population(value: Any) -> int:
+    """Population as a non-negative integer (blank counts as zero)"""
+    if value is None or value == '':
+        return 0
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if isinstance(value, str) and value.strip().isdigit():
+        value = int(value)
+    if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+        raise ValueError(f"invalid population {value!r}")
+    return value
+
+
+def resolve_month(monthly: Dict[str, Any], month: str, records: List[Dict[str, Any]]) -> Dict[int, int]:
+    """Validate a month against the optimized data; returns facility id -> population
+
+    Raises ValueError listing every problem found.
+    """
+    if not MONTH_PATTERN.match(month):
+        raise ValueError(f"Month {month!r} is not YYYY-MM")
+    latest = monthly['meta']['l']
+    if month in monthly['meta']['m'] or month <= latest:
+        raise ValueError(f"Month {month} is not after the latest month {latest}; only appending is supported")
+
+    ids = {facility['i'] for facility in monthly['facilities']}
+    by_key = {(facility['n'], facility['a']): facility['i'] for facility in monthly['facilities']}
+
+    populations: Dict[int, int] = {}
+    problems = []
+    for line, record in enumerate(records, start=1):
+        raw_id = record.get('id')
+        if raw_id not in (None, ''):
+            facility_id = int(raw_id) if str(raw_id).isdigit() else raw_id
+            if facility_id not in ids:
+                problems.append(f"record {line}: unknown facility id {facility_id}")
+                continue
+        else:
+            key = (record.get('name'), record.get('address'))
+            if key not in by_key:
+                problems.append(f"record {line}: unknown facility {key[0]!r} at {key[1]!r}")
+                continue
+            facility_id = by_key[key]
+        if facility_id in populations:
+            problems.append(f"record {line}: facility {facility_id} listed twice")
+            continue
+        try:
+            populations[facility_id] = _population(record.get('population_count'))
+        except ValueError as e:
+            problems.append(f"record {line}: {e}")
+
+    if problems:
+        more = len(problems) - MAX_REPORTED_PROBLEMS
+        listed = problems[:MAX_REPORTED_PROBLEMS] + ([f"... and {more} more"] if more > 0 else [])
+        raise ValueError(f"Month {month} has {len(problems)} invalid records:\n  " + '\n  '.join(listed))
+    return populations
+
+
+def append_optimized(monthly: Dict[str, Any], month: str, populations: Dict[int, int], timestamp: str):
+    """Append a month to the optimized data in place"""
+    meta = monthly['meta']
+    length = len(meta['m'])
+    for facility in monthly['facilities']:
+        series = monthly['data'].setdefault(str(facility['i']), [])
+        series.extend([0] * (length - len(series)))
+        series.append(populations.get(facility['i'], 0))
+    meta['m'].append(month)
+    meta['l'] = month
+    meta['t'] = timestamp
+
+
+def append_ultra(ultra: Dict[str, Any], month: str, populations: Dict[int, int], timestamp: str):
+    """Append a month's sparse triplets to the ultra data in place"""
+    meta = ultra['meta']
+    m = len(meta['m'])
+    ultra['data'].extend([facility['i'], m, populations[facility['i']]]
+                         for facility in ultra['facilities'] if populations.get(facility['i']))
+    meta['m'].append(month)
+    meta['l'] = month
+    meta['t'] = timestamp
+
+
+def append_full(full: Dict[str, Any], month: str, populations: Dict[int, int], timestamp: str):
+    """Append a month to the full monthly data in place"""
+    metadata = full['metadata']
+    for facility in full['facilities']:
+        if populations.get(facility['id']):
+            facility['monthly_population'][month] = populations[facility['id']]
+    metadata['available_months'].append(month)
+    metadata['latest_month'] = month
+    metadata['exported_at'] = timestamp
+
+
+# dataset path -> (append function, json.dumps options matching the committed file)
+DATASETS: List[Tuple[str, Any, Dict[str, Any]]] = [
+    (config.MONTHLY_OPTIMIZED_JSON, append_optimized, {'separators': (',', ':')}),
+    (config.MONTHLY_ULTRA_JSON, append_ultra, {'separators': (',', ':')}),
+    (config.MONTHLY_JSON, append_full, {'indent': 2}),
+]
+
+
+def write_json(path: str, data: Dict[str, Any], options: Dict[str, Any]):
+    """Write JSON to a temporary sibling and rename it into place"""
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    with open(tmp_path, 'w') as f:
+        f.write(json.dumps(data, **options))
+    os.replace(tmp_path, path)
+
+
+def month_changes(monthly: Dict[str, Any], month: str, populations: Dict[int, int], base: str) -> Dict[str, Any]:
+    """Monthly change set of appending a month to data with digest ``base``
+
+    Earlier months keep their ranks, so only facilities populated in the new
+    month gain a rank history entry.
+    """
+    from .diff import CHANGESET_VERSION
+
+    return {
+        'v': CHANGESET_VERSION,
+        'kind': 'monthly',
+        'base': base,
+        'months_added': [month],
+        'months_removed': [],
+        'added': [],
+        'removed': [],
+        'moved': [],
+        'changed': {},
+        'keys': [[facility['n'], facility['a']] for facility in monthly['facilities']
+                 if populations.get(facility['i'])],
+    }
+
+
+def ingest_month(month: str, records: List[Dict[str, Any]],
+                 check_only: bool = False) -> Tuple[Dict[int, int], Optional[Dict[str, Any]]]:
+    """Validate a month and append it to every monthly dataset that exists
+
+    All datasets are loaded and appended in memory before any is written, so
+    a failure leaves the files untouched. Returns facility id -> population
+    and the change set of the append (None when only checking).
+    """
+    base = file_digest(config.MONTHLY_OPTIMIZED_JSON)
+    with open(config.MONTHLY_OPTIMIZED_JSON, 'r') as f:
+        optimized = json.load(f)
+    populations = resolve_month(optimized, month, records)
+    if check_only:
+        return populations, None
+
+    timestamp = datetime.now().isoformat()
+    updated = []
+    for path, append, options in DATASETS:
+        if path == config.MONTHLY_OPTIMIZED_JSON:
+            data = optimized
+        elif os.path.exists(path):
+            with open(path, 'r') as f:
+                data = json.load(f)
+        else:
+            continue
+        append(data, month, populations, timestamp)
+        updated.append((path, data, options))
+
+    for path, data, options in updated:
+        write_json(path, data, options)
+    return populations, month_changes(optimized, month, populations, base)
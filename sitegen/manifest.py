@@ -0,0 +1,97 @@
+"""
+Build manifest: records which inputs produced each output so that
+incremental builds (``--since``) can skip outputs that are up to date
+"""
+
+import hashlib
+import json
+import os
+from datetime import date
+from typing import Dict, Any, Optional
+
+MANIFEST_VERSION = 2
+
+
+def content_digest(data: bytes) -> str:
+    """Short stable digest of raw bytes"""
+    return short_digest(hashlib.sha256(data))
+
+
+def short_digest(digest: Any) -> str:
+    """Short form of a running sha256, for content hashed in pieces"""
+    return digest.hexdigest()[:16]
+
+
+def record_digest(*parts: Any) -> str:
+    """Digest of JSON-serializable inputs (records, settings, other digests)"""
+    return content_digest(json.dumps(parts, sort_keys=True, separators=(',', ':')).encode('utf-8'))
+
+
+def file_digest(path: str) -> str:
+    """Digest of a file's contents (read in chunks, so any size is fine)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return short_digest(digest)
+
+
+def template_digest() -> str:
+    """Digest of the page templates, so template edits invalidate pages"""
+    return file_digest(os.path.join(os.path.dirname(__file__), 'pages.py'))
+
+
+def new_manifest() -> Dict[str, Any]:
+    """Create an empty manifest"""
+    return {'version': MANIFEST_VERSION, 'outputs': {}, 'stages': {}}
+
+
+def load_manifest(path: Optional[str]) -> Dict[str, Any]:
+    """Load a manifest, or start an empty one if missing or from another version"""
+    if not path or not os.path.exists(path):
+        return new_manifest()
+    with open(path, 'r') as f:
+        manifest = json.load(f)
+    if manifest.get('version') != MANIFEST_VERSION:
+        return new_manifest()
+    manifest.setdefault('stages', {})
+    return manifest
+
+
+def save_manifest(path: str, manifest: Dict[str, Any]):
+    """Write a manifest next to the build outputs"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def is_stale(manifest: Dict[str, Any], output: str, inputs: str) -> bool:
+    """Whether an output must be rebuilt for the given inputs digest"""
+    entry = manifest['outputs'].get(output)
+    if entry is None or entry.get('inputs') != inputs:
+        return True
+    return not os.path.exists(output)
+
+
+def record_output(manifest: Dict[str, Any], output: str, inputs: str, content: bytes = b'',
+                  digest: Optional[str] = None):
+    """Remember the inputs and content hash of a freshly written output
+    (pass ``digest`` for content that was hashed while streaming)
+
+    ``lastmod`` only moves forward when the content actually changed, so the
+    sitemap does not claim every page was modified on every build.
+    """
+    digest = digest or content_digest(content)
+    previous = manifest['outputs'].get(output, {})
+    lastmod = previous.get('lastmod') if previous.get('hash') == digest else None
+    manifest['outputs'][output] = {
+        'inputs': inputs,
+        'hash': digest,
+        'lastmod': lastmod or date.today().isoformat(),
+    }
+
+
+def output_lastmod(manifest: Dict[str, Any], output: str) -> str:
+    """Date an output last changed (today if it is unknown)"""
+    return manifest['outputs'].get(output, {}).get('lastmod') or date.today().isoformat()
@@ -1,40 +1,90 @@
-#!/usr/bin/env python3
 """
-Generate static HTML pages for ICE detention facilities to improve SEO
+HTML templates for the static facility pages
 """
 
+import calendar
 import json
-import os
-from datetime import datetime
-from typing import Dict, List, Any
-
-# Fix the f-string syntax by properly escaping braces
-def escape_fstring_braces(text):
-    """Escape braces in text for f-string compatibility"""
-    return text.replace('{', '{{').replace('}', '}}')
-
-def load_facilities_data() -> Dict[str, Any]:
-    """Load facilities data from JSON file"""
-    with open('src/data/facilities.json', 'r') as f:
-        return json.load(f)
-
-def create_facilities_directory():
-    """Create facilities directory if it doesn't exist"""
-    os.makedirs('public/facilities', exist_ok=True)
-
-def generate_facility_page(facility: Dict[str, Any], index: int) -> str:
-    """Generate HTML page for a single facility"""
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+
+from .data import facility_city
+
+# Months of rank history shown on a facility page
+RANK_HISTORY_MONTHS = 12
+
+
+def _month_label(month: str) -> str:
+    """'2025-09' -> 'Sep 2025'"""
+    year, number = month.split('-')
+    return f"{calendar.month_abbr[int(number)]} {year}"
+
+
+def _rank_history_section(rank_history: List[Tuple[str, int, int]]) -> str:
+    """Table of the facility's rank and percentile over recent months"""
+    if not rank_history:
+        return ''
+    rows = ''.join(
+        f"<tr><td>{_month_label(month)}</td><td>#{rank}</td><td>{pct / 100:.1f}%</td></tr>"
+        for month, rank, pct in reversed(rank_history[-RANK_HISTORY_MONTHS:])
+    )
+    return f"""
+    <h2>Rank Over Time</h2>
+    <table class="rank-history">
+        <thead><tr><th>Month</th><th>Rank</th><th>Percentile</th></tr></thead>
+        <tbody>{rows}</tbody>
+    </table>
+"""
+
+
+def _json_ld(facility: Dict[str, Any]) -> str:
+    """Schema.org markup of a facility, safe to embed in a <script> element"""
+    markup = {
+        '@context': 'https://schema.org',
+        '@type': 'GovernmentBuilding',
+        'name': facility['name'],
+        'description': 'ICE immigration detention facility',
+        'address': {
+            '@type': 'PostalAddress',
+            'streetAddress': facility['address'],
+            'addressLocality': facility_city(facility['address']),
+            'addressRegion': facility['state'],
+            'addressCountry': 'US'
+        },
+        'geo': {
+            '@type': 'GeoCoordinates',
+            'latitude': facility['latitude'],
+            'longitude': facility['longitude']
+        },
+        'containedInPlace': {
+            '@type': 'State',
+            'name': facility['state']
+        },
+        'additionalProperty': {
+            '@type': 'PropertyValue',
+            'name': 'Detainee Population',
+            'value': str(facility['population_count'])
+        }
+    }
+    # "</" would end the script element early
+    text = json.dumps(markup, indent=4, ensure_ascii=False).replace('</', '<\\/')
+    return text.replace('\n', '\n    ')
+
+
+def generate_facility_page(facility: Dict[str, Any],
+                           rank_history: Optional[List[Tuple[str, int, int]]] = None) -> str:
+    """Generate HTML page for a single facility table record and its
+    precomputed (month, rank, pct) history"""
     name = facility['name']
     address = facility['address']
     population = facility['population_count']
     lat = facility['latitude']
     lng = facility['longitude']
-
-    # Create URL-friendly name
-    url_name = name.lower().replace(' ', '-').replace('/', '-').replace(',', '').replace('(', '').replace(')', '')
-
-    # Generate state from address
-    state = address.split(', ')[-2] if ', ' in address else 'Unknown'
+    url_name = facility['slug']
+    state = facility['state']
+    rank = facility['rank']
+    rank_label = 'Facility Rank'
+    if rank_history:
+        latest_month, rank, _ = rank_history[-1]
+        rank_label = f"Facility Rank ({_month_label(latest_month)})"
 
     html = f"""<!DOCTYPE html>
 <html lang="en">
@@ -42,7 +92,7 @@ def generate_facility_page(facility: Dict[str, Any], index: int) -> str:
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{name} - ICE Detention Facility | Population & Location</title>
-    <meta name="description" content="{name} is an ICE detention facility located in {address} with a population of {population:,","detainees. Get detailed information about this immigration detention center.">
+    <meta name="description" content="{name} is an ICE detention facility located in {address} with a population of {population:,} detainees. Get detailed information about this immigration detention center.">
     <meta name="keywords" content="{name}, ICE detention, immigration detention center, {state}, detention facility, population {population}">
 
     <!-- Open Graph -->
@@ -59,33 +109,7 @@ def generate_facility_page(facility: Dict[str, Any], index: int) -> str:
 
     <!-- Schema.org markup -->
     <script type="application/ld+json">
-    {json.dumps({
-        "@context": "https://schema.org",
-        "@type": "GovernmentBuilding",
-        "name": name,
-        "description": "ICE immigration detention facility",
-        "address": {
-            "@type": "PostalAddress",
-            "streetAddress": address,
-            "addressLocality": address.split(', ')[0] if ', ' in address else address,
-            "addressRegion": state,
-            "addressCountry": "US"
-        },
-        "geo": {
-            "@type": "GeoCoordinates",
-            "latitude": lat,
-            "longitude": lng
-        },
-        "containedInPlace": {
-            "@type": "State",
-            "name": state
-        },
-        "additionalProperty": {
-            "@type": "PropertyValue",
-            "name": "Detainee Population",
-            "value": str(population)
-        }
-    })}
+    {_json_ld(facility)}
     </script>
 
     <style>
@@ -146,6 +170,15 @@ def generate_facility_page(facility: Dict[str, Any], index: int) -> str:
             background: #3b82f6;
             color: white;
         }}
+        .rank-history {{
+            width: 100%;
+            border-collapse: collapse;
+        }}
+        .rank-history th, .rank-history td {{
+            text-align: left;
+            padding: 0.4rem 0.75rem;
+            border-bottom: 1px solid #e2e8f0;
+        }}
     </style>
 </head>
 <body>
@@ -159,7 +192,7 @@ def generate_facility_page(facility: Dict[str, Any], index: int) -> str:
 
     <div class="stats">
         <div class="stat-card">
-            <div class="stat-number">{population:,","</div>
+            <div class="stat-number">{population:,}</div>
             <div class="stat-label">Current Population</div>
         </div>
         <div class="stat-card">
@@ -167,8 +200,8 @@ def generate_facility_page(facility: Dict[str, Any], index: int) -> str:
             <div class="stat-label">State</div>
         </div>
         <div class="stat-card">
-            <div class="stat-number">#{index + 1}</div>
-            <div class="stat-label">Facility Rank</div>
+            <div class="stat-number">#{rank}</div>
+            <div class="stat-label">{rank_label}</div>
         </div>
     </div>
 
@@ -179,7 +212,7 @@ def generate_facility_page(facility: Dict[str, Any], index: int) -> str:
         <p><strong>Coordinates:</strong> {lat}, {lng}</p>
         <p><strong>State:</strong> {state}</p>
     </div>
-
+{_rank_history_section(rank_history or [])}
     <h2>Interactive Map</h2>
     <div class="map-container">
         <iframe
@@ -193,7 +226,7 @@ def generate_facility_page(facility: Dict[str, Any], index: int) -> str:
     </div>
 
     <h2>About This Facility</h2>
-    <p>{name} is an Immigration and Customs Enforcement (ICE) detention facility located in {address}. This facility is part of the U.S. immigration detention system and currently holds {population:,","detainees.</p>
+    <p>{name} is an Immigration and Customs Enforcement (ICE) detention facility located in {address}. This facility is part of the U.S. immigration detention system and currently holds {population:,} detainees.</p>
 
     <p>The facility provides detention services for individuals awaiting immigration proceedings or deportation. ICE detention facilities are operated by private contractors or local governments under contract with the federal government.</p>
 
@@ -217,122 +250,115 @@ def generate_facility_page(facility: Dict[str, Any], index: int) -> str:
 
     return html
 
-def generate_facilities_index_page(facilities: List[Dict[str, Any]]) -> str:
-    """Generate the main facilities index page"""
-    # Sort facilities by population (descending)
-    sorted_facilities = sorted(facilities, key=lambda x: x['population_count'], reverse=True)
-
-    # Get statistics
-    total_facilities = len(facilities)
-    total_population = sum(f['population_count'] for f in facilities)
-    avg_population = total_population / total_facilities
-
-    # Group by state
-    states = {}
-    for facility in facilities:
-        state = facility['address'].split(', ')[-2] if ', ' in facility['address'] else 'Unknown'
-        if state not in states:
-            states[state] = []
-        states[state].append(facility)
-
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>ICE Detention Facilities Directory | Complete List & Statistics</title>
-    <meta name="description" content="Complete directory of {total_facilities} ICE detention facilities across the United States. Find locations, population data, and statistics for immigration detention centers.">
-    <meta name="keywords" content="ICE facilities, detention centers, immigration detention, facility directory, population statistics">
-
-    <!-- Open Graph -->
-    <meta property="og:type" content="website">
-    <meta property="og:title" content="ICE Detention Facilities Directory">
-    <meta property="og:description" content="Complete directory of ICE detention facilities with locations and population data.">
-    <meta property="og:url" content="https://ice-locator-mcp.vercel.app/facilities/index.html">
 
-    <style>
-        body {{
+DIRECTORY_STYLE = """    <style>
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             line-height: 1.6;
             color: #333;
             max-width: 1200px;
             margin: 0 auto;
             padding: 20px;
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(135deg, #1e40af, #3b82f6);
             color: white;
             padding: 2rem;
             border-radius: 8px;
             margin-bottom: 2rem;
             text-align: center;
-        }}
-        .stats {{
+        }
+        .stats {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 1rem;
             margin: 2rem 0;
-        }}
-        .stat-card {{
+        }
+        .stat-card {
             background: #f8fafc;
             padding: 1.5rem;
             border-radius: 8px;
             border-left: 4px solid #3b82f6;
             text-align: center;
-        }}
-        .stat-number {{
+        }
+        .stat-number {
             font-size: 2.5rem;
             font-weight: bold;
             color: #1e40af;
-        }}
-        .stat-label {{
+        }
+        .stat-label {
             color: #64748b;
             font-size: 0.9rem;
             margin-top: 0.5rem;
-        }}
-        .facilities-grid {{
+        }
+        .facilities-grid {
             display: grid;
             grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
             gap: 1rem;
             margin: 2rem 0;
-        }}
-        .facility-card {{
+        }
+        .facility-card {
             background: white;
             border: 1px solid #e2e8f0;
             border-radius: 8px;
             padding: 1.5rem;
             transition: box-shadow 0.2s;
-        }}
-        .facility-card:hover {{
+        }
+        .facility-card:hover {
             box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
-        }}
-        .facility-name {{
+        }
+        .facility-name {
             font-size: 1.2rem;
             font-weight: 600;
             color: #1e40af;
             margin-bottom: 0.5rem;
-        }}
-        .facility-location {{
+        }
+        .facility-location {
             color: #64748b;
             margin-bottom: 1rem;
-        }}
-        .facility-population {{
+        }
+        .facility-population {
             font-size: 1.5rem;
             font-weight: bold;
             color: #dc2626;
-        }}
-        .state-section {{
-            margin-bottom: 2rem;
-        }}
-        .state-header {{
+        }
+        .state-list {
+            display: grid;
+            grid-template-columns: repeat(auto-fill, minmax(180px, 1fr));
+            gap: 0.75rem;
+            margin: 2rem 0;
+            padding: 0;
+            list-style: none;
+        }
+        .state-list a {
+            display: block;
             background: #f1f5f9;
-            padding: 1rem;
+            padding: 0.75rem 1rem;
             border-radius: 8px;
-            margin-bottom: 1rem;
-            font-weight: 600;
             color: #334155;
-        }}
-        .back-link {{
+            text-decoration: none;
+        }
+        .state-list a:hover {
+            background: #e2e8f0;
+        }
+        .pagination {
+            display: flex;
+            flex-wrap: wrap;
+            gap: 0.5rem;
+            margin: 2rem 0;
+        }
+        .pagination a, .pagination span {
+            padding: 0.5rem 1rem;
+            border: 1px solid #e2e8f0;
+            border-radius: 4px;
+            color: #3b82f6;
+            text-decoration: none;
+        }
+        .pagination .current {
+            background: #3b82f6;
+            color: white;
+        }
+        .back-link {
             display: inline-block;
             margin-bottom: 2rem;
             color: #3b82f6;
@@ -340,14 +366,111 @@ def generate_facilities_index_page(facilities: List[Dict[str, Any]]) -> str:
             padding: 0.5rem 1rem;
             border: 1px solid #3b82f6;
             border-radius: 4px;
-        }}
-        .back-link:hover {{
+        }
+        .back-link:hover {
             background: #3b82f6;
             color: white;
-        }}
+        }
     </style>
-</head>
-<body>
+"""
+
+
+def _directory_head(title: str, description: str, url_path: str) -> str:
+    """Document head shared by the directory, state and paginated pages"""
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <meta name="description" content="{description}">
+    <meta name="keywords" content="ICE facilities, detention centers, immigration detention, facility directory, population statistics">
+
+    <!-- Open Graph -->
+    <meta property="og:type" content="website">
+    <meta property="og:title" content="{title}">
+    <meta property="og:description" content="{description}">
+    <meta property="og:url" content="https://ice-locator-mcp.vercel.app{url_path}">
+
+{DIRECTORY_STYLE}</head>
+<body>"""
+
+
+def _directory_footer() -> str:
+    """Closing section shared by the directory pages"""
+    return """
+    <h2>About This Directory</h2>
+    <p>This directory contains information about all ICE detention facilities currently in operation across the United States. Data includes facility locations, population counts, and operational details.</p>
+
+    <p>Information is sourced from <a href="https://tracreports.org/" target="_blank">TRAC Reports</a> and updated regularly to provide the most current information available.</p>
+
+    <footer style="margin-top: 3rem; padding-top: 2rem; border-top: 1px solid #e2e8f0; color: #64748b; text-align: center;">
+        <p>&copy; 2025 ICE Facility Locator. Data transparency for immigration detention.</p>
+    </footer>
+</body>
+</html>"""
+
+
+def _facility_card(facility: Dict[str, Any], link_prefix: str = '') -> str:
+    """Card linking to a facility page"""
+    return f"""
+            <div class="facility-card">
+                <div class="facility-name">{facility['name']}</div>
+                <div class="facility-location">{facility['address']}</div>
+                <div class="facility-population">{facility['population_count']:,} detainees</div>
+                <a href="{link_prefix}{facility['slug']}.html" style="color: #3b82f6; text-decoration: none; font-size: 0.9rem;">View Details →</a>
+            </div>"""
+
+
+def _pagination(page: int, page_count: int, href_prefix: str = '', window: int = 2) -> str:
+    """Links to the 1-based directory pages (page 0: none is current)
+
+    Only the first and last pages and a window around the current page are
+    linked, so the navigation stays the same size however many pages exist.
+    """
+    center = max(page, 1)
+    numbers = sorted({1, page_count} | set(range(max(1, center - window), min(page_count, center + window) + 1)))
+
+    links = []
+    if page > 1:
+        links.append(f'<a href="{href_prefix}{page - 1}.html" rel="prev">← Previous</a>')
+    for i, number in enumerate(numbers):
+        if i and number - numbers[i - 1] > 1:
+            links.append('<span>…</span>')
+        if number == page:
+            links.append(f'<span class="current">{number}</span>')
+        else:
+            links.append(f'<a href="{href_prefix}{number}.html">{number}</a>')
+    if 0 < page < page_count:
+        links.append(f'<a href="{href_prefix}{page + 1}.html" rel="next">Next →</a>')
+    return f"""
+    <nav class="pagination">
+        {' '.join(links)}
+    </nav>"""
+
+
+def state_page_name(state: str) -> str:
+    """File name of a state's directory page"""
+    return f"{state.lower()}.html"
+
+
+def generate_facilities_index_page(aggregates: Dict[str, Any], page_count: int) -> str:
+    """Generate the top-level facilities directory
+
+    Only totals and links to the state and paginated pages, so its size
+    does not grow with the number of facilities.
+    """
+    total_facilities = aggregates['total_facilities']
+    total_population = aggregates['total_population']
+    avg_population = aggregates['avg_population']
+
+    parts = [_directory_head(
+        'ICE Detention Facilities Directory | Complete List & Statistics',
+        f'Complete directory of {total_facilities} ICE detention facilities across the United States. '
+        'Find locations, population data, and statistics for immigration detention centers.',
+        '/facilities/index.html',
+    )]
+    parts.append(f"""
     <a href="../index.html" class="back-link">← Back to Home</a>
 
     <div class="header">
@@ -361,80 +484,107 @@ def generate_facilities_index_page(facilities: List[Dict[str, Any]]) -> str:
             <div class="stat-label">Total Facilities</div>
         </div>
         <div class="stat-card">
-            <div class="stat-number">{total_population:,","</div>
+            <div class="stat-number">{total_population:,}</div>
             <div class="stat-label">Total Population</div>
         </div>
         <div class="stat-card">
-            <div class="stat-number">{avg_population".1f"}</div>
+            <div class="stat-number">{avg_population:.1f}</div>
             <div class="stat-label">Average per Facility</div>
         </div>
     </div>
 
-    <h2>Facilities by State</h2>"""
+    <h2>Facilities by State</h2>
+    <ul class="state-list">""")
 
-    # Add state sections
-    for state in sorted(states.keys()):
-        facilities_in_state = states[state]
-        html += f"""
-    <div class="state-section">
-        <div class="state-header">
-            {state} ({len(facilities_in_state)} facilities)
-        </div>
-        <div class="facilities-grid">"""
+    for state in sorted(aggregates['states']):
+        summary = aggregates['states'][state]
+        parts.append(f"""
+        <li><a href="state/{state_page_name(state)}"><strong>{state}</strong> · {summary['count']} facilities · {summary['population']:,} detainees</a></li>""")
+
+    parts.append("""
+    </ul>
 
-        for facility in sorted(facilities_in_state, key=lambda x: x['population_count'], reverse=True):
-            name = facility['name']
-            address = facility['address']
-            population = facility['population_count']
-            url_name = name.lower().replace(' ', '-').replace('/', '-').replace(',', '').replace('(', '').replace(')', '')
+    <h2>All Facilities by Population</h2>""")
+    parts.append(_pagination(0, page_count, href_prefix='page/'))
+    parts.append(_directory_footer())
 
-            html += f"""
-            <div class="facility-card">
-                <div class="facility-name">{name}</div>
-                <div class="facility-location">{address}</div>
-                <div class="facility-population">{population:,","detainees</div>
-                <a href="{url_name}.html" style="color: #3b82f6; text-decoration: none; font-size: 0.9rem;">View Details →</a>
-            </div>"""
+    return ''.join(parts)
 
-        html += """
-        </div>
+
+def generate_state_page(state: str, facilities_in_state: List[Dict[str, Any]],
+                        summary: Dict[str, Any]) -> Iterator[str]:
+    """Yield the directory page for one state, chunk by chunk"""
+    yield _directory_head(
+        f'ICE Detention Facilities in {state} | Facility Directory',
+        f"{summary['count']} ICE detention facilities in {state} holding {summary['population']:,} detainees.",
+        f'/facilities/state/{state_page_name(state)}',
+    )
+    yield f"""
+    <a href="../index.html" class="back-link">← All States</a>
+
+    <div class="header">
+        <h1>ICE Detention Facilities in {state}</h1>
+        <p>{summary['count']} facilities · {summary['population']:,} detainees</p>
+    </div>
+
+    <div class="facilities-grid">"""
+
+    for facility in facilities_in_state:
+        yield _facility_card(facility, link_prefix='../')
+
+    yield """
     </div>"""
+    yield _directory_footer()
+
+
+def generate_directory_page(facilities_on_page: List[Dict[str, Any]], page: int, page_count: int,
+                            total_facilities: int) -> Iterator[str]:
+    """Yield one fixed-size page of the population-ordered directory (an
+    empty table still gets its single, empty page)"""
+    if facilities_on_page:
+        first = facilities_on_page[0]['rank']
+        last = facilities_on_page[-1]['rank']
+        title = f'ICE Detention Facilities {first}–{last} of {total_facilities} | Facility Directory'
+        description = (f'ICE detention facilities ranked {first} to {last} by population, '
+                       f'out of {total_facilities} facilities.')
+        summary = f'Facilities {first}–{last} of {total_facilities}'
+    else:
+        title = 'ICE Detention Facilities | Facility Directory'
+        description = 'No ICE detention facilities are listed.'
+        summary = 'No facilities listed'
+
+    yield _directory_head(title, description, f'/facilities/page/{page}.html')
+    yield f"""
+    <a href="../index.html" class="back-link">← Directory</a>
 
-    html += """
-    <h2>About This Directory</h2>
-    <p>This directory contains information about all ICE detention facilities currently in operation across the United States. Data includes facility locations, population counts, and operational details.</p>
+    <div class="header">
+        <h1>ICE Detention Facilities by Population</h1>
+        <p>{summary}</p>
+    </div>"""
+    yield _pagination(page, page_count)
+    yield """
+    <div class="facilities-grid">"""
 
-    <p>Information is sourced from <a href="https://tracreports.org/" target="_blank">TRAC Reports</a> and updated regularly to provide the most current information available.</p>
+    for facility in facilities_on_page:
+        yield _facility_card(facility, link_prefix='../')
 
-    <footer style="margin-top: 3rem; padding-top: 2rem; border-top: 1px solid #e2e8f0; color: #64748b; text-align: center;">
-        <p>&copy; 2025 ICE Facility Locator. Data transparency for immigration detention.</p>
-    </footer>
-</body>
-</html>"""
+    yield """
+    </div>"""
+    yield _pagination(page, page_count)
+    yield _directory_footer()
 
-    return html
 
-def generate_statistics_page(facilities: List[Dict[str, Any]]) -> str:
+def generate_statistics_page(table: List[Dict[str, Any]], aggregates: Dict[str, Any]) -> str:
     """Generate a statistics page with data analysis"""
-    # Calculate statistics
-    total_facilities = len(facilities)
-    total_population = sum(f['population_count'] for f in facilities)
-    avg_population = total_population / total_facilities
-
-    # Group by state
-    states = {}
-    for facility in facilities:
-        state = facility['address'].split(', ')[-2] if ', ' in facility['address'] else 'Unknown'
-        if state not in states:
-            states[state] = {'count': 0, 'population': 0}
-        states[state]['count'] += 1
-        states[state]['population'] += facility['population_count']
+    total_facilities = aggregates['total_facilities']
+    total_population = aggregates['total_population']
+    avg_population = aggregates['avg_population']
 
     # Sort states by population
-    sorted_states = sorted(states.items(), key=lambda x: x[1]['population'], reverse=True)
+    sorted_states = sorted(aggregates['states'].items(), key=lambda x: x[1]['population'], reverse=True)
 
     # Top facilities
-    top_facilities = sorted(facilities, key=lambda x: x['population_count'], reverse=True)[:10]
+    top_facilities = table[:10]
 
     html = f"""<!DOCTYPE html>
 <html lang="en">
@@ -531,11 +681,11 @@ def generate_statistics_page(facilities: List[Dict[str, Any]]) -> str:
             <div>Total Facilities</div>
         </div>
         <div class="stat-card">
-            <div class="stat-number">{total_population:,","</div>
+            <div class="stat-number">{total_population:,}</div>
             <div>Total Population</div>
         </div>
         <div class="stat-card">
-            <div class="stat-number">{avg_population".1f"}</div>
+            <div class="stat-number">{avg_population:.1f}</div>
             <div>Average per Facility</div>
         </div>
     </div>
@@ -557,8 +707,8 @@ def generate_statistics_page(facilities: List[Dict[str, Any]]) -> str:
             <tr>
                 <td>{state}</td>
                 <td>{data['count']}</td>
-                <td>{data['population']:,","</td>
-                <td>{data['population']/data['count']".1f"}</td>
+                <td>{data['population']:,}</td>
+                <td>{data['population'] / data['count']:.1f}</td>
             </tr>"""
 
     html += """
@@ -577,18 +727,18 @@ def generate_statistics_page(facilities: List[Dict[str, Any]]) -> str:
         </thead>
         <tbody>"""
 
-    for i, facility in enumerate(top_facilities):
+    for facility in top_facilities:
         name = facility['name']
-        state = facility['address'].split(', ')[-2] if ', ' in facility['address'] else 'Unknown'
+        state = facility['state']
         population = facility['population_count']
-        url_name = name.lower().replace(' ', '-').replace('/', '-').replace(',', '').replace('(', '').replace(')', '')
+        url_name = facility['slug']
 
         html += f"""
             <tr>
-                <td>{i + 1}</td>
+                <td>{facility['rank']}</td>
                 <td><a href="{url_name}.html">{name}</a></td>
                 <td>{state}</td>
-                <td>{population:,","</td>
+                <td>{population:,}</td>
             </tr>"""
 
     html += """
@@ -605,45 +755,3 @@ def generate_statistics_page(facilities: List[Dict[str, Any]]) -> str:
 </html>"""
 
     return html
-
-def main():
-    """Main function to generate all static pages"""
-    print("Loading facilities data...")
-    data = load_facilities_data()
-    facilities = data['facilities']
-
-    print(f"Found {len(facilities)} facilities")
-
-    # Create facilities directory
-    create_facilities_directory()
-
-    # Generate facilities index page
-    print("Generating facilities index page...")
-    index_html = generate_facilities_index_page(facilities)
-    with open('public/facilities/index.html', 'w') as f:
-        f.write(index_html)
-
-    # Generate statistics page
-    print("Generating statistics page...")
-    stats_html = generate_statistics_page(facilities)
-    with open('public/facilities/statistics.html', 'w') as f:
-        f.write(stats_html)
-
-    # Generate individual facility pages (top 30 by population)
-    print("Generating individual facility pages...")
-    sorted_facilities = sorted(facilities, key=lambda x: x['population_count'], reverse=True)[:30]
-
-    for i, facility in enumerate(sorted_facilities):
-        print(f"  Generating page for {facility['name']}...")
-        facility_html = generate_facility_page(facility, i)
-        url_name = facility['name'].lower().replace(' ', '-').replace('/', '-').replace(',', '').replace('(', '').replace(')', '')
-        with open(f'public/facilities/{url_name}.html', 'w') as f:
-            f.write(facility_html)
-
-    print("✅ Static pages generated successfully!")
-    print("  - Facilities index: public/facilities/index.html")
-    print("  - Statistics page: public/facilities/statistics.html")
-    print(f"  - Individual pages: {len(sorted_facilities)} facility pages")
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
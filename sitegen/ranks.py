@@ -0,0 +1,140 @@
+"""
+Per-month rank and percentile tables for the monthly facility data
+
+Ranks are computed once at build time so neither the facility pages nor the
+map's time slider have to sort populations at runtime. Every table is a flat,
+month-major uint16 array (entry ``month * facility_count + facility``) where
+``facility`` is the position in the monthly data's facility list:
+
+- ``order``: facility positions sorted by population, largest first
+- ``rank``: 1-based competition rank (ties share a rank); 0 when empty
+- ``pct``: share of that month's populated facilities ranked at or below
+  this one, in basis points (10000 = the largest); 0 when empty
+
+The arrays are shipped little-endian and base64 encoded in a generated
+TypeScript module that src/utils/monthRanks.ts decodes. A month's tables
+depend on that month alone, so appending months only ranks the new ones.
+"""
+
+import base64
+import json
+import sys
+from array import array
+from typing import Dict, List, Any, Tuple
+
+RANKS_VERSION = 1
+
+UINT16_MAX = 0xFFFF
+
+
+def compute_month_ranks(monthly: Dict[str, Any], start: int = 0) -> Dict[str, Any]:
+    """Rank every facility in every month of the optimized monthly data (from month ``start`` on)"""
+    months = monthly['meta']['m'][start:]
+    ids = [facility['i'] for facility in monthly['facilities']]
+    facility_count = len(ids)
+    month_count = len(months)
+    if facility_count > UINT16_MAX:
+        raise ValueError(f"{facility_count} facilities do not fit in uint16 rank tables")
+
+    # Facility x month matrix flattened month-major
+    populations = [0] * (month_count * facility_count)
+    for f, facility_id in enumerate(ids):
+        series = monthly['data'].get(str(facility_id), [])
+        for m, population in enumerate(series[start:start + month_count]):
+            populations[m * facility_count + f] = population or 0
+
+    # One argsort over the whole matrix: by month, then population descending.
+    # The sort is stable, so ties keep facility-list order.
+    flat_order = sorted(range(len(populations)), key=lambda k: (k // facility_count, -populations[k]))
+
+    order = array('H', bytes(2 * len(populations)))
+    rank = array('H', bytes(2 * len(populations)))
+    pct = array('H', bytes(2 * len(populations)))
+    for m in range(month_count):
+        base = m * facility_count
+        month_order = flat_order[base:base + facility_count]
+        populated = sum(1 for k in month_order if populations[k] > 0)
+
+        previous, current_rank = None, 0
+        for position, k in enumerate(month_order):
+            order[base + position] = k - base
+            if position >= populated:
+                continue
+            if populations[k] != previous:
+                current_rank, previous = position + 1, populations[k]
+            rank[k] = current_rank
+            pct[k] = round(10000 * (populated - current_rank + 1) / populated)
+
+    return {'v': RANKS_VERSION, 'months': months, 'ids': ids, 'order': order, 'rank': rank, 'pct': pct}
+
+
+def append_month_ranks(ranks: Dict[str, Any], monthly: Dict[str, Any]) -> Dict[str, Any]:
+    """Extend rank tables with the months the monthly data has after theirs"""
+    ids = [facility['i'] for facility in monthly['facilities']]
+    known = len(ranks['months'])
+    if ranks['v'] != RANKS_VERSION or ranks['ids'] != ids or monthly['meta']['m'][:known] != ranks['months']:
+        raise ValueError("Rank tables are not from an earlier version of the monthly data")
+    added = compute_month_ranks(monthly, start=known)
+    return {'v': RANKS_VERSION, 'months': ranks['months'] + added['months'], 'ids': ids,
+            'order': ranks['order'] + added['order'], 'rank': ranks['rank'] + added['rank'],
+            'pct': ranks['pct'] + added['pct']}
+
+
+def encode_uint16(values: array) -> str:
+    """Little-endian uint16 array -> base64"""
+    if sys.byteorder == 'big':
+        values = array('H', values)
+        values.byteswap()
+    return base64.b64encode(values.tobytes()).decode('ascii')
+
+
+def decode_uint16(encoded: str) -> array:
+    """base64 -> little-endian uint16 array"""
+    values = array('H', base64.b64decode(encoded))
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def rank_histories(ranks: Dict[str, Any], monthly: Dict[str, Any]) -> Dict[Tuple[str, str], List[Tuple[str, int, int]]]:
+    """(name, address) -> [(month, rank, pct)] for every month a facility held detainees"""
+    facility_count = len(ranks['ids'])
+    histories = {}
+    for f, facility in enumerate(monthly['facilities']):
+        history = []
+        for m, month in enumerate(ranks['months']):
+            rank = ranks['rank'][m * facility_count + f]
+            if rank:
+                history.append((month, rank, ranks['pct'][m * facility_count + f]))
+        histories[(facility['n'], facility['a'])] = history
+    return histories
+
+
+RANKS_TS_DECLARATION = "export const monthlyRanks: MonthRankData =\n"
+
+
+def render_ranks_ts_module(ranks: Dict[str, Any]) -> str:
+    """TypeScript module embedding the rank tables"""
+    payload = {
+        'v': ranks['v'],
+        'm': ranks['months'],
+        'ids': ranks['ids'],
+        'order': encode_uint16(ranks['order']),
+        'rank': encode_uint16(ranks['rank']),
+        'pct': encode_uint16(ranks['pct']),
+    }
+    return (
+        "// Generated by `python3 -m sitegen ranks` from facilities_monthly_optimized.json; do not edit\n"
+        "import type { MonthRankData } from '../utils/monthRanks';\n\n"
+        f"{RANKS_TS_DECLARATION}{json.dumps(payload, separators=(',', ':'))};\n"
+    )
+
+
+def parse_ranks_ts_module(text: str) -> Dict[str, Any]:
+    """Rank tables back from a module written by render_ranks_ts_module"""
+    _, found, payload = text.partition(RANKS_TS_DECLARATION)
+    if not found:
+        raise ValueError("Not a generated rank table module")
+    payload = json.loads(payload.rstrip().rstrip(';'))
+    return {'v': payload['v'], 'months': payload['m'], 'ids': payload['ids'], 'order': decode_uint16(payload['order']),
+            'rank': decode_uint16(payload['rank']), 'pct': decode_uint16(payload['pct'])}
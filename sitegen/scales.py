@@ -0,0 +1,48 @@
+"""
+Per-month color-scale domains and population histograms
+
+Computed once at export time from the month-major layout so the map can set
+its color domain for a month without scanning every facility. Each month
+gets:
+
+- ``n``: facilities with a non-zero population
+- ``min`` / ``max``: smallest and largest non-zero population
+- ``q``: quantile breakpoints splitting the month into COLOR_STEPS classes
+  (nearest-rank, so every break is an actual population)
+- ``h``: log2-binned histogram; bin ``k`` counts populations in
+  ``[2**k, 2**(k + 1))`` and every month has the same number of bins
+"""
+
+from typing import Dict, List, Any
+
+# Classes of the heatmap color range (COLOR_RANGE in DeckGlHeatmap.tsx)
+COLOR_STEPS = 9
+
+
+def _quantile_breaks(values: List[int], steps: int) -> List[int]:
+    """Nearest-rank breakpoints between ``steps`` equal-count classes of sorted values"""
+    if not values:
+        return []
+    return [values[min(len(values) - 1, (len(values) * k) // steps)] for k in range(1, steps)]
+
+
+def month_scales(csr: Dict[str, List[int]], steps: int = COLOR_STEPS) -> List[Dict[str, Any]]:
+    """Scale summary for every month of a month-major CSR layout (see series.month_csr)"""
+    offsets, populations = csr['o'], csr['p']
+    bins = max((population.bit_length() for population in populations), default=0)
+
+    scales = []
+    for m in range(len(offsets) - 1):
+        values = sorted(populations[offsets[m]:offsets[m + 1]])
+        histogram = [0] * bins
+        for value in values:
+            if value > 0:
+                histogram[value.bit_length() - 1] += 1
+        scales.append({
+            'n': len(values),
+            'min': values[0] if values else 0,
+            'max': values[-1] if values else 0,
+            'q': _quantile_breaks(values, steps),
+            'h': histogram,
+        })
+    return scales
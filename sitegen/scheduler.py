@@ -0,0 +1,163 @@
+"""
+Dependency-graph scheduler for build stages
+
+Stages declare the artifacts they consume and produce; a stage depends on
+every stage that produces one of its inputs. Inputs that no stage produces
+are treated as source files and fingerprinted by content. Independent
+stages run concurrently on a thread pool, and with a manifest a stage whose
+fingerprint (its source files, options plus its dependencies' fingerprints)
+is unchanged and whose recorded outputs all still exist is skipped.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, List, Optional
+
+from .manifest import file_digest, record_digest
+
+
+class Stage:
+    """One node of the build graph"""
+
+    def __init__(self, name: str, run: Callable[[Any], None], inputs: List[str] = (),
+                 outputs: List[str] = (), params: Any = None):
+        self.name = name
+        self.run = run
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        # Options that change what the stage produces (e.g. --only) are part of its fingerprint
+        self.params = params
+
+    def __repr__(self) -> str:
+        return f"Stage({self.name!r})"
+
+
+class Scheduler:
+    """Runs a set of stages in dependency order on a worker pool"""
+
+    def __init__(self, stages: List[Stage]):
+        self.stages = {stage.name: stage for stage in stages}
+        producers = {}
+        for stage in stages:
+            for artifact in stage.outputs:
+                if artifact in producers:
+                    raise ValueError(f"Artifact {artifact!r} produced by both {producers[artifact]} and {stage.name}")
+                producers[artifact] = stage.name
+        self.deps: Dict[str, List[str]] = {
+            stage.name: sorted({producers[a] for a in stage.inputs if a in producers}) for stage in stages
+        }
+        self.sources: Dict[str, List[str]] = {
+            stage.name: [a for a in stage.inputs if a not in producers] for stage in stages
+        }
+        self.durations: Dict[str, float] = {}
+        self.skipped: List[str] = []
+        self._check_acyclic()
+
+    def _check_acyclic(self):
+        """Reject dependency cycles up front"""
+        state: Dict[str, int] = {}
+
+        def visit(name: str, path: List[str]):
+            if state.get(name) == 1:
+                raise ValueError(f"Dependency cycle: {' -> '.join(path + [name])}")
+            if state.get(name) == 2:
+                return
+            state[name] = 1
+            for dep in self.deps[name]:
+                visit(dep, path + [name])
+            state[name] = 2
+
+        for name in self.stages:
+            visit(name, [])
+
+    def closure(self, targets: List[str]) -> List[str]:
+        """Targets plus everything they (transitively) depend on"""
+        needed = set()
+        pending = list(targets)
+        while pending:
+            name = pending.pop()
+            if name not in self.stages:
+                raise ValueError(f"Unknown stage: {name}")
+            if name not in needed:
+                needed.add(name)
+                pending.extend(self.deps[name])
+        return [name for name in self.stages if name in needed]
+
+    def _fingerprint(self, name: str, fingerprints: Dict[str, str]) -> str:
+        """Fingerprint of a stage's source files and upstream fingerprints"""
+        sources = [(path, file_digest(path) if os.path.exists(path) else None) for path in self.sources[name]]
+        upstream = [fingerprints[dep] for dep in self.deps[name]]
+        return record_digest(name, self.stages[name].params, sources, upstream)
+
+    @staticmethod
+    def _up_to_date(entry: Optional[Dict[str, Any]], fingerprint: str) -> bool:
+        """Whether a recorded stage run matches a fingerprint and left every output in place"""
+        return (entry is not None and entry['fingerprint'] == fingerprint
+                and all(os.path.exists(path) for path in entry['outputs']))
+
+    def run(self, ctx: Any, targets: Optional[List[str]] = None, jobs: Optional[int] = None) -> float:
+        """Run targets (default: every stage) and their dependencies
+
+        Returns the wall time in milliseconds.
+        """
+        names = self.closure(targets or list(self.stages))
+        remaining = {name: set(self.deps[name]) for name in names}
+        recorded = ctx.manifest.setdefault('stages', {})
+        fingerprints: Dict[str, str] = {}
+        lock = threading.Lock()
+        self.durations = {}
+        self.skipped = []
+
+        def execute(name: str) -> List[str]:
+            start = time.perf_counter()
+            outputs = ctx.run_stage(self.stages[name].run)
+            with lock:
+                self.durations[name] = (time.perf_counter() - start) * 1000
+            return outputs
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+            running = {}
+
+            def submit_ready():
+                ready = [n for n, deps in remaining.items() if not deps]
+                while ready:
+                    name = ready.pop(0)
+                    del remaining[name]
+                    fingerprints[name] = self._fingerprint(name, fingerprints)
+                    if ctx.incremental and self._up_to_date(recorded.get(name), fingerprints[name]):
+                        # Nothing upstream changed and nothing was deleted: treat as already done
+                        self.skipped.append(name)
+                        finish(name)
+                        ready = [n for n, deps in remaining.items() if not deps]
+                    else:
+                        running[pool.submit(execute, name)] = name
+
+            def finish(name: str):
+                for deps in remaining.values():
+                    deps.discard(name)
+
+            submit_ready()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    recorded[name] = {'fingerprint': fingerprints[name], 'outputs': future.result()}
+                    finish(name)
+                submit_ready()
+
+        return (time.perf_counter() - start) * 1000
+
+    def critical_path(self) -> float:
+        """Longest dependency chain of the last run, in milliseconds"""
+        longest: Dict[str, float] = {}
+
+        def length(name: str) -> float:
+            if name not in longest:
+                upstream = [length(dep) for dep in self.deps[name] if dep in self.durations or dep in self.skipped]
+                longest[name] = self.durations.get(name, 0.0) + max(upstream, default=0.0)
+            return longest[name]
+
+        return max((length(name) for name in self.durations), default=0.0)
@@ -0,0 +1,68 @@
+"""
+Build-time search index over facility names, cities and states
+
+Every token is indexed by its 2-character prefix gram (" a") and by the
+trigrams of the token padded with a leading space (" ad", "ade", ...), so a
+query token only has to match the start of a word. Posting lists hold
+document numbers in facility-table order (population, descending) and are
+stored delta-encoded; src/utils/searchIndex.ts decodes them once and
+intersects the lists for each keystroke. Only facilities with a page of
+their own carry a slug to link to; the rest have an empty one.
+"""
+
+import re
+from typing import Dict, List, Any
+
+from . import config
+from .data import facility_city
+
+SEARCH_INDEX_VERSION = 1
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def token_grams(token: str) -> List[str]:
+    """Grams a token is indexed under (must mirror queryGrams in searchIndex.ts)"""
+    padded = ' ' + token
+    grams = [padded[:2]]
+    grams.extend(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def delta_encode(values: List[int]) -> List[int]:
+    """Sorted integers -> first value followed by gaps"""
+    previous = 0
+    deltas = []
+    for value in values:
+        deltas.append(value - previous)
+        previous = value
+    return deltas
+
+
+def build_search_index(table: List[Dict[str, Any]], page_limit: int = config.TOP_FACILITY_PAGES) -> Dict[str, Any]:
+    """Build the search index document for the facility table (the first
+    ``page_limit`` facilities have pages)"""
+    postings: Dict[str, List[int]] = {}
+    docs = []
+
+    for doc_id, facility in enumerate(table):
+        city = facility_city(facility['address'])
+        docs.append([facility['name'], city, facility['state'], facility['slug'] if doc_id < page_limit else ''])
+
+        grams = set()
+        for token in tokenize(f"{facility['name']} {city} {facility['state']}"):
+            grams.update(token_grams(token))
+        for gram in grams:
+            # doc_id only increases, so every list stays sorted
+            postings.setdefault(gram, []).append(doc_id)
+
+    return {
+        'v': SEARCH_INDEX_VERSION,
+        'docs': docs,
+        'grams': {gram: delta_encode(ids) for gram, ids in sorted(postings.items())},
+    }
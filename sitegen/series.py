@@ -0,0 +1,172 @@
+"""
+Compact codec for the per-facility monthly population series
+
+Populations change slowly from month to month, so each series is stored as
+its first value followed by month-to-month deltas. Deltas are zig-zag
+mapped to unsigned integers and written as LEB128 varints (one byte for
+any change within +/-63), and trailing zero deltas are dropped because the
+decoder repeats the last value to the series length. Each facility's bytes
+are base64 encoded into one string; a facility that never held anyone
+encodes to ''.
+
+The export also carries a month-major compressed sparse (CSR) copy of the
+non-zero populations so the frontend can pull one month as a contiguous
+slice. decodeMonthlyData and getMonthCsr in src/utils/monthlyDataUtils.ts
+are the matching decoders.
+"""
+
+import base64
+from typing import Dict, List, Any, Optional
+
+# meta.e value identifying encoded series in the optimized monthly format
+DELTA_ENCODING = 'zz-delta-varint'
+ENCODED_VERSION = 2
+
+
+def zigzag(n: int) -> int:
+    """Signed -> unsigned: 0, -1, 1, -2, ... -> 0, 1, 2, 3, ..."""
+    return n * 2 if n >= 0 else -n * 2 - 1
+
+
+def unzigzag(n: int) -> int:
+    """Inverse of zigzag"""
+    return n >> 1 if not n & 1 else -((n + 1) >> 1)
+
+
+def encode_varint(n: int, out: bytearray):
+    """Append an unsigned LEB128 varint"""
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def encode_series(values: List[int]) -> str:
+    """Monthly values -> base64 of zig-zag varint deltas"""
+    deltas = []
+    previous = 0
+    for value in values:
+        deltas.append(value - previous)
+        previous = value
+    while deltas and deltas[-1] == 0:
+        deltas.pop()
+
+    out = bytearray()
+    for delta in deltas:
+        encode_varint(zigzag(delta), out)
+    return base64.b64encode(bytes(out)).decode('ascii')
+
+
+def decode_varints(blob: str) -> List[int]:
+    """base64 of LEB128 varints -> unsigned integers"""
+    values = []
+    shift = accumulator = 0
+    for byte in base64.b64decode(blob):
+        accumulator |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        values.append(accumulator)
+        accumulator = shift = 0
+    return values
+
+
+def decode_series(blob: str, length: int) -> List[int]:
+    """base64 zig-zag varint deltas -> ``length`` monthly values"""
+    values = []
+    value = 0
+    for delta in decode_varints(blob):
+        value += unzigzag(delta)
+        values.append(value)
+    if len(values) > length:
+        raise ValueError(f"Encoded series has {len(values)} values, expected at most {length}")
+    values.extend([value] * (length - len(values)))
+    return values
+
+
+def month_csr(monthly: Dict[str, Any]) -> Dict[str, List[int]]:
+    """Month-major compressed sparse rows of the non-zero populations
+
+    Entries for month ``m`` are ``f[o[m]:o[m + 1]]`` (facility positions in
+    ``monthly['facilities']``, ascending) and ``p[o[m]:o[m + 1]]`` (populations).
+    """
+    month_count = len(monthly['meta']['m'])
+    if isinstance(monthly['data'], list):
+        series = [monthly['data'][facility['x']] for facility in monthly['facilities']]
+    else:
+        series = [monthly['data'].get(str(facility['i']), []) for facility in monthly['facilities']]
+
+    offsets, positions, populations = [0], [], []
+    for m in range(month_count):
+        for position, values in enumerate(series):
+            if m < len(values) and values[m]:
+                positions.append(position)
+                populations.append(values[m])
+        offsets.append(len(positions))
+    return {'o': offsets, 'f': positions, 'p': populations}
+
+
+def encode_csr(csr: Dict[str, List[int]]) -> Dict[str, Any]:
+    """Varint-pack the CSR columns: facility positions as gaps within each
+    month, populations zig-zag mapped"""
+    offsets = csr['o']
+    gaps = bytearray()
+    for m in range(len(offsets) - 1):
+        previous = 0
+        for position in csr['f'][offsets[m]:offsets[m + 1]]:
+            encode_varint(position - previous, gaps)
+            previous = position
+    populations = bytearray()
+    for population in csr['p']:
+        encode_varint(zigzag(population), populations)
+    return {
+        'o': offsets,
+        'f': base64.b64encode(bytes(gaps)).decode('ascii'),
+        'p': base64.b64encode(bytes(populations)).decode('ascii'),
+    }
+
+
+def decode_csr(encoded: Dict[str, Any]) -> Dict[str, List[int]]:
+    """Inverse of encode_csr"""
+    offsets = encoded['o']
+    gaps = decode_varints(encoded['f'])
+    positions = []
+    for m in range(len(offsets) - 1):
+        position = 0
+        for gap in gaps[offsets[m]:offsets[m + 1]]:
+            position += gap
+            positions.append(position)
+    return {'o': offsets, 'f': positions, 'p': [unzigzag(value) for value in decode_varints(encoded['p'])]}
+
+
+def encode_monthly(monthly: Dict[str, Any], csr: Optional[Dict[str, List[int]]] = None) -> Dict[str, Any]:
+    """Optimized monthly data with every series delta encoded, plus the
+    packed month-major layout (computed unless given)
+
+    ``data`` may be keyed by facility id or, as in the exported module, a
+    list indexed by dense facility index; it keeps its shape.
+    """
+    meta = dict(monthly['meta'], v=ENCODED_VERSION, e=DELTA_ENCODING)
+    if isinstance(monthly['data'], list):
+        data: Any = [encode_series(series) for series in monthly['data']]
+    else:
+        data = {facility_id: encode_series(series) for facility_id, series in monthly['data'].items()}
+    if csr is None:
+        csr = month_csr(monthly)
+    return {'meta': meta, 'facilities': monthly['facilities'], 'data': data, 'csr': encode_csr(csr)}
+
+
+def decode_monthly(encoded: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of encode_monthly (plain data passes through unchanged; the
+    derived month-major layout is dropped)"""
+    meta = encoded['meta']
+    if meta.get('e') != DELTA_ENCODING:
+        return encoded
+    length = len(meta['m'])
+    meta = {key: value for key, value in meta.items() if key != 'e'}
+    meta['v'] = 1
+    if isinstance(encoded['data'], list):
+        data: Any = [decode_series(blob, length) for blob in encoded['data']]
+    else:
+        data = {facility_id: decode_series(blob, length) for facility_id, blob in encoded['data'].items()}
+    return {'meta': meta, 'facilities': encoded['facilities'], 'data': data}
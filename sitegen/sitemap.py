@@ -0,0 +1,47 @@
+"""
+XML sitemap generation
+"""
+
+from typing import List, Tuple
+
+from .config import SITE_URL
+
+# (path, changefreq, priority) for pages that are not facility pages
+STATIC_ENTRIES = [
+    ('/', 'daily', '1.0'),
+    ('/facilities/', 'weekly', '0.9'),
+    ('/facilities/index.html', 'weekly', '0.9'),
+    ('/facilities/statistics.html', 'weekly', '0.8'),
+    ('/facilities.csv', 'weekly', '0.8'),
+    ('/og-image.html', 'monthly', '0.3'),
+]
+
+
+def sitemap_entries(facility_slugs: List[str], directory_paths: List[str] = ()) -> List[Tuple[str, str, str]]:
+    """All sitemap entries: static pages, directory pages, then facility pages"""
+    entries = list(STATIC_ENTRIES)
+    for path in directory_paths:
+        entries.append((path, 'weekly', '0.7'))
+    for slug in facility_slugs:
+        entries.append((f'/facilities/{slug}.html', 'monthly', '0.8'))
+    return entries
+
+
+def generate_sitemap(entries: List[Tuple[str, str, str, str]]) -> str:
+    """Generate sitemap XML for (path, changefreq, priority, lastmod) entries"""
+    xml = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">"""
+
+    for path, changefreq, priority, lastmod in entries:
+        xml += f"""
+  <url>
+    <loc>{SITE_URL}{path}</loc>
+    <lastmod>{lastmod}</lastmod>
+    <changefreq>{changefreq}</changefreq>
+    <priority>{priority}</priority>
+  </url>"""
+
+    xml += """
+</urlset>
+"""
+    return xml
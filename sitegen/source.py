@@ -0,0 +1,239 @@
+"""
+Streaming ingestion of a raw TRAC source snapshot
+
+The raw snapshot is long-format, one row per facility and month, as CSV or
+NDJSON (one JSON object per line) with the columns of SOURCE_COLUMNS plus
+an optional ``id``. Rows are read one at a time and folded into a sparse
+facility x month accumulator, so memory grows with the number of
+facilities and non-zero observations, never with the file.
+
+From that single pass every source dataset is produced: the facilities.json
+snapshot (each facility's population in the latest month it reported) and
+the full, optimized and ultra monthly files. The build stages that export
+facilities.csv, the TypeScript modules and the binary monthly file then run
+on the same in-memory data instead of re-reading anything.
+
+Facilities are identified by ``id`` when the source has one, otherwise by
+(name, address), and get ids in order of first appearance; include the id
+column to keep ids stable across snapshots. Either every row has an id or
+none does: generated ids could collide with explicit ones. The first row
+of a facility supplies its name, address and coordinates; a row without a
+month lists a facility that has no monthly data.
+"""
+
+import csv
+import json
+import math
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
+
+from . import config
+from .ingest import DATASETS, MONTH_PATTERN, write_json
+
+SOURCE_COLUMNS = ('name', 'address', 'latitude', 'longitude', 'month', 'population')
+
+# Exports derived from the datasets, run on the in-memory data
+SOURCE_STAGES = ['data', 'ranks', 'binary', 'sqlite', 'geo']
+
+SNAPSHOT_DESCRIPTION = 'ICE Detention Facilities - Population Data'
+MONTHLY_DESCRIPTION = 'ICE Detention Facilities - Monthly Population Data (Historical)'
+OPTIMIZED_DESCRIPTION = 'ICE Detention Facilities - Optimized Monthly Data'
+ULTRA_DESCRIPTION = 'ICE Detention Facilities - Ultra-Optimized Monthly Data'
+
+
+def iter_source_rows(path: str) -> Iterator[Dict[str, Any]]:
+    """Raw rows of a CSV or NDJSON snapshot, one at a time"""
+    with open(path, 'r', newline='') as f:
+        if path.endswith(('.ndjson', '.jsonl')):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(f)
+
+
+def normalize_row(row: Dict[str, Any], line: int) -> Dict[str, Any]:
+    """Typed, trimmed copy of a raw row; raises ValueError naming the row"""
+    missing = [column for column in SOURCE_COLUMNS if row.get(column) in (None, '')
+               and column not in ('month', 'population')]
+    if missing:
+        raise ValueError(f"Source row {line}: missing {', '.join(missing)}")
+    try:
+        latitude = float(row['latitude'])
+        longitude = float(row['longitude'])
+        population = int(float(row.get('population') or 0))
+        facility_id = int(row['id']) if row.get('id') not in (None, '') else None
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Source row {line}: {e}") from None
+
+    month = str(row.get('month') or '').strip() or None
+    if month is not None and not MONTH_PATTERN.match(month):
+        raise ValueError(f"Source row {line}: month {month!r} is not YYYY-MM")
+    if not (math.isfinite(latitude) and math.isfinite(longitude)
+            and -90 <= latitude <= 90 and -180 <= longitude <= 180):
+        raise ValueError(f"Source row {line}: coordinates {latitude}, {longitude} out of range")
+    if population < 0:
+        raise ValueError(f"Source row {line}: negative population {population}")
+
+    return {
+        'id': facility_id,
+        'name': str(row['name']).strip(),
+        'address': str(row['address']).strip(),
+        'latitude': latitude,
+        'longitude': longitude,
+        'month': month,
+        'population': population,
+    }
+
+
+class SourceAccumulator:
+    """Sparse facility x month populations folded from normalized rows"""
+
+    def __init__(self):
+        self.facilities: List[Dict[str, Any]] = []
+        self._keys: Dict[Union[int, Tuple[str, str]], Dict[str, Any]] = {}
+        self.populations: Dict[int, Dict[str, int]] = {}
+        self.months: set = set()
+        self.rows = 0
+        # Whether rows carry ids, fixed by the first row
+        self._with_ids: Optional[bool] = None
+
+    def add(self, row: Dict[str, Any], line: int):
+        """Fold one normalized row in; a facility may report each month once"""
+        with_id = row['id'] is not None
+        if self._with_ids is None:
+            self._with_ids = with_id
+        elif with_id != self._with_ids:
+            raise ValueError(f"Source row {line}: {'has an' if with_id else 'has no'} id, unlike the rows before it; "
+                             "give every row an id or none")
+        key = row['id'] if row['id'] is not None else (row['name'], row['address'])
+        facility = self._keys.get(key)
+        if facility is None:
+            facility_id = row['id'] if row['id'] is not None else len(self.facilities) + 1
+            facility = {column: row[column] for column in ('name', 'latitude', 'longitude', 'address')}
+            facility['id'] = facility_id
+            self._keys[key] = facility
+            self.facilities.append(facility)
+            self.populations[facility_id] = {}
+
+        self.rows += 1
+        if row['month'] is None:
+            return
+        series = self.populations[facility['id']]
+        if row['month'] in series:
+            raise ValueError(f"Source row {line}: {facility['name']} reported {row['month']} twice")
+        series[row['month']] = row['population']
+        self.months.add(row['month'])
+
+    def sorted_months(self) -> List[str]:
+        return sorted(self.months)
+
+    def snapshot(self, timestamp: str) -> Dict[str, Any]:
+        """facilities.json: each facility at its latest reported month, largest first"""
+        facilities = []
+        for facility in self.facilities:
+            series = self.populations[facility['id']]
+            latest: Optional[str] = max(series) if series else None
+            facilities.append({
+                'name': facility['name'],
+                'latitude': facility['latitude'],
+                'longitude': facility['longitude'],
+                'address': facility['address'],
+                'population_count': series[latest] if latest else 0,
+            })
+        facilities.sort(key=lambda facility: facility['population_count'], reverse=True)
+        return {
+            'metadata': {
+                'exported_at': timestamp,
+                'total_facilities': len(facilities),
+                'total_population': sum(facility['population_count'] for facility in facilities),
+                'description': SNAPSHOT_DESCRIPTION,
+            },
+            'facilities': facilities,
+        }
+
+    def _by_name(self) -> List[Dict[str, Any]]:
+        return sorted(self.facilities, key=lambda facility: facility['name'])
+
+    def monthly_full(self, timestamp: str) -> Dict[str, Any]:
+        """facilities_monthly.json: non-zero populations keyed by month"""
+        months = self.sorted_months()
+        return {
+            'metadata': {
+                'exported_at': timestamp,
+                'total_facilities': len(self.facilities),
+                'available_months': months,
+                'latest_month': months[-1],
+                'description': MONTHLY_DESCRIPTION,
+            },
+            'facilities': [{
+                'id': facility['id'],
+                'name': facility['name'],
+                'latitude': facility['latitude'],
+                'longitude': facility['longitude'],
+                'address': facility['address'],
+                'monthly_population': {month: population for month, population
+                                       in sorted(self.populations[facility['id']].items()) if population},
+            } for facility in self._by_name()],
+        }
+
+    def _meta(self, version: int, timestamp: str, description: str) -> Dict[str, Any]:
+        months = self.sorted_months()
+        return {'v': version, 't': timestamp, 'f': len(self.facilities), 'm': months, 'l': months[-1],
+                'd': description}
+
+    @staticmethod
+    def _compact(facility: Dict[str, Any]) -> Dict[str, Any]:
+        return {'i': facility['id'], 'n': facility['name'], 'lat': facility['latitude'],
+                'lng': facility['longitude'], 'a': facility['address']}
+
+    def monthly_optimized(self, timestamp: str) -> Dict[str, Any]:
+        """facilities_monthly_optimized.json: one dense series per facility"""
+        months = self.sorted_months()
+        facilities = self._by_name()
+        return {
+            'meta': self._meta(1, timestamp, OPTIMIZED_DESCRIPTION),
+            'facilities': [self._compact(facility) for facility in facilities],
+            'data': {str(facility['id']): [self.populations[facility['id']].get(month, 0) for month in months]
+                     for facility in facilities},
+        }
+
+    def monthly_ultra(self, timestamp: str) -> Dict[str, Any]:
+        """facilities_monthly_ultra.json: sparse [id, month, population] triplets"""
+        months = self.sorted_months()
+        facilities = sorted(self.facilities, key=lambda facility: facility['id'])
+        return {
+            'meta': self._meta(2, timestamp, ULTRA_DESCRIPTION),
+            'facilities': [self._compact(facility) for facility in facilities],
+            'data': [[facility['id'], m, self.populations[facility['id']][month]]
+                     for facility in facilities for m, month in enumerate(months)
+                     if self.populations[facility['id']].get(month)],
+        }
+
+
+def read_source(path: str) -> SourceAccumulator:
+    """Fold a raw snapshot into an accumulator in one streaming pass"""
+    accumulator = SourceAccumulator()
+    for line, row in enumerate(iter_source_rows(path), start=1):
+        accumulator.add(normalize_row(row, line), line)
+    if not accumulator.months:
+        raise ValueError(f"Source {path} has no rows")
+    return accumulator
+
+
+def source_datasets(accumulator: SourceAccumulator, timestamp: str,
+                    snapshot_path: str = config.FACILITIES_JSON) -> List[Tuple[str, Dict[str, Any], Dict[str, Any]]]:
+    """(path, data, json.dumps options) of every source dataset"""
+    builders = {
+        config.MONTHLY_OPTIMIZED_JSON: accumulator.monthly_optimized,
+        config.MONTHLY_ULTRA_JSON: accumulator.monthly_ultra,
+        config.MONTHLY_JSON: accumulator.monthly_full,
+    }
+    datasets = [(snapshot_path, accumulator.snapshot(timestamp), {'indent': 2})]
+    datasets += [(path, builders[path](timestamp), options) for path, _, options in DATASETS]
+    return datasets
+
+
+def write_source_datasets(datasets: List[Tuple[str, Dict[str, Any], Dict[str, Any]]]):
+    """Write every dataset (each atomically)"""
+    for path, data, options in datasets:
+        write_json(path, data, options)
@@ -0,0 +1,119 @@
+"""
+Space-filling-curve ordering of facilities
+
+Facilities are projected to Web Mercator, quantized to a 2**CURVE_BITS grid
+and sorted along a Hilbert or Z-order curve, so facilities that are close
+on the map are close in every exported array. Both curves visit each
+quadtree cell in one contiguous run, which gives a cheap coarse index: for
+the map tiles at TILE_ZOOM, the table ``[x, y, start, end, ...]`` lists the
+index range ``[start, end)`` of the facilities inside each non-empty tile.
+"""
+
+import math
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+CURVE_BITS = 16
+TILE_ZOOM = 6
+
+# Web Mercator is undefined at the poles
+MAX_LATITUDE = 85.05112878
+
+
+def mercator_cell(lng: float, lat: float, bits: int = CURVE_BITS) -> Tuple[int, int]:
+    """Grid cell of a coordinate on a 2**bits x 2**bits Web Mercator grid"""
+    size = 1 << bits
+    lat = max(-MAX_LATITUDE, min(MAX_LATITUDE, lat))
+    x = (lng + 180.0) / 360.0
+    sin_lat = math.sin(math.radians(lat))
+    y = 0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)
+    return (min(size - 1, max(0, int(x * size))), min(size - 1, max(0, int(y * size))))
+
+
+def hilbert_index(x: int, y: int, bits: int = CURVE_BITS) -> int:
+    """Distance of cell (x, y) along the Hilbert curve"""
+    n = 1 << bits
+    d = 0
+    s = n >> 1
+    while s:
+        rx = 1 if x & s else 0
+        ry = 1 if y & s else 0
+        d += s * s * ((3 * rx) ^ ry)
+        # Rotate the quadrant so the curve stays continuous
+        if not ry:
+            if rx:
+                x, y = n - 1 - x, n - 1 - y
+            x, y = y, x
+        s >>= 1
+    return d
+
+
+def zorder_index(x: int, y: int, bits: int = CURVE_BITS) -> int:
+    """Morton code of cell (x, y): interleaved bits, x in the low bit"""
+    d = 0
+    for bit in range(bits):
+        d |= ((x >> bit) & 1) << (2 * bit) | ((y >> bit) & 1) << (2 * bit + 1)
+    return d
+
+
+CURVES: Dict[str, Callable[[int, int, int], int]] = {'hilbert': hilbert_index, 'zorder': zorder_index}
+
+
+def spatial_sort(items: List[Any], coordinates: Callable[[Any], Tuple[float, float]],
+                 curve: str) -> List[Any]:
+    """Items ordered along the curve; ties keep their original order"""
+    index = CURVES[curve]
+
+    def key(item: Any) -> int:
+        x, y = mercator_cell(*coordinates(item))
+        return index(x, y, CURVE_BITS)
+
+    return sorted(items, key=key)
+
+
+def tile_ranges(items: List[Any], coordinates: Callable[[Any], Tuple[float, float]],
+                zoom: int = TILE_ZOOM) -> List[int]:
+    """Flat ``[x, y, start, end, ...]`` table of the runs of curve-ordered
+    items falling in each zoom-level tile"""
+    table: List[int] = []
+    current: Optional[Tuple[int, int]] = None
+    for position, item in enumerate(items):
+        tile = mercator_cell(*coordinates(item), bits=zoom)
+        if tile != current:
+            if current is not None:
+                table.append(position)
+            table.extend([tile[0], tile[1], position])
+            current = tile
+    if current is not None:
+        table.append(len(items))
+    return table
+
+
+def _monthly_coordinates(facility: Dict[str, Any]) -> Tuple[float, float]:
+    return facility['lng'], facility['lat']
+
+
+def _table_coordinates(facility: Dict[str, Any]) -> Tuple[float, float]:
+    return facility['longitude'], facility['latitude']
+
+
+def order_monthly(monthly: Dict[str, Any], curve: str) -> Dict[str, Any]:
+    """Monthly data with facilities in curve order; meta.o names the curve and
+    meta.g holds the tile table (positions index ``facilities``, ids are kept)"""
+    if curve == 'source':
+        return monthly
+    facilities = spatial_sort(monthly['facilities'], _monthly_coordinates, curve)
+    grid = {'z': TILE_ZOOM, 't': tile_ranges(facilities, _monthly_coordinates)}
+    meta = dict(monthly['meta'], o=curve, g=grid)
+    return dict(monthly, meta=meta, facilities=facilities)
+
+
+def order_table(table: List[Dict[str, Any]], curve: str) -> List[Dict[str, Any]]:
+    """Facility table rows in curve order (unchanged for 'source')"""
+    if curve == 'source':
+        return table
+    return spatial_sort(table, _table_coordinates, curve)
+
+
+def table_tile_ranges(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Tile table for curve-ordered facility table rows"""
+    return {'z': TILE_ZOOM, 't': tile_ranges(rows, _table_coordinates)}
@@ -0,0 +1,571 @@
+"""
+Build stages. Each stage imports its rendering module lazily so that a
+single-stage invocation only pays for what it actually renders.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional
+
+from . import config
+from .data import build_facility_table, compute_aggregates, load_facility_records, top_facility_table
+from .manifest import (
+    load_manifest, save_manifest, is_stale, record_output, record_digest, content_digest,
+    file_digest, template_digest, output_lastmod, short_digest,
+)
+from .scheduler import Stage
+from .writer import OutputWriter
+
+TEMPLATES_PATH = os.path.join(os.path.dirname(__file__), 'pages.py')
+
+
+class BuildContext:
+    """Inputs, output location and manifest shared by the stages of one run"""
+
+    def __init__(self, data_path: str = config.FACILITIES_JSON, out_dir: str = config.OUTPUT_DIR,
+                 manifest_path: Optional[str] = None, incremental: bool = False,
+                 writer: Optional[OutputWriter] = None, monthly_path: str = config.MONTHLY_OPTIMIZED_JSON,
+                 facility_order: str = config.FACILITY_ORDER, changes: Optional[Dict[str, Any]] = None,
+                 cache: bool = True, stream: bool = False):
+        self.data_path = data_path
+        self.monthly_path = monthly_path
+        self.facility_order = facility_order
+        # Change set from sitegen/diff.py: outputs it does not touch are kept as they are
+        self.changes = changes
+        # Reuse parsed sources from the on-disk cache (see sitegen/cache.py)
+        self.cache = cache
+        # Stream the snapshot record by record where a stage allows it (very large snapshots)
+        self.stream = stream
+        self.out_dir = out_dir
+        self.manifest_path = manifest_path
+        self.manifest = load_manifest(manifest_path)
+        # An in-memory manifest is enough for incremental rebuilds within one process
+        self.incremental = incremental or manifest_path is not None
+        self.writer = writer or OutputWriter()
+        self.written: List[str] = []
+        self.skipped = 0
+        # Stages may run concurrently on the scheduler's worker pool
+        self._lock = threading.Lock()
+        # Outputs of the stage running on each worker thread (see run_stage)
+        self._stage = threading.local()
+        # Sources are parsed once even when several stages ask at the same time
+        # (reentrant: month_ranks loads monthly)
+        self._load_lock = threading.RLock()
+        self._table: Optional[List[Dict[str, Any]]] = None
+        self._aggregates: Optional[Dict[str, Any]] = None
+        self._table_digest: Optional[str] = None
+        self._template_digest: Optional[str] = None
+        self._monthly: Optional[Dict[str, Any]] = None
+        self._monthly_preloaded = False
+        self._monthly_digest: Optional[str] = None
+        self._month_ranks: Optional[Dict[str, Any]] = None
+        self._rank_histories: Optional[Dict[Any, List[Any]]] = None
+
+    def _load_table(self):
+        """Facility table and its digest, from the cache when the source is unchanged"""
+        from .cache import load_cached
+
+        def build():
+            table = build_facility_table(load_facility_records(self.data_path))
+            return table, record_digest(table)
+
+        self._table, self._table_digest = load_cached(self.data_path, 'table', build, enabled=self.cache)
+
+    @property
+    def table(self) -> List[Dict[str, Any]]:
+        """Normalized facility table, loaded on first use"""
+        with self._load_lock:
+            if self._table is None:
+                self._load_table()
+        return self._table
+
+    @property
+    def table_digest(self) -> str:
+        """Digest of the whole facility table, for outputs that list every facility"""
+        with self._load_lock:
+            if self._table_digest is None:
+                if self._table is None:
+                    self._load_table()
+                else:
+                    self._table_digest = record_digest(self._table)
+        return self._table_digest
+
+    def top_table(self, limit: int) -> List[Dict[str, Any]]:
+        """The first ``limit`` table rows; when streaming and the table is not
+        loaded, read from the snapshot holding only ``limit`` records"""
+        if self._table is not None or not self.stream:
+            return self.table[:limit]
+        return top_facility_table(load_facility_records(self.data_path), limit)
+
+    @property
+    def aggregates(self) -> Dict[str, Any]:
+        """Totals and per-state breakdown, computed on first use"""
+        with self._load_lock:
+            if self._aggregates is None:
+                self._aggregates = compute_aggregates(self.table)
+        return self._aggregates
+
+    @property
+    def template_digest(self) -> str:
+        """Digest of the page templates, computed on first use"""
+        if self._template_digest is None:
+            self._template_digest = template_digest()
+        return self._template_digest
+
+    @property
+    def monthly(self) -> Dict[str, Any]:
+        """Optimized monthly data in export order, loaded on first use"""
+        with self._load_lock:
+            if self._monthly is None:
+                from .cache import load_cached
+                from .spatial import order_monthly
+
+                def build():
+                    with open(self.monthly_path, 'r') as f:
+                        return order_monthly(json.load(f), self.facility_order)
+
+                self._monthly = load_cached(self.monthly_path, f'monthly-{self.facility_order}', build,
+                                            enabled=self.cache)
+        return self._monthly
+
+    @property
+    def monthly_digest(self) -> str:
+        """Digest of the monthly source file and the export order"""
+        if self._monthly_digest is None:
+            self._monthly_digest = record_digest(file_digest(self.monthly_path), self.facility_order)
+        return self._monthly_digest
+
+    @property
+    def month_ranks(self) -> Dict[str, Any]:
+        """Per-month rank tables for the monthly data, computed on first use"""
+        with self._load_lock:
+            if self._month_ranks is None:
+                from .cache import load_cached
+                from .ranks import append_month_ranks, compute_month_ranks, parse_ranks_ts_module, rank_histories
+
+                def build():
+                    if self.appended_months(config.MONTHLY_RANKS_TS_MODULE):
+                        # Months already ranked keep their tables
+                        with open(config.MONTHLY_RANKS_TS_MODULE, 'r') as f:
+                            ranks = append_month_ranks(parse_ranks_ts_module(f.read()), self.monthly)
+                    else:
+                        ranks = compute_month_ranks(self.monthly)
+                    return ranks, rank_histories(ranks, self.monthly)
+
+                if self._monthly_preloaded:
+                    self._month_ranks, self._rank_histories = build()
+                else:
+                    self._month_ranks, self._rank_histories = load_cached(
+                        self.monthly_path, f'ranks-{self.facility_order}', build, enabled=self.cache)
+        return self._month_ranks
+
+    def appended_months(self, path: str) -> int:
+        """Number of months the change set appended to the monthly data when
+        ``path`` was built from the data before them, else 0 (rebuild it whole)"""
+        changes = self.changes
+        if not changes or changes['kind'] != 'monthly' or 'base' not in changes:
+            return 0
+        if any(changes[key] for key in ('months_removed', 'added', 'removed', 'moved', 'changed')):
+            return 0
+        added = changes['months_added']
+        if not added or self.monthly['meta']['m'][-len(added):] != added:
+            return 0
+        entry = self.manifest['outputs'].get(path)
+        if entry is None or entry['inputs'] != record_digest(changes['base'], self.facility_order):
+            return 0
+        return len(added) if os.path.exists(path) else 0
+
+    def preload(self, facilities: List[Dict[str, Any]], monthly: Dict[str, Any]):
+        """Use already parsed source data instead of loading the input files"""
+        from .spatial import order_monthly
+        self.invalidate(data=True, monthly=True)
+        self._table = build_facility_table(facilities)
+        self._monthly = order_monthly(monthly, self.facility_order)
+        self._monthly_preloaded = True
+
+    def rank_history(self, facility: Dict[str, Any]) -> List[Any]:
+        """(month, rank, pct) for each month a facility held detainees"""
+        self.month_ranks
+        return self._rank_histories.get((facility['name'], facility['address']), [])
+
+    def invalidate(self, data: bool = False, templates: bool = False, monthly: bool = False):
+        """Drop cached inputs so the next stage run picks up changes"""
+        if data:
+            self._table = None
+            self._table_digest = None
+            self._aggregates = None
+        if monthly:
+            self._monthly = None
+            self._monthly_preloaded = False
+            self._monthly_digest = None
+            self._month_ranks = None
+            self._rank_histories = None
+        if templates:
+            self._template_digest = None
+
+    def reset_counters(self):
+        """Forget what the previous run wrote"""
+        self.written = []
+        self.skipped = 0
+
+    def output_path(self, *parts: str) -> str:
+        """Path of an output inside the output directory"""
+        return os.path.join(self.out_dir, *parts)
+
+    def run_stage(self, run: Callable[['BuildContext'], None]) -> List[str]:
+        """Run a stage function and return every output it looked after,
+        written or found up to date"""
+        self._stage.outputs = {}
+        try:
+            run(self)
+            return list(self._stage.outputs)
+        finally:
+            self._stage.outputs = None
+
+    def track(self, *paths: str):
+        """Count outputs towards the running stage (see run_stage)"""
+        outputs = getattr(self._stage, 'outputs', None)
+        if outputs is not None:
+            outputs.update(dict.fromkeys(paths))
+
+    def is_stale(self, path: str, inputs: str, touched: bool = True) -> bool:
+        """Whether an output needs rebuilding (always, unless incremental or
+        left untouched by the change set)"""
+        self.track(path)
+        if touched and not self.incremental:
+            return True
+        if touched and is_stale(self.manifest, path, inputs):
+            return True
+        with self._lock:
+            self.skipped += 1
+        return False
+
+    def touches(self, kind: str, key: Any = None) -> bool:
+        """Whether the change set (if any) touches a facility page, state page,
+        directory page, the directory index or the statistics page"""
+        changes = self.changes
+        if changes is None:
+            return True
+        if kind == 'facility':
+            if changes['kind'] == 'monthly':
+                return [key['name'], key['address']] in changes['keys']
+            return key['slug'] in changes['facilities']
+        if changes['kind'] == 'monthly':
+            # Monthly data only feeds the facility pages' rank history
+            return False
+        if kind == 'state':
+            return key in changes['states']
+        if kind == 'page':
+            return key in changes['pages']
+        return bool(changes[kind])
+
+    def write(self, path: str, text: str, inputs: str):
+        """Queue an output for writing and record it in the manifest"""
+        self.write_bytes(path, text.encode('utf-8'), inputs)
+
+    def write_bytes(self, path: str, content: bytes, inputs: str, digest: Optional[str] = None):
+        """Queue a binary output for writing and record it in the manifest
+        (pass ``digest`` when the content hash is already known)"""
+        self.track(path)
+        self.writer.submit(path, content)
+        with self._lock:
+            record_output(self.manifest, path, inputs, content, digest=digest)
+            self.written.append(path)
+
+    def write_stream(self, path: str, chunks: Iterable[str], inputs: str):
+        """Write an output chunk by chunk and record it in the manifest"""
+        self.track(path)
+        digest = hashlib.sha256()
+
+        def encoded() -> Iterator[bytes]:
+            for chunk in chunks:
+                data = chunk.encode('utf-8')
+                digest.update(data)
+                yield data
+
+        self.writer.write_stream(path, encoded())
+        with self._lock:
+            record_output(self.manifest, path, inputs, digest=short_digest(digest))
+            self.written.append(path)
+
+    def flush(self):
+        """Wait for queued outputs to reach disk (before reading them back)"""
+        self.writer.flush()
+
+    def finish(self):
+        """Flush outputs and persist the manifest for the next incremental run"""
+        self.writer.flush()
+        if self.manifest_path is not None:
+            save_manifest(self.manifest_path, self.manifest)
+
+
+def select_facilities(table: List[Dict[str, Any]], only: Optional[List[str]] = None,
+                      limit: int = config.TOP_FACILITY_PAGES) -> List[Dict[str, Any]]:
+    """Facilities that get a page: the top ``limit``, or exactly the ``only`` slugs"""
+    if not only:
+        return table[:limit]
+
+    by_slug = {facility['slug']: facility for facility in table}
+    unknown = [slug for slug in only if slug not in by_slug]
+    if unknown:
+        raise ValueError(f"Unknown facility slug(s): {', '.join(unknown)}")
+    return [by_slug[slug] for slug in only]
+
+
+def run_table(ctx: BuildContext):
+    """Load and normalize the facility table"""
+    ctx.table_digest
+
+
+def run_aggregates(ctx: BuildContext):
+    """Compute totals and per-state aggregates"""
+    ctx.aggregates
+
+
+def run_ranks(ctx: BuildContext, ts_module_path: str = config.MONTHLY_RANKS_TS_MODULE):
+    """Rank every facility in every month and export the tables for the frontend"""
+    from .ranks import render_ranks_ts_module
+
+    inputs = ctx.monthly_digest
+    if ctx.is_stale(ts_module_path, inputs):
+        ctx.write(ts_module_path, render_ranks_ts_module(ctx.month_ranks), inputs)
+
+
+def run_pages(ctx: BuildContext, only: Optional[List[str]] = None,
+              limit: int = config.TOP_FACILITY_PAGES):
+    """Generate individual facility pages"""
+    from .pages import generate_facility_page
+
+    facilities = select_facilities(ctx.table, only, limit) if only else ctx.top_table(limit)
+    ctx.writer.ensure_dirs([ctx.output_path(config.FACILITIES_DIR, 'index.html')])
+    for facility in facilities:
+        path = ctx.output_path(config.FACILITIES_DIR, f"{facility['slug']}.html")
+        rank_history = ctx.rank_history(facility)
+        inputs = record_digest(facility, rank_history, ctx.template_digest)
+        if ctx.is_stale(path, inputs, ctx.touches('facility', facility)):
+            ctx.write(path, generate_facility_page(facility, rank_history), inputs)
+
+
+def directory_page_count(ctx: BuildContext) -> int:
+    """Number of fixed-size pages in the paginated directory"""
+    return max(1, -(-len(ctx.table) // config.DIRECTORY_PAGE_SIZE))
+
+
+def run_index(ctx: BuildContext):
+    """Generate the facilities directory: top-level index, one page per
+    state and fixed-size pages ordered by population"""
+    from .pages import (
+        generate_facilities_index_page, generate_state_page, generate_directory_page, state_page_name,
+    )
+
+    aggregates = ctx.aggregates
+    page_count = directory_page_count(ctx)
+    ctx.writer.ensure_dirs([ctx.output_path(config.FACILITIES_DIR, sub, 'index.html') for sub in ('state', 'page')])
+
+    path = ctx.output_path(config.FACILITIES_DIR, 'index.html')
+    inputs = record_digest(aggregates['states'], page_count, ctx.template_digest)
+    if ctx.is_stale(path, inputs, ctx.touches('index')):
+        ctx.write(path, generate_facilities_index_page(aggregates, page_count), inputs)
+
+    # Per-state pages: only states whose facilities changed are re-rendered
+    for state, facilities_in_state in aggregates['by_state'].items():
+        summary = aggregates['states'][state]
+        path = ctx.output_path(config.FACILITIES_DIR, 'state', state_page_name(state))
+        inputs = record_digest(facilities_in_state, ctx.template_digest)
+        if ctx.is_stale(path, inputs, ctx.touches('state', state)):
+            ctx.write(path, ''.join(generate_state_page(state, facilities_in_state, summary)), inputs)
+
+    size = config.DIRECTORY_PAGE_SIZE
+    for page in range(1, page_count + 1):
+        facilities_on_page = ctx.table[(page - 1) * size:page * size]
+        path = ctx.output_path(config.FACILITIES_DIR, 'page', f'{page}.html')
+        inputs = record_digest(facilities_on_page, page_count, ctx.template_digest)
+        if ctx.is_stale(path, inputs, ctx.touches('page', page)):
+            html = ''.join(generate_directory_page(facilities_on_page, page, page_count, len(ctx.table)))
+            ctx.write(path, html, inputs)
+
+
+def run_stats(ctx: BuildContext):
+    """Generate the statistics page"""
+    from .pages import generate_statistics_page
+
+    path = ctx.output_path(config.FACILITIES_DIR, 'statistics.html')
+    inputs = record_digest(ctx.table_digest, ctx.template_digest)
+    if ctx.is_stale(path, inputs, ctx.touches('stats')):
+        ctx.write(path, generate_statistics_page(ctx.table, ctx.aggregates), inputs)
+
+
+def run_sitemap(ctx: BuildContext, limit: int = config.TOP_FACILITY_PAGES):
+    """Generate sitemap.xml"""
+    from .sitemap import sitemap_entries, generate_sitemap
+
+    from .pages import state_page_name
+
+    directory_paths = [f'/facilities/state/{state_page_name(state)}' for state in sorted(ctx.aggregates['states'])]
+    directory_paths += [f'/facilities/page/{page}.html' for page in range(1, directory_page_count(ctx) + 1)]
+    facility_slugs = [facility['slug'] for facility in ctx.table[:limit]]
+
+    entries = []
+    for url_path, changefreq, priority in sitemap_entries(facility_slugs, directory_paths):
+        relpath = url_path.lstrip('/')
+        if not relpath or relpath.endswith('/'):
+            relpath += 'index.html'
+        lastmod = output_lastmod(ctx.manifest, ctx.output_path(relpath))
+        entries.append((url_path, changefreq, priority, lastmod))
+
+    path = ctx.output_path(config.SITEMAP_XML)
+    inputs = record_digest(entries)
+    if ctx.is_stale(path, inputs):
+        ctx.write(path, generate_sitemap(entries), inputs)
+
+
+def run_search(ctx: BuildContext, limit: int = config.TOP_FACILITY_PAGES):
+    """Generate the compact search index for facility names and locations"""
+    from .search import build_search_index
+
+    path = ctx.output_path(config.SEARCH_INDEX_JSON)
+    inputs = record_digest(ctx.table_digest, limit)
+    if ctx.is_stale(path, inputs):
+        index = build_search_index(ctx.table, page_limit=limit)
+        ctx.write(path, json.dumps(index, separators=(',', ':')), inputs)
+
+
+def run_data(ctx: BuildContext, ts_module_path: str = config.MONTHLY_TS_MODULE,
+             series_codec: str = config.MONTHLY_SERIES_CODEC,
+             module_format: str = config.MONTHLY_MODULE_FORMAT,
+             index_path: str = config.FACILITY_INDEX_JSON):
+    """Export public/facilities.csv, the embedded monthly TypeScript module
+    and the facility index mapping it uses"""
+    from .export import iter_facilities_csv, render_monthly_ts_module
+    from .ids import extend_facility_index, load_facility_index, render_facility_index
+    from .spatial import order_table, table_tile_ranges
+
+    csv_path = ctx.output_path(config.FACILITIES_CSV)
+    tiles_path = ctx.output_path(config.FACILITIES_TILES_JSON)
+    inputs = record_digest(ctx.table_digest, ctx.facility_order)
+    ordered = ctx.facility_order != 'source'
+    if ctx.is_stale(csv_path, inputs) or (ordered and ctx.is_stale(tiles_path, inputs)):
+        rows = order_table(ctx.table, ctx.facility_order)
+        ctx.write_stream(csv_path, iter_facilities_csv(rows), inputs)
+        if ordered:
+            # Row ranges per map tile (row 0 is the first data row)
+            ctx.write(tiles_path, json.dumps(table_tile_ranges(rows), separators=(',', ':')), inputs)
+
+    # Known ids keep their dense index; only new facilities are appended
+    known_ids = load_facility_index(index_path)
+    facility_ids = extend_facility_index(known_ids, ctx.monthly)
+    inputs = record_digest(facility_ids)
+    if ctx.is_stale(index_path, inputs):
+        ctx.write(index_path, render_facility_index(facility_ids), inputs)
+
+    inputs = record_digest(ctx.monthly_digest, series_codec, module_format, facility_ids)
+    if ctx.is_stale(ts_module_path, inputs):
+        ctx.write(ts_module_path, render_monthly_ts_module(ctx.monthly, series_codec, module_format, facility_ids),
+                  inputs)
+
+
+def run_binary(ctx: BuildContext):
+    """Export the Range-friendly binary monthly file and its offset table"""
+    from .binary import append_monthly_binary, build_monthly_binary, verify_monthly_binary
+
+    path = ctx.output_path(config.MONTHLY_BINARY)
+    index_path = ctx.output_path(config.MONTHLY_BINARY_INDEX)
+    inputs = ctx.monthly_digest
+    if ctx.is_stale(path, inputs) or ctx.is_stale(index_path, inputs):
+        packed, start = None, 0
+        appended = ctx.appended_months(path)
+        if appended:
+            # Existing columns are copied over; only the new months are packed and checked
+            with open(path, 'rb') as f:
+                packed = append_monthly_binary(f.read(), ctx.monthly)
+            start = len(ctx.monthly['meta']['m']) - appended
+        if packed is None:
+            packed, start = build_monthly_binary(ctx.monthly), 0
+        content, table = packed
+        verify_monthly_binary(content, table, ctx.monthly, start=start)
+        # Busts client caches; the manifest records the same digest
+        table['hash'] = content_digest(content)
+        ctx.write_bytes(path, content, inputs, digest=table['hash'])
+        ctx.write(index_path, json.dumps(table, separators=(',', ':')), inputs)
+
+
+def run_sqlite(ctx: BuildContext):
+    """Export the indexed, full-text searchable SQLite database"""
+    from .database import SQLITE_SCHEMA_VERSION, build_database
+
+    path = ctx.output_path(config.FACILITIES_SQLITE)
+    inputs = record_digest(ctx.table_digest, ctx.monthly_digest, SQLITE_SCHEMA_VERSION)
+    if ctx.is_stale(path, inputs):
+        ctx.write_bytes(path, build_database(ctx.table, ctx.monthly), inputs)
+
+
+def run_geo(ctx: BuildContext):
+    """Export newline-delimited GeoJSON and a spatially indexed FlatGeobuf file"""
+    from .geo import build_flatgeobuf, facility_features, iter_geojson_lines, verify_flatgeobuf
+
+    geojson_path = ctx.output_path(config.FACILITIES_GEOJSONL)
+    fgb_path = ctx.output_path(config.FACILITIES_FGB)
+    inputs = ctx.monthly_digest
+    if ctx.is_stale(geojson_path, inputs) or ctx.is_stale(fgb_path, inputs):
+        features = facility_features(ctx.monthly)
+        content = build_flatgeobuf(features)
+        verify_flatgeobuf(content, features)
+        ctx.write_stream(geojson_path, iter_geojson_lines(features), inputs)
+        ctx.write_bytes(fgb_path, content, inputs)
+
+
+def run_compress(ctx: BuildContext, force: bool = False):
+    """Precompress generated pages, sitemap, CSV and JSON exports"""
+    from .compress import compress_file, compressed_paths, compressible_outputs
+
+    facilities_dir = ctx.output_path(config.FACILITIES_DIR)
+    # monthly.bin and facilities.fgb stay uncompressed: Range requests address their raw bytes
+    relpaths = [config.SITEMAP_XML, config.FACILITIES_CSV, config.SEARCH_INDEX_JSON, config.MONTHLY_BINARY_INDEX,
+                config.FACILITIES_TILES_JSON, config.FACILITIES_GEOJSONL]
+    for directory, _, names in os.walk(facilities_dir):
+        relpaths += [os.path.relpath(os.path.join(directory, name), ctx.out_dir) for name in sorted(names)]
+
+    # Compression reads the final bytes back from disk
+    ctx.flush()
+    for path in compressible_outputs(ctx.out_dir, relpaths):
+        ctx.track(*compressed_paths(path))
+        ctx.written.extend(compress_file(path, force=force, write=ctx.writer.submit))
+
+
+def stage_graph(ctx: BuildContext, only: Optional[List[str]] = None,
+                limit: int = config.TOP_FACILITY_PAGES, force: bool = False,
+                series_codec: str = config.MONTHLY_SERIES_CODEC,
+                module_format: str = config.MONTHLY_MODULE_FORMAT) -> List[Stage]:
+    """Declare every stage with the artifacts it consumes and produces"""
+    return [
+        Stage('table', run_table, inputs=[ctx.data_path], outputs=['facility_table']),
+        Stage('aggregates', run_aggregates, inputs=['facility_table'], outputs=['aggregates']),
+        Stage('data', lambda c: run_data(c, series_codec=series_codec, module_format=module_format),
+              inputs=['facility_table', ctx.monthly_path, config.FACILITY_INDEX_JSON],
+              outputs=['facilities_csv', 'monthly_ts_module'],
+              params=[series_codec, module_format, ctx.facility_order]),
+        Stage('ranks', run_ranks, inputs=[ctx.monthly_path], outputs=['month_ranks'], params=ctx.facility_order),
+        Stage('binary', run_binary, inputs=[ctx.monthly_path], outputs=['monthly_binary'], params=ctx.facility_order),
+        Stage('search', lambda c: run_search(c, limit=limit), inputs=['facility_table'], outputs=['search_index'],
+              params=limit),
+        Stage('sqlite', run_sqlite, inputs=['facility_table', ctx.monthly_path], outputs=['sqlite_database']),
+        Stage('geo', run_geo, inputs=[ctx.monthly_path], outputs=['geo_exports'], params=ctx.facility_order),
+        # Streaming top pages read the snapshot themselves instead of the whole table
+        Stage('pages', lambda c: run_pages(c, only=only, limit=limit),
+              inputs=[ctx.data_path if ctx.stream and not only else 'facility_table', 'month_ranks', TEMPLATES_PATH],
+              outputs=['facility_pages'],
+              params=[only, limit, ctx.stream, ctx.changes]),
+        Stage('index', run_index, inputs=['facility_table', 'aggregates', TEMPLATES_PATH], outputs=['directory_pages'],
+              params=ctx.changes),
+        Stage('stats', run_stats, inputs=['facility_table', 'aggregates', TEMPLATES_PATH],
+              outputs=['statistics_page'], params=ctx.changes),
+        # lastmod of every URL comes from the hashes the page stages recorded
+        Stage('sitemap', lambda c: run_sitemap(c, limit=limit),
+              inputs=['facility_pages', 'directory_pages', 'statistics_page'], outputs=['sitemap'], params=limit),
+        Stage('compress', lambda c: run_compress(c, force=force),
+              inputs=['facility_pages', 'directory_pages', 'statistics_page', 'sitemap', 'facilities_csv',
+                      'search_index', 'monthly_binary', 'geo_exports'],
+              outputs=['compressed'], params=force),
+    ]
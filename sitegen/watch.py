@@ -0,0 +1,111 @@
+"""
+Watch mode: keep the facility table and templates warm in memory and
+regenerate only the outputs whose inputs changed
+"""
+
+import importlib
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .scheduler import Scheduler
+from .stages import BuildContext, TEMPLATES_PATH
+
+# Stages kept up to date while watching; unchanged subgraphs are skipped
+WATCH_STAGES = ['data', 'ranks', 'binary', 'sqlite', 'geo', 'pages', 'index', 'stats', 'sitemap', 'search']
+
+
+def _signature(path: str) -> Optional[Tuple[float, int]]:
+    """Cheap change signature for a file (None if it does not exist)"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime, stat.st_size)
+
+
+class FileWatcher:
+    """Polling watcher that reports a debounced batch of changed paths
+
+    Polling a handful of files is cheaper than any notification backend's
+    setup cost and works the same on every platform and network volume.
+    """
+
+    def __init__(self, paths: List[str], interval: float = 0.05, debounce: float = 0.1):
+        self.paths = paths
+        self.interval = interval
+        self.debounce = debounce
+        self._signatures: Dict[str, Optional[Tuple[float, int]]] = {path: _signature(path) for path in paths}
+
+    def poll(self) -> List[str]:
+        """Paths whose signature changed since the last poll"""
+        changed = []
+        for path in self.paths:
+            signature = _signature(path)
+            if signature != self._signatures[path]:
+                self._signatures[path] = signature
+                changed.append(path)
+        return changed
+
+    def wait(self) -> List[str]:
+        """Block until something changes and edits have settled"""
+        changed = set()
+        while not changed:
+            time.sleep(self.interval)
+            changed.update(self.poll())
+
+        # Editors often save in several writes; wait for a quiet period
+        settled_at = time.monotonic() + self.debounce
+        while time.monotonic() < settled_at:
+            time.sleep(self.interval)
+            more = self.poll()
+            if more:
+                changed.update(more)
+                settled_at = time.monotonic() + self.debounce
+
+        return sorted(changed)
+
+
+def rebuild(ctx: BuildContext, changed: List[str], scheduler: Scheduler, jobs: Optional[int] = None) -> float:
+    """Refresh warm inputs for the changed paths and re-run the watch stages
+
+    Returns the elapsed time in milliseconds.
+    """
+    ctx.reset_counters()
+
+    templates_changed = TEMPLATES_PATH in changed
+    if templates_changed:
+        from . import pages
+        importlib.reload(pages)
+    ctx.invalidate(data=ctx.data_path in changed, templates=templates_changed,
+                   monthly=ctx.monthly_path in changed)
+
+    elapsed_ms = scheduler.run(ctx, WATCH_STAGES, jobs=jobs)
+    ctx.finish()
+    return elapsed_ms
+
+
+def watch(ctx: BuildContext, scheduler: Scheduler, jobs: Optional[int] = None,
+          interval: float = 0.05, debounce: float = 0.1):
+    """Run an initial build, then rebuild on every change until interrupted"""
+    paths = [ctx.data_path, ctx.monthly_path, TEMPLATES_PATH]
+    watcher = FileWatcher(paths, interval=interval, debounce=debounce)
+
+    elapsed_ms = rebuild(ctx, [], scheduler, jobs)
+    print(f"👀 Watching {', '.join(paths)} (initial build: {len(ctx.written)} written, {elapsed_ms:.1f} ms)")
+
+    try:
+        while True:
+            changed = watcher.wait()
+            try:
+                elapsed_ms = rebuild(ctx, changed, scheduler, jobs)
+            except (ValueError, SyntaxError) as e:
+                # Half-saved JSON or a template typo: keep watching
+                print(f"❌ {e}")
+                continue
+            names = ', '.join(os.path.basename(path) for path in changed)
+            print(f"🔄 {names}: {len(ctx.written)} written, {ctx.skipped} up to date ({elapsed_ms:.1f} ms)")
+            for path in ctx.written:
+                print(f"  - {path}")
+    except KeyboardInterrupt:
+        print("Stopped watching")
@@ -0,0 +1,138 @@
+"""
+Background output writer
+
+Rendering hands finished bytes to the writer and moves on; a small thread
+pool does the disk I/O. Each file is written to a temporary sibling and
+renamed into place, so readers (a dev server, rsync, a half-finished CI
+upload) never see a partially written page.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+
+
+class OutputWriter:
+    """Queue writes onto a worker pool with bounded backpressure"""
+
+    def __init__(self, workers: int = 4, max_pending: int = 64):
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='sitegen-writer')
+        # Bounded queue: submit() blocks once this many writes are in flight
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+        self._created_dirs = set()
+        self._error: Optional[BaseException] = None
+        self.files = 0
+        self.bytes = 0
+        self._first_start: Optional[float] = None
+        self._last_end = 0.0
+
+    def ensure_dirs(self, paths: Iterable[str]):
+        """Create the parent directories of many outputs in one pass"""
+        dirs = {os.path.dirname(path) or '.' for path in paths}
+        with self._lock:
+            missing = dirs - self._created_dirs
+        for directory in sorted(missing):
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            self._created_dirs |= dirs
+
+    def submit(self, path: str, content: bytes):
+        """Queue content to be written to path (blocks when the queue is full)"""
+        self._raise_pending_error()
+        self._slots.acquire()
+        with self._lock:
+            self._pending += 1
+        self._pool.submit(self._write, path, content)
+
+    def _write(self, path: str, content: bytes):
+        """Worker: atomic write through a temporary file"""
+        start = time.perf_counter()
+        tmp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+        try:
+            directory = os.path.dirname(path) or '.'
+            if directory not in self._created_dirs:
+                self.ensure_dirs([path])
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException as e:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            with self._lock:
+                if self._error is None:
+                    self._error = e
+        else:
+            with self._lock:
+                self.files += 1
+                self.bytes += len(content)
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                if self._first_start is None or start < self._first_start:
+                    self._first_start = start
+                self._last_end = max(self._last_end, end)
+                self._pending -= 1
+                if self._pending == 0:
+                    self._idle.notify_all()
+            self._slots.release()
+
+    def write_stream(self, path: str, chunks: Iterable[bytes]):
+        """Write chunks to path from the calling thread, atomically like
+        queued writes, without holding the whole output in memory"""
+        self._raise_pending_error()
+        start = time.perf_counter()
+        self.ensure_dirs([path])
+        tmp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+        size = 0
+        try:
+            with open(tmp_path, 'wb') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    size += len(chunk)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        end = time.perf_counter()
+        with self._lock:
+            self.files += 1
+            self.bytes += size
+            if self._first_start is None or start < self._first_start:
+                self._first_start = start
+            self._last_end = max(self._last_end, end)
+
+    def _raise_pending_error(self):
+        """Surface the first failed write to the caller"""
+        with self._lock:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def flush(self):
+        """Wait until every queued write has reached disk"""
+        with self._lock:
+            while self._pending:
+                self._idle.wait()
+        self._raise_pending_error()
+
+    def close(self):
+        """Flush and stop the worker threads"""
+        try:
+            self.flush()
+        finally:
+            self._pool.shutdown(wait=True)
+
+    def stats(self) -> Dict[str, float]:
+        """Files, bytes and wall-clock write throughput in MB/s"""
+        with self._lock:
+            window = self._last_end - self._first_start if self._first_start is not None else 0.0
+            throughput = self.bytes / window / 1e6 if window > 0 else 0.0
+            return {'files': self.files, 'bytes': self.bytes, 'mb_per_s': throughput}
@@ -1,4 +1,4 @@
-import React, { useState, useEffect, useRef } from 'react';
+import React, { useState, useEffect, useMemo, useRef } from 'react';
 // Import MapboxOverlay for proper MapLibre integration
 import { MapboxOverlay } from '@deck.gl/mapbox';
 // Import MapLibre
@@ -9,8 +9,8 @@ import { HeatmapLayer } from '@deck.gl/aggregation-layers';
 import { ScatterplotLayer } from '@deck.gl/layers';
 import type { Color } from '@deck.gl/core';
 // Import embedded data
-import { monthlyFacilitiesData } from '../../data/monthlyFacilitiesData';
-import { getFacilitiesForMonth, getAvailableMonths, formatMonthYear, getTopFacilitiesForMonth, getTotalPopulationForMonth, type MonthlyFacilityData } from '../../utils/monthlyDataUtils';
+import { formatMonthYear, type MonthAttributes, type MonthlyFacilityData, type OptimizedMonthlyData } from '../../utils/monthlyDataUtils';
+import { getMonthlyDataClient } from '../../utils/monthlyDataClient';
 
 // Mobile detection utility
 const isMobileDevice = (): boolean => {
@@ -23,6 +23,9 @@ const isMobileDevice = (): boolean => {
   return mobileKeywords.some(keyword => userAgent.includes(keyword));
 };
 
+// Monthly data is decoded in a worker; months arrive as transferred buffers
+const monthlyData = getMonthlyDataClient();
+
 // Using Voyager style from CartoCDN - colorful and detailed
 const MAP_STYLE = 'https://basemaps.cartocdn.com/gl/voyager-gl-style/style.json';
 
@@ -41,6 +44,22 @@ interface HeatmapPoint {
   facility: Facility;
 }
 
+// Points with usable coordinates and a population, the same facilities the
+// worker puts in the month's attributes
+const toHeatmapPoints = (facilities: Facility[]): HeatmapPoint[] => facilities
+  .filter(facility =>
+    facility.latitude !== 0 && 
+    facility.longitude !== 0 &&
+    !isNaN(facility.latitude) &&
+    !isNaN(facility.longitude) &&
+    facility.population_count > 0 // Only include facilities with population
+  )
+  .map(facility => ({
+    position: [facility.longitude, facility.latitude],
+    weight: facility.population_count,
+    facility: facility
+  }));
+
 // Mobile-responsive initial view state
 const getInitialViewState = () => {
   const isMobile = isMobileDevice();
@@ -73,7 +92,9 @@ const DeckGlHeatmap: React.FC = () => {
   const [hoverInfo, setHoverInfo] = useState<any>(null);
   const [clickInfo, setClickInfo] = useState<any>(null);
   const [isMobile, setIsMobile] = useState(false);
-  const [selectedMonth, setSelectedMonth] = useState<string>(monthlyFacilitiesData.meta.l);
+  const [meta, setMeta] = useState<OptimizedMonthlyData['meta'] | null>(null);
+  const [selectedMonth, setSelectedMonth] = useState<string>('');
+  const [attributes, setAttributes] = useState<MonthAttributes | null>(null);
   const [topFacilities, setTopFacilities] = useState<MonthlyFacilityData[]>([]);
   const [totalPopulation, setTotalPopulation] = useState<number>(0);
   const [isFacilitiesListExpanded, setIsFacilitiesListExpanded] = useState(false);
@@ -83,30 +104,53 @@ const DeckGlHeatmap: React.FC = () => {
   const mapContainerRef = useRef<HTMLDivElement>(null);
   const mapRef = useRef<maplibregl.Map | null>(null);
   const overlayRef = useRef<MapboxOverlay | null>(null);
+  // Rebuilt only when a new month arrives, not on every render
+  const heatmapData = useMemo(() => toHeatmapPoints(facilities), [facilities]);
 
-  // Mobile detection and data loading
+  // Mobile detection and dataset metadata
   useEffect(() => {
     // Detect mobile device
     setIsMobile(isMobileDevice());
-    
-    // Load monthly facilities data for selected month
-    try {
-      console.log('Loading monthly facilities data for:', selectedMonth);
-      console.log('Monthly data metadata:', monthlyFacilitiesData.meta);
-      
-      const monthlyFacilities = getFacilitiesForMonth(monthlyFacilitiesData, selectedMonth);
-      const topFacilitiesData = getTopFacilitiesForMonth(monthlyFacilitiesData, selectedMonth, 8);
-      const totalPop = getTotalPopulationForMonth(monthlyFacilitiesData, selectedMonth);
-      
-      setFacilities(monthlyFacilities);
-      setTopFacilities(topFacilitiesData);
-      setTotalPopulation(totalPop);
-      setLoading(false);
-    } catch (err) {
-      console.error('Failed to load monthly data:', err);
-      setError('Failed to load facilities data: ' + (err as Error).message);
-      setLoading(false);
-    }
+
+    monthlyData.getMeta()
+      .then(loadedMeta => {
+        console.log('Monthly data metadata:', loadedMeta);
+        setMeta(loadedMeta);
+        setSelectedMonth(loadedMeta.l);
+      })
+      .catch(err => {
+        console.error('Failed to load monthly data:', err);
+        setError('Failed to load facilities data: ' + (err as Error).message);
+        setLoading(false);
+      });
+  }, []);
+
+  // Load monthly facilities data for selected month
+  useEffect(() => {
+    if (!selectedMonth) return;
+
+    let cancelled = false;
+    console.log('Loading monthly facilities data for:', selectedMonth);
+    monthlyData.getMonth(selectedMonth, 8)
+      .then(snapshot => {
+        if (cancelled) return;
+        setFacilities(snapshot.facilities);
+        setTopFacilities(snapshot.topFacilities);
+        setTotalPopulation(snapshot.totalPopulation);
+        setAttributes(snapshot.attributes);
+        setLoading(false);
+      })
+      .catch(err => {
+        if (cancelled) return;
+        console.error('Failed to load monthly data:', err);
+        setError('Failed to load facilities data: ' + (err as Error).message);
+        setLoading(false);
+      });
+
+    // A newer month superseded this request (fast slider drags)
+    return () => {
+      cancelled = true;
+    };
   }, [selectedMonth]);
 
   // Initialize MapLibre map and DeckGL overlay
@@ -158,39 +202,34 @@ const DeckGlHeatmap: React.FC = () => {
 
   // Get layers for the heatmap
   const getLayers = () => {
-    // Convert facilities to heatmap points, filtering out invalid coordinates
-    const heatmapData: HeatmapPoint[] = facilities
-      .filter(facility => 
-        facility.latitude !== 0 && 
-        facility.longitude !== 0 &&
-        !isNaN(facility.latitude) &&
-        !isNaN(facility.longitude) &&
-        facility.population_count > 0 // Only include facilities with population
-      )
-      .map(facility => ({
-        position: [facility.longitude, facility.latitude],
-        weight: facility.population_count,
-        facility: facility
-      }));
-
     console.log('Heatmap data points:', heatmapData.length);
-    console.log('Sample heatmap data:', heatmapData.slice(0, 3));
 
     if (heatmapData.length === 0) {
       return [];
     }
 
+    // The heatmap reads the month's typed arrays as binary attributes
+    const heatmapAttributes = attributes && {
+      length: attributes.length,
+      attributes: {
+        getPosition: { value: attributes.positions, size: 2 },
+        getWeight: { value: attributes.weights, size: 1 }
+      }
+    };
+
     // Create layers using the functional approach to avoid constructor issues
     return [
       new HeatmapLayer({
         id: 'heatmap-layer',
-        data: heatmapData,
+        data: heatmapAttributes ?? heatmapData,
         getPosition: (d: HeatmapPoint) => d.position,
         getWeight: (d: HeatmapPoint) => d.weight,
         radiusPixels: 30, // Reduced radius for sparse data
         intensity: 1, // Reduced intensity for sparse data
         threshold: 0.05, // Adjusted threshold for sparse data
         colorRange: COLOR_RANGE,
+        // No colorDomain: it applies to the summed kernel weight per pixel,
+        // which depends on zoom and clustering, so the layer derives it
         aggregation: 'SUM',
         pickable: true
       }),
@@ -202,6 +241,13 @@ const DeckGlHeatmap: React.FC = () => {
         getFillColor: (d: HeatmapPoint) => hoveredFacilityName === d.facility.name ? [255, 165, 0, 255] : [255, 0, 0, 180],
         getLineColor: (d: HeatmapPoint) => hoveredFacilityName === d.facility.name ? [255, 165, 0, 255] : [0, 0, 0, 0],
         getLineWidth: (d: HeatmapPoint) => hoveredFacilityName === d.facility.name ? 3 : 0,
+        // Hovering restyles the same objects instead of rebuilding them
+        updateTriggers: {
+          getRadius: hoveredFacilityName,
+          getFillColor: hoveredFacilityName,
+          getLineColor: hoveredFacilityName,
+          getLineWidth: hoveredFacilityName
+        },
         pickable: true,
         onHover: (info: any) => {
           setHoverInfo(info);
@@ -235,21 +281,6 @@ const DeckGlHeatmap: React.FC = () => {
     );
   }
 
-  // Check if we have data to display
-  const heatmapData: HeatmapPoint[] = facilities
-    .filter(facility => 
-      facility.latitude !== 0 && 
-      facility.longitude !== 0 &&
-      !isNaN(facility.latitude) &&
-      !isNaN(facility.longitude) &&
-      facility.population_count > 0 // Only include facilities with population
-    )
-    .map(facility => ({
-      position: [facility.longitude, facility.latitude],
-      weight: facility.population_count,
-      facility: facility
-    }));
-
   if (heatmapData.length === 0) {
     return (
       <div className="flex items-center justify-center h-full">
@@ -261,8 +292,6 @@ const DeckGlHeatmap: React.FC = () => {
     );
   }
 
-  console.log('Creating DeckGL layers:', getLayers());
-
   return (
     <div className="relative h-full w-full">
       {/* Mobile UI Controls */}
@@ -274,7 +303,7 @@ const DeckGlHeatmap: React.FC = () => {
             onChange={(e) => setSelectedMonth(e.target.value)}
             className="bg-white/95 backdrop-blur-sm rounded-lg px-2 py-1 shadow-lg border border-gray-200 text-xs text-gray-600 focus:ring-2 focus:ring-blue-500 focus:border-blue-500"
           >
-            {getAvailableMonths(monthlyFacilitiesData).map((month) => (
+            {(meta?.m ?? []).map((month) => (
               <option key={month} value={month}>
                 {formatMonthYear(month)}
               </option>
@@ -319,12 +348,12 @@ const DeckGlHeatmap: React.FC = () => {
             <div className={`text-blue-800 ${isMobile ? 'text-xs' : 'text-xs'}`}>
               <div className="font-medium">📅 Historical Data Available</div>
               <div className="text-blue-600">
-                {monthlyFacilitiesData.meta.t}
+                {meta?.t}
               </div>
               <div className={`text-blue-500 mt-1 ${isMobile ? 'text-xs' : 'text-xs'}`}>
                 {isMobile 
-                  ? `${monthlyFacilitiesData.meta.f} facilities • ${monthlyFacilitiesData.meta.m.length} months of data`
-                  : `${monthlyFacilitiesData.meta.f} facilities • ${monthlyFacilitiesData.meta.m.length} months of historical data (2019-2025)`
+                  ? `${meta?.f} facilities • ${meta?.m.length} months of data`
+                  : `${meta?.f} facilities • ${meta?.m.length} months of historical data (2019-2025)`
                 }
               </div>
             </div>
@@ -364,7 +393,7 @@ const DeckGlHeatmap: React.FC = () => {
               onChange={(e) => setSelectedMonth(e.target.value)}
               className="w-full bg-white border border-gray-300 rounded-md shadow-sm focus:ring-2 focus:ring-blue-500 focus:border-blue-500 text-sm p-2"
             >
-              {getAvailableMonths(monthlyFacilitiesData).map((month) => (
+              {(meta?.m ?? []).map((month) => (
                 <option key={month} value={month}>
                   {formatMonthYear(month)}
                 </option>
@@ -1,4 +1,4 @@
-import type { OptimizedMonthlyData } from '../utils/monthlyDataUtils';
+import { decodeMonthlyData, type OptimizedMonthlyData } from '../utils/monthlyDataUtils';
 
-export const monthlyFacilitiesData: OptimizedMonthlyData = 
-{"meta":{"v":1,"t":"2025-09-14T14:50:40.242020","f":186,"m":["2019-09","2020-08","2020-09","2020-11","2020-12","2021-01","2021-02","2021-03","2021-04","2021-05","2021-06","2021-07","2021-08","2021-09","2021-10","2021-11","2021-12","2022-01","2022-02","2022-03","2022-04","2022-05","2022-06","2022-07","2022-08","2022-09","2022-10","2022-11","2022-12","2023-01","2023-02","2023-03","2023-04","2023-05","2023-06","2023-07","2023-08","2023-09","2023-10","2023-11","2023-12","2024-01","2024-02","2024-03","2024-04","2024-05","2024-06","2024-07","2024-08","2024-09","2024-10","2024-11","2024-12","2025-01","2025-02","2025-03","2025-04","2025-05","2025-06","2025-07","2025-08","2025-09"],"l":"2025-09","d":"ICE Detention Facilities - Optimized Monthly Data"},"facilities":[{"i":146,"n":"Adams County Correctional Center","lat":31.5576334,"lng":-91.2211771,"a":"Adams County Correctional Center, Natchez, MS, 39120"},{"i":190,"n":"Adams County Jail","lat":39.9356016,"lng":-91.4098727,"a":"Quincy, IL, 62301"},{"i":92,"n":"Adelanto ICE Processing Center","lat":34.5599467,"lng":-117.4421505,"a":"Adelanto ICE Processing Center, Adelanto, CA, 92301"},{"i":184,"n":"Adult Correctional Institutions","lat":41.779588,"lng":-71.4366813,"a":"Cranston, RI, 02920"},{"i":178,"n":"Alamance County Jail","lat":36.0690258,"lng":-79.4005756,"a":"Graham, NC, 27253"},{"i":191,"n":"Allen County Jail","lat":40.7399785,"lng":-84.105006,"a":"Lima, OH, 45801"},{"i":188,"n":"Anchorage Correctional Complex","lat":61.2183804,"lng":-149.857649,"a":"Anchorage Correctional Complex, Anchorage, AK, 99501"},{"i":192,"n":"Anderson County Jail","lat":34.5334395,"lng":-82.6831902,"a":"Anderson County Jail, Anderson, SC, 29621"},{"i":193,"n":"Ashtabula County Jail","lat":41.7392218,"lng":-80.7700844,"a":"Ashtabula County Jail, Jefferson, OH, 44047"},{"i":194,"n":"Athens County Jail","lat":39.3289242,"lng":-82.1012479,"a":"Athens, OH, 45701"},{"i":195,"n":"Auglaize County Jail","lat":40.5678265,"lng":-84.1935594,"a":"Wapakoneta, OH, 45895"},{"i":129,"n":"Aurora Contract Detention Facility","lat":39.7405111,"lng":-104.830994,"a":"Aurora, CO, 80011"},{"i":116,"n":"Baker County Detention Center","lat":30.2968674,"lng":-82.1215872,"a":"Baker County Detention Center, Macclenny, FL, 32063"},{"i":169,"n":"Baxter County Jail","lat":36.3361391,"lng":-92.3801187,"a":"Mountain Home, AR, 72653"},{"i":196,"n":"Belmont County Jail","lat":40.0806266,"lng":-80.9000916,"a":"St. Clairsville, OH, 43950"},{"i":131,"n":"Bergen County Jail","lat":40.8738731,"lng":-74.0390422,"a":"Bergen County Jail, Hackensack, NJ, 07601"},{"i":179,"n":"Berkeley County Detention Center","lat":33.2007396,"lng":-80.0182187,"a":"Berkeley County Detention Center, Moncks Corner, SC, 29461"},{"i":177,"n":"Berkeley County Jail","lat":39.4562528,"lng":-77.9639604,"a":"Martinsburg, WV, 25401"},{"i":154,"n":"Berks County Residential Center","lat":40.3795408,"lng":-76.0158335,"a":"Berks County Residential Center, Leesport, PA, 19533"},{"i":99,"n":"Big Spring Correctional Center","lat":32.2590164,"lng":-101.5030409,"a":"Big Spring Correctional Center, Big Spring, TX, 79720"},{"i":100,"n":"Bluebonnet Detention Center","lat":32.7680198,"lng":-99.8881024,"a":"Bluebonnet Detention Center, Anson, TX, 79501"},{"i":150,"n":"Boone County Jail","lat":39.0365965,"lng":-84.728322,"a":"Boone County Jail, Burlington, KY, 41005"},{"i":101,"n":"Brooks County Detention Center","lat":27.2482748,"lng":-98.1258468,"a":"Brooks County Detention Center, Falfurrias, TX, 78355"},{"i":117,"n":"Broward Transitional Center","lat":26.2772767,"lng":-80.1509053,"a":"Broward Transitional Center, Pompano Beach, FL, 33069"},{"i":197,"n":"Brown County Jail","lat":38.8645138,"lng":-83.9040944,"a":"Georgetown, OH, 45121"},{"i":156,"n":"Buffalo Federal Detention Facility","lat":43.0203148,"lng":-78.2016158,"a":"Buffalo Federal Detention Facility, Batavia, NY, 14020"},{"i":164,"n":"Burleigh County Detention Center","lat":46.808327,"lng":-100.783739,"a":"Bismarck, ND, 58501"},{"i":167,"n":"Butler County Jail","lat":37.8173015,"lng":-96.8537388,"a":"El Dorado, KS, 67042"},{"i":198,"n":"Butler County Jail","lat":39.399223,"lng":-84.56328,"a":"Butler County Jail, Hamilton, OH, 45011"},{"i":152,"n":"Butler County Jail","lat":39.399223,"lng":-84.56328,"a":"Butler County Jail, Hamilton, OH, 45011"},{"i":93,"n":"Calexico ICE Processing Center","lat":32.6668134,"lng":-115.4963754,"a":"Calexico, CA, 92231"},{"i":134,"n":"Calhoun County Correctional Center","lat":42.3192548,"lng":-85.1824269,"a":"Battle Creek, MI, 49015"},{"i":136,"n":"Caroline Detention Facility","lat":38.0498524,"lng":-77.3469994,"a":"Bowling Green, VA, 22427"},{"i":199,"n":"Carroll County Jail","lat":40.5728404,"lng":-81.0856532,"a":"Carrollton, OH, 44615"},{"i":163,"n":"Cascade County Detention Center","lat":47.5048851,"lng":-111.29189,"a":"Great Falls, MT, 59401"},{"i":200,"n":"Champaign County Jail","lat":40.1083912,"lng":-83.7524298,"a":"Urbana, OH, 43078"},{"i":135,"n":"Chippewa County Correctional Facility","lat":46.497309,"lng":-84.3454755,"a":"Chippewa County Correctional Facility, Sault Ste. Marie, MI, 49783"},{"i":181,"n":"Chittenden County Correctional Facility","lat":44.4671635,"lng":-73.1715669,"a":"South Burlington, VT, 05403"},{"i":127,"n":"Cibola County Correctional Center","lat":35.1796636,"lng":-107.9078742,"a":"Cibola County Correctional Center, Milan, NM, 87021"},{"i":201,"n":"Clark County Jail","lat":39.9234046,"lng":-83.810138,"a":"Springfield, OH, 45501"},{"i":202,"n":"Clermont County Jail","lat":39.0919866,"lng":-84.1850705,"a":"Clermont County Jail, Batavia, OH, 45103"},{"i":155,"n":"Clinton County Correctional Facility","lat":41.1511182,"lng":-77.3493663,"a":"Clinton County Correctional Facility, McElhattan, PA, 17748"},{"i":203,"n":"Clinton County Jail","lat":39.4453393,"lng":-83.8285375,"a":"Wilmington, OH, 45177"},{"i":204,"n":"Columbiana County Jail","lat":40.7720044,"lng":-80.7681336,"a":"Lisbon, OH, 44432"},{"i":102,"n":"Conroe Processing Center","lat":30.3118769,"lng":-95.4560512,"a":"Conroe, TX, 77301"},{"i":103,"n":"Corrections Corporation of America","lat":29.7589382,"lng":-95.3676974,"a":"Houston, TX, 77002"},{"i":205,"n":"Coshocton County Jail","lat":40.2753484,"lng":-81.8662428,"a":"Coshocton County Jail, Coshocton, OH, 43812"},{"i":206,"n":"Crawford County Jail","lat":40.8092243,"lng":-82.9743537,"a":"Crawford County Jail, Bucyrus, OH, 44820"},{"i":180,"n":"Cumberland County Jail","lat":43.6508623,"lng":-70.2816197,"a":"Cumberland County Jail, Portland, ME, 04101"},{"i":207,"n":"Cuyahoga County Jail","lat":41.4996574,"lng":-81.6936772,"a":"Cleveland, OH, 44113"},{"i":208,"n":"Darke County Jail","lat":40.1003265,"lng":-84.6313447,"a":"Darke County Jail, Greenville, OH, 45331"},{"i":209,"n":"Defiance County Jail","lat":41.2844933,"lng":-84.3557802,"a":"Defiance, OH, 43512"},{"i":210,"n":"Delaware County Jail","lat":40.3122836,"lng":-83.0479642,"a":"Delaware County Jail, Delaware, OH, 43015"},{"i":130,"n":"Denver Contract Detention Facility","lat":39.7392364,"lng":-104.984862,"a":"Denver, CO, 80202"},{"i":104,"n":"Dilley Family Residential Center","lat":28.6695971,"lng":-99.1672017,"a":"Dilley, TX, 78017"},{"i":174,"n":"Dodge County Jail","lat":43.4055504,"lng":-88.7051037,"a":"Juneau, WI, 53039"},{"i":94,"n":"El Centro Service Processing Center","lat":32.792,"lng":-115.563051,"a":"El Centro, CA, 92243"},{"i":105,"n":"El Paso Service Processing Center","lat":31.7955926,"lng":-106.3696348,"a":"El Paso Service Processing Center, El Paso, TX, 79925"},{"i":132,"n":"Elizabeth Contract Detention Facility","lat":40.6639916,"lng":-74.2107006,"a":"Elizabeth, NJ, 07201"},{"i":123,"n":"Eloy Detention Center","lat":32.8166837,"lng":-111.5200433,"a":"Eloy Detention Center, Eloy, AZ, 85131"},{"i":211,"n":"Erie County Jail","lat":41.4530769,"lng":-82.7111132,"a":"Erie County Jail, Sandusky, OH, 44870"},{"i":144,"n":"Etowah County Detention Center","lat":34.0128323,"lng":-86.0030251,"a":"Gadsden, AL, 35901"},{"i":212,"n":"Fairfield County Jail","lat":39.7132527,"lng":-82.59836,"a":"Fairfield County Jail, Lancaster, OH, 43130"},{"i":137,"n":"Farmville Detention Center","lat":37.3213468,"lng":-78.4415853,"a":"Farmville Detention Center, Farmville, VA, 23901"},{"i":213,"n":"Fayette County Jail","lat":39.5364511,"lng":-83.4390843,"a":"Washington Court House, OH, 43160"},{"i":124,"n":"Florence Service Processing Center","lat":33.0640298,"lng":-111.3825565,"a":"Florence Service Processing Center, Florence, AZ, 85132"},{"i":143,"n":"Folkston ICE Processing Center","lat":30.8717749,"lng":-81.981524,"a":"Folkston ICE Processing Center, Folkston, GA, 31537"},{"i":214,"n":"Franklin County Jail","lat":39.9622601,"lng":-83.0007065,"a":"Columbus, OH, 43215"},{"i":215,"n":"Fulton County Jail","lat":41.546069,"lng":-84.1362047,"a":"Wauseon, OH, 43567"},{"i":216,"n":"Gallia County Jail","lat":38.809803,"lng":-82.2023691,"a":"Gallipolis, OH, 45631"},{"i":217,"n":"Geauga County Jail","lat":41.5824944,"lng":-81.2034066,"a":"Chardon, OH, 44024"},{"i":153,"n":"Geauga County Safety Center","lat":41.5824944,"lng":-81.2034066,"a":"Chardon, OH, 44024"},{"i":118,"n":"Glades County Detention Center","lat":26.8331174,"lng":-81.0931234,"a":"Moore Haven, FL, 33471"},{"i":168,"n":"Grady County Jail","lat":35.0512159,"lng":-97.9370036,"a":"Chickasha, OK, 73018"},{"i":151,"n":"Grayson County Detention Center","lat":37.4890391,"lng":-86.2702303,"a":"Grayson County Detention Center, Leitchfield, KY, 42754"},{"i":218,"n":"Greene County Jail","lat":39.6859955,"lng":-83.9283174,"a":"Greene County Jail, Xenia, OH, 45385"},{"i":219,"n":"Guernsey County Jail","lat":40.031183,"lng":-81.5884561,"a":"Cambridge, OH, 43725"},{"i":166,"n":"Hall County Detention Center","lat":40.924271,"lng":-98.338685,"a":"Grand Island, NE, 68801"},{"i":220,"n":"Hamilton County Jail","lat":39.1014537,"lng":-84.5124602,"a":"Cincinnati, OH, 45202"},{"i":221,"n":"Hancock County Jail","lat":41.038313,"lng":-83.6521917,"a":"Hancock County Jail, Findlay, OH, 45840"},{"i":148,"n":"Hardeman County Correctional Center","lat":35.3262451,"lng":-89.1505724,"a":"Whiteville, TN, 38075"},{"i":222,"n":"Hardin County Jail","lat":40.6478171,"lng":-83.6089968,"a":"Kenton, OH, 43326"},{"i":172,"n":"Hardin County Jail","lat":42.3606883,"lng":-93.099609,"a":"Eldora, IA, 50627"},{"i":223,"n":"Harrison County Jail","lat":40.2728452,"lng":-80.9967628,"a":"Cadiz, OH, 43907"},{"i":185,"n":"Hartford Correctional Center","lat":41.7934056,"lng":-72.6613292,"a":"Hartford Correctional Center, Hartford, CT, 06103"},{"i":161,"n":"Henderson Detention Center","lat":36.0299427,"lng":-114.9823566,"a":"Henderson, NV, 89015"},{"i":224,"n":"Henry County Jail","lat":41.3911444,"lng":-84.1237918,"a":"Henry County Jail, Napoleon, OH, 43545"},{"i":225,"n":"Highland County Jail","lat":39.2022866,"lng":-83.611587,"a":"Hillsboro, OH, 45133"},{"i":182,"n":"Hillsborough County House of Corrections","lat":42.9956397,"lng":-71.4547891,"a":"Manchester, NH, 03103"},{"i":226,"n":"Hocking County Jail","lat":39.5395981,"lng":-82.4065106,"a":"Hocking County Jail, Logan, OH, 43138"},{"i":227,"n":"Holmes County Jail","lat":40.5545071,"lng":-81.9179198,"a":"Millersburg, OH, 44654"},{"i":106,"n":"Houston Contract Detention Facility","lat":29.7589382,"lng":-95.3676974,"a":"Houston, TX, 77002"},{"i":133,"n":"Hudson County Correctional Center","lat":40.7278297,"lng":-74.1077874,"a":"Hudson County Correctional Center, Kearny, NJ, 07032"},{"i":228,"n":"Huron County Jail","lat":41.2424219,"lng":-82.6155745,"a":"Norwalk, OH, 44857"},{"i":95,"n":"Imperial Regional Detention Facility","lat":32.6668134,"lng":-115.4963754,"a":"Calexico, CA, 92231"},{"i":142,"n":"Irwin County Detention Center","lat":31.5802816,"lng":-83.2552781,"a":"Irwin County Detention Center, Ocilla, GA, 31774"},{"i":229,"n":"Jackson County Jail","lat":39.0522947,"lng":-82.6368314,"a":"Jackson County Jail, Jackson, OH, 45640"},{"i":230,"n":"Jefferson County Jail","lat":40.3600714,"lng":-80.6151034,"a":"Steubenville, OH, 43952"},{"i":107,"n":"Karnes County Residential Center","lat":28.8849772,"lng":-97.9008356,"a":"Karnes City, TX, 78118"},{"i":231,"n":"Knox County Jail","lat":40.3933956,"lng":-82.4857181,"a":"Mount Vernon, OH, 43050"},{"i":119,"n":"Krome Service Processing Center","lat":25.7546881,"lng":-80.4896527,"a":"Krome Service Processing Center, Miami, FL, 33194"},{"i":125,"n":"La Palma Correctional Center","lat":32.7551703,"lng":-111.553493,"a":"Eloy, AZ, 85131"},{"i":139,"n":"LaSalle Detention Facility","lat":31.6832271,"lng":-92.1337448,"a":"Jena, LA, 71342"},{"i":232,"n":"Lake County Jail","lat":41.726471,"lng":-81.2449057,"a":"Lake County Jail, Painesville, OH, 44077"},{"i":108,"n":"Laredo Processing Center","lat":27.4168043,"lng":-99.4514344,"a":"Laredo Processing Center, Laredo, TX, 78040"},{"i":233,"n":"Lawrence County Jail","lat":38.5367471,"lng":-82.6829406,"a":"Ironton, OH, 45638"},{"i":234,"n":"Licking County Jail","lat":40.056199,"lng":-82.4014328,"a":"Licking County Jail, Newark, OH, 43055"},{"i":235,"n":"Logan County Jail","lat":40.3611643,"lng":-83.7596557,"a":"Bellefontaine, OH, 43311"},{"i":236,"n":"Lorain County Jail","lat":41.3673191,"lng":-82.1073583,"a":"Elyria, OH, 44035"},{"i":237,"n":"Lucas County Jail","lat":41.6566804,"lng":-83.5364672,"a":"Lucas County Jail, Toledo, OH, 43604"},{"i":238,"n":"Madison County Jail","lat":39.8864493,"lng":-83.448253,"a":"London, OH, 43140"},{"i":239,"n":"Mahoning County Jail","lat":41.1035786,"lng":-80.6520161,"a":"Youngstown, OH, 44503"},{"i":240,"n":"Marion County Jail","lat":40.5886259,"lng":-83.1287349,"a":"Marion, OH, 43302"},{"i":175,"n":"McHenry County Jail","lat":42.3147529,"lng":-88.4474302,"a":"Woodstock, IL, 60098"},{"i":241,"n":"Medina County Jail","lat":41.127946,"lng":-81.8909634,"a":"Medina County Jail, Medina, OH, 44256"},{"i":242,"n":"Meigs County Jail","lat":39.0280514,"lng":-82.0342217,"a":"Pomeroy, OH, 45769"},{"i":243,"n":"Mercer County Jail","lat":40.5463487,"lng":-84.6152944,"a":"Mercer County Jail, Celina, OH, 45822"},{"i":96,"n":"Mesa Verde ICE Processing Facility","lat":35.3738712,"lng":-119.019463,"a":"Bakersfield, CA, 93308"},{"i":244,"n":"Miami County Jail","lat":40.0394982,"lng":-84.2032767,"a":"Troy, OH, 45373"},{"i":165,"n":"Minnehaha County Jail","lat":43.5476008,"lng":-96.7293629,"a":"Sioux Falls, SD, 57104"},{"i":120,"n":"Monroe County Detention Center","lat":24.5770255,"lng":-81.7514791,"a":"Monroe County Detention Center, Key West, FL, 33040"},{"i":245,"n":"Monroe County Jail","lat":39.7625729,"lng":-81.1153842,"a":"Woodsfield, OH, 43793"},{"i":246,"n":"Montgomery County Jail","lat":39.7596657,"lng":-84.1977416,"a":"Montgomery County Jail, Dayton, OH, 45402"},{"i":247,"n":"Morgan County Jail","lat":39.6491005,"lng":-81.852712,"a":"Morgan County Jail, McConnelsville, OH, 43756"},{"i":248,"n":"Morrow County Jail","lat":40.5492438,"lng":-82.8263126,"a":"Morrow County Jail, Mount Gilead, OH, 43338"},{"i":249,"n":"Muskingum County Jail","lat":39.9408474,"lng":-82.0070985,"a":"Muskingum County Jail, Zanesville, OH, 43701"},{"i":250,"n":"Noble County Jail","lat":39.7478508,"lng":-81.5165127,"a":"Caldwell, OH, 43724"},{"i":158,"n":"Northwest Detention Center","lat":47.2492053,"lng":-122.4211756,"a":"Northwest Detention Center, Tacoma, WA, 98421"},{"i":189,"n":"Oahu Community Correctional Center","lat":21.3300829,"lng":-157.8849773,"a":"Oahu Community Correctional Center, Honolulu, HI, 96817"},{"i":157,"n":"Orange County Jail","lat":41.4021497,"lng":-74.3242129,"a":"Goshen, NY, 10924"},{"i":97,"n":"Otay Mesa Detention Center","lat":32.5765248,"lng":-116.9154777,"a":"Otay Mesa Detention Center, San Diego, CA, 92154"},{"i":128,"n":"Otero County Processing Center","lat":32.0786798,"lng":-106.2779169,"a":"Otero County Processing Center, Chaparral, NM, 88081"},{"i":251,"n":"Ottawa County Jail","lat":41.5119954,"lng":-82.9376919,"a":"Port Clinton, OH, 43452"},{"i":252,"n":"Paulding County Jail","lat":41.1628401,"lng":-84.5902954,"a":"Paulding, OH, 45879"},{"i":253,"n":"Perry County Jail","lat":39.713978,"lng":-82.2084975,"a":"Perry County Jail, New Lexington, OH, 43764"},{"i":170,"n":"Phelps County Jail","lat":37.9509324,"lng":-91.7708076,"a":"Rolla, MO, 65401"},{"i":254,"n":"Pickaway County Jail","lat":39.600618,"lng":-82.9460133,"a":"Circleville, OH, 43113"},{"i":255,"n":"Pike County Jail","lat":39.126735,"lng":-82.9854553,"a":"Waverly, OH, 45690"},{"i":145,"n":"Pike County Jail","lat":31.8087678,"lng":-85.969951,"a":"Troy, AL, 36081"},{"i":126,"n":"Pinal County Jail","lat":33.0398533,"lng":-111.3756957,"a":"Pinal County Jail, Florence, AZ, 85132"},{"i":121,"n":"Polk County Jail","lat":27.8824098,"lng":-81.8196765,"a":"Polk County Jail, Bartow, FL, 33830"},{"i":109,"n":"Port Isabel Service Processing Center","lat":26.0714502,"lng":-97.4770792,"a":"Los Fresnos, TX, 78566"},{"i":256,"n":"Portage County Jail","lat":41.2147834,"lng":-81.2575551,"a":"Portage County Jail, Ravenna, OH, 44266"},{"i":176,"n":"Porter County Jail","lat":41.466405,"lng":-87.0595192,"a":"Porter County Jail, Valparaiso, IN, 46383"},{"i":257,"n":"Preble County Jail","lat":39.7439398,"lng":-84.6364891,"a":"Eaton, OH, 45320"},{"i":258,"n":"Putnam County Jail","lat":41.0059283,"lng":-84.0390043,"a":"Putnam County Jail, Ottawa, OH, 45875"},{"i":259,"n":"Richland County Jail","lat":40.7574585,"lng":-82.512842,"a":"Richland County Jail, Mansfield, OH, 44902"},{"i":138,"n":"Richmond County Jail","lat":37.9587465,"lng":-76.7580211,"a":"Warsaw, VA, 22572"},{"i":110,"n":"Rio Grande Detention Center","lat":27.5075005,"lng":-99.5069922,"a":"Laredo, TX, 78040"},{"i":260,"n":"Ross County Jail","lat":39.3331197,"lng":-82.9824019,"a":"Chillicothe, OH, 45601"},{"i":261,"n":"Sandusky County Jail","lat":41.3575283,"lng":-83.0837256,"a":"Sandusky County Jail, Fremont, OH, 43420"},{"i":262,"n":"Scioto County Jail","lat":38.7345374,"lng":-82.9962742,"a":"Portsmouth, OH, 45662"},{"i":122,"n":"Seminole County Jail","lat":28.8117345,"lng":-81.2680223,"a":"Sanford, FL, 32773"},{"i":263,"n":"Seneca County Jail","lat":41.114485,"lng":-83.1779537,"a":"Tiffin, OH, 44883"},{"i":264,"n":"Shelby County Jail","lat":40.284241,"lng":-84.1555267,"a":"Sidney, OH, 45365"},{"i":173,"n":"Sherburne County Jail","lat":45.3038538,"lng":-93.5671825,"a":"Elk River, MN, 55330"},{"i":160,"n":"Sheridan Federal Correctional Institution","lat":45.083863,"lng":-123.3815878,"a":"Sheridan Federal Correctional Institution, Sheridan, OR, 97378"},{"i":111,"n":"South Texas Family Residential Center","lat":28.6564798,"lng":-99.2021906,"a":"South Texas Family Residential Center, Dilley, TX, 78017"},{"i":171,"n":"St. Louis County Jail","lat":38.6485039,"lng":-90.3378037,"a":"St. Louis County Jail, Clayton, MO, 63105"},{"i":265,"n":"Stark County Jail","lat":40.8387953,"lng":-81.3087739,"a":"Stark County Jail, Canton, OH, 44702"},{"i":141,"n":"Stewart Detention Center","lat":32.0356341,"lng":-84.7719795,"a":"Stewart Detention Center, Lumpkin, GA, 31815"},{"i":183,"n":"Suffolk County House of Correction","lat":42.3341589,"lng":-71.068675,"a":"Suffolk County House of Correction, Boston, MA, 02118"},{"i":266,"n":"Summit County Jail","lat":41.0603905,"lng":-81.5211716,"a":"Summit County Jail, Akron, OH, 44308"},{"i":186,"n":"Sussex Correctional Institution","lat":38.6900507,"lng":-75.3858753,"a":"Georgetown, DE, 19947"},{"i":112,"n":"T. Don Hutto Residential Center","lat":30.5647288,"lng":-97.4194342,"a":"T. Don Hutto Residential Center, Taylor, TX, 76574"},{"i":147,"n":"Tallahatchie County Correctional Facility","lat":34.0260769,"lng":-90.4450243,"a":"Tallahatchie County Correctional Facility, Tutwiler, MS, 38963"},{"i":98,"n":"Theo Lacy Facility","lat":33.7811502,"lng":-117.8875303,"a":"Theo Lacy Facility, Orange, CA, 92868"},{"i":149,"n":"Trousdale Turner Correctional Center","lat":36.3521745,"lng":-86.0915632,"a":"Trousdale Turner Correctional Center, Hartsville, TN, 37074"},{"i":267,"n":"Trumbull County Jail","lat":41.2367955,"lng":-80.8190423,"a":"Warren, OH, 44481"},{"i":268,"n":"Tuscarawas County Jail","lat":40.4908982,"lng":-81.4426149,"a":"Tuscarawas County Jail, New Philadelphia, OH, 44663"},{"i":269,"n":"Union County Jail","lat":40.2364486,"lng":-83.3671432,"a":"Marysville, OH, 43040"},{"i":270,"n":"Van Wert County Jail","lat":40.8696461,"lng":-84.5829261,"a":"Van Wert, OH, 45891"},{"i":271,"n":"Vinton County Jail","lat":39.2464596,"lng":-82.4784898,"a":"McArthur, OH, 45651"},{"i":272,"n":"Warren County Jail","lat":39.4353373,"lng":-84.2029922,"a":"Lebanon, OH, 45036"},{"i":273,"n":"Washington County Jail","lat":39.4282793,"lng":-81.4759425,"a":"Washington County Jail, Marietta, OH, 45750"},{"i":274,"n":"Wayne County Jail","lat":40.7980976,"lng":-81.9397733,"a":"Wooster, OH, 44691"},{"i":162,"n":"Weber County Correctional Facility","lat":41.240367,"lng":-111.9935488,"a":"Weber County Correctional Facility, Ogden, UT, 84401"},{"i":113,"n":"West Texas Detention Facility","lat":31.1662348,"lng":-105.3515233,"a":"West Texas Detention Facility, Sierra Blanca, TX, 79851"},{"i":114,"n":"Willacy County Processing Center","lat":26.4814565,"lng":-97.783051,"a":"Raymondville, TX, 78580"},{"i":275,"n":"Williams County Jail","lat":41.4758844,"lng":-84.553562,"a":"Williams County Jail, Bryan, OH, 43506"},{"i":140,"n":"Winn Correctional Center","lat":31.8502693,"lng":-92.7792943,"a":"Winn Correctional Center, Winnfield, LA, 71483"},{"i":115,"n":"Winn Correctional Center","lat":31.7630345,"lng":-106.04638,"a":"Winnfield, TX, 71483"},{"i":276,"n":"Wood County Jail","lat":41.3768671,"lng":-83.6482732,"a":"Wood County Jail, Bowling Green, OH, 43402"},{"i":187,"n":"Worcester County Jail","lat":38.1770634,"lng":-75.3926959,"a":"Snow Hill, MD, 21863"},{"i":277,"n":"Wyandot County Jail","lat":40.8272785,"lng":-83.2813089,"a":"Upper Sandusky, OH, 43351"},{"i":159,"n":"Yakima County Jail","lat":46.601557,"lng":-120.510842,"a":"Yakima, WA, 98902"}],"data":{"146":[109,926,908,457,386,353,325,313,349,309,554,617,662,700,716,872,872,862,809,743,661,703,732,770,776,830,1122,1159,1071,979,964,953,948,870,853,838,840,909,1681,1714,1594,1493,1533,1516,1407,1390,1409,1449,1480,1492,2067,2092,2123,2149,2148,2161,2171,2168,2179,2170,2170,2172],"190":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"92":[868,538,523,207,211,231,234,220,216,230,207,222,234,238,229,79,76,74,66,62,56,51,49,47,1073,1109,1425,20,19,19,1346,18,1355,1282,1278,16,16,15,1722,1695,387,1657,1653,1654,1613,1613,1609,1605,1589,1580,1688,1689,1681,1683,1666,1664,1659,1659,1670,1674,1687,1692],"184":[70,58,59,63,61,60,57,51,49,55,43,41,39,39,38,35,33,32,27,25,23,21,21,21,20,19,19,19,18,17,18,21,23,26,27,28,28,28,39,35,36,35,37,39,43,44,0,0,47,48,75,73,72,71,74,76,76,77,79,80,81,81],"178":[35,31,29,8,8,7,6,5,0,4,4,4,4,4,4,12,13,12,10,9,8,8,8,7,7,7,8,8,9,9,10,11,12,14,15,16,17,17,23,24,23,22,21,22,22,22,22,22,21,21,20,20,20,19,20,20,20,20,21,22,24,24],"191":[63,80,79,1,1,1,1,1,65,1,60,1,1,1,1,1,131,130,1,106,91,1,97,97,97,101,139,148,127,102,90,83,84,87,91,93,96,102,112,117,126,124,125,127,127,127,129,128,132,134,176,170,171,172,175,177,176,175,174,175,173,172],"188":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,3,4,3,3],"192":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"193":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"194":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"195":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"129":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"116":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"169":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"196":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"131":[394,185,184,212,207,199,189,167,160,182,138,128,119,112,107,0,10,9,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"179":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"177":[0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"154":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,4,7,9,8,13,16,16,19,56,61,47,41,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"99":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"100":[0,250,256,476,452,429,421,390,374,413,364,383,393,397,393,280,300,299,290,294,301,328,341,360,365,389,688,737,684,602,582,563,550,527,531,531,529,544,702,626,597,579,590,600,615,617,622,633,649,654,804,763,752,739,770,846,881,908,930,950,963,968],"150":[137,101,101,77,72,68,63,56,55,60,62,64,66,68,69,85,84,84,80,81,82,87,88,90,90,92,123,137,134,136,136,139,137,131,129,128,125,125,135,135,132,133,131,131,130,129,129,130,130,130,119,126,129,128,133,144,148,152,157,162,166,168],"101":[36,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,3],"117":[651,482,476,374,387,409,391,344,330,374,314,322,323,320,318,314,330,340,318,314,324,330,334,340,345,364,473,469,464,463,461,469,478,494,498,502,507,521,631,596,583,595,602,604,591,593,591,594,598,599,640,632,638,651,656,648,643,640,639,643,646,649],"197":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"156":[28,30,29,18,18,18,18,18,18,18,16,16,15,14,14,9,9,9,10,10,10,10,10,9,9,8,4,4,6,6,5,6,7,9,9,10,10,11,15,17,17,16,17,18,18,19,20,20,20,20,16,15,15,15,20,27,30,33,38,42,45,47],"164":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,4,5,6],"167":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"198":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"152":[120,102,102,104,98,94,93,94,92,94,82,0,0,0,87,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,13,42,66,96,126,142,150],"93":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"134":[185,136,138,130,127,124,122,120,114,122,87,82,78,76,74,50,51,51,52,52,55,58,59,61,62,65,89,89,82,78,77,77,76,76,75,76,80,84,121,124,125,123,125,126,129,129,129,126,124,123,141,137,135,133,139,139,141,144,151,155,157,158],"136":[273,234,230,166,172,176,176,176,176,177,167,167,167,167,168,194,206,209,204,200,195,191,191,190,189,184,171,174,173,173,174,173,172,182,186,190,194,201,253,260,252,249,252,253,251,248,244,242,239,239,251,268,271,268,273,288,293,293,296,298,298,300],"199":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"163":[2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"200":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"135":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"181":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,0,0,1,1,1,1,1,1,4,3,2,2,2,2,2,2,2,2,2,1,0,1,1,1,2,2,2,3,3,4,4,4],"127":[373,60,55,0,0,2,0,0,0,0,3,13,17,19,22,87,83,81,81,78,75,77,77,77,77,74,65,64,56,53,64,68,73,78,81,86,87,88,112,134,148,149,153,171,186,184,180,175,183,185,184,165,157,160,163,184,216,227,227,223,222,220],"201":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,4,14,22,27,31,33],"202":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"155":[57,75,76,77,82,82,81,81,80,82,79,78,77,76,76,55,53,51,48,48,46,45,45,45,45,44,52,50,51,51,51,52,52,52,53,54,53,54,64,63,64,62,60,59,2,58,0,0,60,61,72,72,75,77,78,80,80,81,82,82,83,84],"203":[7,8,8,5,5,7,7,6,6,6,5,4,4,5,5,5,0,0,3,3,5,6,6,6,7,7,4,3,3,2,3,3,3,3,3,3,0,0,0,1,2,2,2,2,3,3,58,2,59,2,1,2,2,2,4,5,5,6,5,5,5,5],"204":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"102":[844,152,153,69,57,7,43,35,33,40,27,33,37,38,43,88,71,69,99,104,120,148,154,164,615,653,895,325,315,320,996,350,378,1003,999,518,550,578,963,1125,1181,1200,1196,1198,1173,1168,1161,1159,1165,1165,1285,1231,1231,1239,1228,1220,1223,1216,1206,1214,1219,1218],"103":[1,6,6,4,3,1,4,4,4,4,4,4,4,4,5,7,7,7,6,6,5,5,5,4,4,4,1,1,1,1,1,1,1,1,2,2,2,79,6,5,5,5,6,6,6,6,6,6,6,5,4,3,3,3,4,5,5,6,6,7,8,9],"205":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"206":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"180":[1,1,1,5,5,4,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,2,3,3,2,3,3,3,3,3,3,3,3,3,4,4,3,3,3,3,3,0,0,3,4,28,33,33,35,40,47,51,53,55,56,56,55],"207":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"208":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"209":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"210":[3,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"130":[248,131,126,54,48,43,41,39,38,41,39,51,57,63,69,169,550,553,72,63,518,507,510,522,528,527,666,721,719,683,675,675,670,681,671,667,679,697,818,870,916,948,966,979,970,976,978,984,993,1003,1185,1180,1171,1155,1138,1150,1147,1150,1159,1169,1177,1180],"104":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,1099,2,2022,1868,1810,1845,1849,1822,1814,1784,1707,0,0,0,0,0,0,0,0,13,33,80,124,144,152],"174":[128,95,94,83,77,74,74,70,70,73,69,71,73,74,73,47,45,44,40,39,38,35,35,35,35,40,98,107,110,109,109,111,111,114,115,116,116,117,107,115,121,122,124,122,120,121,121,120,118,116,100,105,107,107,110,112,114,114,112,109,109,109],"94":[611,379,374,282,276,5,265,258,252,264,229,231,238,246,251,286,309,298,270,258,247,249,253,261,345,351,366,304,297,286,417,283,286,482,492,322,338,359,582,592,587,579,577,578,577,577,579,582,585,586,587,596,584,567,551,741,778,833,871,917,911,909],"105":[813,554,534,331,332,1,340,326,322,4,306,324,332,332,4,427,427,422,432,422,411,420,423,426,428,430,389,436,431,417,420,424,432,454,486,512,533,563,777,801,796,781,771,768,766,765,764,767,770,768,720,711,708,709,720,3,29,46,112,173,7,823],"132":[293,171,160,136,133,130,119,106,102,114,106,106,105,106,105,93,96,94,90,91,88,91,90,90,90,94,139,144,148,145,140,138,137,146,152,158,163,168,222,213,219,220,215,220,224,226,229,234,237,238,282,280,274,268,276,282,286,287,290,293,297,297],"123":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"211":[0,0,0,1,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,4,7,9,10,11,12,13],"144":[287,177,172,123,115,108,105,100,97,104,88,95,97,103,107,119,128,133,113,102,93,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,11,19,20,24,32,38,42],"212":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"137":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"213":[3,2,2,1,1,1,1,1,1,1,0,1,1,0,1,0,1,1,1,1,1,1,0,1,1,1,0,1,1,1,0,1,1,1,1,1,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,0,42,1,2,0],"124":[415,288,274,107,101,92,86,75,73,81,67,74,84,92,94,132,127,134,137,142,151,161,165,168,167,174,230,222,191,186,188,183,182,185,202,215,222,238,392,383,372,367,0,0,0,0,0,0,390,390,351,368,376,378,376,381,383,385,390,384,387,390],"143":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,12,28],"214":[34,21,21,21,21,28,22,22,22,22,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"215":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"216":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"217":[58,49,48,35,33,30,28,25,24,27,20,20,20,20,20,16,17,17,17,17,17,17,17,17,16,16,14,15,15,16,18,18,19,19,19,20,22,25,52,58,56,52,50,50,51,52,52,53,53,53,45,50,52,50,51,46,45,43,43,42,42,42],"153":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"118":[423,390,384,306,304,300,296,267,256,289,204,189,181,182,187,159,125,111,83,74,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,16,45,68,89,108,121],"168":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"151":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,0,1,1,1,1,1,1,0,0,0,0,0,1,1,0,0,1,1,0,0,3,2,2,5,18,28,36,46,56,65,68],"218":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,49,74,94,111,125,133,139],"219":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"166":[82,62,60,26,26,26,25,23,22,24,21,20,20,20,19,16,16,17,18,18,18,17,16,15,15,15,13,13,14,14,15,14,14,14,14,14,14,14,8,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,25,96,139,187,1],"220":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"221":[0,1,1,3,3,3,2,0,0,0,1,0,0,0,1,0,0,0,5,5,0,0,4,4,4,4,5,5,4,4,4,5,5,5,6,6,6,6,6,6,7,9,10,9,9,10,10,10,10,10,12,13,13,12,13,18,21,21,22,22,23,23],"148":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"222":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"172":[57,51,51,37,37,37,38,38,37,39,30,28,0,0,34,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,3,6,8,9,10],"223":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"185":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"161":[215,185,184,135,131,130,133,127,125,131,102,101,97,94,90,34,35,36,36,35,36,40,40,43,43,43,71,78,75,69,70,71,70,70,70,70,70,69,62,66,66,66,68,69,69,69,70,70,69,69,67,64,61,63,66,70,71,71,72,75,77,77],"224":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"225":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"182":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"226":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"227":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"106":[908,625,590,172,214,199,211,191,190,206,208,224,237,245,249,259,240,231,252,263,302,342,353,363,363,374,458,470,426,442,469,510,529,501,523,554,562,588,918,868,808,835,835,836,763,763,773,775,782,782,821,862,855,850,833,828,833,825,832,832,842,846],"133":[473,213,200,87,89,87,81,73,71,78,63,61,59,58,57,0,0,0,0,3,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"228":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"95":[115,1,3,45,58,50,52,50,54,54,39,337,35,39,41,34,47,64,82,82,87,88,90,483,82,83,102,88,100,115,110,112,111,108,105,106,100,97,108,108,93,80,73,66,65,69,68,71,66,65,101,100,67,50,44,70,110,134,61,192,213,222],"142":[850,661,646,394,385,377,361,326,314,350,292,294,284,276,287,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"229":[498,633,623,308,266,235,210,188,184,183,261,323,368,395,404,570,496,452,364,338,321,341,350,383,400,466,875,878,788,666,602,604,607,549,561,553,539,582,1032,1066,1055,994,935,927,896,891,867,856,844,839,952,954,970,982,971,1004,1022,1032,1045,1053,1054,1056],"230":[6,2,2,1,1,1,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,0,1,2,2,2,2,2,2,2,2,0,1,0,1,2,1,2,2,0,2,0,0,0,1,2,2,3,3,4,4,5,5,5,5],"107":[214,231,218,1,1,1,96,101,112,99,124,136,146,160,169,245,252,262,309,327,348,392,405,402,399,393,966,914,821,669,660,720,681,647,696,727,745,797,1292,1215,1206,1227,2,1,1,1171,1161,1140,1132,1123,1121,1122,1104,1131,1081,2,816,844,881,914,946,958],"231":[3,0,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,1,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,0,2,2,2,3,3,3,3,3,3,5,6,6,9,13,18,22,20,23,27,29],"119":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"125":[4,2,592,1,1,1,299,347,1,298,1,1,563,1,584,721,696,1,770,780,785,718,708,1,1,1,3,925,2,2,910,2,2,857,1,1,1,1041,1436,1432,1,1,1418,1418,1419,1420,1420,1424,1428,1427,1308,1,1295,1,1,1,1346,1362,1545,1,1,1401],"139":[1179,1021,977,565,542,524,505,473,465,495,468,488,491,491,489,475,479,475,436,419,412,440,453,477,486,532,836,863,856,795,784,791,800,780,771,790,798,808,899,932,970,1007,1019,1025,1049,1057,1071,1085,1102,1107,1174,1161,1170,1183,1182,1187,1186,1180,1177,1176,1176,1180],"232":[0,0,0,2,1,1,0,0,0,0,0,0,1,0,0,0,1,1,1,0,2,2,2,2,2,2,3,3,3,3,3,3,3,4,4,4,4,4,5,5,5,4,4,4,4,4,4,4,4,4,6,6,6,6,6,6,6,6,6,7,7,7],"108":[369,202,194,83,73,77,83,91,96,84,114,120,122,124,125,177,169,164,161,168,160,160,159,152,149,150,302,303,269,233,221,215,209,197,196,195,197,212,392,358,298,299,294,292,289,293,297,297,302,302,341,346,344,353,346,348,353,355,360,364,367,368],"233":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"234":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"235":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2],"236":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"237":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"238":[4,2,2,2,2,2,1,0,1,1,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,1,2,0,2,2,3,3,4,4,4,4,4,4,3,3,3,3,3,3,3,0,0,2,2,2,2,2,2,2,2,4,4,4,5,6,7,8],"239":[287,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,31,53,71,86,32,114,41],"240":[0,1,0,2,0,2,0,0,0,0,0,2,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,14,23,32,40,45,50,52],"175":[281,222,216,140,130,126,118,110,108,116,103,111,115,116,118,94,88,84,72,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"241":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"242":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"243":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"96":[377,275,261,53,50,48,46,44,43,45,40,39,37,36,36,52,53,54,54,53,50,51,51,52,52,52,50,51,49,49,50,49,48,47,47,48,49,49,42,43,44,45,45,45,46,46,46,47,47,48,50,51,51,50,51,51,51,51,60,90,117,128],"244":[0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,15,3,4,3,4,4,220,230],"165":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,2,2,2],"120":[66,53,50,15,13,11,10,8,8,9,10,11,11,12,12,26,29,29,24,22,22,22,22,22,24,29,9,8,6,0,0,0,0,9,13,17,21,26,55,63,63,59,58,56,51,49,0,0,36,36,68,67,69,65,71,87,94,98,102,104,106,107],"245":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"246":[2,25,26,22,22,21,20,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,2],"247":[56,39,39,24,22,23,24,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"248":[35,32,30,10,8,23,6,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"249":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"250":[2,0,1,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"158":[1342,787,761,423,388,362,344,319,311,336,290,315,342,358,363,433,441,438,414,398,377,366,369,372,372,371,447,3,4,3,554,3,3,557,561,3,3,4,7,8,7,6,6,6,773,775,772,761,735,728,5,5,6,5,5,6,7,8,9,9,9,9],"189":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"157":[165,107,104,64,63,62,65,70,70,66,71,75,77,78,79,148,152,149,142,141,141,140,140,139,139,126,74,78,80,81,81,80,80,78,76,75,73,72,65,64,63,2,2,2,2,2,67,68,2,69,76,77,77,74,81,93,102,108,115,120,124,126],"97":[966,790,754,368,361,350,341,348,352,341,370,394,414,442,1,732,740,755,777,774,751,714,696,677,684,717,940,931,936,919,913,922,924,929,954,975,967,982,1265,1246,1211,1233,1243,1247,1242,1244,1217,1228,1239,1241,1320,1364,1375,1384,1391,1356,1351,1348,1350,1361,1374,1383],"128":[958,680,646,251,219,208,200,192,188,196,230,266,290,294,303,551,532,537,525,507,480,491,493,496,497,506,427,527,528,505,511,513,507,500,521,543,557,579,886,928,924,922,903,905,892,881,871,865,864,855,773,789,801,818,819,815,816,824,843,856,871,877],"251":[9,0,0,0,2,3,4,5,6,4,8,9,9,9,8,4,5,6,7,8,9,11,12,13,13,14,23,23,26,26,25,26,27,27,28,28,28,27,20,20,23,24,25,25,26,27,27,28,27,27,31,30,30,31,33,34,35,35,36,36,37,37],"252":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"253":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"170":[10,13,13,13,14,16,17,17,16,17,13,12,12,11,11,3,2,0,0,0,2,3,3,3,0,3,3,2,2,1,2,2,2,2,2,2,2,2,5,4,6,7,9,10,12,13,14,14,15,15,25,26,27,26,27,1,30,31,31,31,31,31],"254":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"255":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"145":[198,131,123,58,54,50,47,44,43,47,39,38,37,35,35,25,30,32,39,42,47,1,53,57,58,63,94,92,96,97,96,97,98,98,96,97,98,100,125,122,124,123,122,122,123,123,123,123,126,127,162,163,176,181,182,182,183,184,187,187,189,191],"126":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"121":[32,29,29,28,29,31,30,28,27,30,23,22,22,21,21,13,11,11,11,11,11,11,11,11,12,14,21,20,21,22,23,24,25,25,24,24,25,25,23,23,24,23,23,24,26,26,26,26,27,27,28,27,27,28,32,37,40,39,40,42,43,43],"109":[1231,747,708,5,1,1,401,407,392,405,399,408,423,417,420,516,473,457,451,486,505,519,529,544,549,588,833,856,780,773,763,768,770,738,761,775,781,799,1158,1133,1103,1089,1072,1083,1040,1038,1032,1020,972,972,918,914,910,968,986,1025,1032,1034,1047,1053,1076,1087],"256":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"176":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"257":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"258":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,3,5,6],"259":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"138":[0,0,0,0,0,6,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"110":[384,78,80,42,47,39,57,75,85,59,102,105,109,114,117,176,174,170,171,176,166,152,152,151,148,148,230,231,228,214,196,189,184,182,182,184,184,182,271,275,236,228,243,241,224,227,227,225,227,227,240,254,263,283,298,329,345,357,366,374,384,388],"260":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"261":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"262":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"122":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"263":[54,47,47,34,34,33,31,28,27,30,24,25,26,26,27,39,38,38,37,36,36,36,36,37,38,40,53,54,53,54,54,55,55,54,55,56,56,57,54,62,64,60,63,65,66,66,66,66,66,66,66,64,62,61,62,62,61,61,60,60,60,60],"264":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"173":[307,232,222,78,75,74,72,67,65,71,56,53,50,47,46,13,13,13,11,11,11,11,11,10,10,9,3,3,2,2,2,2,2,2,2,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1,6,5,4,3,12,28,38,46,51,55,59,61],"160":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"111":[1075,827,770,155,174,178,195,253,299,211,388,427,463,478,484,390,371,435,515,525,673,715,734,741,724,738,1562,1623,1565,1372,1333,1367,1348,1216,1183,1160,1110,1091,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"171":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"265":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"141":[1911,1408,1381,838,791,773,738,698,673,721,627,667,710,746,769,1136,1181,1183,1134,1117,1095,1086,1092,1098,1093,1076,1280,1314,1268,1213,1164,1136,1111,1137,1163,1194,1209,1232,1460,1488,1514,1523,1522,1523,1529,1528,1528,1530,1531,1532,1510,1524,1507,1516,1559,1681,1751,1806,1857,1882,1903,1912],"183":[145,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"266":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"186":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"112":[482,314,293,75,69,66,66,70,71,82,96,106,110,117,124,321,307,298,308,311,285,290,293,292,288,266,440,410,382,335,350,363,370,368,372,379,382,383,430,435,433,432,428,427,426,422,418,415,414,416,435,430,430,428,423,425,429,428,429,429,430,429],"147":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"98":[326,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"149":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"267":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"268":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"269":[0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"270":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"271":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"272":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"273":[2,5,2,5,1,1,1,1,0,1,3,3,3,2,3,2,0,1,0,2,1,1,1,2,2,2,8,7,6,6,1,1,1,5,1,1,1,1,1,1,1,2,2,2,2,0,2,2,2,2,6,0,3,3,3,4,4,4,4,4,3,5],"274":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"162":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"113":[1,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"114":[697,659,630,33,289,11,280,320,326,290,356,365,375,379,380,328,314,321,301,341,356,342,342,346,348,395,471,622,622,534,570,576,584,562,590,603,612,645,912,929,897,869,858,857,843,843,846,844,830,833,862,870,867,884,854,862,854,837,837,840,850,854],"275":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"140":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"115":[450,1054,1040,511,475,455,421,374,365,401,451,520,561,586,602,963,920,866,719,660,601,612,618,645,659,725,1467,1483,1369,1231,1151,1125,1119,1123,1108,1114,1126,1161,1432,1462,1483,1497,1476,1470,1437,1424,1412,1411,1422,1424,1496,1487,1474,1479,1491,1516,1531,1541,1552,1553,1560,1563],"276":[379,523,507,189,190,6,179,160,156,172,227,285,323,350,358,445,453,443,402,362,341,357,360,369,372,399,578,572,514,453,454,478,488,470,472,465,452,469,750,779,764,768,752,749,737,742,749,757,769,774,791,741,746,777,788,1,4,6,12,19,25,27],"187":[155,90,85,25,24,22,21,20,21,21,20,21,21,22,22,19,18,17,15,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"277":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"159":[4,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]}};
+export const monthlyFacilitiesData: OptimizedMonthlyData = decodeMonthlyData(
+JSON.parse('{"meta":{"v":2,"t":"2025-09-14T14:50:40.242020","f":186,"m":["2019-09","2020-08","2020-09","2020-11","2020-12","2021-01","2021-02","2021-03","2021-04","2021-05","2021-06","2021-07","2021-08","2021-09","2021-10","2021-11","2021-12","2022-01","2022-02","2022-03","2022-04","2022-05","2022-06","2022-07","2022-08","2022-09","2022-10","2022-11","2022-12","2023-01","2023-02","2023-03","2023-04","2023-05","2023-06","2023-07","2023-08","2023-09","2023-10","2023-11","2023-12","2024-01","2024-02","2024-03","2024-04","2024-05","2024-06","2024-07","2024-08","2024-09","2024-10","2024-11","2024-12","2025-01","2025-02","2025-03","2025-04","2025-05","2025-06","2025-07","2025-08","2025-09"],"l":"2025-09","d":"ICE Detention Facilities - Optimized Monthly Data","s":[{"n":79,"min":1,"max":1911,"q":[3,28,57,128,215,369,473,868],"h":[3,7,5,2,1,11,6,10,19,10,5,0]},{"n":71,"min":1,"max":1408,"q":[2,30,58,101,177,234,523,747],"h":[4,4,2,2,5,9,8,15,6,14,2,0]},{"n":72,"min":1,"max":1381,"q":[3,29,59,102,184,256,523,708],"h":[3,6,1,2,6,8,10,12,8,14,2,0]},{"n":72,"min":1,"max":838,"q":[2,10,26,53,77,130,207,374],"h":[6,4,5,4,7,10,12,11,11,2,0,0]},{"n":73,"min":1,"max":791,"q":[1,8,24,50,73,127,211,361],"h":[10,4,2,4,7,11,11,10,12,2,0,0]},{"n":78,"min":1,"max":773,"q":[1,3,11,26,50,82,130,350],"h":[14,5,7,2,10,9,12,9,8,2,0,0]},{"n":70,"min":1,"max":738,"q":[4,20,38,63,83,133,234,344],"h":[6,1,5,1,10,9,14,9,14,1,0,0]},{"n":64,"min":1,"max":698,"q":[6,25,44,70,100,167,258,344],"h":[4,0,4,1,8,8,16,8,14,1,0,0]},{"n":62,"min":1,"max":673,"q":[8,27,49,71,97,160,256,349],"h":[3,0,3,1,8,8,17,8,13,1,0,0]},{"n":65,"min":1,"max":721,"q":[4,22,41,66,94,172,230,341],"h":[5,0,5,1,8,9,14,9,13,1,0,0]},{"n":64,"min":1,"max":627,"q":[5,21,39,67,96,138,230,364],"h":[3,2,3,3,8,9,14,8,12,2,0,0]},{"n":63,"min":1,"max":667,"q":[4,20,39,74,106,189,315,394],"h":[3,2,3,4,7,7,13,7,14,3,0,0]},{"n":62,"min":1,"max":710,"q":[4,20,37,77,109,181,323,423],"h":[3,1,3,4,6,8,14,6,13,4,0,0]},{"n":60,"min":1,"max":746,"q":[9,21,39,76,112,182,320,417],"h":[2,1,3,4,6,8,14,6,13,3,0,0]},{"n":65,"min":1,"max":769,"q":[4,19,35,69,94,125,287,404],"h":[5,1,4,4,6,8,16,6,11,4,0,0]},{"n":57,"min":1,"max":1136,"q":[9,19,47,87,148,259,390,551],"h":[1,2,3,4,5,8,7,8,11,7,1,0]},{"n":58,"min":1,"max":1181,"q":[10,18,47,83,131,252,427,532],"h":[2,1,2,5,5,8,8,8,12,6,1,0]},{"n":59,"min":1,"max":1183,"q":[7,17,38,74,130,231,340,475],"h":[5,0,2,5,4,8,8,8,13,5,1,0]},{"n":59,"min":1,"max":1134,"q":[6,17,39,72,99,252,318,515],"h":[3,1,4,5,4,7,10,6,12,6,1,0]},{"n":58,"min":1,"max":1117,"q":[7,17,42,74,106,258,341,507],"h":[1,3,3,5,4,9,8,5,14,5,1,0]},{"n":57,"min":1,"max":1095,"q":[8,17,46,82,141,301,356,518],"h":[2,2,2,6,4,8,7,6,13,6,1,0]},{"n":56,"min":1,"max":1086,"q":[5,11,35,58,152,328,366,519],"h":[4,2,2,6,4,7,4,7,13,6,1,0]},{"n":56,"min":1,"max":1092,"q":[8,16,40,77,154,334,369,529],"h":[1,2,3,6,4,8,5,7,13,6,1,0]},{"n":59,"min":1,"max":1098,"q":[3,11,22,57,139,292,372,522],"h":[4,3,4,5,4,8,4,6,14,6,1,0]},{"n":56,"min":1,"max":1093,"q":[7,15,38,77,149,348,400,615],"h":[2,2,4,5,4,7,5,5,13,7,2,0]},{"n":61,"min":1,"max":1109,"q":[2,8,19,63,101,351,399,653],"h":[6,3,4,5,4,6,7,4,12,8,2,0]},{"n":60,"min":1,"max":1562,"q":[3,8,50,74,139,427,578,940],"h":[1,8,3,5,3,4,8,5,9,9,5,0]},{"n":62,"min":1,"max":1623,"q":[2,5,20,64,137,304,572,914],"h":[4,8,3,4,4,4,7,6,7,11,4,0]},{"n":63,"min":1,"max":1565,"q":[2,4,18,53,110,269,514,821],"h":[5,8,5,3,4,5,7,5,7,10,4,0]},{"n":64,"min":1,"max":1372,"q":[1,3,16,51,102,214,453,683],"h":[8,8,3,2,5,5,7,6,8,9,3,0]},{"n":60,"min":1,"max":1346,"q":[2,5,50,81,174,454,582,913],"h":[4,8,2,2,4,3,8,6,7,12,4,0]},{"n":60,"min":1,"max":1367,"q":[2,3,21,68,112,283,510,768],"h":[4,10,2,2,5,3,8,6,7,10,3,0]},{"n":62,"min":1,"max":1355,"q":[2,3,19,70,111,286,529,800],"h":[6,9,3,2,4,3,8,6,7,10,4,0]},{"n":63,"min":1,"max":1282,"q":[2,5,26,78,146,470,557,870],"h":[5,6,4,4,4,3,8,6,7,12,4,0]},{"n":63,"min":1,"max":1278,"q":[2,4,24,75,129,472,561,853],"h":[6,7,3,4,4,3,8,6,5,13,4,0]},{"n":63,"min":1,"max":1194,"q":[2,4,17,56,106,215,531,775],"h":[6,8,3,2,7,3,8,6,4,13,3,0]},{"n":61,"min":1,"max":1209,"q":[2,4,22,70,100,222,539,781],"h":[5,7,3,2,7,3,9,5,4,13,3,0]},{"n":63,"min":1,"max":1232,"q":[2,11,27,79,125,383,582,909],"h":[5,5,4,3,6,3,10,5,3,14,5,0]},{"n":59,"min":1,"max":1722,"q":[3,8,42,107,135,582,886,1265],"h":[3,4,6,2,3,6,8,3,4,11,9,0]},{"n":61,"min":1,"max":2022,"q":[3,8,43,108,135,592,928,1246],"h":[5,3,5,2,4,6,7,3,5,10,11,0]},{"n":58,"min":1,"max":1868,"q":[3,7,56,93,219,433,897,1181],"h":[3,4,6,0,4,5,8,5,4,10,9,0]},{"n":58,"min":1,"max":1810,"q":[2,7,45,80,220,579,922,1227],"h":[3,6,4,1,4,6,6,5,3,11,9,0]},{"n":58,"min":1,"max":1845,"q":[2,6,37,68,153,577,903,1243],"h":[1,9,3,2,4,6,6,5,2,11,9,0]},{"n":59,"min":1,"max":1849,"q":[2,6,25,66,131,578,857,1247],"h":[4,7,3,2,4,5,7,5,2,10,10,0]},{"n":59,"min":1,"max":1822,"q":[2,6,26,69,186,591,843,1242],"h":[3,9,2,2,4,4,6,6,2,11,10,0]},{"n":56,"min":1,"max":1814,"q":[3,22,52,123,248,742,891,1244],"h":[1,6,2,2,4,5,6,6,2,11,11,0]},{"n":52,"min":1,"max":1784,"q":[6,27,68,129,297,764,978,1409],"h":[1,3,2,2,4,3,6,7,2,11,11,0]},{"n":55,"min":1,"max":1707,"q":[2,20,66,126,242,757,865,1228],"h":[2,6,2,2,4,2,7,6,2,12,10,0]},{"n":58,"min":1,"max":1589,"q":[3,20,53,118,237,598,844,1165],"h":[2,6,2,2,4,6,6,6,3,12,9,0]},{"n":57,"min":1,"max":1580,"q":[4,21,61,123,238,654,839,1165],"h":[2,4,3,2,4,5,7,6,3,12,9,0]},{"n":56,"min":1,"max":2067,"q":[6,28,67,101,251,640,862,1285],"h":[1,2,5,1,6,2,9,6,4,10,9,1]},{"n":58,"min":1,"max":2092,"q":[3,15,51,77,170,430,862,1180],"h":[3,4,4,2,4,3,9,5,5,10,8,1]},{"n":59,"min":1,"max":2123,"q":[3,20,52,77,176,584,855,1231],"h":[1,6,4,2,4,5,6,5,6,10,9,1]},{"n":59,"min":1,"max":2149,"q":[3,15,50,74,172,428,818,1183],"h":[2,7,3,2,4,6,5,5,6,10,8,1]},{"n":62,"min":1,"max":2148,"q":[3,12,33,71,163,376,819,1182],"h":[2,5,5,4,3,7,6,5,6,10,8,1]},{"n":67,"min":1,"max":2161,"q":[3,6,20,47,87,184,741,1150],"h":[4,5,7,4,6,7,7,5,6,7,8,1]},{"n":70,"min":1,"max":2171,"q":[4,18,30,53,102,286,816,1186],"h":[1,1,11,1,10,9,8,5,6,8,9,1]},{"n":72,"min":2,"max":2168,"q":[6,21,36,61,108,287,825,1180],"h":[0,4,7,3,6,13,9,6,6,7,10,1]},{"n":76,"min":1,"max":2179,"q":[5,20,40,61,102,187,832,1159],"h":[1,4,8,3,6,12,13,5,6,7,10,1]},{"n":77,"min":1,"max":2170,"q":[4,11,32,60,120,187,429,1053],"h":[3,2,10,3,6,11,11,8,6,7,9,1]},{"n":80,"min":1,"max":2170,"q":[4,9,31,60,117,189,430,1076],"h":[3,5,8,5,6,9,10,11,6,7,9,1]},{"n":79,"min":1,"max":2172,"q":[5,13,41,68,128,222,823,1180],"h":[1,5,7,5,6,11,8,11,6,8,10,1]}],"e":"zz-delta-varint"},"facilities":[{"i":146,"n":"Adams County Correctional Center","lat":31.5576334,"lng":-91.2211771,"a":"Adams County Correctional Center, Natchez, MS, 39120","x":54},{"i":190,"n":"Adams County Jail","lat":39.9356016,"lng":-91.4098727,"a":"Quincy, IL, 62301","x":98},{"i":92,"n":"Adelanto ICE Processing Center","lat":34.5599467,"lng":-117.4421505,"a":"Adelanto ICE Processing Center, Adelanto, CA, 92301","x":0},{"i":184,"n":"Adult Correctional Institutions","lat":41.779588,"lng":-71.4366813,"a":"Cranston, RI, 02920","x":92},{"i":178,"n":"Alamance County Jail","lat":36.0690258,"lng":-79.4005756,"a":"Graham, NC, 27253","x":86},{"i":191,"n":"Allen County Jail","lat":40.7399785,"lng":-84.105006,"a":"Lima, OH, 45801","x":99},{"i":188,"n":"Anchorage Correctional Complex","lat":61.2183804,"lng":-149.857649,"a":"Anchorage Correctional Complex, Anchorage, AK, 99501","x":96},{"i":192,"n":"Anderson County Jail","lat":34.5334395,"lng":-82.6831902,"a":"Anderson County Jail, Anderson, SC, 29621","x":100},{"i":193,"n":"Ashtabula County Jail","lat":41.7392218,"lng":-80.7700844,"a":"Ashtabula County Jail, Jefferson, OH, 44047","x":101},{"i":194,"n":"Athens County Jail","lat":39.3289242,"lng":-82.1012479,"a":"Athens, OH, 45701","x":102},{"i":195,"n":"Auglaize County Jail","lat":40.5678265,"lng":-84.1935594,"a":"Wapakoneta, OH, 45895","x":103},{"i":129,"n":"Aurora Contract Detention Facility","lat":39.7405111,"lng":-104.830994,"a":"Aurora, CO, 80011","x":37},{"i":116,"n":"Baker County Detention Center","lat":30.2968674,"lng":-82.1215872,"a":"Baker County Detention Center, Macclenny, FL, 32063","x":24},{"i":169,"n":"Baxter County Jail","lat":36.3361391,"lng":-92.3801187,"a":"Mountain Home, AR, 72653","x":77},{"i":196,"n":"Belmont County Jail","lat":40.0806266,"lng":-80.9000916,"a":"St. Clairsville, OH, 43950","x":104},{"i":131,"n":"Bergen County Jail","lat":40.8738731,"lng":-74.0390422,"a":"Bergen County Jail, Hackensack, NJ, 07601","x":39},{"i":179,"n":"Berkeley County Detention Center","lat":33.2007396,"lng":-80.0182187,"a":"Berkeley County Detention Center, Moncks Corner, SC, 29461","x":87},{"i":177,"n":"Berkeley County Jail","lat":39.4562528,"lng":-77.9639604,"a":"Martinsburg, WV, 25401","x":85},{"i":154,"n":"Berks County Residential Center","lat":40.3795408,"lng":-76.0158335,"a":"Berks County Residential Center, Leesport, PA, 19533","x":62},{"i":99,"n":"Big Spring Correctional Center","lat":32.2590164,"lng":-101.5030409,"a":"Big Spring Correctional Center, Big Spring, TX, 79720","x":7},{"i":100,"n":"Bluebonnet Detention Center","lat":32.7680198,"lng":-99.8881024,"a":"Bluebonnet Detention Center, Anson, TX, 79501","x":8},{"i":150,"n":"Boone County Jail","lat":39.0365965,"lng":-84.728322,"a":"Boone County Jail, Burlington, KY, 41005","x":58},{"i":101,"n":"Brooks County Detention Center","lat":27.2482748,"lng":-98.1258468,"a":"Brooks County Detention Center, Falfurrias, TX, 78355","x":9},{"i":117,"n":"Broward Transitional Center","lat":26.2772767,"lng":-80.1509053,"a":"Broward Transitional Center, Pompano Beach, FL, 33069","x":25},{"i":197,"n":"Brown County Jail","lat":38.8645138,"lng":-83.9040944,"a":"Georgetown, OH, 45121","x":105},{"i":156,"n":"Buffalo Federal Detention Facility","lat":43.0203148,"lng":-78.2016158,"a":"Buffalo Federal Detention Facility, Batavia, NY, 14020","x":64},{"i":164,"n":"Burleigh County Detention Center","lat":46.808327,"lng":-100.783739,"a":"Bismarck, ND, 58501","x":72},{"i":167,"n":"Butler County Jail","lat":37.8173015,"lng":-96.8537388,"a":"El Dorado, KS, 67042","x":75},{"i":198,"n":"Butler County Jail","lat":39.399223,"lng":-84.56328,"a":"Butler County Jail, Hamilton, OH, 45011","x":106},{"i":152,"n":"Butler County Jail","lat":39.399223,"lng":-84.56328,"a":"Butler County Jail, Hamilton, OH, 45011","x":60},{"i":93,"n":"Calexico ICE Processing Center","lat":32.6668134,"lng":-115.4963754,"a":"Calexico, CA, 92231","x":1},{"i":134,"n":"Calhoun County Correctional Center","lat":42.3192548,"lng":-85.1824269,"a":"Battle Creek, MI, 49015","x":42},{"i":136,"n":"Caroline Detention Facility","lat":38.0498524,"lng":-77.3469994,"a":"Bowling Green, VA, 22427","x":44},{"i":199,"n":"Carroll County Jail","lat":40.5728404,"lng":-81.0856532,"a":"Carrollton, OH, 44615","x":107},{"i":163,"n":"Cascade County Detention Center","lat":47.5048851,"lng":-111.29189,"a":"Great Falls, MT, 59401","x":71},{"i":200,"n":"Champaign County Jail","lat":40.1083912,"lng":-83.7524298,"a":"Urbana, OH, 43078","x":108},{"i":135,"n":"Chippewa County Correctional Facility","lat":46.497309,"lng":-84.3454755,"a":"Chippewa County Correctional Facility, Sault Ste. Marie, MI, 49783","x":43},{"i":181,"n":"Chittenden County Correctional Facility","lat":44.4671635,"lng":-73.1715669,"a":"South Burlington, VT, 05403","x":89},{"i":127,"n":"Cibola County Correctional Center","lat":35.1796636,"lng":-107.9078742,"a":"Cibola County Correctional Center, Milan, NM, 87021","x":35},{"i":201,"n":"Clark County Jail","lat":39.9234046,"lng":-83.810138,"a":"Springfield, OH, 45501","x":109},{"i":202,"n":"Clermont County Jail","lat":39.0919866,"lng":-84.1850705,"a":"Clermont County Jail, Batavia, OH, 45103","x":110},{"i":155,"n":"Clinton County Correctional Facility","lat":41.1511182,"lng":-77.3493663,"a":"Clinton County Correctional Facility, McElhattan, PA, 17748","x":63},{"i":203,"n":"Clinton County Jail","lat":39.4453393,"lng":-83.8285375,"a":"Wilmington, OH, 45177","x":111},{"i":204,"n":"Columbiana County Jail","lat":40.7720044,"lng":-80.7681336,"a":"Lisbon, OH, 44432","x":112},{"i":102,"n":"Conroe Processing Center","lat":30.3118769,"lng":-95.4560512,"a":"Conroe, TX, 77301","x":10},{"i":103,"n":"Corrections Corporation of America","lat":29.7589382,"lng":-95.3676974,"a":"Houston, TX, 77002","x":11},{"i":205,"n":"Coshocton County Jail","lat":40.2753484,"lng":-81.8662428,"a":"Coshocton County Jail, Coshocton, OH, 43812","x":113},{"i":206,"n":"Crawford County Jail","lat":40.8092243,"lng":-82.9743537,"a":"Crawford County Jail, Bucyrus, OH, 44820","x":114},{"i":180,"n":"Cumberland County Jail","lat":43.6508623,"lng":-70.2816197,"a":"Cumberland County Jail, Portland, ME, 04101","x":88},{"i":207,"n":"Cuyahoga County Jail","lat":41.4996574,"lng":-81.6936772,"a":"Cleveland, OH, 44113","x":115},{"i":208,"n":"Darke County Jail","lat":40.1003265,"lng":-84.6313447,"a":"Darke County Jail, Greenville, OH, 45331","x":116},{"i":209,"n":"Defiance County Jail","lat":41.2844933,"lng":-84.3557802,"a":"Defiance, OH, 43512","x":117},{"i":210,"n":"Delaware County Jail","lat":40.3122836,"lng":-83.0479642,"a":"Delaware County Jail, Delaware, OH, 43015","x":118},{"i":130,"n":"Denver Contract Detention Facility","lat":39.7392364,"lng":-104.984862,"a":"Denver, CO, 80202","x":38},{"i":104,"n":"Dilley Family Residential Center","lat":28.6695971,"lng":-99.1672017,"a":"Dilley, TX, 78017","x":12},{"i":174,"n":"Dodge County Jail","lat":43.4055504,"lng":-88.7051037,"a":"Juneau, WI, 53039","x":82},{"i":94,"n":"El Centro Service Processing Center","lat":32.792,"lng":-115.563051,"a":"El Centro, CA, 92243","x":2},{"i":105,"n":"El Paso Service Processing Center","lat":31.7955926,"lng":-106.3696348,"a":"El Paso Service Processing Center, El Paso, TX, 79925","x":13},{"i":132,"n":"Elizabeth Contract Detention Facility","lat":40.6639916,"lng":-74.2107006,"a":"Elizabeth, NJ, 07201","x":40},{"i":123,"n":"Eloy Detention Center","lat":32.8166837,"lng":-111.5200433,"a":"Eloy Detention Center, Eloy, AZ, 85131","x":31},{"i":211,"n":"Erie County Jail","lat":41.4530769,"lng":-82.7111132,"a":"Erie County Jail, Sandusky, OH, 44870","x":119},{"i":144,"n":"Etowah County Detention Center","lat":34.0128323,"lng":-86.0030251,"a":"Gadsden, AL, 35901","x":52},{"i":212,"n":"Fairfield County Jail","lat":39.7132527,"lng":-82.59836,"a":"Fairfield County Jail, Lancaster, OH, 43130","x":120},{"i":137,"n":"Farmville Detention Center","lat":37.3213468,"lng":-78.4415853,"a":"Farmville Detention Center, Farmville, VA, 23901","x":45},{"i":213,"n":"Fayette County Jail","lat":39.5364511,"lng":-83.4390843,"a":"Washington Court House, OH, 43160","x":121},{"i":124,"n":"Florence Service Processing Center","lat":33.0640298,"lng":-111.3825565,"a":"Florence Service Processing Center, Florence, AZ, 85132","x":32},{"i":143,"n":"Folkston ICE Processing Center","lat":30.8717749,"lng":-81.981524,"a":"Folkston ICE Processing Center, Folkston, GA, 31537","x":51},{"i":214,"n":"Franklin County Jail","lat":39.9622601,"lng":-83.0007065,"a":"Columbus, OH, 43215","x":122},{"i":215,"n":"Fulton County Jail","lat":41.546069,"lng":-84.1362047,"a":"Wauseon, OH, 43567","x":123},{"i":216,"n":"Gallia County Jail","lat":38.809803,"lng":-82.2023691,"a":"Gallipolis, OH, 45631","x":124},{"i":217,"n":"Geauga County Jail","lat":41.5824944,"lng":-81.2034066,"a":"Chardon, OH, 44024","x":125},{"i":153,"n":"Geauga County Safety Center","lat":41.5824944,"lng":-81.2034066,"a":"Chardon, OH, 44024","x":61},{"i":118,"n":"Glades County Detention Center","lat":26.8331174,"lng":-81.0931234,"a":"Moore Haven, FL, 33471","x":26},{"i":168,"n":"Grady County Jail","lat":35.0512159,"lng":-97.9370036,"a":"Chickasha, OK, 73018","x":76},{"i":151,"n":"Grayson County Detention Center","lat":37.4890391,"lng":-86.2702303,"a":"Grayson County Detention Center, Leitchfield, KY, 42754","x":59},{"i":218,"n":"Greene County Jail","lat":39.6859955,"lng":-83.9283174,"a":"Greene County Jail, Xenia, OH, 45385","x":126},{"i":219,"n":"Guernsey County Jail","lat":40.031183,"lng":-81.5884561,"a":"Cambridge, OH, 43725","x":127},{"i":166,"n":"Hall County Detention Center","lat":40.924271,"lng":-98.338685,"a":"Grand Island, NE, 68801","x":74},{"i":220,"n":"Hamilton County Jail","lat":39.1014537,"lng":-84.5124602,"a":"Cincinnati, OH, 45202","x":128},{"i":221,"n":"Hancock County Jail","lat":41.038313,"lng":-83.6521917,"a":"Hancock County Jail, Findlay, OH, 45840","x":129},{"i":148,"n":"Hardeman County Correctional Center","lat":35.3262451,"lng":-89.1505724,"a":"Whiteville, TN, 38075","x":56},{"i":222,"n":"Hardin County Jail","lat":40.6478171,"lng":-83.6089968,"a":"Kenton, OH, 43326","x":130},{"i":172,"n":"Hardin County Jail","lat":42.3606883,"lng":-93.099609,"a":"Eldora, IA, 50627","x":80},{"i":223,"n":"Harrison County Jail","lat":40.2728452,"lng":-80.9967628,"a":"Cadiz, OH, 43907","x":131},{"i":185,"n":"Hartford Correctional Center","lat":41.7934056,"lng":-72.6613292,"a":"Hartford Correctional Center, Hartford, CT, 06103","x":93},{"i":161,"n":"Henderson Detention Center","lat":36.0299427,"lng":-114.9823566,"a":"Henderson, NV, 89015","x":69},{"i":224,"n":"Henry County Jail","lat":41.3911444,"lng":-84.1237918,"a":"Henry County Jail, Napoleon, OH, 43545","x":132},{"i":225,"n":"Highland County Jail","lat":39.2022866,"lng":-83.611587,"a":"Hillsboro, OH, 45133","x":133},{"i":182,"n":"Hillsborough County House of Corrections","lat":42.9956397,"lng":-71.4547891,"a":"Manchester, NH, 03103","x":90},{"i":226,"n":"Hocking County Jail","lat":39.5395981,"lng":-82.4065106,"a":"Hocking County Jail, Logan, OH, 43138","x":134},{"i":227,"n":"Holmes County Jail","lat":40.5545071,"lng":-81.9179198,"a":"Millersburg, OH, 44654","x":135},{"i":106,"n":"Houston Contract Detention Facility","lat":29.7589382,"lng":-95.3676974,"a":"Houston, TX, 77002","x":14},{"i":133,"n":"Hudson County Correctional Center","lat":40.7278297,"lng":-74.1077874,"a":"Hudson County Correctional Center, Kearny, NJ, 07032","x":41},{"i":228,"n":"Huron County Jail","lat":41.2424219,"lng":-82.6155745,"a":"Norwalk, OH, 44857","x":136},{"i":95,"n":"Imperial Regional Detention Facility","lat":32.6668134,"lng":-115.4963754,"a":"Calexico, CA, 92231","x":3},{"i":142,"n":"Irwin County Detention Center","lat":31.5802816,"lng":-83.2552781,"a":"Irwin County Detention Center, Ocilla, GA, 31774","x":50},{"i":229,"n":"Jackson County Jail","lat":39.0522947,"lng":-82.6368314,"a":"Jackson County Jail, Jackson, OH, 45640","x":137},{"i":230,"n":"Jefferson County Jail","lat":40.3600714,"lng":-80.6151034,"a":"Steubenville, OH, 43952","x":138},{"i":107,"n":"Karnes County Residential Center","lat":28.8849772,"lng":-97.9008356,"a":"Karnes City, TX, 78118","x":15},{"i":231,"n":"Knox County Jail","lat":40.3933956,"lng":-82.4857181,"a":"Mount Vernon, OH, 43050","x":139},{"i":119,"n":"Krome Service Processing Center","lat":25.7546881,"lng":-80.4896527,"a":"Krome Service Processing Center, Miami, FL, 33194","x":27},{"i":125,"n":"La Palma Correctional Center","lat":32.7551703,"lng":-111.553493,"a":"Eloy, AZ, 85131","x":33},{"i":139,"n":"LaSalle Detention Facility","lat":31.6832271,"lng":-92.1337448,"a":"Jena, LA, 71342","x":47},{"i":232,"n":"Lake County Jail","lat":41.726471,"lng":-81.2449057,"a":"Lake County Jail, Painesville, OH, 44077","x":140},{"i":108,"n":"Laredo Processing Center","lat":27.4168043,"lng":-99.4514344,"a":"Laredo Processing Center, Laredo, TX, 78040","x":16},{"i":233,"n":"Lawrence County Jail","lat":38.5367471,"lng":-82.6829406,"a":"Ironton, OH, 45638","x":141},{"i":234,"n":"Licking County Jail","lat":40.056199,"lng":-82.4014328,"a":"Licking County Jail, Newark, OH, 43055","x":142},{"i":235,"n":"Logan County Jail","lat":40.3611643,"lng":-83.7596557,"a":"Bellefontaine, OH, 43311","x":143},{"i":236,"n":"Lorain County Jail","lat":41.3673191,"lng":-82.1073583,"a":"Elyria, OH, 44035","x":144},{"i":237,"n":"Lucas County Jail","lat":41.6566804,"lng":-83.5364672,"a":"Lucas County Jail, Toledo, OH, 43604","x":145},{"i":238,"n":"Madison County Jail","lat":39.8864493,"lng":-83.448253,"a":"London, OH, 43140","x":146},{"i":239,"n":"Mahoning County Jail","lat":41.1035786,"lng":-80.6520161,"a":"Youngstown, OH, 44503","x":147},{"i":240,"n":"Marion County Jail","lat":40.5886259,"lng":-83.1287349,"a":"Marion, OH, 43302","x":148},{"i":175,"n":"McHenry County Jail","lat":42.3147529,"lng":-88.4474302,"a":"Woodstock, IL, 60098","x":83},{"i":241,"n":"Medina County Jail","lat":41.127946,"lng":-81.8909634,"a":"Medina County Jail, Medina, OH, 44256","x":149},{"i":242,"n":"Meigs County Jail","lat":39.0280514,"lng":-82.0342217,"a":"Pomeroy, OH, 45769","x":150},{"i":243,"n":"Mercer County Jail","lat":40.5463487,"lng":-84.6152944,"a":"Mercer County Jail, Celina, OH, 45822","x":151},{"i":96,"n":"Mesa Verde ICE Processing Facility","lat":35.3738712,"lng":-119.019463,"a":"Bakersfield, CA, 93308","x":4},{"i":244,"n":"Miami County Jail","lat":40.0394982,"lng":-84.2032767,"a":"Troy, OH, 45373","x":152},{"i":165,"n":"Minnehaha County Jail","lat":43.5476008,"lng":-96.7293629,"a":"Sioux Falls, SD, 57104","x":73},{"i":120,"n":"Monroe County Detention Center","lat":24.5770255,"lng":-81.7514791,"a":"Monroe County Detention Center, Key West, FL, 33040","x":28},{"i":245,"n":"Monroe County Jail","lat":39.7625729,"lng":-81.1153842,"a":"Woodsfield, OH, 43793","x":153},{"i":246,"n":"Montgomery County Jail","lat":39.7596657,"lng":-84.1977416,"a":"Montgomery County Jail, Dayton, OH, 45402","x":154},{"i":247,"n":"Morgan County Jail","lat":39.6491005,"lng":-81.852712,"a":"Morgan County Jail, McConnelsville, OH, 43756","x":155},{"i":248,"n":"Morrow County Jail","lat":40.5492438,"lng":-82.8263126,"a":"Morrow County Jail, Mount Gilead, OH, 43338","x":156},{"i":249,"n":"Muskingum County Jail","lat":39.9408474,"lng":-82.0070985,"a":"Muskingum County Jail, Zanesville, OH, 43701","x":157},{"i":250,"n":"Noble County Jail","lat":39.7478508,"lng":-81.5165127,"a":"Caldwell, OH, 43724","x":158},{"i":158,"n":"Northwest Detention Center","lat":47.2492053,"lng":-122.4211756,"a":"Northwest Detention Center, Tacoma, WA, 98421","x":66},{"i":189,"n":"Oahu Community Correctional Center","lat":21.3300829,"lng":-157.8849773,"a":"Oahu Community Correctional Center, Honolulu, HI, 96817","x":97},{"i":157,"n":"Orange County Jail","lat":41.4021497,"lng":-74.3242129,"a":"Goshen, NY, 10924","x":65},{"i":97,"n":"Otay Mesa Detention Center","lat":32.5765248,"lng":-116.9154777,"a":"Otay Mesa Detention Center, San Diego, CA, 92154","x":5},{"i":128,"n":"Otero County Processing Center","lat":32.0786798,"lng":-106.2779169,"a":"Otero County Processing Center, Chaparral, NM, 88081","x":36},{"i":251,"n":"Ottawa County Jail","lat":41.5119954,"lng":-82.9376919,"a":"Port Clinton, OH, 43452","x":159},{"i":252,"n":"Paulding County Jail","lat":41.1628401,"lng":-84.5902954,"a":"Paulding, OH, 45879","x":160},{"i":253,"n":"Perry County Jail","lat":39.713978,"lng":-82.2084975,"a":"Perry County Jail, New Lexington, OH, 43764","x":161},{"i":170,"n":"Phelps County Jail","lat":37.9509324,"lng":-91.7708076,"a":"Rolla, MO, 65401","x":78},{"i":254,"n":"Pickaway County Jail","lat":39.600618,"lng":-82.9460133,"a":"Circleville, OH, 43113","x":162},{"i":255,"n":"Pike County Jail","lat":39.126735,"lng":-82.9854553,"a":"Waverly, OH, 45690","x":163},{"i":145,"n":"Pike County Jail","lat":31.8087678,"lng":-85.969951,"a":"Troy, AL, 36081","x":53},{"i":126,"n":"Pinal County Jail","lat":33.0398533,"lng":-111.3756957,"a":"Pinal County Jail, Florence, AZ, 85132","x":34},{"i":121,"n":"Polk County Jail","lat":27.8824098,"lng":-81.8196765,"a":"Polk County Jail, Bartow, FL, 33830","x":29},{"i":109,"n":"Port Isabel Service Processing Center","lat":26.0714502,"lng":-97.4770792,"a":"Los Fresnos, TX, 78566","x":17},{"i":256,"n":"Portage County Jail","lat":41.2147834,"lng":-81.2575551,"a":"Portage County Jail, Ravenna, OH, 44266","x":164},{"i":176,"n":"Porter County Jail","lat":41.466405,"lng":-87.0595192,"a":"Porter County Jail, Valparaiso, IN, 46383","x":84},{"i":257,"n":"Preble County Jail","lat":39.7439398,"lng":-84.6364891,"a":"Eaton, OH, 45320","x":165},{"i":258,"n":"Putnam County Jail","lat":41.0059283,"lng":-84.0390043,"a":"Putnam County Jail, Ottawa, OH, 45875","x":166},{"i":259,"n":"Richland County Jail","lat":40.7574585,"lng":-82.512842,"a":"Richland County Jail, Mansfield, OH, 44902","x":167},{"i":138,"n":"Richmond County Jail","lat":37.9587465,"lng":-76.7580211,"a":"Warsaw, VA, 22572","x":46},{"i":110,"n":"Rio Grande Detention Center","lat":27.5075005,"lng":-99.5069922,"a":"Laredo, TX, 78040","x":18},{"i":260,"n":"Ross County Jail","lat":39.3331197,"lng":-82.9824019,"a":"Chillicothe, OH, 45601","x":168},{"i":261,"n":"Sandusky County Jail","lat":41.3575283,"lng":-83.0837256,"a":"Sandusky County Jail, Fremont, OH, 43420","x":169},{"i":262,"n":"Scioto County Jail","lat":38.7345374,"lng":-82.9962742,"a":"Portsmouth, OH, 45662","x":170},{"i":122,"n":"Seminole County Jail","lat":28.8117345,"lng":-81.2680223,"a":"Sanford, FL, 32773","x":30},{"i":263,"n":"Seneca County Jail","lat":41.114485,"lng":-83.1779537,"a":"Tiffin, OH, 44883","x":171},{"i":264,"n":"Shelby County Jail","lat":40.284241,"lng":-84.1555267,"a":"Sidney, OH, 45365","x":172},{"i":173,"n":"Sherburne County Jail","lat":45.3038538,"lng":-93.5671825,"a":"Elk River, MN, 55330","x":81},{"i":160,"n":"Sheridan Federal Correctional Institution","lat":45.083863,"lng":-123.3815878,"a":"Sheridan Federal Correctional Institution, Sheridan, OR, 97378","x":68},{"i":111,"n":"South Texas Family Residential Center","lat":28.6564798,"lng":-99.2021906,"a":"South Texas Family Residential Center, Dilley, TX, 78017","x":19},{"i":171,"n":"St. Louis County Jail","lat":38.6485039,"lng":-90.3378037,"a":"St. Louis County Jail, Clayton, MO, 63105","x":79},{"i":265,"n":"Stark County Jail","lat":40.8387953,"lng":-81.3087739,"a":"Stark County Jail, Canton, OH, 44702","x":173},{"i":141,"n":"Stewart Detention Center","lat":32.0356341,"lng":-84.7719795,"a":"Stewart Detention Center, Lumpkin, GA, 31815","x":49},{"i":183,"n":"Suffolk County House of Correction","lat":42.3341589,"lng":-71.068675,"a":"Suffolk County House of Correction, Boston, MA, 02118","x":91},{"i":266,"n":"Summit County Jail","lat":41.0603905,"lng":-81.5211716,"a":"Summit County Jail, Akron, OH, 44308","x":174},{"i":186,"n":"Sussex Correctional Institution","lat":38.6900507,"lng":-75.3858753,"a":"Georgetown, DE, 19947","x":94},{"i":112,"n":"T. Don Hutto Residential Center","lat":30.5647288,"lng":-97.4194342,"a":"T. Don Hutto Residential Center, Taylor, TX, 76574","x":20},{"i":147,"n":"Tallahatchie County Correctional Facility","lat":34.0260769,"lng":-90.4450243,"a":"Tallahatchie County Correctional Facility, Tutwiler, MS, 38963","x":55},{"i":98,"n":"Theo Lacy Facility","lat":33.7811502,"lng":-117.8875303,"a":"Theo Lacy Facility, Orange, CA, 92868","x":6},{"i":149,"n":"Trousdale Turner Correctional Center","lat":36.3521745,"lng":-86.0915632,"a":"Trousdale Turner Correctional Center, Hartsville, TN, 37074","x":57},{"i":267,"n":"Trumbull County Jail","lat":41.2367955,"lng":-80.8190423,"a":"Warren, OH, 44481","x":175},{"i":268,"n":"Tuscarawas County Jail","lat":40.4908982,"lng":-81.4426149,"a":"Tuscarawas County Jail, New Philadelphia, OH, 44663","x":176},{"i":269,"n":"Union County Jail","lat":40.2364486,"lng":-83.3671432,"a":"Marysville, OH, 43040","x":177},{"i":270,"n":"Van Wert County Jail","lat":40.8696461,"lng":-84.5829261,"a":"Van Wert, OH, 45891","x":178},{"i":271,"n":"Vinton County Jail","lat":39.2464596,"lng":-82.4784898,"a":"McArthur, OH, 45651","x":179},{"i":272,"n":"Warren County Jail","lat":39.4353373,"lng":-84.2029922,"a":"Lebanon, OH, 45036","x":180},{"i":273,"n":"Washington County Jail","lat":39.4282793,"lng":-81.4759425,"a":"Washington County Jail, Marietta, OH, 45750","x":181},{"i":274,"n":"Wayne County Jail","lat":40.7980976,"lng":-81.9397733,"a":"Wooster, OH, 44691","x":182},{"i":162,"n":"Weber County Correctional Facility","lat":41.240367,"lng":-111.9935488,"a":"Weber County Correctional Facility, Ogden, UT, 84401","x":70},{"i":113,"n":"West Texas Detention Facility","lat":31.1662348,"lng":-105.3515233,"a":"West Texas Detention Facility, Sierra Blanca, TX, 79851","x":21},{"i":114,"n":"Willacy County Processing Center","lat":26.4814565,"lng":-97.783051,"a":"Raymondville, TX, 78580","x":22},{"i":275,"n":"Williams County Jail","lat":41.4758844,"lng":-84.553562,"a":"Williams County Jail, Bryan, OH, 43506","x":183},{"i":140,"n":"Winn Correctional Center","lat":31.8502693,"lng":-92.7792943,"a":"Winn Correctional Center, Winnfield, LA, 71483","x":48},{"i":115,"n":"Winn Correctional Center","lat":31.7630345,"lng":-106.04638,"a":"Winnfield, TX, 71483","x":23},{"i":276,"n":"Wood County Jail","lat":41.3768671,"lng":-83.6482732,"a":"Wood County Jail, Bowling Green, OH, 43402","x":184},{"i":187,"n":"Worcester County Jail","lat":38.1770634,"lng":-75.3926959,"a":"Snow Hill, MD, 21863","x":95},{"i":277,"n":"Wyandot County Jail","lat":40.8272785,"lng":-83.2813089,"a":"Upper Sandusky, OH, 43351","x":185},{"i":159,"n":"Yakima County Jail","lat":46.601557,"lng":-120.510842,"a":"Yakima, WA, 98902","x":67}],"data":["yA2TBR33BAgoBhsHHC0eGAgRqwIFAw8HCwkDA4QQSPgE+RUBAN4U3xTyFJEBB9sTAAHWGjW3FOwTBwJRAAcHHxHYAQIPBCEDCQAWCBoK","","xgnPAwm3AQudBIgEDQsYRQQOEApGLhU3FxUECBCoAQweew0VhgKLAgaIAxTTAiAqvgMUCQ8DAgEABAYGAgISFyEf/AJKbkxcCwM=","5gHjAQRUGg8EAwgAHdQE2wQIBA0aIiQACgIEkgahBgImGxgeCQQBBQUCCwUWAB0ZDQ0BCAEGCQFIAUEhCzRQMJEBhgIqEg==","8gXLARufAwUDAwMBBAkBAwEAIAICAAEFAgACAAADAgMAAgEBAQACAgANAgICAAACAAACAAIEAgABAgAAABI8NhY=","jA/fAkeDBg0VEQ4IFTowKDjxBrYLEB4sBS1JIyUOQr4DEQohCxIECjIqDx62BCVFLBQICQQ1FhYEngFYFhIORQkFBBYaEg==","jAWLBQ==","","APQDDLgDLy0PPR9OYSYUCAfhASgBEQgONhomCjDWBGJpowEnJRktCAADHrwClwE5IxYUHgQKFiAKrAJRFRk+mAFGNiwoGgo=","SEcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgQ=","mA3nCgKnARdjSA8DDhkMCAIKWiEDPAogOAwUhgdM5APzCBMKyAqLCjjiCQfBB0A4ggbEAnAmBwQxCQ0DDADwAWsAEBUPBg0TEAoB","AgoAAwEDBgAAAAAAAAACBAAAAQABAAABAAAFAAAAAAAAAAIAAJoBkQEBAAACAAAAAAAAAQEBAAACAgACAAICAg==","AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACAQIBAAAAAAAAAAAAAJYRkRHIH7MCc0YINQ87mQHVGgAAAAAAAAAaKF5YKBA=","2gyFBCeVAwKVBaYFGwf7BNwEJBAAjwXOBgAJFBMVEgYGBARRXgkbBggQLEA0KjysAzAJHRMFAwEBBgYDXxEFAhaZCzQihAF6ywLgDA==","mA61BEXDBlQdGCcBIAQgGhAIFCURKhZOUBYUABaoARhXIDZSJjcsPhA0lAVjdzYAApEBABQEDgBOUg0JIQkKDw4AFAg=","rAMiGbEDAAC+AQoWGTIYFBwSmAEOFF4kKlgaBQUL+ghnuQGvAhF4TUNiPiRo3geZAREqkRMBAKQSEykPEQMCIzZj7RDcDDhKQkAY","4gXNAg/dARMIDBAKFzwMBAQCaA8JBQ4PAAENBQKwAgJDRxcLCxcBAQQe6AJDdwIJAwUICAAKAE4KAxINBAoECggGAg==","nhPHB039CgcAoAYMHRoLEh4LBsABVR8LRiYcFB4KTuoDLpcBDRMKBD8uHAwkzgUxOxshFlUDCxdfAGsHB3QkTg4EGgwuFg==","gAbjBARLCg8kJBQzVgYICgZ2AwcCChMbAAEFAKQBAgUbIw0JAwAEAAOyAQhNDx4DIQYAAwQAGhwSKB4+IBgSEBQI","5hDvA3HNCSYIInRcrwHiAk5IHgy7ASWAAaABFKgCVCYOIRzwDHpzgQNNRCWHAkEtYyWFEQ==","xAfPAimzAwsFAAgCFhwUCA4OigMbERQGMwoGAQcr3AI7N10eGg4DCA4GAl4KAwEHAQEHBwUBBCYJAAMJBAgBAgACAQ==","AgEAAAIB","8gpLOakJgASrBJoEUAxHhAESFAgCZxsOJ1AeGwAIBF6YAa4CAK8BSAwQKzgaEkKWBCI/NxUBGwAGAxsGOhAFIjsQDyEABhQI","hAe4CRuhCEcnQ10RSGSKAVIyINIFVWulAnV1Fgw2HIQBzAsg4wGTAp8BMwsIHQwYRp4EPCocKQtBGRcBFgSQAREZChgyHhQWAg4G","","lgrRAgvLARosI10bWHcQAgUDByAUKwcUDAgMCibaAQcJAQMQEiAICAoc3AFFGRgOBBkEAwYIAlIPDBoKDwkFAQgGBg==","zgZBC5sBAwcHORVCqQEdDwIKN0MbNxGTAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIDouKiYa","","hAEZBUUDAwEDAAICAgACABwGAAkDAAAAAAQKJwEDCwAAABIICAgKOhAABwEDCQNhAEgAQAEEBwwgDggIBAQC","QAUAAQIEAQMBBg0BAAEADwMAAAAAAAAAAgQOAQICAgICAAEAAgADAAIBAAIEAAAAAgACAQACCAoGAQIEAg==","","","vgb9ARvNAgsRCxUDEBsOFBAETAkOBgoSFAgGAQ5wDz0JBAkBBiIaDiC0AhEVCd0FAAAAAACMBgBNIhAEAwoEBAoLBgY=","CAOcCZ0JAADUBGCzBdIE0QQA5AjjCI4JkgIx7QqCDBQKhQEThQsAAAS0DrUOAJgOlw4Arg2vDQAAoBCWBgetFgCSFgACAgAICAHtAbUUnBSbFAAAghUg7gKPGADwFQ==","","6gXxBAltAAQDAAAABhQIBAaCAQcDAAUFBAAAAAURAQ8FFggKCgYKAgIwLBwCCCQeAwcJEAQBJQ8GBipAFgAHAQM=","/A6rBEOVBj8VDw8HEERIMAgS8AMlChcjNRYEBgISnQHIAQItDAQLDSosHCzmBFQHAyUEGRUTCwERowEgGCICBwIQJhoeDA==","","8APpAQmPAQsJAwMBBgMYDAwMyAH6BQbBBxGOBxUGGAwBlgJuA0cPAAkWEwcYJPIBaFxAJBoRDAQMEhTsAgkRHyEYBQYSFBAG","lAahAwE4CQ8TKw0sVxMRDQnVARQBEQ==","ygTzARUvBQUVGQcYDwABAgEXBgMHAgUGAQAACFoKCAUJAwESDAwKCmwRDAIJCggEBgoGAlgDCwsQDAgCBgYI","sgeHBBnhAQQDCw8DDh0DAwEBcQAAAAYF","8gJhBA8FBQMDCxBFCQcDAy8CAAIABgYCBAIGMAANBwEAAQABAggISgYCAwQCBgAABQMBJAcDAwwABAYOCAQC","","ogRNB38MCAAAAAITAAAAAjQYBgkHCQcAAQEJGQYBAAIBARQICAgOaA4PBQYCAwUHAwUAGCIGBQoeCgAGBAAE","","AAAAAAAMCw==","thK7Ale3Bi0jJT8PPDUoBgADGwgHTSENOBowElzgBDYNeRUOEicRJhAUtgFCTEoYDDAQHBwiCoYBGRIaAQoBCwUBAAg=","","7h3tBzW9CF0jRU8xYLsBUFZILt4FWgRhISsRDAwJIZgDRFttYTcxNDQ+Hi7IAzg0EgECDAEABAICKxwhElb0AYwBbmYyKhI=","pA35Ah33AxEPH0UXSHMEEw8WvQQ=","AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGCA=","vgTbAQlhDw0FCQUOHw4EDAgYEgonFRG5AQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABYQAggQDAg=","jAOFAQ+BAQcHBQUBCA8BAQMAEwoEDgYKW2gIAgo+AwgCAQICAAMCAgQyBQQBAQACAAAABgJGAhoKAgACAgYABAQ=","2gHiDCOFB40BQTcXSE/qA35aTCC4AgATaYMBowFUOkwMbMgESq8BtwEdFQmbASEdBIoBiAxC7wHJAVAh2QEhJlA+GP4IMj40ARoUBRYRAAQ=","","","","kgJHAC8JBwkNAQoEBAQEAiABAAcCAgoCBAAEPhwFBAAGAwsDAQUAFAAFAgMAAQEAAgAAFQ4GAQoWCAgKCggE","AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIAAAECAAAAAAABAAAAAAIAAQACAAEABgEABhoUEBQUEgY=","8AEjAAQLBwECAwQXowEAAK4BrQEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAaOjA8PCAQ","","AAAAAAAAAAAAAAAAAAAAAAAACAYEAQoGAAZKChsLUQ==","ciQCAgoAAQABBAUBAQEAKQMDBQADAQAAAAEQAwIAAAIAAAICAQIUAQIDAwFxcHMAeAIWAAYEAgQAAgIAAgI=","OAQBFQAAAAAAAAMAAQEACQAAAgAAAAABAAEHAAQAAQICBAACAAIIBAABAgIAAgIAAAAHAQAACg4GBgoIBgQ=","ygJzBU8BAQYKAAcKCAQCAooBCAUNAQABAAEAGWcIBAIAAQADAwEDAQ0BAXkAAAAAggECgwGGAQ4CAAUOGBIMDgoIBA==","/BTVCDOjBUUzIzEPMlsyNiAKjAEQBS8fKRUGBgABmAH3BgIBzgjNCADUCAjbCAACBgIBAQAA/gsEBRUzDaULAAIBAAICAgI=","CAc=","","rgM7AWEHAQYLAww5AQcFB28CAgABAggABgAAOA4FCwICAQAAAAABDQgAAAQCAAACAAEAAwUFBAYIAgACBgQ=","","BAMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgAAAAAAAAAAAAAAAQ==","AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQEAgI=","AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIC","pAEnA0MAAAEDAQQFAQAAAQUAAgIAAAEBAQAAAwACAAIBAAAAAAAACwAPAAAAAAAAAAAAAAAAAAAAADKOAVZg8wI=","","","","FAYAAAIEAgABAgcBAAEADwEDAAAEAgAABQYAAQABAgAAAAAAAAAGAQQCBAIEAgIAAgAUAgIBAjM6Ag==","","cgsAGwAAAgABBBEDNwBEQwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABgYEAgI=","5gSVAROfAgUBAwkDDB0FBQUBQQAAAwAAAAABAAELAAEAAAAAAAAAAAABAAAAAAAAAAAAAAAKAQEBEiAUEAoICAQ=","gAJBARULBQAHAAYHBAQCATMDAQcBAQUAAAAKdBIGAQAEAAYCAgACExAMAgQDAwIAAQMDHwoEAAYEBAADBQ==","sgR1C5cBEwcPDwMQGRAIAgQvCwcXjwE=","","AAAAAAACAQ==","RgcDKQABAQEJCAAAAAAAEAIBAwEBAAABAAACAAIAAgICBAICAgAMAgEBAQIAAAAAAQABAAABAgAAAAICBA==","","AgAACAABBwAAAAIBAAAAAAAAAAAAAAAAAAICAgABAgAAAAAAAAAAAgABAAAAAAUABgIwCgAECg4IBAQCAAE=","AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgAAAQACAAAAAAAGAQEAAAAAAAAAAAEBAgAAAgAAAgAC","","ogKhAg==","jAEXAggDAQULAwwXAwMAAQUDAQkDAwMAAAEBAAABAQIGBAYCAgAAFgcCAQQECAJXAF4CNgMBAQYEAAIEAgI=","","","tgKBAQl3AQMBAQIAAQIAAgAFAQEDHQ==","AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAYCAQ==","","","fiIBmwEAAAAAgAF/dnUAAAAAhAIBgQLSAR2zAcABAAAITBIpMRcNAgYIBAYMFAoSAwIEAAAEAQgEVAsCAgYEAQEBAgMB","","","","","","","","","","AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIFBAKCAQ=","","DgIABQAEAAEAAAEBAAIAAAkABgAEAgAAAgAFAQABAgAAAAAABQAAAgIAAAACAG5vcnEBAgAABAIAAgE=","","","","","","","BgU=","AAAAAgECAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAACAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgGBAICAgI=","","BgEAAQAAAAAAAAECAAECAQIAAAAAAAECAAABAgAAAQIAAAAAAQIBAgEAAAAAAAAAAAAAAAAAAgAAAVRRAgM=","RBkAAAAOCwAAACs=","","","dBEBGQMFAwUBBg0AAAAABwIAAAAAAAAAAQADAgACBAACAAACBAY2DAMHAwACAgACAAAPCgQDAgkBAwAB","AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGIyKCIcEAw=","","","AAIABAAAAQMAAAIBAAACAQAACgAJAAgAAAACAAEAAAIAAAIAAAAAAAIEAgEAAgAAAAAEAgABAgoGAAIAAg==","","","","","","","","5AeOAhP1BFM9MSsHAZwBfFo2EswCkwFXrwEzISgSQiKEAbIGBrMB8wF/BAZzGA8bVoQHRBV5dQ89CS8VFwniAQQgGBVCJBQaEAIE","DAcAAQAAAQAAAgEAAAAAAAAAAAAAAAAAAAAEAAMCAgAAAAAAAAADAgECAgECAAMEAwAAAgIAAgACAAI=","BgUEAwAAAAAAAAAAAAAAAAAAAAAAAAACAQICAAAAAAAAAAAAAAAAAgAFBAAAAgAAAAAABAIABggKCAMGCAQ=","AAAABAEAAQAAAAAAAgEAAAIAAAEEAAAAAAACAAAAAAAAAgAAAAACAAABAAAAAAAAAAAEAAAAAAAAAAAC","","","AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABA==","","","CAMAAAAAAQECAAEAAAACAQAAAAAAAAAAAAICAwQAAgACAAAAAAABAAAAAAAABQAEAAAAAAAAAAQAAAICAgI=","vgS9BAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPiwkHmukAZEB","AAIBBAMEAwAAAAAEAwAAAAACAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABBgSEhAKCgQ=","","","","AAAAAAACAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAHhcCAQIAsAMU","","BC4CBwABAScAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACAAI=","cCEAHQMCAi8=","RgUDJwMeIQs=","","BAMCAQIAAQ==","EhEAAAQCAgICAwgCAAABBwICAgICBAICAAISAAYAAQICAAIAAAENAAYCAgACAgACAQAIAQACBAICAAIAAg==","","","","","","","AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAACBAI=","","","","","bA0AGQABAwUBBgsCAgACGAEAAQEAAAACAgQaAgECAAIAAQICAAIFEAQHBgQCAAAAAAAAAwMBAgABAAE=","","","","","","AAAAAAAAAgAB","","","","BAYFBgcAAAABAgQAAAECAQMCAQQBAAACAAAMAQEACQAACAcAAAAAAAACAAAAAwQAAAAICwYAAAIAAAAAAQQ=","","","9gWgAh/7BALvAtoCJQcgbnRMNhCuARATUU8pIAYSBjbmAgtzeQIwFCMEDRkisgQ6HQgfBRcKDhAYCiJjCj4WpQwGBAwODAQ=",""],"csr":{"o":[0,79,150,222,294,367,445,515,579,641,706,770,833,895,955,1020,1077,1135,1194,1253,1311,1368,1424,1480,1539,1595,1656,1716,1778,1841,1905,1965,2025,2087,2150,2213,2276,2337,2400,2459,2520,2578,2636,2694,2753,2812,2868,2920,2975,3033,3090,3146,3204,3263,3322,3384,3451,3521,3593,3669,3746,3826,3905],"f":"AAIBAQEKBgEBAgQCAQIEAwECAQMEAQIBAQEDAwECAwIFBQMGAQIBAQEBAQIBAgYBAgQDAgEBAgECAQEBAwMCAQcFAgIDAQMCCAMBAwEBAgACAQEBCgUBAgIEAgEGAwECAQMFAgEBAQMDAQIDAgUCAwMGAQIBAQEBAwECBgIBBAMCAQEDAgEBBAMCAQcFAgIDBAoEAwEBAAIBAQEKBQECAgQCAQYDAQIBAwUCAQEBAwMBAgMCBQIDAwYBAgEBAQEBAgECBgMEAwIBAQIBAgEBBAMCAQcFAgIDBAoEAwEBAAIBAQEKBQECAgQCAQkBAgEDBQIBAQECAQMBAgMCBQIDAwYBAgEBAQEDAQEBBgIBBAMCAQEDAgEBBAMCAQcFAgIDBAoEAwEBAAIBAQEKBQECAgQCAQkBAgEDBQIBAQEDAwECAwIFAgMDBgECAQEBAQMBAQEGAwQDAgEBAgECAQEBAwMCAQcFAgIDBAoDAQMBAQACAQEBCgIDAQICBAIBBgMBAgEDBQIBAQECAQMBAgMCBQIDAwYBAgEBAQEDAQEBBgIBBAECAgEBAgECAQEBAwMCAQYBBQICAwQKBAMBAQACAQEBCgUBAgIEAgEJAQIBCAIBAQECAQMBAgMCBQIDAwYBAgEBAgMBAgYDBAMCAQEDAgEBAQMDAgEHBQICAwQGBAQDAQEAAgEBAQoFAQICBAIBCQECAQgCAQEBAwMBAgMCBQUDBgECAQECAwECCQQDBwIBAQEDAwIBBwUCAgMEBgQEAwEBAAIBAgoFAQICBAIBCQECAQgCAQEBAwMBAgMCBQUDBgECAQECAwECBgMEAwcCAQEBAwMCAQcFAgIDBA4DAQEAAgEBAQoFAQICBAIBCQECAQgCAQEBAwMBAgMCBQUDBgECAQEBAQMBAgYDBAMHAgEBAQMDAgEHBQICAwQKBAMBAQACAQEBCgUBAgIEAgEGAwECAQMFAgEBAQMEBQIFAgMDBgECAQECAwECCQQDBwIBAQEDAwIBBwUCAgMECgQDAQEAAgEBAQoFAQICBgEGAwECAQgCAQEBAwMBBQIFBQMGAQIBAQIDAQIIAQQDBwIBAQEDAwIBBwUCAgMECgQDAQEAAgEBAQoFAQICBgEGAwECAQgCAQEBAwMBBQIFCAYBAgEBAgMBAQEJBAMHAgEBAQMDAgEHBQICAwQKBAMBAQACAQEBCgUBAgIGAQYDAQIBCAIBAQEDBAUCBQgGAQIBAQIDAQIJBAMHAgEBAQMDAgEHBQICAwQKBAMBAQACAQEBCgUBAgIEAgEGAwECAQgCAQEBAwMBBQIFAgMDBgECAQECAwECBgMEAwcCAQEBAwMCAQcFAgIDBAoEAwEBAAIBAQEPAQICBgEGAwECAQgCAQEBAwQFAgUIBgMCAgMBAgkEAwcCAQEBAwMCAQcFAgIDBAoEAwEBAAIBAQEKBQECAgYBBgMDAQgCAQEBAwMBBQIFCAYDAgIDAQEBCQQDBwIBAQEDAwIBBwUCAgMEDgMBAQACAQEBCgUBAgIGAQYDAwEIAgEBAQMDAQUCBQgGAwICAwEBAQgBBAMHAgEBAQYCAQcFAgIDBAoEAwEBAAIBAQENAgECAgYBBgMBAgEIAgEBAQMDAQUCBQIGBgMCAgMBAQEJBAMHAgEBAQYCAQcFAgIDBA4DAQEAAgEBAQ0CAQICBgEGAwECAQgCAQEBAwMBBQIFAgYGAQICAgMBAg0DBwIBAQEGAgEHBQICAwQKBAMBAAIBAQENAgECAgYBBgMBAgEIAgEBAQMDAQUHCAYDAgIDAQEBDQMHAgEBAQMDAgEHBQICAwQKBAMBAAIBAQENAgECAgYBBgMBAgEIAgEBAQYBBQcIBgMCAgMBAQENAwcCAQEBAwMCAQcFAgIDBAoEAwEAAgEBAQ0CAQICBgEGAwECAQgCAQEBBwUHAgYGAwICAwEBAQ0DBwIBAQEDAwIBBwUCAgMECgQDAQACAQEBDQIBAgIGAQYDAQIBCAEBAQEBBgEFBwIGBgMCAgECAQEBDQMHAgEBAQMDAgEHBQICAwQKBAMBAAIBAQENAgECAgYBBgMBAgEIAgEBAQYBBQcCBgYDAgIDAQEBDQMHAgEBAQYCAQcFAgIDBAoEAwEAAgEBAQ0CAQICBgEGAwECAQMFAQEBAQEGAQUHAgYGAwICAQIBAQEGBwMHAgEBAQMDAgEHBQICAwQKBAMBAAIBAQENAgECAgYBBgMBAgEDBQIBAQEHBQcCBgYDAgEBAQIBAQEGBwMHAgEBAQMDAgEHBQICAwQKBAMBAAIBAQENAgECAgYBAgMBAwECAQMFAgEBAQYBBQcCBgYDAgEBAQIBAQENAwcCAQEBAwMCAQcFAgIDBAoEAwEAAgEBAQ0CAQICBgECAwEDAQIBAwUCAQEBBgEFBAMCBgYDAgIBAgEBAQYHAwcCAQEBAwMCAQcFAgIDBAoEAwEAAgEBAQ0CAQICBgECAwEDAQIBAwUCAQEBAgQBBQQDAgYGAwIBAQECAQEBBgcKAgEBAQMDAgEHBQICAwQKBAMBAAIBAQEPAQICBgECBAMBAgEDBQIBAQEHBQQDAgYGAwIBAQECAQEBBgcKAgEBAQMDAgEHBQICAwQKBAMBAAIBAQEPAQICBgECBAMBAgEDBQIBAQEGAQUHAgYGAwIBAQECAQEBBgcKAgEBAQMDAgEHBQICAwQKBAMBAAIBAQEPAQICBgECAwEDAQIBAwUCAQEBBgEFBAMCBgYDAgEBAQIBAQEGBwoCAQEBAwMCAQcFAgIDBAoEAwEAAgEBAQ8BAgIGAQIDAQMBAgEDBQIBAQEGAQUEAwIGBgMCAQEBAgEBAQYHAwcCAQEBAwMCAQcFAgIDBAoEAwEAAgEBAQ8BAgIGAQIDAQMBAgEDBQIBAQEGAQUEAwIGBgMCAQEBAgEBAQYHAwcCAQEBAwMCAQcFAgIDBAoEAwEAAgEBAQ8BAgIGAQIDAQMBAgEDBQIBAQEGAQUEAwIGBgMCAQEBAgEBAQYHAwcCAQEBAwMCAQcFAgIDBAoEAwEAAgEBAQ8BAgIGAQIDAQMDAQMFAgEBAQcFBAMCBgYDAgEBAQIBAQEGBwMHAgEBAQMDAgEHBQICAwQKBAMBAAIBAQEPAQICBgECAwEDAwEDBQEBAQEBBgEFBAMCBgYDAgEBAQIBAQEGBwMHAgEBAQMDAgEHBQICAwQKBAMBAAIBAQEPAQICBgECAwEDAwEDBQEBAQEBBwUHAgYGAwICAQIBAQEGBwMHAgEBAQMDAgEHBQIFBAoEAwEAAgEBAQ8BAgIGAQUBAwECAQMFAQEBAQEGAQUHAgYGAwIBAQECAQEBBgcDBwIBAQEDAwIBBwUCBQQKBAMBAAIBAQEPAQICBgEFAQMBAgEDBQEBAQEBBwUJBgYDAgIBAgEBAQYHAwcCAQEBAwMCAQcFAgUECgQDAQACAQEBDwECAgYBBQEDAQIBAwUBAQEBAQcFCQYGAwIBAQMBAQEGBwMHAgEBAQMDAgEHBQIFBAoEAwEAAgEBAQ8BAgIGAQUBAwECAQMFAQEBAQEMCQYGAwIBAQECAQEBBgcDBwIBAQEDAwIBBwUCBQQKBAMBAAIBAQEPAQICBgEFAQMBAgEDBQEBAQEBDAQFBgYDAgEBAQIBAQEGBwMHAgEBAQMDAgEHBQIFBAoEAwEAAgEBAQ8BAgIGAQUBAwECAQMFAQEBAQEMBAUGBgMCAQEBAgEBAQYHAwcCAQEBAwMCAQcFAgUECgQDAQACAQEBDwECAgYBBQEDAQIBAwUBAQEBAQwJBgYDAgEBAQIBAQENAwcCAQEBAwMCAQcFAgUEDgMBAAICAQ8BAgIGAQUBBAIBCAEBAQEBDAkGBgMCAgECAQEBDQoCAQEBAwMCAQcFAgUECgQDAQACAgEPAQICBgEFAQQCAQgBAQEBAQwEBQYGAwIBAQECAQEBBgcKAgEBAQMDAgEHBQIFBAoEAwEAAgEBAQ8BAgIGAQUBAwECAQMFAgEBAQcFBAUGBgMCAgECAQEBBgcDBwIBAQEDAwIBBwUCBQQKBAMBAAIBAQEPAQICBgEFAQMBAgEDBQIBAQEHBQkGBgMCAgECAQEBBgcDBwIBAQEDAwIBBwUCBQQKBAMBAAIBAQEPAQICBgEGAwECAQMFAgEBAQcFCQYGAwICAQIBAQEGBwMHAgEBAQMDAgEHBQIFBAoEAwEAAgEBAQ8BAgIGAQUBAwECAQMFAgEBAQcFBAUGBgMCAQEBAgEBAQYHAwcCAQEBAwMCAQcFAgUEDgMBAAIBAQEPAQICBgEFAQMBAgEDBQIBAQEHBQQFBgYDAgEBAQIBAQEGBwMHAgEBAQMDAgEHBQIFBAoEAwEAAgEBAQ8BAgIGAQUBAwECAQMFAgEBAQcFBAUGBgMCAQEBAgEBAQYHAwcCAQEBAwMCAQcFAgUECgQDAQACAQEBDwECAgYBBQEDAQIBAwUCAQEBBgEFBAUGBgMCAQEBAgEBAQYCBQECBwIBAQEDAwIBBwUCBQQKBAMBAAIBAQEPAQICBAIBBQEDAQIBAwUCAQEBAgEDAQUEAQQGBgMCAQEBAgEBAQYBAQUBAgcCAQEBAwMCAQcFAgUECgQDAQACAQEBDwECAgQCAQUBAQIBAgEDBQEBAQEBAgEDAQUCAgEEBgYDAgEBAQIBAQEGAQEFAQIHAgEBAQMDAgEHBQIFBAoEAwEAAgEBAQ8BAgIEAgEFAQECAQIBAwUBAQEBAQIBBAUCAgECAgMDBgMCAQEBAgEBAQYBAQUBAgcCAQEBAwMCAQQDBQIFBAoEAwEAAgEBAQEOAQICAQMCAQUBAQIBAgEDBQEBAQEBAgEDAQUCAgECAgMDBgMCAQEBAgEBAQYBAQUBAQEHAgEBAQMDAgEEAwUCBQQKBAMBAAIBAQEBDgECAgEDAgEFAQECAQIBAwUBAQEBAQIBAwEFAgIBAgIDAwYDAgEBAQIBAQEGAQEFAQEBAgUCAQEBAwMCAQQDBQIFBAoEAwEAAgEBAQEOAQEBAgEDAgEFAQECAQIBAwUBAQEBAQIBAwEBBAICAQICAwMGAwIBAQECAQEBAwMBAQUBAQECBQIBAQEDAwIBBAMFAgUECgQDAQACAQEBAQ4BAQECAQMCAQUBAQIBAgEDBQEBAQEBAgEEAQQCAgECAgMDBgMCAQEBAgEBAQMDAQEFAQEBAgUCAQEBAwMCAQQDBQIFBAoEAwE=","p":"2gHIDYwBRn6UBpICSJYKOPAB8gKiBATqBXIOmA0CAgbwA4ACxgnaDMoEvgQGvgZEdM4GpAFyrgOYDrIH5gGkDeQHDKwDBgi2EuIFCL4EsgTyBYQBBHBGBPwUygKMD/wOEhSMA0CeE4AGbOYE5hDuHaICxAeMBQQC8gqEB/YFtgIIvA60CHQ+oAHyAvQDygHEBzzMAZAC1AN4lgEQsAIMAoYCvgH2BdQI1gLiAgTABCpijAZ8AmbyAuIJqgMCqgryCQTOAwT6D5QDBAK8A6YEajJOQKYM1gGsDNAKGoYCOtYLnAFe0AP2DIAW9AQKpgq8EJYItAGYDpYIdjqeAfACgATKAbgHOswBlALMA26YARCyAgwC/AG8AewFrAjAAtgCBKQEKmCABngCZvACnAmQAwaMCt4JBLQDBKAJog+EAwSwA4oEZDROPALyC9AB5AuMChr2ATqIC6ABXrwDhAzKFcoEBOwJoBD2B6oBkgeeA34QAqgDuAeaAewFJNABhALMApoBCooBCApspgG0BJYFkAIC9gEC1gEqRuQENAZKjgLYAq4BWpQG6AQCAgLqCASmAQQEmAJqHiwwFM4GgAHgBfYDGnQ4ClREnAG2AowNlgEKQv4H+gIyhAamA3oQAp4DiAeQAYYGJMQB/gHYAqQBCnIGCmCaAagEmAWKAuYBAsoBKkLgBDQGSoYCrAOyAXSCBpQEAgICvAgCkgEEhAJkGiwsEAKIBn7SBbYDBBxsOgJeRJYB3AKuDIoBAgLCBLYH/AIwwgXOA3gOAo4DAtoGiAGyBiS8AfgB4AIEpAEODgIIVpQBCgKEAgLYAQK4ATg82AQ0BkqEAo4DrgFk8gXWAwICApgIApoBBAT8AWACFiouLgLUBXy8BaADBiBkPgIMTkKUAeQCigyEAQIWjgcMLIoF1ANyDAL6AsoGfo4GJLoB9AHgAqIBDlYIUpQBkgSoBe4BAtIBAqwBLDjQBDIETIoCpgOiAWjSBaQDwAHWBPIHpgEC7AFcFCgwDLAFggGqBZADCCJePKIGcj6QAYYDxAuEAQICsATKBuYCKvIEuANmCgLOAowGcLAFJLwB8AHgAqIBDEYITowBhASMBdQByAEClgEsMpYELkz+Af4CkgFkjAX4AsoBtgWyB7YB3AFYEP4EjAG4BYADCiJYOK4GlgE4hgH6A/QKjAECAoAF7AXAAii6BbADYoIBwALsBW6UBSS4AeQB4AKgAQxCCEyMAfgDhAXMAcIBApIBLDCABCxK+gH8Ao4BbPQE8ALgAQKiB8ABAtgBVhDuBIwBwAX4AgwgVjaQBqoBNoIB1gTCCo4BjAXaBbgCKuoEzANuCALsAroGeOwFJLwB9AHiAqQBDFAIUpIBkAQI5AHQAQKiASw2wgQwToYCnAOcAWy8Be4CAsYB1ATeB6gBAugBWhKgBYQBqgWIAwgiXjyqBnY8jgGmA6ILpAECxASiBtgCKtQIngNWCHiUAtgFfPQEIKQBrgHOAgaeAQo2CAJOigHKA+QE1AGwAYYBKJgDKgI8zAGgA35OyASKBPgBAqgH5AHOAVAUxASOAeQFzAMQGk4ungbMATBwiAbmCcABBsgFhgfGAyjSCbwDUggCgAL+BYABhAUgpAHOAhqcAQhCCGaOAc4DiAXUAb4BApQBKPoCKDjKAcADeqIFzASGBZACAtAH8AEE3gFOFvYElgGUBpQEEhhMLLAG0gEyatYGtgrUAQbaBZAIugQqrArUA04IAu4BkgaEAYYFHpwBzgIimgEISghykgHcA5gF0gHCAQKoASjqAijCAdoDdka4BOAFpALmCNYHAvQB5gFKFqwFmgG8BsQEEhhKLM4G2gE0ZJ4HjAvcAQbuBeIIhgUq+ArcA04IAuABmgaIAYAFHJgBzgImmAEKTAh+lAHsA5gF1AHOAbgBKOwCKLwB6gN0TqgElgbAAgLWB/gB6AFIGMwFnAH0BswEEhZGKsIG5AE0XrwH1AvqAQT2BZQJvAUsmAvKA0wIAtYBkgaKAfwEHK4BlAHQAiyYAQpWCooBkgH2AwjSAdYBArwBKPYCJgJEtAHyA3JSvgSoBtICkAnSB/oBAuwBSBjWBZ4BAt4EEBZGKsgG6gE2XMgHggz4AQb4BbQJzAUs0A2eAUYYArAEqgH0BBJkhAOuAW4KsAEO0gJevATWBroB7gGIAiC+AiBEhgRE9AjqA6ILtgfiArwBaDTiBqgCuAvOCAgGMhqICOACThqMBuARggUEkAWGD/oGJtANmAFCGoYCFNgEqAGUBRJmnAOmAWqOAQ7MCFrqBNYGwAGAAgL+ASL6ASBG4ANe4Af4A/AKvgcC0gKwAWo68gawAsgLqAgKBDwWsgfcAkwa5gW6EuYE9ASwDooHJLwNlAFAGIQCEtYEqAGoBRJmogOiAWaKAQ7SCFjUBMwGvAGKAgKMAiLeASJIzgOAAYgHjAQCtgcCyAICqAFsOuwGqgLmC7IIDEAWkgfUAkwa5ga+EtQEAoIFxA32BiLSDIQBNhQCCMQEoAH8BBRomAOiAWAGxgEMkAFQnATgBrQB4gECkgIipgEkCkj4A6QB2AXqBIQM6AYCwgKQAWwwvAacApIMmggOThaGB9YCShaGCNwR6ATaBJ4LpAYezgt8MhLUAQ7MBKIB9AQUaJADnAFgBtABDH5OhATMBrYBzAECnAIilAEkCkaOBAakAaQFjgWYDMYG0AJqLJwGmgKMDPYHEFQWzAfgAkgWmgi6Ee4EBKoFqArUBaoKcC4QtgES2gSkAYgFFG6GA5YBXArwAQqMCEzuA7YGsAG6AQKuAiIkSNwErgGCBbgFogy4BgTAAmQs8gWaAt4LwAcSBF4W8gfMAkgWwgqOEboEAsgFsgmqBf4KZioQAhCQBa4BlAUUdP4CmgFaDKgCCvYHRvIDyAa2AQLCAiIiUKwFsAGqBZAGnAvwBgTAAmYs3AWYApQL1gcWBgIWjgiwAkgWlgv8EMQEAqwFyAnKBbgLYioQwgEaqgWwAZwFFHb+ApoBWgy0Agr8B0b6A84GtAHKAiIgCFDCBbQBvAWqBogLigcEvgJmLOIFmALwCtoHGAZqFqIIsAJIFrwLiBHKBAKsBdQJ0AWEDF4qDsIBINAFtAGoBRJ6/AKaAVoMyAIIlAgCRooE1Aa0AQLQAiIeCFbWBcYH/gWkBgICugcEsAJoLOgFlgLKCuAHGgZyFsAIrgJKFMoLlBHIBAS0BYoK4gWQDOIQKA7CASDaBbQBsgUSfPoCmgFaDs4JCKAIRrIF2Aa0AQLOAiAeCFbWBaQBoAaeBgLMBwSqAmgw6AWWAtgK4gcadBjKCKgCTBSoC4oRwAQEuAWmCugF/AyqESYOygEmiga4AdgFEIIB8AKUAVgOmgoIAp4IAlC+BdwGvAEC3AIgHghW7AWmAaQHkgYCAqgIBKwCAmg65gX8AZoL9AccBn4cmAmoAlASxAvoEJQEBJYGqgueBsQRohYmEJYCcOAK9gGyBwiyAdYCggFoCP4NAgS0CsQB3AWKBpYCzAMcGgqOAZQHzAHWDQSMDwQGiA0G3AQEZBL+BpQB2A7WBi4GvAEqgg3MA2oGtBiAFPAGEK4H9haECY4SKCYQqAJ6wguSAqoHCLIB3AICAoABZAaKBQIGogvWAeAE6AagAgK8Ax4aCpwBrAewAdwNBKQOBLoOvg0G3gRmEAacAcYOngguBLgBKLANzgNsBq4ZxBS0Bg7cCZYX+AjeECYkEv4BXtgKjAKgBwykAdoCAgJwZgb2BAIGngvcAdIE3gaoAgL+Ah4CHAiWAdQGyAGoDOoMBASwDQaaBARiDAigAdAOoAg0BMABKpgMyANqBLoY6BP8BQzcCbIVhAimDyYiEswBUrQJkAKeBwycAdoCAgJqZgSABQIE1graAbwEwgaiAgIC9AIgAhwIigH0BuYBtAoCugoEBLYMBtIDBGIGogGuDvIHNALCASyKDKwDbAS4FfoSngUMrAieE4oHiA+EFSQUtAGMCZACmgcKmgHcAgKAAWYGyA8CBsYK2gHCBsgGmAL4AiQCHgiMAaoH3AG0CQSoCgScDqAMBroDBmTUCKIBog7+BzIEwAEu9guIA2wE6hSYErwFAvQI/hGMB/IOJCoWpgHmCJYCqgcMmgHaAgKIAWgGvAUCBsYK3gG2BNAGlAIC7gIkHAqOAfwH4AG4CQSgCwQErgwGrgMGYgagAbQOggg0BMIBMIAM+gJuBK4V4BHWBQKACcoRvAfoDpYVLhioAcwIkgK8Bw6YAdgCAgKSAWgG9AUCBrwK3gG8BOAGkgIC7AImAhwKjAGiCN4BvgkE0goEBMAMBqIDCGAGoAG4DvYHNgTEATKEDPACbgSIFa4R5AUCkAm+EdAHzA2EFDQcrgGeCIYC3AcSmAHsAgICnAFoBtYPAgbSCuQBxAeMB6QCAvICJgIcCowB6gfYAcoIBI4KBLINmAwIigMIXhLaCJwBwg7oBzYExAEyxAvsAmwEgBPiEeAFCuQIxhGsB6oN/BM2HrYBpgiCAuQHEpYB9AICAqIBagbODwQGvgrmAdgHzAewAgKUAyYCHAyMAZYI0gHiCATwCgQChgwIiAMIXhriCJgB9A6SCDgEwAEw8gvsAm4EvhKWEugFApwJqBGwB4wNIDggugGmCIAC7AcUmAH8AgICrAFsBowIBAa2CugBhAWACLwCAq4DKAIcDIwB1AjUAdIIBK4LBAKsDAiGAwhgIgaWAZ4Pvgg4BMIBMI4M8AJwBJAS1BL2BQK2CbQRogeQDSA4IsABogj6AfYHFKABhAMCAq4BaswIBAbOCugBpAWqCMYCvAMsAhwMjAHkCMgBtggE0gsEArwMCIoDCGIqBpIBjg/aCDgExAEymgzwAnAErBHyEvwFAsgJzBGIB5oOHjgizAHACPoBkggWqAGSAwICsAFshAmeAQbyCpYR6gHOBeYI0AIC3AMyAhwMigGYCcIBjAkEugwEohDQDAioAwhiNAiQAawPhgk2BMgBMr4M7AJyBIYRoBP+BQKKCpISqgeiGvQaTi7gAfwKjgLuCR7yAfoDAgjgAYABhg8MBuQMBNYBjAmSDLwDkAZoEAx8rA7YAZAQmBQEuBaGDgqQBgZUbg6CAeIT7A0oCvoBLowSngRsAugW3AYCoA6wFtwL5Bq+GkYw6gHkCY4CqAki+AGIBAaMAn4CyhEKCMwNzB/mAaAJwgyqAwL+BXQQDIQByA3YAdQQAv4SBrAWyA4KzAUGVn4QgAG8E8AOKAj0AS7aEaYEfAKgF+YGAsIO7BaWDPQYhgZILvwBqgmIAo4JIvoB+AMEqAKAAQS6EgoIqA6YHfIBlgm4DLYD6AVwDoQB0Ay6Ab4Q7BIGApQPCtQEBlh+Dn72ErgOLgz4ATCeEdgDgAEC1BfiBgKCDpYX+AuqF/IZRiz4AYYJigKmCSD2AfIDBKoCfATgEgoG6A6kHPQBhgmaDLgD3gVoEoQBhg2gAcQPApYTAt4PCNYEBlp2DASiE7QOMA72AS6CEcgDeALmF+AGBMoNsheADPoX6hlKKvoBnAmGArQJIvoB+AMEsgJ4BNgSDAaMD+oc+AGCCYYMrgNkFIgBhg2SAc4OBAQElBb2DwjMBAZadAwEthOODjIS9AEu4BDmA34C5BfYBgS0DYgX4AvYF+wZTiz+AbAJhgK4CST8AfoDBNYCdgTcEgwGpg/yHPQBhAmADLgDZAISigGIDYQBvg4CAgSUFoIQCMgEBlpwDAS+E5IOMhT0ATD2EOIDggEC5hfWBgSyDfwW2gv+FZoZViz+Ac4JhAKeCSSCAvYDBPQCBAaqEgwGlA+8HPABggn8C8ADZgISigH2C4IBgA4EAgSWFrIQCMIEBlxmigwEtBP4DTQY9gE0oBDAA4QBAvIX1AYElg26FsIL3BWaGVgs/gHSCYICogkmggLwAwTwAnQGoBIMBqAPrBzyAYIJ+gvEA2gUigH2C4oB9g0EphIGmBbCEAjKBFxijgwEuBPiDTYa9gE0nBDGA4QBAvAXzAaWDaAWzAuCFpIZLIIC3AmCAp4JKIIC6AME6AJ0khIMpA/wG/IBhgn4C8oDaBSMAYoMiAHGDZISBpgW3hAI0gRciAyGAYITzg02HPYBNJAQxgOEAQLwF8QGBJwNiBbaC9IWihksgALyCYQCpAko/AHkAwTeAgSOEgywD9Ya8AGMCf4L1ANqAhSMAY4MjgGwDQToEQagFvoQCNIEBF7yC4gBmBPCDTgc9gE0+A/CA4QBAvQXvgYEmA2GFuoLkBfqGF4qiAKSCoQCrAko+AHeAwTuAnh2mhIMBsIP7AGSCYQM2gOMBmoCFIoBnAyEAZgN2BEGqBacEQjcBAReSL4LBK4TwA02HvwBNpgPxgOEAQL2F7wGBPwMnBaCDKgX2BhgKowCnAqEAq4JKPYB3gMC8gJ6BJoSCgjWD+gBlAmADNwDjAZqFIoBnAyCAY4NxhEGphamEQjcBARgSLALigGyE64NNh7+ATaYD8YDhAEC+BfABgSCDaAWjAymILAalgEo4ALIDO4BgAogmgL2A/ACkAECihQIOMISyAGWCaALtAS+BVoYhgHqDMoB8A7CEQa4FKwSDKoFBGSIAQqYAdAUigw+MsQCOKwO4AOEAQzMF+YGDLwNsBeuDNggshqSASjUAvYL/AHwCR6SApgEAsoCkAEEnhMGQrgS0gGoCY4LsATgBWQGGoABvA3IAfQOAsQRCgKSEgy0BQRmhgEKmgGoFaoMPDTGAjakDvwDgAEK6BfcBswNnhfKC5YhohqQASjWAuALggL8CR6OAp4EAroClgEEnhMGQqYS1gGQCYgLpATwBWgEGnquDYYBlA8EoBEMnhSkEgywBQRmigEMmgG+FcIMPDbgAjacDo4EfAjGF9wGBsYNhBfUC8ohphqOASbYAsYLgAKWCh6KApgEAsACmgEErhMGRoYS1gHuCIoLmAT0BWQEGH6kDWSsDwTWEQwCvhIMwgUEZIIBCpQB0BXkDD406gI4kA+2BHoG2BfYBgboDY4XkgzIIYQalAEo3gKEDIoCoAoolgKiBATGApwBCJgTCFDkEdwBzgigC6gEAvAFZgoahAGCDViWDwbyEBICvBIMtAUEBGYejgEKogHeFeYMQjbsAkC0D9QEfBiuGM4GBqwNpheoDOIhgBqYASjiApwNoAKQCjYalgLABATwAqABCogTCl78EeABygsGtAQIFgL6BVwkYiSMAfgMjAHYDwYEGgLGEgy4BQg+HGYGrgEMugGYFd4MRALsAkqCEJIFfDiiGtIGCLwN2BcC9iH2GZgBKOAC4g2oAoYKPFSaAsoEBLADCKABCo4TCmb2ERrkAZQMOrwEDiYC/gVaIDiUASqOAYIN3AH8DwjgDCSEFcQSDMIFCGouZgi8AQ7MAY4V4AxGPO4CUJAQsgV6TK4b2gYIrA32FwjwIfYZmgEo3gKYDrACgApChAGgAsoEBsYDHKIBDIATDGr8EULkAYINXL4EEiiCBlZaSLwBMioGjgHyDIwCkBAImA0spBW4EgzGBQiOAUBmBsQBENgBiBXwDEY+8AJOlBAEygV6XJwc2AYIig2KGAyGIowangEq3AIGxA66Av4JTATAAa4C0AQGxgMspAEK7BIMbo4SoAHgAc4N4AHEBBQwVIwGVogBXN4BwAEsDJABgA16qhAK4g0okhiyEgzQBQqsAVB4CALMARLmAYwVlg1IPvYCUK4QBNwFeGaCHdoGCIoNoBgY9CGUGqABLN4CCOwOxAKGClQI/AG2AtQECL4DNqQBCvwSDnCiEvgB2gGqDtoCygQWQAKABlSyAXD6AZYCLBCWAYANgAO6EAqkDi4CsBIO2AUMQFq0AQgE0AECEvABohWwDUg+9gJUuhAG7AV4brQd2gYIkA2iGCb0Ia4aogEw2gIGhg/MAgKMCloKnAK6AtQECLwDPqYBCoYTEHCyEqAC2gGeDg7SBBhMBIYGGFTYAYIBigL2Ai4SmgGUDaoDvBAK5A42ArASDt4FBA7kAWTqAbgDBNQBAhL4AbwVzg1KPvoCVugQCoAGeHbeHdwGBqQNsBgy+CG4GqIBMNgCBpAP0AIGkgpeDKwCvALYBAi4A0KoAQqEExJuuBKwAtoBmg7uDNIEGlSMBjhU8gGIAZYCAi4UmgGcDbwDwBAK/A468hW4Eg7gBQQQUmiAAswDBNYBBBL8Ac4V2g1KPv4CVv4QDIgGeHrwHdoGCqwNthg2"}}'));
@@ -0,0 +1,5 @@
+// Generated by `python3 -m sitegen ranks` from facilities_monthly_optimized.json; do not edit
+import type { MonthRankData } from '../utils/monthRanks';
+
+export const monthlyRanks: MonthRankData =
+{"v":1,"m":["2019-09","2020-08","2020-09","2020-11","2020-12","2021-01","2021-02","2021-03","2021-04","2021-05","2021-06","2021-07","2021-08","2021-09","2021-10","2021-11","2021-12","2022-01","2022-02","2022-03","2022-04","2022-05","2022-06","2022-07","2022-08","2022-09","2022-10","2022-11","2022-12","2023-01","2023-02","2023-03","2023-04","2023-05","2023-06","2023-07","2023-08","2023-09","2023-10","2023-11","2023-12","2024-01","2024-02","2024-03","2024-04","2024-05","2024-06","2024-07","2024-08","2024-09","2024-10","2024-11","2024-12","2025-01","2025-02","2025-03","2025-04","2025-05","2025-06","2025-07","2025-08","2025-09"],"ids":[146,190,92,184,178,191,188,192,193,194,195,129,116,169,196,131,179,177,154,99,100,150,101,117,197,156,164,167,198,152,93,134,136,199,163,200,135,181,127,201,202,155,203,204,102,103,205,206,180,207,208,209,210,130,104,174,94,105,132,123,211,144,212,137,213,124,143,214,215,216,217,153,118,168,151,218,219,166,220,221,148,222,172,223,185,161,224,225,182,226,227,106,133,228,95,142,229,230,107,231,119,125,139,232,108,233,234,235,236,237,238,239,240,175,241,242,243,96,244,165,120,245,246,247,248,249,250,158,189,157,97,128,251,252,253,170,254,255,145,126,121,109,256,176,257,258,259,138,110,260,261,262,122,263,264,173,160,111,171,265,141,183,266,186,112,147,98,149,267,268,269,270,271,272,273,274,162,113,114,275,140,115,276,187,277,159],"order":"oAB/AI0AZgCdAIIAgwBbAAIAXwAsADkAsgAXADgAYACkAFwAtQBIAEEADwCUALYAdQAmAGgApgCbADoAPQBvAHEAIAA1AFUAYgCKAB8AgQC3AKEAFQA3AB0AXgAAAE0AAwB4AAUARgApAFIAewCZABYABAB8AEMAjAAZAIcAhAAqAGEAZQBuALkANABAAGMAIgB6AH4ArgAtADAAsQABAAYABwAIAAkACgALAAwADQAOABAAEQASABMAFAAYABoAGwAcAB4AIQAjACQAJQAnACgAKwAuAC8AMQAyADMANgA7ADwAPgA/AEIARABFAEcASQBKAEsATABOAE8AUABRAFMAVABWAFcAWABZAFoAXQBkAGcAaQBqAGsAbABtAHAAcgBzAHQAdgB3AHkAfQCAAIUAhgCIAIkAiwCOAI8AkACRAJIAkwCVAJYAlwCYAJoAnACeAJ8AogCjAKUApwCoAKkAqgCrAKwArQCvALAAswC0ALgAoAC1AGYAAACdAIIAfwCNAIMAXwCyAGAAWwA5AAIAtgAXAEgAOACkAEEAdQAUACAAmwBiAHEAXABoAA8AVQA9ADoALAAfADUAigCBAB0AFQA3ALcABQCUACkATQAmAAMAeABSAEYAmQB7AHwABAAZAIwAegBDAIcAKgAtAK4AQABhAGUAbgAwAE8AXgBwAAEABgAHAAgACQAKAAsADAANAA4AEAARABIAEwAWABgAGgAbABwAHgAhACIAIwAkACUAJwAoACsALgAvADEAMgAzADQANgA7ADwAPgA/AEIARABFAEcASQBKAEsATABOAFAAUQBTAFQAVgBXAFgAWQBaAF0AYwBkAGcAaQBqAGsAbABtAG8AcgBzAHQAdgB3AHkAfQB+AIAAhACFAIYAiACJAIsAjgCPAJAAkQCSAJMAlQCWAJcAmACaAJwAngCfAKEAogCjAKUApgCnAKgAqQCqAKsArACtAK8AsACxALMAtAC4ALkAoAC1AGYAAACdAH8AggCNAF8AgwCyAGAAZQBbADkAAgC2ABcASAA4AKQAQQB1ABQAIACbAGIAcQBcAGgADwBVAD0AOgAsAB8ANQCKAIEAHQAVADcAtwCUAAUAKQBNAAMAJgBSAHgARgCZAHsAfAAEABkAjAB6AEMAhwAqAC0AXgBAAGEAYwBuAK4AMABPAH4AAQAGAAcACAAJAAoACwAMAA0ADgAQABEAEgATABYAGAAaABsAHAAeACEAIgAjACQAJQAnACgAKwAuAC8AMQAyADMANAA2ADsAPAA+AD8AQgBEAEUARwBJAEoASwBMAE4AUABRAFMAVABWAFcAWABZAFoAXQBkAGcAaQBqAGsAbABtAG8AcAByAHMAdAB2AHcAeQB9AIAAhACFAIYAiACJAIsAjgCPAJAAkQCSAJMAlQCWAJcAmACaAJwAngCfAKEAogCjAKUApgCnAKgAqQCqAKsArACtAK8AsACxALMAtAC4ALkAoABmALUAFAAAAH8AXwAXAIIAOQBgAEgAOACDAA8AAgC2AFsAIACdAHEAOgBVAB8APQBBAB0AXAA3AGgAmwAVACkApAAsAIEAAwCKADUAdQBeAJQAUgBGAJkAsgCMAE0AtwB7AHoAQwAZAHgAhwB8AAQAKgAwAI0ArgAtAE8AZwBuAHAABQA8AEAAYQBiAGUAAQAGAAcACAAJAAoACwAMAA0ADgAQABEAEgATABYAGAAaABsAHAAeACEAIgAjACQAJQAmACcAKAArAC4ALwAxADIAMwA0ADYAOwA+AD8AQgBEAEUARwBJAEoASwBMAE4AUABRAFMAVABWAFcAWABZAFoAXQBjAGQAaQBqAGsAbABtAG8AcgBzAHQAdgB3AHkAfQB+AIAAhACFAIYAiACJAIsAjgCPAJAAkQCSAJMAlQCWAJcAmACaAJwAngCfAKEAogCjAKUApgCnAKgAqQCqAKsArACtAK8AsACxALMAtAC4ALkAoABmALUAFAB/ABcAAABfAIIAOQBIALIAOABgAIMAWwACAA8AtgCdACAAOgBVAHEAHwA9AEEAHQBcACkANwCbAGgAFQCkAIEAAwBeACwAigB1ADUAlABSAJkARgCMAE0AtwB6AHsAQwAZAIcAeAAEAHwAKgAwAC0ATwBuAIQABQBAAGEAYgBlAGcAfgCNAK4AsQABAAYABwAIAAkACgALAAwADQAOABAAEQASABMAFgAYABoAGwAcAB4AIQAiACMAJAAlACYAJwAoACsALgAvADEAMgAzADQANgA7ADwAPgA/AEIARABFAEcASQBKAEsATABOAFAAUQBTAFQAVgBXAFgAWQBaAF0AYwBkAGkAagBrAGwAbQBvAHAAcgBzAHQAdgB3AHkAfQCAAIUAhgCIAIkAiwCOAI8AkACRAJIAkwCVAJYAlwCYAJoAnACeAJ8AoQCiAKMApQCmAKcAqACpAKoAqwCsAK0ArwCwALMAtAC4ALkAoABmALUAFAAXAF8AfwAAAIIASABgAAIAgwAPAFsAnQAgADoAVQBxAB8APQAdAEEAXAApAGgANwCbABUApACBAAMAXgCKAHUANQCUAFIAmQCMAEYAQwBNAHsAfAC3AHoAGQCHAHgAsgAEACoALACTALYAOAAwAE8AhAAmAG4AcAAFABEALQA5ADwAQABhAGIAZQBnAHYAfgCNAK4AAQAGAAcACAAJAAoACwAMAA0ADgAQABIAEwAWABgAGgAbABwAHgAhACIAIwAkACUAJwAoACsALgAvADEAMgAzADQANgA7AD4APwBCAEQARQBHAEkASgBLAEwATgBQAFEAUwBUAFYAVwBYAFkAWgBdAGMAZABpAGoAawBsAG0AbwByAHMAdAB3AHkAfQCAAIUAhgCIAIkAiwCOAI8AkACRAJIAlQCWAJcAmACaAJwAngCfAKEAogCjAKUApgCnAKgAqQCqAKsArACtAK8AsACxALMAtAC4ALkAoABmABQAtQCNABcAXwB/AIIAOQAAAGUASACyADgAAgBbAGAAgwCdAA8AtgAgAFUAHwA6AHEAPQBiAB0AQQBoACkAXAA3AJsApACBABUAAwCUAF4AigB1ACwANQBSAJkAjABGAE0AewBDALcAegAZAIcAeAAqAAQAfAAtAIQATwAFADwAQABuAKoArgABAAYABwAIAAkACgALAAwADQAOABAAEQASABMAFgAYABoAGwAcAB4AIQAiACMAJAAlACYAJwAoACsALgAvADAAMQAyADMANAA2ADsAPgA/AEIARABFAEcASQBKAEsATABOAFAAUQBTAFQAVgBXAFgAWQBaAF0AYQBjAGQAZwBpAGoAawBsAG0AbwBwAHIAcwB0AHYAdwB5AH0AfgCAAIUAhgCIAIkAiwCOAI8AkACRAJIAkwCVAJYAlwCYAJoAnACeAJ8AoQCiAKMApQCmAKcAqACpAKsArACtAK8AsACxALMAtAC4ALkAoABmAI0AFAC1AIIAZQAXADkAXwCyAH8AAABIADgAnQACAIMAWwBgACAADwC2AFUAHwBxADoAYgA9AB0AaAApAEEAlABcADcAgQCkAJsAFQADAF4AdQCKADUAUgAsAIwAmQBGAE0AQwC3ABkAhwB4ACoABACEAC0ABQBAAKoArgABAAYABwAIAAkACgALAAwADQAOABAAEQASABMAFgAYABoAGwAcAB4AIQAiACMAJAAlACYAJwAoACsALgAvADAAMQAyADMANAA2ADsAPAA+AD8AQgBEAEUARwBJAEoASwBMAE4ATwBQAFEAUwBUAFYAVwBYAFkAWgBdAGEAYwBkAGcAaQBqAGsAbABtAG4AbwBwAHIAcwB0AHYAdwB5AHoAewB8AH0AfgCAAIUAhgCIAIkAiwCOAI8AkACRAJIAkwCVAJYAlwCYAJoAnACeAJ8AoQCiAKMApQCmAKcAqACpAKsArACtAK8AsACxALMAtAC4ALkAoABmAI0AFAC1AIIAAAAXALIAOQBfAH8AnQBIADgAAgBbAIMAYAAgAA8AtgBVAB8AYgBxADoAPQBoAB0AlAApAEEAXACkADcAgQAFAJsAFQBeAAMAdQCKADUAUgAsAIwAmQBGAEMATQC3ABkAhwB4ACoAhAAtAEAAZQBuAAEABAAGAAcACAAJAAoACwAMAA0ADgAQABEAEgATABYAGAAaABsAHAAeACEAIgAjACQAJQAmACcAKAArAC4ALwAwADEAMgAzADQANgA7ADwAPgA/AEIARABFAEcASQBKAEsATABOAE8AUABRAFMAVABWAFcAWABZAFoAXQBhAGMAZABnAGkAagBrAGwAbQBvAHAAcgBzAHQAdgB3AHkAegB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJEAkgCTAJUAlgCXAJgAmgCcAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCuAK8AsACxALMAtAC4ALkAoABmABQAjQC1ABcAXwCCAH8AAABlALIASAA4AAIAnQBbAIMAYAAPACAAtgBVAB8AcQA6AD0AYgAdAGgAKQCkAEEAXAA3AJsAgQAVAJQAAwBeAIoAdQA1ACwAUgCMAJkARgBNAEMAtwAZAIcAeAAqAAQALQA5AIQABQBAAGEAbgCuAAEABgAHAAgACQAKAAsADAANAA4AEAARABIAEwAWABgAGgAbABwAHgAhACIAIwAkACUAJgAnACgAKwAuAC8AMAAxADIAMwA0ADYAOwA8AD4APwBCAEQARQBHAEkASgBLAEwATgBPAFAAUQBTAFQAVgBXAFgAWQBaAF0AYwBkAGcAaQBqAGsAbABtAG8AcAByAHMAdAB2AHcAeQB6AHsAfAB9AH4AgACFAIYAiACJAIsAjgCPAJAAkQCSAJMAlQCWAJcAmACaAJwAngCfAKEAogCjAKUApgCnAKgAqQCqAKsArACtAK8AsACxALMAtAC4ALkAoAAAAGYAtQCNAJ0AggAUALIAFwA5AF8AfwBgAIMAOAC2AFsAAgBIACAADwBiAGgAOgBxAFUAlACkAD0AHwAdACkAgQA3AEEAXAAVAAUAmwADAHUANQBeAIoAUgAsAJkAjABNAEYAtwAZAIcAeACEACoABAAtACYArgAwAE8AZQABAAYABwAIAAkACgALAAwADQAOABAAEQASABMAFgAYABoAGwAcAB4AIQAiACMAJAAlACcAKAArAC4ALwAxADIAMwA0ADYAOwA8AD4APwBAAEIAQwBEAEUARwBJAEoASwBMAE4AUABRAFMAVABWAFcAWABZAFoAXQBhAGMAZABnAGkAagBrAGwAbQBuAG8AcAByAHMAdAB2AHcAeQB6AHsAfAB9AH4AgACFAIYAiACJAIsAjgCPAJAAkQCSAJMAlQCWAJcAmACaAJwAngCfAKEAogCjAKUApgCnAKgAqQCqAKsArACtAK8AsACxALMAtAC4ALkAoAAAALUAZgCdAI0AggAUALIAXgA5AGAAFwB/AF8AtgCDADgAWwACAEgAIABiAA8AaABxADoApACUAFUAPQAfACkAgQBBADcAFQBcAJsANQADAHUAigAsAFIAmQCMALcARgBNABkAJgCHAHgAhAAEACoALQCuAHAABQBAAGUAAQAGAAcACAAJAAoACwAMAA0ADgAQABEAEgATABYAGAAaABsAHAAdAB4AIQAiACMAJAAlACcAKAArAC4ALwAwADEAMgAzADQANgA7ADwAPgA/AEIAQwBEAEUARwBJAEoASwBMAE4ATwBQAFEAUwBUAFYAVwBYAFkAWgBdAGEAYwBkAGcAaQBqAGsAbABtAG4AbwByAHMAdAB2AHcAeQB6AHsAfAB9AH4AgACFAIYAiACJAIsAjgCPAJAAkQCSAJMAlQCWAJcAmACaAJwAngCfAKEAogCjAKUApgCnAKgAqQCqAKsArACtAK8AsACxALMAtAC4ALkAoAAAAGUAtQBmAJ0AjQCCABQAsgBgAH8AOQAXALYAgwBfADgAWwACAEgAIABiAGgADwBxAKQAlAA6AD0AVQBBAB8AKQCBADcAFQBcADUAmwADACwAdQCKAF4AmQCMALcARgBNACYAGQCHAHgAhAAEACoALQCuAAUAQABnAAEABgAHAAgACQAKAAsADAANAA4AEAARABIAEwAWABgAGgAbABwAHQAeACEAIgAjACQAJQAnACgAKwAuAC8AMAAxADIAMwA0ADYAOwA8AD4APwBCAEMARABFAEcASQBKAEsATABOAE8AUABRAFIAUwBUAFYAVwBYAFkAWgBdAGEAYwBkAGkAagBrAGwAbQBuAG8AcAByAHMAdAB2AHcAeQB6AHsAfAB9AH4AgACFAIYAiACJAIsAjgCPAJAAkQCSAJMAlQCWAJcAmACaAJwAngCfAKEAogCjAKUApgCnAKgAqQCqAKsArACtAK8AsACxALMAtAC4ALkAoAAAALUAZgCdAIIAjQAUAGAAsgB/ALYAOQAXAIMAXwA4AFsAAgBIACAAYgBoAKQAcQCUAA8AOgA9AFUAQQCBAB8AKQA3ABUANQBcAJsAAwBeACwAdQCKAJkAtwCMAEYATQAmABkAeACHAIQAKgAEAC0ArgAFAGUAAQAGAAcACAAJAAoACwAMAA0ADgAQABEAEgATABYAGAAaABsAHAAdAB4AIQAiACMAJAAlACcAKAArAC4ALwAwADEAMgAzADQANgA7ADwAPgA/AEAAQgBDAEQARQBHAEkASgBLAEwATgBPAFAAUQBSAFMAVABWAFcAWABZAFoAXQBhAGMAZABnAGkAagBrAGwAbQBuAG8AcAByAHMAdAB2AHcAeQB6AHsAfAB9AH4AgACFAIYAiACJAIsAjgCPAJAAkQCSAJMAlQCWAJcAmACaAJwAngCfAKEAogCjAKUApgCnAKgAqQCqAKsArACtAK8AsACxALMAtAC4ALkAoAAAALUAZQBmAJ0AjQBgABQAsgB/ALYAFwCDAF8AOABbAAIASABiACAAaACkAHEAlAAPAD0AOgBBAFUAHQCBACkAHwA3ABUANQBcAJsALABeAAMAdQCKAFIAmQAmALcAjABGAE0AGQB4AIcAhAAqAC0ABAA5AK4ABQBAAE8AbgCCAAEABgAHAAgACQAKAAsADAANAA4AEAARABIAEwAWABgAGgAbABwAHgAhACIAIwAkACUAJwAoACsALgAvADAAMQAyADMANAA2ADsAPAA+AD8AQgBDAEQARQBHAEkASgBLAEwATgBQAFEAUwBUAFYAVwBYAFkAWgBdAGEAYwBkAGcAaQBqAGsAbABtAG8AcAByAHMAdAB2AHcAeQB6AHsAfAB9AH4AgACFAIYAiACJAIsAjgCPAJAAkQCSAJMAlQCWAJcAmACaAJwAngCfAKEAogCjAKUApgCnAKgAqQCqAKsArACtAK8AsACxALMAtAC4ALkAoAC1AAAAggBlAGAAgwCNAGYAtgB/ADkAnQCyAKQAFwA4ABQAWwBiACAAaACUADUASACBAEEAPQBxADoALAAmABUAAgApAHUAHwA3AJkAAwBVAF4AeACKALcARgBNAIwAmwAEABkALQAqAIQAhwCuAAUAAQAGAAcACAAJAAoACwAMAA0ADgAPABAAEQASABMAFgAYABoAGwAcAB0AHgAhACIAIwAkACUAJwAoACsALgAvADAAMQAyADMANAA2ADsAPAA+AD8AQABCAEMARABFAEcASQBKAEsATABOAE8AUABRAFIAUwBUAFYAVwBYAFkAWgBcAF0AXwBhAGMAZABnAGkAagBrAGwAbQBuAG8AcAByAHMAdAB2AHcAeQB6AHsAfAB9AH4AgACFAIYAiACJAIsAjgCPAJAAkQCSAJMAlQCWAJcAmACaAJwAngCfAKEAogCjAKUApgCnAKgAqQCqAKsArACtAK8AsACxALMAtAC4ALkAoAC1AAAAggBlADUAgwBgAGYAjQC2AH8AOQCdABcAsgA4AKQAFABiAFsAIACUAGgAgQAFAD0AQQBIADoAcQAVACYAAgAsACkAdQAfAF4ANwCZAFUAAwCKAHgAtwBGAE0ABACbAIwADwAZAC0AhACHAEAAZwABAAYABwAIAAkACgALAAwADQAOABAAEQASABMAFgAYABoAGwAcAB0AHgAhACIAIwAkACUAJwAoACoAKwAuAC8AMAAxADIAMwA0ADYAOwA8AD4APwBCAEMARABFAEcASQBKAEsATABOAE8AUABRAFIAUwBUAFYAVwBYAFkAWgBcAF0AXwBhAGMAZABpAGoAawBsAG0AbgBvAHAAcgBzAHQAdgB3AHkAegB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJEAkgCTAJUAlgCXAJgAmgCcAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCuAK8AsACxALMAtAC4ALkAoAC1AAAAggA1AIMAZgCNAGAAtgB/AJ0AOQAXALIAFAA4AKQAYgBbACAAlABoAIEAQQA9AAUASAA6ABUAcQAmAAIALABeAHUAHwApADcAmQBVAAMAigB4AEYATQC3AJsABACMAA8AGQAtAIQAQABlAGcAcACuAAEABgAHAAgACQAKAAsADAANAA4AEAARABIAEwAWABgAGgAbABwAHQAeACEAIgAjACQAJQAnACgAKgArAC4ALwAwADEAMgAzADQANgA7ADwAPgA/AEIAQwBEAEUARwBJAEoASwBMAE4ATwBQAFEAUgBTAFQAVgBXAFgAWQBaAFwAXQBfAGEAYwBkAGkAagBrAGwAbQBuAG8AcgBzAHQAdgB3AHkAegB7AHwAfQB+AIAAhQCGAIcAiACJAIsAjgCPAJAAkQCSAJMAlQCWAJcAmACaAJwAngCfAKEAogCjAKUApgCnAKgAqQCqAKsArACtAK8AsACxALMAtAC4ALkAoAAAAIIAZQC1AIMAnQCNAGYAOQB/ALYAYAAXAGIApACyABQAOABbACAAlABoAIEAQQA9ACwAOgBIAF4AJgAVADUAcQACAHUAHwApADcAigCZAFUAAwB4AE0ARgC3AIwAmwAEABkAhAAtAE8AEgAqAAUAQABnAAEABgAHAAgACQAKAAsADAANAA4ADwAQABEAEwAWABgAGgAbABwAHQAeACEAIgAjACQAJQAnACgAKwAuAC8AMAAxADIAMwA0ADYAOwA8AD4APwBCAEMARABFAEcASQBKAEsATABOAFAAUQBSAFMAVABWAFcAWABZAFoAXABdAF8AYQBjAGQAaQBqAGsAbABtAG4AbwBwAHIAcwB0AHYAdwB5AHoAewB8AH0AfgCAAIUAhgCHAIgAiQCLAI4AjwCQAJEAkgCTAJUAlgCXAJgAmgCcAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCuAK8AsACxALMAtAC4ALkAoABlAIIAAAC1AJ0AgwCNADkAZgB/ALYAsgBgAGIAFwCkABQAWwA4ACAAlABoAEEAgQAFACwAPQA6AF4AFQAmAEgANQACAHUAHwApAIoANwCZAFUAAwB4AE0ARgCMAJsAGQAEAIQAEgAtAE8AKgBcAK4AQAABAAYABwAIAAkACgALAAwADQAOAA8AEAARABMAFgAYABoAGwAcAB0AHgAhACIAIwAkACUAJwAoACsALgAvADAAMQAyADMANAA2ADsAPAA+AD8AQgBDAEQARQBHAEkASgBLAEwATgBQAFEAUgBTAFQAVgBXAFgAWQBaAF0AXwBhAGMAZABnAGkAagBrAGwAbQBuAG8AcABxAHIAcwB0AHYAdwB5AHoAewB8AH0AfgCAAIUAhgCHAIgAiQCLAI4AjwCQAJEAkgCTAJUAlgCXAJgAmgCcAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAoABlAIIAnQAAALUANQCNAIMAZgA5AH8AsgBiALYAFwBgAFsAFACkADgAIACUAGgAQQCBACwAPQAFADoAXgAVACYAAgAfAHUAigApADcAVQCZAAMAeABNAEYAjACbABkAEgCEAAQAKgAtAGcAhwBAAK4AAQAGAAcACAAJAAoACwAMAA0ADgAPABAAEQATABYAGAAaABsAHAAdAB4AIQAiACMAJAAlACcAKAArAC4ALwAwADEAMgAzADQANgA7ADwAPgA/AEIAQwBEAEUARwBIAEkASgBLAEwATgBPAFAAUQBSAFMAVABWAFcAWABZAFoAXABdAF8AYQBjAGQAaQBqAGsAbABtAG4AbwBwAHEAcgBzAHQAdgB3AHkAegB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJEAkgCTAJUAlgCXAJgAmgCcAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAoABlAJ0AggAAALUAjQA1AIMAZgA5AGIAfwC2AFsAsgBgABcAFACkADgAIABBAGgAlAAsAIEAOgBeABUAJgAfAAIAdQApAFUAmQA3AHgAAwBGAE0AhACMAJsAGQAEABIAKgAtAIcAZwAFAEAAigCuAAEABgAHAAgACQAKAAsADAANAA4ADwAQABEAEwAWABgAGgAbABwAHQAeACEAIgAjACQAJQAnACgAKwAuAC8AMAAxADIAMwA0ADYAOwA8AD0APgA/AEIAQwBEAEUARwBIAEkASgBLAEwATgBPAFAAUQBSAFMAVABWAFcAWABZAFoAXABdAF8AYQBjAGQAaQBqAGsAbABtAG4AbwBwAHEAcgBzAHQAdgB3AHkAegB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJEAkgCTAJUAlgCXAJgAmgCcAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAoACdAAAAZQCCALUAjQA1AIMAZgA5AGIAfwC2AFsAYACyABQAFwCkADgAIABBAGgALACUAIEABQA6AF4AFQAmAB8AigB1AAIAKQBVAJkANwB4AAMARgBNABIAhACMAJsAGQAEACoALQBPAIcAZwCuAAEABgAHAAgACQAKAAsADAANAA4ADwAQABEAEwAWABgAGgAbABwAHQAeACEAIgAjACQAJQAnACgAKwAuAC8AMAAxADIAMwA0ADYAOwA8AD0APgA/AEAAQgBDAEQARQBHAEgASQBKAEsATABOAFAAUQBSAFMAVABWAFcAWABZAFoAXABdAF8AYQBjAGQAaQBqAGsAbABtAG4AbwBwAHEAcgBzAHQAdgB3AHkAegB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJEAkgCTAJUAlgCXAJgAmgCcAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAoAAAAJ0AggC1AI0ANQCDAF4AZgA5AGIAYAB/ALYAWwAUALIAFwCkADgAIABBACwAaACUAIEABQAVADoAJgAfAIoAdQACACkAVQCZADcAeAADAEYAEgBNAIQAjACbABkABAAqAC0ATwCHAGcArgA2AEAAYwBlAAEABgAHAAgACQAKAAsADAANAA4ADwAQABEAEwAWABgAGgAbABwAHQAeACEAIgAjACQAJQAnACgAKwAuAC8AMAAxADIAMwA0ADsAPAA9AD4APwBCAEMARABFAEcASABJAEoASwBMAE4AUABRAFIAUwBUAFYAVwBYAFkAWgBcAF0AXwBhAGQAaQBqAGsAbABtAG4AbwBwAHEAcgBzAHQAdgB3AHkAegB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJEAkgCTAJUAlgCXAJgAmgCcAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAoAACAAAAnQCCALUALACNADUAgwBmADkAYABiAH8AtgAUAFsAsgAXADgApAAgAEEAaACUAIEABQAVADoAXgAmAB8AigB1ACkAVQCZADcAeAADABIARgBNAIQAjACbABkABAAqAC0ATwBnAK4AQABlAAEABgAHAAgACQAKAAsADAANAA4ADwAQABEAEwAWABgAGgAbABwAHQAeACEAIgAjACQAJQAnACgAKwAuAC8AMAAxADIAMwA0ADYAOwA8AD0APgA/AEIAQwBEAEUARwBIAEkASgBLAEwATgBQAFEAUgBTAFQAVgBXAFgAWQBaAFwAXQBfAGEAYwBkAGkAagBrAGwAbQBuAG8AcABxAHIAcwB0AHYAdwB5AHoAewB8AH0AfgCAAIUAhgCHAIgAiQCLAI4AjwCQAJEAkgCTAJUAlgCXAJgAmgCcAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAAgCgAAAAnQC1AIIALACNAGYANQCDAGAAOQC2ALIAYgAUAFsAfwAXADgApAAgAEEAaACUAIEABQA6ABUAXgAmAB8AigB1ACkAVQA3AJkAeAADABIARgBNAIQAjACbABkABAAqAC0ATwCHAGcArgAwADYAQABjAGUAbgABAAYABwAIAAkACgALAAwADQAOAA8AEAARABMAFgAYABoAGwAcAB0AHgAhACIAIwAkACUAJwAoACsALgAvADEAMgAzADQAOwA8AD0APgA/AEIAQwBEAEUARwBIAEkASgBLAEwATgBQAFEAUgBTAFQAVgBXAFgAWQBaAFwAXQBfAGEAZABpAGoAawBsAG0AbwBwAHEAcgBzAHQAdgB3AHkAegB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJEAkgCTAJUAlgCXAJgAmgCcAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAnQC1AAIAoAAAAGIAggAsAGAAZgCNABQANQC2ABcAsgBbAH8ApACDADkAOABoAEEAlAAgAAUAOgAVAF4ANwCKAB8AgQBVACYAEgCZACkAdQCEAIwAAwBGAE0AeAAEAK4ATwAZACoAZQBnAIcAmwAwAGEAYwBuAC0AAQAGAAcACAAJAAoACwAMAA0ADgAPABAAEQATABYAGAAaABsAHAAdAB4AIQAiACMAJAAlACcAKAArAC4ALwAxADIAMwA0ADYAOwA8AD0APgA/AEAAQgBDAEQARQBHAEgASQBKAEsATABOAFAAUQBSAFMAVABWAFcAWABZAFoAXABdAF8AZABpAGoAawBsAG0AbwBwAHEAcgBzAHQAdgB3AHkAegB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJEAkgCTAJUAlgCXAJgAmgCcAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAnQC1AKAAAACCAGUAYgBgAGYAjQAUADUAsgC2AIMAWwAXADkApAAsADgAaACUAEEAIAAFADoAFQA3AIoAHwBeAFUAgQAmABIAmQB1ACkAhAACAIwAAwBGAE0ABAB4AK4ATwAZACoAMABnAH8AmwBhAGMAhwAiACUALQBAAAEABgAHAAgACQAKAAsADAANAA4ADwAQABEAEwAWABgAGgAbABwAHQAeACEAIwAkACcAKAArAC4ALwAxADIAMwA0ADYAOwA8AD0APgA/AEIAQwBEAEUARwBIAEkASgBLAEwATgBQAFEAUgBTAFQAVgBXAFgAWQBaAFwAXQBfAGQAaQBqAGsAbABtAG4AbwBwAHEAcgBzAHQAdgB3AHkAegB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJEAkgCTAJUAlgCXAJgAmgCcAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAnQC1AKAAAACCAGYAYgBgAI0ANQAUALIAgwC2ABcAOQBbAKQALAA4AGgAlABBACAAOgAVAAUANwBeAIoAHwCBAFUAJgCZACkAdQASAIQAjAACAAMARgBNAAQAGQB4AK4ATwB/ACoAMABnAGMAZQBuAIcAmwAiACUALQBAAEoAAQAGAAcACAAJAAoACwAMAA0ADgAPABAAEQATABYAGAAaABsAHAAdAB4AIQAjACQAJwAoACsALgAvADEAMgAzADQANgA7ADwAPQA+AD8AQgBDAEQARQBHAEgASQBLAEwATgBQAFEAUgBTAFQAVgBXAFgAWQBaAFwAXQBfAGEAZABpAGoAawBsAG0AbwBwAHEAcgBzAHQAdgB3AHkAegB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJEAkgCTAJUAlgCXAJgAmgCcAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAnQC1AKAAAACCAGYAjQA1AGIAYAAUALIAgwAXALYAWwA5AKQALAA4AGgAlABBACAAOgAVAF4ANwAFAIoAgQAfAFUAmQAmACkAdQASAIQAjAACAAMARgBNAAQAGQCuAE8AZwB/ACoAMABjAGUAbgCbACIAJQAtADwAQABKAGEAhwABAAYABwAIAAkACgALAAwADQAOAA8AEAARABMAFgAYABoAGwAcAB0AHgAhACMAJAAnACgAKwAuAC8AMQAyADMANAA2ADsAPQA+AD8AQgBDAEQARQBHAEgASQBLAEwATgBQAFEAUgBTAFQAVgBXAFgAWQBaAFwAXQBfAGQAaQBqAGsAbABtAG8AcABxAHIAcwB0AHYAdwB4AHkAegB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJEAkgCTAJUAlgCXAJgAmgCcAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAAgCdAKAAtQAsAAAAggBlAGYAjQA1AGIAYAAUALIAfwCDAFsAFwC2ADkAOACkAGgAlABBACAAOgAVAF4ANwCKAAUAgQAfAFUAJgCZACkAdQCEAIwAAwBGAE0ABAAZAE8AKgAwAGcAbgBhAGMAhwCbACIALQBKAK4AAQAGAAcACAAJAAoACwAMAA0ADgAPABAAEQASABMAFgAYABoAGwAcAB0AHgAhACMAJAAlACcAKAArAC4ALwAxADIAMwA0ADYAOwA8AD0APgA/AEAAQgBDAEQARQBHAEgASQBLAEwATgBQAFEAUgBTAFQAVgBXAFgAWQBaAFwAXQBfAGQAaQBqAGsAbABtAG8AcABxAHIAcwB0AHYAdwB4AHkAegB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJEAkgCTAJUAlgCXAJgAmgCcAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAnQCgALUAAACCAGYAjQBiADUAYACyABQAgwBbALYAFwA5AKQALAA4AGgAlABBACAAFQA6AF4ANwCKAAUAgQAfAFUAJgCZACkAdQCEAIwAAwACAEYATQAEABkATwAqADAAZwBuAH8AYQBjAGUAhwCbACIALQBAAK4AAQAGAAcACAAJAAoACwAMAA0ADgAPABAAEQASABMAFgAYABoAGwAcAB0AHgAhACMAJAAlACcAKAArAC4ALwAxADIAMwA0ADYAOwA8AD0APgA/AEIAQwBEAEUARwBIAEkASgBLAEwATgBQAFEAUgBTAFQAVgBXAFgAWQBaAFwAXQBfAGQAaQBqAGsAbABtAG8AcABxAHIAcwB0AHYAdwB4AHkAegB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJEAkgCTAJUAlgCXAJgAmgCcAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAAgCdALUAoAAAAIIAZgCNAGIANQBgALIAFABbAIMAtgAXADkALACkADgAaACUAEEAIAAVADoANwBeAIoABQCBAB8AJgBVAJkAKQB1AIQAjAADAEYATQAEABkATwBuACoAMABnAH8AYQBjAGUAhwCbACIAJQAtAEAASgCuAAEABgAHAAgACQAKAAsADAANAA4ADwAQABEAEgATABYAGAAaABsAHAAdAB4AIQAjACQAJwAoACsALgAvADEAMgAzADQANgA7ADwAPQA+AD8AQgBDAEQARQBHAEgASQBLAEwATgBQAFEAUgBTAFQAVgBXAFgAWQBaAFwAXQBfAGQAaQBqAGsAbABtAG8AcABxAHIAcwB0AHYAdwB4AHkAegB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJEAkgCTAJUAlgCXAJgAmgCcAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAAgCdAKAAtQAsAIIAAABlAGYAjQA1AGIAsgB/AGAAFABbAIMAFwA4ALYAOQCkAGgAQQAgAJQAOgAVADcAXgCKAAUAJgCBAB8AVQCZACkAdQCEAAMAjABGAAQATQAZAHgATwCuAGcAbgAqADAAYQBjAIcAmwAiACUALQBAAEoAAQAGAAcACAAJAAoACwAMAA0ADgAPABAAEQASABMAFgAYABoAGwAcAB0AHgAhACMAJAAnACgAKwAuAC8AMQAyADMANAA2ADsAPAA9AD4APwBCAEMARABFAEcASABJAEsATABOAFAAUQBSAFMAVABWAFcAWABZAFoAXABdAF8AZABpAGoAawBsAG0AbwBwAHEAcgBzAHQAdgB3AHkAegB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJEAkgCTAJUAlgCXAJgAmgCcAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAAgCdAKAAtQAsAIIAAABmAI0AYgA1ALIAYAB/ABQAWwCDABcAOAA5ALYApABBAGgAIACUADoAFQA3AF4AigAFACYAgQAfAFUAmQApAHUAhAADAIwARgAEAE0AeAAZAE8AZwBuACoAMAAtAGEAYwCHAJsAIgAlAEAASgBlAK4AAQAGAAcACAAJAAoACwAMAA0ADgAPABAAEQASABMAFgAYABoAGwAcAB0AHgAhACMAJAAnACgAKwAuAC8AMQAyADMANAA2ADsAPAA9AD4APwBCAEMARABFAEcASABJAEsATABOAFAAUQBSAFMAVABWAFcAWABZAFoAXABdAF8AZABpAGoAawBsAG0AbwBwAHEAcgBzAHQAdgB3AHkAegB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJEAkgCTAJUAlgCXAJgAmgCcAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAoACdALUAggAAAGYAjQBiADUAsgBbAGAAgwAUACwAOQAXALYApAA4AEEAaAAgAJQAOgAVADcAXgCKAAUAJgAfAIEAVQCZACkAdQADAIQAjABGAHgAAgAEAE0AGQBPAGcAbgAqADAAfwAtAGEAYwCHAJsAIgAlAEAASgBlAK4AAQAGAAcACAAJAAoACwAMAA0ADgAPABAAEQASABMAFgAYABoAGwAcAB0AHgAhACMAJAAnACgAKwAuAC8AMQAyADMANAA2ADsAPAA9AD4APwBCAEMARABFAEcASABJAEsATABOAFAAUQBSAFMAVABWAFcAWABZAFoAXABdAF8AZABpAGoAawBsAG0AbwBwAHEAcgBzAHQAdgB3AHkAegB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJEAkgCTAJUAlgCXAJgAmgCcAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAoAC1AJ0AggAAAGYAjQBiADUAsgBbAIMALABgADkAFAAXALYApAA4AEEAaAAgAJQAOgAVADcAXgCKAAUAJgAfAIEAVQCZACkAdQADAIQAjABGAHgABAACAE0AGQBPAGcAbgAwAH8ALQBhAGMAhwCbACIAJQBKAGUArgABAAYABwAIAAkACgALAAwADQAOAA8AEAARABIAEwAWABgAGgAbABwAHQAeACEAIwAkACcAKAAqACsALgAvADEAMgAzADQANgA7ADwAPQA+AD8AQABCAEMARABFAEcASABJAEsATABOAFAAUQBSAFMAVABWAFcAWABZAFoAXABdAF8AZABpAGoAawBsAG0AbwBwAHEAcgBzAHQAdgB3AHkAegB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJEAkgCTAJUAlgCXAJgAmgCcAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAoAC1ADYAnQBlAIIAAABmAI0AYgA1ALIAWwBgAIMALAA5ABQAFwC2AKQAOABBAGgAIACUADoAFQA3AAUAigBeACYAHwAtAIEAVQCZACkAdQADAIQAeABGAIwABAACAE0AGQBPAGcAbgB/ADAAYQBjAIcAmwAiACUAQABKAK4AAQAGAAcACAAJAAoACwAMAA0ADgAPABAAEQASABMAFgAYABoAGwAcAB0AHgAhACMAJAAnACgAKgArAC4ALwAxADIAMwA0ADsAPAA9AD4APwBCAEMARABFAEcASABJAEsATABOAFAAUQBSAFMAVABWAFcAWABZAFoAXABdAF8AZABpAGoAawBsAG0AbwBwAHEAcgBzAHQAdgB3AHkAegB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJEAkgCTAJUAlgCXAJgAmgCcAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAAgAAAKAAZQC1AGIAggCNAGAALABbALIAZgCDADUAOQC2ABQAFwA4AKQAQQBoAJQAIAA6ABUAigAfAAUAJgBeADcAgQApAFUAeACZAEYAdQADAAQAjACEABkATQB/AC0ATwBnAIcAJQAwAG4ANgBjACIAmwCuAAEABgAHAAgACQAKAAsADAANAA4ADwAQABEAEgATABYAGAAaABsAHAAdAB4AIQAjACQAJwAoACoAKwAuAC8AMQAyADMANAA7ADwAPQA+AD8AQABCAEMARABFAEcASABJAEoASwBMAE4AUABRAFIAUwBUAFYAVwBYAFkAWgBcAF0AXwBhAGQAaQBqAGsAbABtAG8AcABxAHIAcwB0AHYAdwB5AHoAewB8AH0AfgCAAIUAhgCIAIkAiwCOAI8AkACRAJIAkwCVAJYAlwCYAJoAnACdAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkANgAAAAIAoAC1AGUAggBiAI0ALABgAGYAsgCDADUAWwA5ALYAFAAXADgApABBAGgAlAAgADoAFQAmAB8AigAFADcAXgBVAIEAKQB4AJkARgB1AAMABACMAIQAGQBNAH8ATwAtAGcAMACHACUAYwBuACoAQABhAJsArgABAAYABwAIAAkACgALAAwADQAOAA8AEAARABIAEwAWABgAGgAbABwAHQAeACEAIgAjACQAJwAoACsALgAvADEAMgAzADQAOwA8AD0APgA/AEIAQwBEAEUARwBIAEkASgBLAEwATgBQAFEAUgBTAFQAVgBXAFgAWQBaAFwAXQBfAGQAaQBqAGsAbABtAG8AcABxAHIAcwB0AHYAdwB5AHoAewB8AH0AfgCAAIUAhgCIAIkAiwCOAI8AkACRAJIAkwCVAJYAlwCYAJoAnACdAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkANgAAAKAAtQCCAGIALACNAGAAZgCDADUAsgBbADkAtgAUADgAFwCkAAIAQQBoACAAlAA6ACYAFQAFAB8AigA3AF4AVQApAJkAeACBAEYAdQADAIwABACEABkATwB/AIcALQBnADAAYwBuACUAKgBlAJsArgABAAYABwAIAAkACgALAAwADQAOAA8AEAARABIAEwAWABgAGgAbABwAHQAeACEAIgAjACQAJwAoACsALgAvADEAMgAzADQAOwA8AD0APgA/AEAAQgBDAEQARQBHAEgASQBKAEsATABNAE4AUABRAFIAUwBUAFYAVwBYAFkAWgBcAF0AXwBhAGQAaQBqAGsAbABtAG8AcABxAHIAcwB0AHYAdwB5AHoAewB8AH0AfgCAAIUAhgCIAIkAiwCOAI8AkACRAJIAkwCVAJYAlwCYAJoAnACdAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkANgACAKAAtQAAAIIAYgAsAI0AZgBgADUAgwCyAFsAOQC2ABcAFAA4AKQAQQBoACAAlAA6ACYAFQAFAB8AigA3AF4AVQApAJkAeABGAHUAAwCEAIwABAAZAE8AhwB/AC0AZwAwAG4AJQAqAIEArgBhAGUAmwABAAYABwAIAAkACgALAAwADQAOAA8AEAARABIAEwAWABgAGgAbABwAHQAeACEAIgAjACQAJwAoACsALgAvADEAMgAzADQAOwA8AD0APgA/AEAAQgBDAEQARQBHAEgASQBKAEsATABNAE4AUABRAFIAUwBUAFYAVwBYAFkAWgBcAF0AXwBjAGQAaQBqAGsAbABtAG8AcABxAHIAcwB0AHYAdwB5AHoAewB8AH0AfgCAAIUAhgCIAIkAiwCOAI8AkACRAJIAkwCVAJYAlwCYAJoAnACdAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkANgACAAAAoAC1AGUAggAsAI0AZgA1AGAAgwCyAFsAOQC2ABcAFAA4AKQAaAAgAJQAOgAmABUABQAfADcAigBeAFUAmQApAHgARgB1AAMAhACMAAQAGQBPAIcALQB/AGcAMABuACUAKgBhAGIAYwCBAK4AmwABAAYABwAIAAkACgALAAwADQAOAA8AEAARABIAEwAWABgAGgAbABwAHQAeACEAIgAjACQAJwAoACsALgAvADEAMgAzADQAOwA8AD0APgA/AEAAQQBCAEMARABFAEcASABJAEoASwBMAE0ATgBQAFEAUgBTAFQAVgBXAFgAWQBaAFwAXQBfAGQAaQBqAGsAbABtAG8AcABxAHIAcwB0AHYAdwB5AHoAewB8AH0AfgCAAIUAhgCIAIkAiwCOAI8AkACRAJIAkwCVAJYAlwCYAJoAnACdAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkANgACAKAAAAC1AGUAggAsAI0AZgA1AGAAgwCyAFsAOQC2ABcAFAA4AKQAaAAgAJQAOgAmABUABQAfADcAigBVAF4AmQApAHgARgB1AAMAhACMAAQAGQCHAE8ALQB/AGcAMABuACUAKgBjAIEArgBKAGEAYgCbAAEABgAHAAgACQAKAAsADAANAA4ADwAQABEAEgATABYAGAAaABsAHAAdAB4AIQAiACMAJAAnACgAKwAuAC8AMQAyADMANAA7ADwAPQA+AD8AQABBAEIAQwBEAEUARwBIAEkASwBMAE0ATgBQAFEAUgBTAFQAVgBXAFgAWQBaAFwAXQBfAGQAaQBqAGsAbABtAG8AcABxAHIAcwB0AHYAdwB5AHoAewB8AH0AfgCAAIUAhgCIAIkAiwCOAI8AkACRAJIAkwCVAJYAlwCYAJoAnACdAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkANgACAKAAtQBlAAAAggAsAGYAjQA1AGAAgwCyAH8AOQBbALYAFAAXADgApABoACAAOgCUACYAFQAfAAUAigA3AFUAmQBeAEYAeAB1AAMAhACMAAQAGQCHAE8ALQBnACoAMABuACUAKQBhAGMAgQCuAEoAYgCbAAEABgAHAAgACQAKAAsADAANAA4ADwAQABEAEgATABYAGAAaABsAHAAdAB4AIQAiACMAJAAnACgAKwAuAC8AMQAyADMANAA7ADwAPQA+AD8AQABBAEIAQwBEAEUARwBIAEkASwBMAE0ATgBQAFEAUgBTAFQAVgBXAFgAWQBaAFwAXQBfAGQAaQBqAGsAbABtAG8AcABxAHIAcwB0AHYAdwB5AHoAewB8AH0AfgCAAIUAhgCIAIkAiwCOAI8AkACRAJIAkwCVAJYAlwCYAJoAnACdAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkANgACAKAAtQBlAAAAggBiACwAZgCNADUAYACDALIAfwA5AFsAtgAUABcAOACkAGgAIACUADoAJgAVAB8ABQCKADcAVQBeAJkAKQBGAHgAdQADAIQAjAAEABkAhwBPAC0AZwAqADAAYwAlAGEAgQCbAAEABgAHAAgACQAKAAsADAANAA4ADwAQABEAEgATABYAGAAaABsAHAAdAB4AIQAiACMAJAAnACgAKwAuAC8AMQAyADMANAA7ADwAPQA+AD8AQABBAEIAQwBEAEUARwBIAEkASgBLAEwATQBOAFAAUQBSAFMAVABWAFcAWABZAFoAXABdAF8AZABpAGoAawBsAG0AbgBvAHAAcQByAHMAdAB2AHcAeQB6AHsAfAB9AH4AgACFAIYAiACJAIsAjgCPAJAAkQCSAJMAlQCWAJcAmACaAJwAnQCeAJ8AoQCiAKMApQCmAKcAqACpAKoAqwCsAK0ArgCvALAAsQCzALQAtwC4ALkANgACAKAAZQC1AAAAggAsAGIAZgCNADUAgwBgALIAWwB/ADkAtgAUABcAOACkAGgAIAA6AJQAJgAFABUAHwCKADcAVQBeAIEAmQAqAEYAdQCEAIwABAAZAIcATwAtAGcAYwAlAK4AmwABAAMABgAHAAgACQAKAAsADAANAA4ADwAQABEAEgATABYAGAAaABsAHAAdAB4AIQAiACMAJAAnACgAKQArAC4ALwAwADEAMgAzADQAOwA8AD0APgA/AEAAQQBCAEMARABFAEcASABJAEoASwBMAE0ATgBQAFEAUgBTAFQAVgBXAFgAWQBaAFwAXQBfAGEAZABpAGoAawBsAG0AbgBvAHAAcQByAHMAdAB2AHcAeAB5AHoAewB8AH0AfgCAAIUAhgCIAIkAiwCOAI8AkACRAJIAkwCVAJYAlwCYAJoAnACdAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkANgACAKAAAABlALUAggAsAGIAZgCNADUAgwBgALIAWwA5AH8AtgAUABcAOACkAGgAIAA6AJQAJgAVAAUAHwCKADcAXgBVAIEAmQBGAHUAhACMAAQAGQCHAE8ALQBnAGMAJQAqAGEAbgCuAEoAmwABAAMABgAHAAgACQAKAAsADAANAA4ADwAQABEAEgATABYAGAAaABsAHAAdAB4AIQAiACMAJAAnACgAKQArAC4ALwAwADEAMgAzADQAOwA8AD0APgA/AEAAQQBCAEMARABFAEcASABJAEsATABNAE4AUABRAFIAUwBUAFYAVwBYAFkAWgBcAF0AXwBkAGkAagBrAGwAbQBvAHAAcQByAHMAdAB2AHcAeAB5AHoAewB8AH0AfgCAAIUAhgCIAIkAiwCOAI8AkACRAJIAkwCVAJYAlwCYAJoAnACdAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAAgCgAAAAZQC1AIIALABiAGYANQCNAIMAYACyAFsAOQC2AH8AFAAXADgApABBAGgAIAA6AJQAJgAFABUAigAfADcAVQBeAJkAKQAqAEYAAwB1AHgAhACMAAQAGQCHAE8ALQBnADAAYwAlAG4AgQCuAEoAmwABAAYABwAIAAkACgALAAwADQAOAA8AEAARABIAEwAWABgAGgAbABwAHQAeACEAIgAjACQAJwAoACsALgAvADEAMgAzADQANgA7ADwAPQA+AD8AQABCAEMARABFAEcASABJAEsATABNAE4AUABRAFIAUwBUAFYAVwBYAFkAWgBcAF0AXwBhAGQAaQBqAGsAbABtAG8AcABxAHIAcwB0AHYAdwB5AHoAewB8AH0AfgCAAIUAhgCIAIkAiwCOAI8AkACRAJIAkwCVAJYAlwCYAJoAnACdAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAAgCgAAAAZQC1AIIALABiAGYANQCNAIMAYACyAFsAtgA5AH8AFAAXADgApABBAGgAIAA6AJQAJgAFABUAigAfADcAVQCBAJkAXgApAEYAAwB1AHgAhACMAAQAGQCHAE8ALQAwAGcAYwAqAG4ArgAlAJsAAQAGAAcACAAJAAoACwAMAA0ADgAPABAAEQASABMAFgAYABoAGwAcAB0AHgAhACIAIwAkACcAKAArAC4ALwAxADIAMwA0ADYAOwA8AD0APgA/AEAAQgBDAEQARQBHAEgASQBKAEsATABNAE4AUABRAFIAUwBUAFYAVwBYAFkAWgBcAF0AXwBhAGQAaQBqAGsAbABtAG8AcABxAHIAcwB0AHYAdwB5AHoAewB8AH0AfgCAAIUAhgCIAIkAiwCOAI8AkACRAJIAkwCVAJYAlwCYAJoAnACdAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAAAACAKAAtQCCAGUALAA1AGYAYgBgAI0AsgBbABQAtgCDADkAFwA4AKQAQQBoADoAIACUACYABQCKAB8AFQBeADcAgQADACkAeABVAJkAdQBGAIQAMACMAIcABAAZAE8AZwCbAK4AfwAtAGMAbgAqAAEABgAHAAgACQAKAAsADAANAA4ADwAQABEAEgATABYAGAAaABsAHAAdAB4AIQAiACMAJAAlACcAKAArAC4ALwAxADIAMwA0ADYAOwA8AD0APgA/AEAAQgBDAEQARQBHAEgASQBKAEsATABNAE4AUABRAFIAUwBUAFYAVwBYAFkAWgBcAF0AXwBhAGQAaQBqAGsAbABtAG8AcABxAHIAcwB0AHYAdwB5AHoAewB8AH0AfgCAAIUAhgCIAIkAiwCOAI8AkACRAJIAkwCVAJYAlwCYAJoAnACdAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAAAACAKAAtQCCACwANQBmAGIAYACNALIAWwCDABQAtgA5ABcAOACkAEEAaAA6ACAAlAAFACYAigAfABUANwBeAIEAAwApAHgAVQCZAHUARgAwAIQAjACHAAQAGQBPAGcAYwB/AJsALQBKACoAbgAlAGEAZQABAAYABwAIAAkACgALAAwADQAOAA8AEAARABIAEwAWABgAGgAbABwAHQAeACEAIgAjACQAJwAoACsALgAvADEAMgAzADQANgA7ADwAPQA+AD8AQABCAEMARABFAEcASABJAEsATABNAE4AUABRAFIAUwBUAFYAVwBYAFkAWgBcAF0AXwBkAGkAagBrAGwAbQBvAHAAcQByAHMAdAB2AHcAeQB6AHsAfAB9AH4AgACFAIYAiACJAIsAjgCPAJAAkQCSAJMAlQCWAJcAmACaAJwAnQCeAJ8AoQCiAKMApQCmAKcAqACpAKoAqwCsAK0ArgCvALAAsQCzALQAtwC4ALkAAAACAKAAtQCCAGUALAA1AGYAYgBgAI0AsgBbAIMAFAC2ADkAFwA4AKQAQQBoADoAIACUAIoABQAmAB8AFQA3AIEAKQADAHgAXgCZAFUARgB1ADAAhACHAIwABAAZAE8AYwBnAH8AmwAtAK4AKgBKAGEAbgAlAAEABgAHAAgACQAKAAsADAANAA4ADwAQABEAEgATABYAGAAaABsAHAAdAB4AIQAiACMAJAAnACgAKwAuAC8AMQAyADMANAA2ADsAPAA9AD4APwBAAEIAQwBEAEUARwBIAEkASwBMAE0ATgBQAFEAUgBTAFQAVgBXAFgAWQBaAFwAXQBfAGQAaQBqAGsAbABtAG8AcABxAHIAcwB0AHYAdwB5AHoAewB8AH0AfgCAAIUAhgCIAIkAiwCOAI8AkACRAJIAkwCVAJYAlwCYAJoAnACdAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAAAACAKAAtQCCACwAZgA1AGIAYACNALIAWwCDALYAFAA5ABcAOACkAEEAaACUACAAOgCKAAUAJgAfABUANwApAIEAAwB4AFUAmQBGAF4AdQAwAIQAjACHAAQAGQBPAGMAZwB/AC0AmwCuACoASgBhAG4AJQBlAAEABgAHAAgACQAKAAsADAANAA4ADwAQABEAEgATABYAGAAaABsAHAAdAB4AIQAiACMAJAAnACgAKwAuAC8AMQAyADMANAA2ADsAPAA9AD4APwBAAEIAQwBEAEUARwBIAEkASwBMAE0ATgBQAFEAUgBTAFQAVgBXAFgAWQBaAFwAXQBfAGQAaQBqAGsAbABtAG8AcABxAHIAcwB0AHYAdwB5AHoAewB8AH0AfgCAAIUAhgCIAIkAiwCOAI8AkACRAJIAkwCVAJYAlwCYAJoAnACdAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAAAACAKAAtQCCACwAZgA1AGIAjQBgALIAWwCDALYAFAA5ABcAOACkAEEAaACUADoAIACKAAUAJgAfABUANwCBACkAAwB4AFUAmQBGAHUAXgAwAIQAjACHAAQAGQB2AE8AmwBjAGcASgB/ACoALQBhAK4AJQBuAHAAQABlAAEABgAHAAgACQAKAAsADAANAA4ADwAQABEAEgATABYAGAAaABsAHAAdAB4AIQAiACMAJAAnACgAKwAuAC8AMQAyADMANAA2ADsAPAA9AD4APwBCAEMARABFAEcASABJAEsATABNAE4AUABRAFIAUwBUAFYAVwBYAFkAWgBcAF0AXwBkAGkAagBrAGwAbQBvAHEAcgBzAHQAdwB5AHoAewB8AH0AfgCAAIUAhgCIAIkAiwCOAI8AkACRAJIAkwCVAJYAlwCYAJoAnACdAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAAACgAAIAtQCCACwAZgA1AI0AYACyABQAWwCDADgAFwCkAEEAaACUACAAOgAmAIoABQAVAB8ANwCBAHgAKQADAFUAXgCZAHUASwAwAEYAjACEAG8AmwAZAAQASgBPAHAAHQBjAD0AZwB/ACoALQA8AG4ArgA5AGEAdgAlAGIAQABlAIcAtgABAAYABwAIAAkACgALAAwADQAOAA8AEAARABIAEwAWABgAGgAbABwAHgAhACIAIwAkACcAKAArAC4ALwAxADIAMwA0ADYAOwA+AD8AQgBDAEQARQBHAEgASQBMAE0ATgBQAFEAUgBTAFQAVgBXAFgAWQBaAFwAXQBfAGQAaQBqAGsAbABtAHEAcgBzAHQAdwB5AHoAewB8AH0AfgCAAIUAhgCIAIkAiwCOAI8AkACRAJIAkwCVAJYAlwCYAJoAnACdAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAAACgAAIAtQCCAGUALABmADUAjQBgABQAsgBbAGIAgwA4ABcApABBAGgAlAAgADoAJgCKAAUAFQAfADcAXgCBAHgAKQADAEsAVQCZAG8AMAB1AEYAHQCMAJsAhAAZAIcAOQBKAHAATwAEAD0AYwBIADYAPAB/AGcAKgAtACcAYQBuAHYArgC2ACUAQAABAAYABwAIAAkACgALAAwADQAOAA8AEAARABIAEwAWABgAGgAbABwAHgAhACIAIwAkACgAKwAuAC8AMQAyADMANAA7AD4APwBCAEMARABFAEcASQBMAE0ATgBQAFEAUgBTAFQAVgBXAFgAWQBaAFwAXQBfAGQAaQBqAGsAbABtAHEAcgBzAHQAdwB5AHoAewB8AH0AfgCAAIUAhgCIAIkAiwCOAI8AkACRAJIAkwCVAJYAlwCYAJoAnACdAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAAACgAAIAtQBlAIIALABmADUAjQBgABQAYgCyADgAWwCDABcApABBAJQAaAAgADoAJgCKAAUAFQAfAF4ANwCBAHgASwApAAMAVQBvAB0AmQAwAHUAOQCbAEgARgCMAEoAhAAZADYAcACHAE0AYwBPAAQAPQAnADwAfwAqAC0AZwC2AGEAbgCuACUAUgB2AJEAAQAGAAcACAAJAAoACwAMAA0ADgAPABAAEQASABMAFgAYABoAGwAcAB4AIQAiACMAJAAoACsALgAvADEAMgAzADQAOwA+AD8AQABCAEMARABFAEcASQBMAE4AUABRAFMAVABWAFcAWABZAFoAXABdAF8AZABpAGoAawBsAG0AcQByAHMAdAB3AHkAegB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJIAkwCVAJYAlwCYAJoAnACdAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAAACgAAIAtQBlAIIALABmADUAjQBgABQAYgA4AIMAsgBbABcApABBAJQAaAAgADoAJgCKAAUAFQAfAIEANwA5AEsAeAAdAE0AbwApADYAAwBVAEgAXgB1AJkAMACbAEoARgBAAHAAjAAZAIQAhwA9ACcATwAEAGMAtgA8AH8ALQBSAGcAKgBhAG4AdgCuAAYAJQAaAJEAdwABAAcACAAJAAoACwAMAA0ADgAPABAAEQASABMAFgAYABsAHAAeACEAIgAjACQAKAArAC4ALwAxADIAMwA0ADsAPgA/AEIAQwBEAEUARwBJAEwATgBQAFEAUwBUAFYAVwBYAFkAWgBcAF0AXwBkAGkAagBrAGwAbQBxAHIAcwB0AHkAegB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJIAkwCVAJYAlwCYAJoAnACdAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAAACgAAIAtQCCACwAZgA1AGAAjQAUADgAYgCDALIAWwAXAKQAQQCUAGgAIAA6ACYAXgCKAAUAOQAVAB8ATQAdAEsANgCBADcAeAB1AEgAKQADAFUAmQAwAEoAmwBwABkARgCMAIQAPQBvAIcAJwBjAAQATwC2ADwAfwBSAC0AZwBuACoAYQAGABoAJQB2AK4AkQB3AEAAZQB6AAEABwAIAAkACgALAAwADQAOAA8AEAARABIAEwAWABgAGwAcAB4AIQAiACMAJAAoACsALgAvADEAMgAzADQAOwA+AD8AQgBDAEQARQBHAEkATABOAFAAUQBTAFQAVgBXAFgAWQBaAFwAXQBfAGQAaQBqAGsAbABtAHEAcgBzAHQAeQB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJIAkwCVAJYAlwCYAJoAnACdAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAAACgAAIAtQCCACwANQBmAI0AYAAUAGIAOACDALIAWwAXAKQAQQCUAGgAIAA6ACYAdgBeAIoATQAFABUAHwA2AB0ASwCBAHUAbwA3AEgAeAApAAMAVQBKAJkAmwAwAHAAGQCMAEYAPQCEACcAhwBjALYABABPADwAQgBSAH8ALQA5AGcAbgAaACoAYQCRACUABgCuAEAAawB3ABYAZQB6AAEABwAIAAkACgALAAwADQAOAA8AEAARABIAEwAYABsAHAAeACEAIgAjACQAKAArAC4ALwAxADIAMwA0ADsAPgA/AEMARABFAEcASQBMAE4AUABRAFMAVABWAFcAWABZAFoAXABdAF8AZABpAGoAbABtAHEAcgBzAHQAeQB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJIAkwCVAJYAlwCYAJoAnACdAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkAAACgAAIAtQBlAIIALAA1AGYAjQBgABQAYgA4AIMAsgBbADkAFwCkAEEAlABoACAAOgB2AF4AJgCKAAUAFQAfADYAHQBLAHUAgQBIADcAeAApAAMAVQBKAJsAmQAwAHAAGQCMAD0ARgBvAIQAJwCHAGMAQgC2AAQATwA8AFIALQB/AG4AZwAaAJEAKgBhAK4AJQAGABYAawB3AHoATQABAAcACAAJAAoACwAMAA0ADgAPABAAEQASABMAGAAbABwAHgAhACIAIwAkACgAKwAuAC8AMQAyADMANAA7AD4APwBAAEMARABFAEcASQBMAE4AUABRAFMAVABWAFcAWABZAFoAXABdAF8AZABpAGoAbABtAHEAcgBzAHQAeQB7AHwAfQB+AIAAhQCGAIgAiQCLAI4AjwCQAJIAkwCVAJYAlwCYAJoAnACdAJ4AnwChAKIAowClAKYApwCoAKkAqgCrAKwArQCvALAAsQCzALQAtwC4ALkA","rank":"LwAAAAkAMQA6ADMAAAAAAAAAAAAAAAAAAAAAAAAAFgAAAAAAAAAAAAAAKwA5AA4AAAA+AAAAAAAAAC0AAAAnACIAAABJAAAAAAAAABoAAAAAADUAQQAAAAsATQAAAAAATQAAAAAAAABGACMAAAAsAA8ADAAeAAAAAAAfAAAAAABGABUAAAA8AAAAAAA0AAAAFAAAAAAAAAAAADAAAAAAAAAAAAA1AAAAAAAkAAAAAAAAAAAAAAAIABIAAAAuAAoAEABCACUARgAAAEMABAAAABsAAAAAAAAAAAAAAEMAHwAAACEAAAAAAAAAGQAAAAAAMgAAAEkANwA6AAAASQACAAAAKAAGAAcAQAAAAAAAPwAAAAAAJgAAAD0AAwAAAAAAAAAAAAAAAAAXAAAAAAAAAAAAOAAAAB0AAAAFAAAAAAABACoAAAAAABEAAAAcAAAAAAAAAAAAAAAAAAAASQAAAAAATQANAAAAAAATABgAKQAAAEMABAAAAA8AMAA3ACsAAAAAAAAAAAAAAAAAAAAAAAAAHgAAAAAAAAAAABcAKAAAABEAAAA4AAAAAAAAACcAAAAjABgAAAAAAAAAAAAAAC8AAAAAAC0APQAAACIAPgAAAAAARAAAAAAAAAAAACQAAAApABMADgAhAAAAAAAgAAAAAABAABUAAAA7AAAAAAAzAAAAEgAAAAAAAAAAAC4AAABEAAAAAAAyAAAAAAAeAAAAAAAAAAAAAAANABwAAABEAAoADABAABoAAAAAAEAAAwAAAB0AAAAAAAAAAAAAAEAAAABEABsAAAAAAAAAFgAAAAAAMQAAADoANQA2AAAAAAAHAAAAJgAGAAkAAAAAAAAAPAAAAAAAJAAAADkACAAAAAAAAAAAAAAAAAAsAAAAAAAAAAAANAAAABkAAAAFAAAAAAABAAAAAAAAABQAAAAAAAAAAAAAAAAAAAAAAAAAPwAAAAAAAAALAAAAAAACABAAKgAAAAAABAAAABAAMAA4AC0AAAAAAAAAAAAAAAAAAAAAAAAAHwAAAAAAAAAAABgAKQAAABIAAAA4AAAAAAAAACgAAAAkABkAAAAAAAAAAAAAADEAAAAAAC4APgAAACMAPwAAAAAARgAAAAAAAAAAACUAAAAqABQADwAiAAAAAAAhAAAAAABBABYAAAA8AAAAAAA0AAAAEwAAAAAAAAAAAC8AAABGAAAAAAAyAAAAAAAfAAAAAAAAAAAAAAAOAB0AAABAAAkADABBABsAQQAAAA0AAwAAAB4AAAAAAAAAAAAAAEEAAAAAABwAAAAAAAAAFwAAAAAAMwAAADsANgA3AAAARgAGAAAAJwAHAAkAAAAAAAAAPQAAAAAAJgAAADgACAAAAAAAAAAAAAAAAAAsAAAAAAAAAAAANQAAABoAAAAFAAAAAAABAAAAAAAAABUAAAAAAAAAAAAAAAAAAAAAAAAAQQAAAAAAAAALAAAAAAACABEAKwAAAAAABQAAABAAJQA5AEMAAAAAAAAAAAAAAAAAAAAAAAAADwAAAAAAAAAAAAQAIAAAAAgAAAA1AAAAAAAAABsAAAAYABMAAAAAAAAAAAAAAAAAAAAAACAAOgAAACMAPgAAAAAAOgAAAAAAAAAAACcAAAAdAA0ACgAWAAAAQwAZAAAAAABDABoAAAA0AAAAAAAsAAAADAAAAAAAAAAAADAAAAA/AAAAAAArAAAAAAAXAAAAAAAAAAAAAAASABwAAAApAAcACwBDAEMAAAAAAEMAAgBAAB0AAAAAAAAAAAAAAEAAAABAABUAAAAAAAAAKAAAAAAANgAAADMAMgA4AAAAAAAGAAAAJAAJAA4AAAAAAAAANwAAAAAAJgAAAC8AOgAAAAAAAAAAAAAAAAAqAAAAAAAAAAAALQAAAB8AAAAUAAAAAAABAAAAAAAAACIAAAAAAAAAAAAAAAAAAAAAAAAAOgAAAAAAAAAuAAAAAAADABEAMQAAAAAABwAAABEAJQA4AEAAAAAAAAAAAAAAAAAAAAAAAAAAEgAAAAAAAAAAAAQAIgAAAAYAAAA1AAAAAAAAABwAAAAZABUAAAAAAAAAAAAAAAAAAAAAAB4AOgAAACcAPAAAAAAAOgAAAAAAAAAAACoAAAAfAA0ACgAWAAAAAAAaAAAAAABAABsAAAA0AAAAAAAuAAAACwAAAAAAAAAAADAAAAA8AAAAAAAsAAAAAAAXAAAAAAAAAAAAAAAQAB0AAAAmAAgADgBAAEAAAAAAAEAAAgBAACEAAAAAAAAAAAAAAD4AAAAAABgAAAAAAAAAKQAAAAAANwAAADIAMgA4AAAAQAAFAAAAJAAJAA8APgAAAAAANgAAAAAAKAAAAC8AQAAAAAAAAAAAAAAAAAArAAAAAAAAAAAALQAAACAAAAAUAAAAAAABAAAAAAAAACMAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAAAAQAAMAAAAAAADABMAMQAAAAAACAAAAAwAIQA1AEEAAAAAAAAAAAAAAAAAAAAAAAAADgAAAEEAAAAAAAQAHgAAAAUAAAAxAAAAAAAAABcAAAAVABEAAAAAAAAAAAAAAD4AAAAAABoANQAAADUAQQAAAAAAOwAAAAAAAAAAACUAAAAcADoAQQASAAAAQQAWAAAAAABBABgAAAArAAAAAAAqAAAACgAAAAAAAAAAACwAAAA8AAAAAAAnAAAAAAASAAAAAAAAAAAAAAAOABkAAAAiAAYACwBBAEEAAAAAAEEAAgBBABsAAAAAAAAAAAAAAD4AAAA+ABQAAAAAAAAAJABBAAAAMwAAADAALQAtAAAAQQAHAAAAIAAJAA0APAAAAAAAMgAAAAAAIgAAACkAQQAAAAAAAAAAAAAAOAAmAAAAAAAAAAAAKAAAABwAAAAQAAAAAAABAAAAAAAAAB8AAAAAAAAAAAAAAAAAAAAAAAAAQQAAAAAAAAAzAAAAAAADADgALwAAAAAACwAAABAAKAA8AEEAAAAAAAAAAAAAAAAAAAAAAAAAFQAAAAAAAAAAAAMAJwAAAAYAAAA4AAAAAAAAAB4AAAAZABcAAAAAAAAAAAAAAAAAAAAAACEAOwAAAC0APgAAAAAAAAAAAAAAAAAAAC4AAAAjAA8ACgAaAAAAQQAcAAAAAABBAB8AAAA1AAAAAAAyAAAADQAAAAAAAAAAADMAAABAAAAAAAAvAAAAAAAYAAAAAAAAAAAAAAARACEAAAAqAAcAEgAAAB0AAAAAAAwAAgAAACAAAAAAAAAAAAAAAEEAAAAAABsAAAAAAAAALAAAAAAAOgAAADcANAA8AAAAAAAIAAAAJgAJABMAPgAAAAAAOQAAAAAAKwAAADEABQAAAAAAAAAAAAAAAAAoAAAAAAAAAAAAMAAAACQAAAAUAAAAAAABAAAAAAAAACUAAAAAAAAAAAAAAEEAAAAAAAAAQQAAAAAAAAAOAAAAAAADABYANgAAAAAADQAAABEAKQA6AD0AAAAAAAAAAAAAAAAAAAAAAAAAFgAAAAAAAAAAAAQAKAAAAAgAAAA2AAAAAAAAAB4AAAAZABUAAAAAAAAAAAAAAAAAAAAAACAAOQAAAC8APAAAAAAAAAAAAAAAAAAAAC0AAAAkAA8ACQAbAAAAAAAdAAAAAAA9ACEAAAA0AAAAAAAyAAAADgAAAAAAAAAAADMAAAAAAAAAAAAuAAAAAAAYAAAAAAAAAAAAAAATACMAAAAqAAkAFAAAABwAAAAAAAcAAgAAAB8AAAAAAAAAAAAAAAAAAAAAABoAAAAAAAAAKwAAAAAAOAAAAAAAAAAAAAAAAAAMAAAAJAAGABIAOgAAAAAANwAAAAAAKwAAADAAAwAAAAAAAAAAAAAAAAAhAAAAAAAAAAAAMAAAACcAAAAQAAAAAAABAAAAAAAAACQAAAAAAAAAAAAAAD0AAAAAAAAAPQAAAAAAAAALAAAAAAAFABcANQAAAAAABwAAABAAKgAAACYAAAAAAAAAAAAAAAAAAAAAAAAAFQAAAAAAAAAAAAQAKAAAAAgAAAA2AAAAAAAAAB4AAAAYABQAAAAAAAAAAAAAAAAAAAAAACAAOQAAAC8AOwAAAAAAAAAAAAAAAAAAAC0AAAAkAA8ACgAbAAAAAAAcAAAAAAA8ACEAAAAzAAAAAAAyAAAADgAAAAAAAAAAADMAAAAAAAAAAAAuAAAAAAAXAAAAAAAAAAAAAAARACIAAAApAAsAEwAAABkAAAAAADwAAgAAAB0AAAAAAAAAAAAAADwAAAAAABoAAAAAAAAAKwAAAAAAOAAAAAAAAAAAAAAAAAAMAAAAJAAGABIAOQAAAAAANwAAAAAAKwAAADAAAwAAAAAAAAAAAAAAAAAfAAAAAAAAAAAAMAAAACYAAAANAAAAAAABAAAAAAAAACIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJAAAAAAAFABYANQAAAAAACgAAAA8AKAA5AD0AAAAAAAAAAAAAAAAAAAAAAAAAFAAAAAAAAAAAAAMAJgAAAAYAAAA1AAAAAAAAAB0AAAAYABUAAAAAAAAAAAAAAAAAAAAAAB8AOAAAAC0AOQAAAAAAAAAAAAAAAAAAACwAAAAjAA4AOQAaAAAAAAAbAAAAAAA9ACEAAAAzAAAAAAAxAAAADQAAAAAAAAAAADIAAAAAAAAAAAAuAAAAAAAXAAAAAAAAAAAAAAARACIAAAApAAcAEwA9ABwAAAAAAAsAAgAAAB4AAAAAAAAAAAAAAD0AAAAAABkAAAAAAAAAKwAAAAAANwAAAAAAAAAAAAAAAAAJAAAAJQAIABIAOQAAAAAANgAAAAAAKgAAAC8ABAAAAAAAAAAAAAAAAAAnAAAAAAAAAAAALwAAACQAAAAQAAAAAAABAAAAAAAAAB8AAAAAAAAAAAAAAAAAAAAAAAAAPQAAAAAAAAAMAAAAAAAFABYANAAAAAAAAgAAABMAKQA6ACcAAAAAAAAAAAAAAAAAAAAAAAAAFgAAAAAAAAAAAAgAJgAAAAoAAAA1AAAAAAAAACAAAAAfABUAAAAAAAAAAAAAADwAAAAAACEAOQAAAC8AOgAAAAAAPgAAAAAAAAAAACsAAAAjABAACwAZAAAAAAAeAAAAAAAAACQAAAAAAAAAAAAzAAAAFAAAAAAAAAAAADIAAAA+AAAAAAAuAAAAAAAbAAAAAAAAAAAAAAASACUAAAArAAwADgAAABcAAAAAAD4AAwAAABgAAAAAAAAAAAAAAAAAAAAAABoAAAAAAAAAKgAAAAAANwAAAAAAAAAAAAAAAAANAAAAIgAHAA8AOAAAAAAANgAAAAAAKwAAADEABQAAAAAAAAAAAAAAAAAbAAAAAAAAAAAAMAAAACgAAAAGAAAAAAABAAAAAAAAAB0AAAAAAAAAAAAAAAAAAAAAAAAAPAAAAAAAAAAJAAAAAAAEABEAMwAAAAAAAgAAABQAKQA4AD0AAAAAAAAAAAAAAAAAAAAAAAAAGAAAAAAAAAAAAAgAJQAAAA0AAAAzAAAAAAAAAAAAAAAgABYAAAAAAAAAAAAAADQAAAAAACEAOAAAACwAOAAAAAAAAAAAAAAAAAAAACgAAAAkABIACwAbAAAAAAAfAAAAAAA9ACMAAAAAAAAAAAAxAAAAFQAAAAAAAAAAADEAAAAAAAAAAAAtAAAAAAAeAAAAAAAAAAAAAAATACYAAAAKAA8ADAAAABcAAAAAAD0ABAAAABkAAAAAAAAAAAAAAAAAAAA8ABoAAAAAAAAAKgAAAAAANgAAAAAAAAAAAAAAAAAOAAAAIgAHABEANwAAAAAANQAAAAAAKwAAAC8ABgAAAAAAAAAAAAAAAAAdAAAAAAAAAAAALgAAACcAAAAFAAAAAAABAAAAAAAAABsAAAAAAAAAAAAAAAAAAAAAAAAAOwAAAAAAAAAJAAAAAAADABAAMAAAAAAAAgAAABQAKQA4ADwAAAAAAAAAAAAAAAAAAAAAAAAAGQAAAAAAAAAAAAkAJQAAAA4AAAA0AAAAAAAAAAAAAAAhABYAAAAAAAAAAAAAADMAAAAAACIAOAAAACoAOAAAAAAAAAAAAAAAAAAAACcAAAAkABIADQAdAAAAAAAeAAAAAAA8ACAAAAAAAAAAAAAxAAAAFQAAAAAAAAAAADEAAAAAAAAAAAAAAAAAAAAeAAAAAAAAAAAAAAATACYAAAAtABEACwAAABcAAAAAAAMABQA8ABgAAAAAAAAAAAAAAAAAAAAAABoAAAAAAAAAKgAAAAAANgAAAAAAAAAAAAAAAAAMAAAAIgAIABAANwAAAAAANQAAAAAAKgAAAC8ABwAAAAAAAAAAAAAAAAAcAAAAAAAAAAAALgAAACgAAAAGAAAAAAABAAAAAAAAABsAAAAAAAAAAAAAAAAAAAAAAAAAOwAAAAAAAAAKAAAAAAAEAA4AMAAAAAAAAgAAABMAKAA4ADsAAAAAAAAAAAAAAAAAAAAAAAAAGwAAAAAAAAAAAAgAJAAAAA4AAAAzAAAAAAAAAAAAAAAhABUAAAAAAAAAAAAAADIAAAAAACEANwAAACoAOAAAAAAAAAAAAAAAAAAAACUAAAAjABEADQAcAAAAAAAdAAAAAAAAAB8AAAAAAAAAAAAwAAAAFAAAAAAAAAAAADAAAAAAAAAAAAAAAAAAAAAeAAAAAAAAAAAAAAASACYAAAAoABAACQAAABYAAAAAADsABAAAABcAAAAAAAAAAAAAAAAAAAAAABkAAAAAAAAAKwAAAAAANAAAAAAAAAAAAAAAAAALAAAAIAAGAA8ANgAAAAAANQAAAAAALAAAAC8ABwAAAAAAAAAAAAAAAAAaAAAAAAAAAAAALQAAACcAAAAFAAAAAAABAAAAAAAAABgAAAAAAAAAAAAAAAAAAAAAAAAAOgAAAAAAAAAKAAAAAAADAAwALgAAAAAAAgAAABIAKgA6AD0AAAAAAAAAAAAAAAAAAAAAAAAAGgAAAAAAAAAAAAkAJAAAAA0AAAA0AAAAAAAAAB8AAAAiABUAAAAAAAAAAAAAAC8AAAAAACEAOAAAACgAOAAAAAAAAAAAAAAAAAAAACQAAAAjABAAOgAcAAAAAAAaAAAAAAA9AB0AAAAAAAAAAAAyAAAAEwAAAAAAAAAAADMAAAA9AAAAAAAtAAAAAAAeAAAAAAAAAAAAAAARACYAAAApAA8ACAAAABQAAAAAAAQABQAAABYAAAAAAAAAAAAAAD0AAAAAABgAAAAAAAAAKwAAAAAANQAAAAAAAAAAAAAAAAALAAAAIAA9AA4ANwAAAAAANgAAAAAALAAAADEABwAAAAAAAAAAAAAAAAAZAAAAAAAAAAAALgAAACcAAAAGAAAAAAABAAAAAAAAABcAAAAAAAAAAAAAAAAAAAAAAAAAPAAAAAAAAAAKAAAAAAADAAwALwAAAAAAAwAAACIAKAAyADkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABIAIQAAABAAAAAzAAAAAAAAAAAAAAAlABUAAAAAAAAAAAAAACAAAAAAACMANQAAAB8ANAAAAAAAAAAAAAAAAAAAABgAAAAmABEADAAeAAAAAAAcAAAAAAAAABsAAAAAAAAAAAAuAAAAGQAAAAAAAAAAAC4AAAAAAAAAAAAAAAAAAAApAAAAAAAAAAAAAAATAAAAAAApAAAABgAAABQAAAAAAAUACQAAABYAAAAAAAAAAAAAAAAAAAAAAB0AAAAAAAAAJAAAAAAAKwAAAAAAAAAAAAAAAAALAAAAGgAEAAcANgAAAAAANwAAAAAALAAAADAACAAAAAAAAAAAAAAAAAAXAAAAAAAAAAAAJwAAADAAAAANAAAAAAABAAAAAAAAAA8AAAAAAAAAAAAAAAAAAAAAAAAAOAAAAAAAAAAOAAAAAAACAAoALQAAAAAAAwAAACIAKwAxABoAAAAAAAAAAAAAAAAAAAAAAAAANAAAAAAAAAAAABMAIAAAAA8AAAA1AAAAAAAAAAAAAAAmABYAAAAAAAAAAAAAACEAAAAAACQAAAAAACMANgAAAAAAAAAAAAAAAAAAAAYAAAAoABEADQAeAAAAAAAbAAAAAAA5ABwAAAAAAAAAAAAvAAAAHQAAAAAAAAAAADAAAAAAAAAAAAAAAAAAAAAqAAAAAAAAAAAAAAAVAAAAAAAnAAAACAAAABQAAAAAAAUACQA5ABgAAAAAAAAAAAAAAAAAAAAAAB8AAAAAAAAAJAAAAAAALQAAAAAAAAAAAAAAAAAMAAAAGQAEAAcANwAAAAAAOAAAAAAALAAAADMACgAAAAAAAAAAAAAAAAAXAAAAAAAAAAAAKQAAADEAAAAOAAAAAAABAAAAAAAAABIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAAAACAAsALgAAAAAAAwAAACEAKgAxABsAAAAAAAAAAAAAAAAAAAAAAAAAMwAAAAAAAAAAABAAHgAAAA4AAAAzAAAAAAAAAAAAAAAlABUAAAAAAAAAAAAAACAAAAAAACUAAAAAACIANQAAAAAAAAAAAAAAAAAAAAUAAAAnABEADQAdAAAAAAAaAAAAAAA3ABkAAAAAAAAAAAAtAAAAHAAAAAAAAAAAAC0AAAAAAAAAAAAAAAAAAAApAAAAAAAAAAAAAAAUAAAAAAAjAAAACQAAABMAAAAAADcABwA3ABcAAAAAAAAAAAAAAAAAAAA3AB4AAAAAAAAAJAAAAAAALAAAAAAAAAAAAAAAAAALAAAAGAAEAAYANgAAAAAAAAAAAAAAKgAAADIACAAAAAAAAAAAAAAAAAAWAAAAAAAAAAAAKAAAADAAAAAMAAAAAAABAAAAAAAAABEAAAAAAAAAAAAAAAAAAAAAAAAANwAAAAAAAAAPAAAAAAACAAoALQAAAAAAAgAAACMAKwAyADkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANwAAABIAIAAAAA4AAAAyAAAAAAAAAAAAAAAlABUAAAAAAAAAAAAAAB8AAAAAACYAOAAAABsANQAAAAAAAAAAAAAAAAAAACEAAAAnABMACgAcAAAAAAAaAAAAAAA5ABkAAAAAAAAAAAAuAAAAHQAAAAAAAAAAAC0AAAA2AAAAAAAAAAAAAAAqAAAAAAAAAAAAAAAUAAAAAAAeAAAADQAAAA8AAAAAAAQACQA5ABcAAAAAAAAAAAAAAAAAAAAAACEAAAAAAAAAJAAAAAAALAAAAAAAAAAAAAAAAAALAAAAGAADAAYANAAAAAAAAAAAAAAAKAAAADAACAAAAAAAAAAAAAAAAAAWAAAAAAAAAAAAKQAAADAAAAAHAAAAAAABAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAARAAAAAAAFAAwALwAAAAAABAAAACMAKwAyABoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANAAAABIAHwAAABAAAAAxAAAAAAAAAAAAAAAlABUAAAAAAAAAAAAAACAAAAAAACYANwAAABsANQAAAAAAAAAAAAAAAAAAACIAAAAoABQACQAdAAAAAAAcAAAAAAA6ABgAAAAAAAAAAAAuAAAAIQAAAAAAAAAAAC0AAAA2AAAAAAAAAAAAAAAqAAAAAAAAAAAAAAATADcAAAAeAAAADgAAAA8AAAAAAAIACgAAABcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJAAAAAAALAAAAAAAAAAAAAAAAAALAAAAGQADAAcAMwAAAAAAAAAAAAAAJwAAAC8ACAAAAAAAAAAAAAAAAAAWAAAAAAAAAAAAKQAAAC8AAAAGAAAAAAABAAAAAAAAABEAAAAAAAAAAAAAAAAAAAAAAAAAOQAAAAAAAAANAAAAAAAFAAwAAAAAAAAABQAAACIAKgAzAB0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMQAAABMAIAAAABAAAAAwAAAAAAAAAAAAAAAjABYAAAAAAAAAAAAAACEAAAAAACYANAAAABsANAAAAAAAAAAAAAAAAAAAAAcAAAAnABUACwAeAAAAAAAcAAAAAAA4ABkAAAAAAAAAAAAtAAAAAAAAAAAAAAAAACwAAAAAAAAAAAAAAAAAAAAoAAAAAAAAAAAAAAASAAAAAAAfAAAAEQAAAA4AAAAAAAIACgA2ABgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJAAAAAAAKwAAAAAAAAAAAAAAAAAMAAAAGgADAAkAMQAAAAAANgAAAAAAJQAAAC4ACAAAAAAAAAAAAAAAAAAXAAAAAAAAAAAAKAAAAC4AAAAEAAAAAAABAAAAAAAAABQAAAAAAAAAAAAAAAAAAAAAAAAAOAAAAAAAAAANAAAAAAAGAA8AAAAAAAAABQAAACEAKAAvADUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAALwAAABMAHgAAABIAAAAuAAAAAAAAAAAAAAAgABYAAAAAAAAAAAAAAB8AAAAAACMAMQAAABoAMgAAAAAAAAAAAAAAAAAAAAgAAAAmABUACwAcAAAAAAAAAAAAAAA1ABcAAAAAAAAAAAApAAAAAAAAAAAAAAAAACkAAAAAAAAAAAAAAAAAAAAkAAAAAAAAAAAAAAAPAAAAAAAdAAAAEQAAAAwAAAAAAAIACgA0ABgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIQAAAAAAJwAAAAAAAAAAAAAAAAANAAAAGwAEAAkAKwAAAAAAMwAAAAAANQAAACsABwAAAAAAAAAAAAAAAAAZAAAAAAAAAAAAJQAAACsAAAADAAAAAAABAAAAAAAAABQAAAAAAAAAAAAAAAAAAAAAAAAANQAAAAAAAAAPAAAAAAAGAA4AAAAAAAAAAwAAACQAKgAyABwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAALQAAABIAHwAAABMAAAAxAAAAAAAAAAAAAAAhABYAAAAAAAAAAAAAACAAAAAAACUAMwAAABkANAAAAAAAAAAAAAAAAAAAAAgAAAAoABUACwAdAAAAAAAAAAAAAAAAABcAAAAAAAAAAAArAAAAAAAAAAAAAAAAACwAAAA1AAAAAAAAAAAAAAAmAAAAAAAAAAAAAAAPAAAAAAAdAAAAEAAAAAwAAAAAAAQACgA3ABgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIwAAAAAAKQAAAAAAAAAAAAAAAAANAAAAGwAFAAkALgAAAAAANgAAAAAAIgAAAC8ABwAAAAAAAAAAAAAAAAAaAAAAAAAAAAAAJwAAAC8AAAACAAAAAAABAAAAAAAAABQAAAAAAAAAAAAAAAAAAAAAAAAAOAAAAAAAAAARAAAAAAAGAA4AAAAAAAAAAgAAACMAKQAxABwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKwAAABEAHQAAABMAAAAwAAAAAAAAAAAAAAAgABYAAAAAAAAAAAAAAB8AAAAAACQAMgAAABgAMwAAAAAAAAAAAAAAAAAAAAcAOAAnABUACwAdAAAAAAAAAAAAAAA4ABcAAAAAAAAAAAAqAAAAAAAAAAAAAAAAACwAAAAzAAAAAAAAAAAAAAAlAAAAAAAAAAAAAAAQAAAAAAAJAAAADQAAAAwAOAAAADgACgA2ABkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIgAAAAAAKAAAAAAAAAAAAAAAAAAOAAAAGwAEAAgALQAAAAAANQAAAAAAIQAAAC4ABgAAAAAAAAAAAAAAAAAaAAAAAAAAAAAAJgAAAC8AAAADAAAAAAABAAAAAAAAABQAAAAAAAAAAAAAAAAAAAAAAAAANgAAAAAAAAASAAAAAAAFAA8AAAAAAAAAAwAAAAIAKQAxABwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKgAAABEAHQAAABQAAAAwAAAAAAAAAAAAAAAhABcAAAAAAAAAAAAAACAAAAAAACQAMQAAAAcAMwAAAAAAAAAAAAAAAAAAAAkAAAAnABQADAAdAAAAAAAAAAAAAAA3ABgAAAAAAAAAAAAqAAAAAAAAAAAAAAAAACwAAAAzAAAAAAAAAAAAAAAlAAAAAAAAAAAAAAASAAAAAAAfAAAADQAAAA4AAAAAADcACwA1ABkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIwAAAAAAKAAAAAAAAAAAAAAAAAAPAAAAGwAFAAoALQAAAAAAAAAAAAAAIgAAAC4ACAAAAAAAAAAAAAAAAAAaAAAAAAAAAAAAJgAAAC8AAAAEAAAAAAABAAAAAAAAABYAAAAAAAAAAAAAAAAAAAAAAAAANQAAAAAAAAATAAAAAAAGAA8AAAAAAAAAAwAAAAEAKQAxABwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKQAAABEAHgAAABQAAAAwAAAAAAAAAAAAAAAhABcAAAAAAAAAAAAAACAAAAAAACQAMQAAAAcAMwAAAAAAOAAAAAAAAAAAAAoAOAAmABUADQAdAAAAAAAAAAAAAAA4ABgAAAAAAAAAAAArAAAAAAAAAAAAAAAAACwAAAAzAAAAAAAAAAAAAAAlAAAAAAAAAAAAAAASAAAAAAAfAAAADAAAABAAOAAAADgACQA2ABkAAAAAAAAAAAAAADgAAAAAAAAAAAAAAAAAIwAAAAAAKAAAAAAAAAAAAAAAAAATAAAAGwAGAAsALQAAAAAANQAAAAAAIgAAAC0ACAAAAAAAAAAAAAAAAAAaAAAAAAAAAAAAJgAAAC8AAAAEAAAAAAACAAAAAAAAABYAAAAAAAAAAAAAAAAAAAAAAAAANgAAAAAAAAAPAAAAAAAFAA4AAAAAAAAABQAAAAMAKwAvABsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJQAAAAwAHQAAAA8AAAAyAAAAAAAAAAAAAAAhABoAAAAAAAAAAAAAACQAAAAAACcAMgAAAAgAPAAAAAAAOAAAAAAAAAAAAA0AAAAfABYAFQAbAAAAAAAAAAAAAAAAABgAAAAAAAAAAAAsAAAAAAAAAAAAAAAAAC0AAAAxAAAAAAAAAAAAAAAjAAAAAAAAAAAAAAARAAAAAAAeAAAACQA4AAYAOAAAADQACgA0ABcAAAAAAAAAAAAAADgAAAAAAAAAAAAAAAAAKAAAAAAALgAAAAAAAAAAAAAAAAASAAAAIgAHABQAKQAAAAAANAAAAAAAIAAAACoACwAAAAAAAAAAAAAAAAAYAAAAAAAAAAAAJgAAADQAAAABAAAAAAAEAAAAAAAAABMAAAAAAAAAAAAAAAAAAAAAAAAALwAAAAAAAAAQAAAAAAACAA4AAAAAAAAABAAAACkAKwAuABoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJAAAAAsAHAAAABEAAAAyAAAAAAAAAAAAAAAfABkAAAA7AAAAAAA7ACMAAAAAACcAMwAAABQAOwAAAAAAMwAAAAAAAAAAAAwAAAAdABUAEgAbAAAAAAAAAAAAAAA7ABgAAAAAAAAAAAAsAAAAAAAAAAAAAAAAAC0AAAAxAAAAAAAAAAAAAAAhAAAAAAAAAAAAAAAQAAAAAAAgAAAACAA4AAcAOAAAAAYACQAzABYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJgAAAAAALgAAAAAAAAAAAAAAAAAzAAAAIQAFAA8AKAAAAAAAOAAAAAAAHgAAACkACgAAAAAAAAAAAAAAAAAXAAAAAAAAAAAAJQAAADMAAAABAAAAAAADAAAAAAAAABMAAAAAAAAAAAAAAAAAAAAAAAAAMAAAAAAAAAANAAAAAAACAA4AAAAAAAAABAAAACkAKgAtABsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJgAAAAsAGgAAAA8AAAAuAAAAAAAAAAAAAAAfABgAAAA7AAAAAAA7ACIAAAAAACQAMwAAABMAOwAAAAAAMwAAAAAAAAAAAAoAAAAcABQAEAAZAAAAAAAAAAAAAAA7ABcAAAAAAAAAAAArAAAAAAAAADsAAAAAACwAAAAxAAAAAAAAAAAAAAAhAAAAAAAAAAAAAAARAAAAAAAdAAAACAAAAAcANgAAADYABgAzABUAAAAAAAAAAAAAADYAAAAAAAAAAAAAAAAAJQAAAAAALgAAAAAAAAAAAAAAAAAxAAAAIAAFAA0AJwAAAAAANgAAAAAAHgAAACgACQAAAAAAAAAAAAAAAAAWAAAAAAAAAAAAIwAAADYAAAABAAAAAAADAAAAAAAAABIAAAAAAAAAAAAAAAAAAAAAAAAALgAAAAAAAAAMAAAAAAACAA4AAAAAAAAABAAAACkAKgAtAB0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJgAAAAsAGgAAAA4AAAAuAAAAAAAAAAAAAAAgABgAAAA5AAAAAAA5ACMAAAAAACQAMwAAABMAOQAAAAAAMwAAAAAAAAAAAAgAAAAcABQAEQAZAAAAOQAAAAAAAAA5ABcAAAAAAAAAAAArAAAAAAAAADkAAAAAACwAAAAwAAAAAAAAAAAAAAAhAAAAAAAAAAAAAAAQAAAAAAAbAAAACgA5AAkAMwAAADMABgAxABUAAAAAAAAAAAAAADMAAAAAAAAAAAAAAAAAJQAAAAAAAAAAAAAAAAAAAAAAAAAxAAAAHwAFAA0AJwAAAAAAOQAAAAAAHgAAACgABwAAAAAAAAAAAAAAAAAWAAAAAAAAAAAAIgAAADMAAAABAAAAAAADAAAAAAAAABIAAAAAAAAAAAAAAAAAAAAAAAAALgAAAAAAAAAMAAAAAAACAA8AAAAAAAAABgAAAAEAKwAuACEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4AHQAAABMAAAAvAAAAAAAAAAAAAAAjABsAAAA5AAAAAAAAACUAAAAAACcAMQAAAAUAOQAAAAAAMQAAAAAAAAAAAAsAAAAfABYAFQAcAAAAAAAAAAAAAAAAABoAAAAAAAAAAAArAAAAAAAAADkAAAAAAC0AAAAwAAAAAAAAAAAAAAAkAAAAAAAAAAAAAAASAAAAAAAeAAAADQA1AAwANQAAAAgACQAxABgAAAAAAAAAAAAAADEAAAAAAAAAAAAAAAAAKAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAIgAHABEAKQAAAAAANQAAAAAAIAAAACoACgAAAAAAAAAAAAAAAAAZAAAAAAAAAAAAJgAAADUAAAACAAAAAAADAAAAAAAAABcAAAAAAAAAAAAAAAAAAAAAAAAAOQAAAAAAAAAPAAAAAAAEABQAAAAAAAAABAAAACkAKAAsAB4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwAGQAAABAAAAAtAAAAAAAAAAAAAAAgABgAAAA5AAAAAAAAACIAAAAAACQALwAAABMAOQAAAAAALwAAAAAAAAAAAAkAAAAcABQAEQAaAAAAAAAAAAAAAAA5ABcAAAAAAAAAAAApAAAAAAAAAAAAAAAAACsAAAAuAAAAAAAAAAAAAAAhAAAAAAAAAAAAAAAOAAAAAAAbAAAACgA0AAgANAAAADQABgAvABUAAAAAAAAAAAAAAC8AAAAAAAAAAAAAAAAAJQAAAAAAAAAAAAAAAAAAAAAAAAAvAAAAHwAFAA0AJgAAAAAANAAAAAAAHQAAACcABwAAAAAAAAAAAAAAAAAWAAAAAAAAAAAAIwAAADQAAAABAAAAAAACAAAAAAAAABIAAAAAAAAAAAAAAAAAAAAAAAAAOQAAAAAAAAALAAAAAAADAA8AAAAAAAAABQAAAAEAKQAsAB8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA0AGgAAABEAAAAtAAAAAAAAAAAAAAAhABkAAAA5AAAAAAA5ACIAAAAAACUAMAAAABMAOQAAAAAAMAAAAAAAAAAAAAoAAAAcABUAEgAaAAAAAAAAAAAAAAA5ABgAAAAAAAAAAAAqAAAAAAAAADkAAAAAACsAAAAuAAAAAAAAAAAAAAAjAAAAAAAAAAAAAAAOAAAAAAAcAAAACwA0AAkANAAAADQABwAwABYAAAAAAAAAAAAAAC8AAAAAAAAAAAAAAAAAJgAAAAAAAAAAAAAAAAAAAAAAAAAwAAAAIAAGAA8AJwAAAAAANAAAAAAAHgAAACgACAAAAAAAAAAAAAAAAAAXAAAAAAAAAAAAJAAAADQAAAACAAAAAAAEAAAAAAAAABQAAAAAAAAAAAAAAAAAAAAAAAAAOQAAAAAAAAAMAAAAAAADABAAAAAAAAAABwAAAAEAKgAtACEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAHQAAABMAAAAvAAAAAAAAAAAAAAAkABoAAAA7AAAAAAA7ACIAAAAAACcANQAAAAUAOwAAAAAANQAAAAAAAAAAAAsAAAAeABQAFgAcAAAAAAAAAAAAAAA7ABkAAAAAAAAAAAAsAAAAAAAAADsAAAAAAC0AAAAxAAAAAAAAAAAAAAAlAAAAAAAAAAAAAAARAAAAAAAfAAAADwA3AAwANwAAAAgACQAzABgAAAAAAAAAAAAAADMAAAAAAAAAAAAAAAAAKAAAAAAALwAAAAAAAAAAAAAAAAAOAAAAIgAGABIAKQAAAAAANwAAAAAAIAAAACsACgAAAAAAAAAAAAAAAAAaAAAAAAAAAAAAJgAAADcAAAACAAAAAAADAAAAAAAAABcAAAAAAAAAAAAAAAAAAAAAAAAAMQAAAAAAAAANAAAAAAAEABUAAAAAAAAABwAAAAEAKQAsACAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA8AHAAAABIAAAAvAAAAAAAAAAAAAAAjABkAAAA6AAAAAAA6ACEAAAAAACYAMwAAAAUANQAAAAAAMwAAAAAAAAAAAAsAAAAdABMAFAAbAAAAAAAAAAAAAAA6ABcAAAAAAAAAAAArAAAAAAAAADoAAAAAAC0AAAAwAAAAAAAAAAAAAAAkAAAAAAAAAAAAAAAQAAAAAAAeAAAADQA1AAoANQAAADoACAAxABgAAAAAAAAAAAAAADEAAAAAAAAAAAAAAAAAJwAAAAAALgAAAAAAAAAAAAAAAAANAAAAIgAGABEAKAAAAAAANQAAAAAAHwAAACoACQAAAAAAAAAAAAAAAAAaAAAAAAAAAAAAJQAAADUAAAACAAAAAAADAAAAAAAAABYAAAAAAAAAAAAAAAAAAAAAAAAAOgAAAAAAAAAMAAAAAAAEABUAAAAAAAAABQAAACsAJgArAB4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4AGgAAABEAAAAuAAAAAAAAAAAAAAAgABcAAAA6AAAAAAA6AB8AAAAAACQAMgAAAA8ANQAAAAAAMgAAAAAAAAAAAAkAAAAbABQAEAAZAAAAAAAAAAAAAAA6ABUAAAAAAAAAAAApAAAAAAAAADoAAAAAAC0AAAAvAAAAAAAAAAAAAAAiAAAAAAAAAAAAAAALAAAAAAAcAAAADAA1AAgANQAAADoABgAwABYAAAAAAAAAAAAAADAAAAAAAAAAAAAAAAAAJQAAAAAAKgAAAAAAAAAAAAAAAAAyAAAAIQAEAA0AJgAAAAAANQAAAAAAHQAAACgABwAAAAAAAAAAAAAAAAAYAAAAAAAAAAAAIwAAADUAAAACAAAAAAABAAAAAAAAABMAAAAAAAAAAAAAAAAAAAAAAAAAOgAAAAAAAAAKAAAAAAADABIAAAAAAAAABQAAACwAJgArAB4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAGgAAABEAAAAuAAAAAAAAAAAAAAAgABcAAAA5AAAAAAA5AB8AAAAAACQAAAAAAA0ANAAAAAAAMgAAAAAAAAAAAAkAAAAbABQADwAZAAAAAAAAAAAAAAAAABUAAAAAAAAAAAApAAAAAAAAADkAAAAAAC0AAAAvAAAAAAAAAAAAAAAiAAAAAAAAAAAAAAALAAAAAAAcAAAADgA0AAgANAAAADkABgAwABYAAAAAAAAAAAAAADAAAAAAAAAAAAAAAAAAJQAAAAAAKgAAAAAAAAAAAAAAAAAyAAAAIQAEAAwAJgAAAAAANAAAAAAAHQAAACgABwAAAAAAAAAAAAAAAAAYAAAAAAAAAAAAIwAAADQAAAADAAAAAAABAAAAAAAAABMAAAAAAAAAAAAAAAAAAAAAAAAAOQAAAAAAAAAKAAAAAAACABIAAAAAAAAABwAAAC8AKQAuAB4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABIAHAAAABMAAAAxAAAAAAAAAAAAAAAiABkAAAA7AAAAAAA7ACEAAAAAACcAAAAAABAAIwAAAAAANgAAAAAAAAAAAAsAAwAdABYAEQAbAAAAAAAAAAAAAAA7ABcAAAAAAAAAAAAsAAAAAAAAADsAAAAAADAAAAAyAAAAAAAAAAAAAAAlAAAAAAAAAAAAAAANAAAAAAAgAAAADgA3AAoANwAAAAUACAAzABgAAAAAAAAAAAAAADMAAAAAAAAAAAAAAAAAKAAAAAAAKwAAAAAAAAAAAAAAAAAzAAAAJAAGAA8AKgAAAAAANwAAAAAAHwAAACwACQAAAAAAAAAAAAAAAAAaAAAAAAAAAAAAJgAAADcAAAAEAAAAAAABAAAAAAAAABUAAAAAAAAAAAAAAAAAAAAAAAAAOwAAAAAAAAAMAAAAAAACABQAAAAAAAAAAgAAAAEAKQAqAB4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABIAGwAAABMAAAAtAAAAAAAAAAAAAAAdABkAAAA5AAAAAAA0AB4AAAAAACMAAAAAAAoAMAAAAAAANQAAAAAAAAAAAA8ANwAhABQAEAAaAAAAAAAAAAAAAAAAABYAAAAAAAAAAAAnAAAAAAAAAAAAAAAAAC4AAAAwAAAAAAAAAAAAAAAkAAAAAAAAAAAAAAALAAAAAAAgAAAACQAAAAYANwAAAAQADQAyABYAAAAAAAAAAAAAADUAAAAAAAAAAAAAAAAAKAAAAAAAJQAAAAAAAAAAAAAAAAAvAAAAIgAHAA4ALAAAAAAAMgAAAAAAHAAAACoACAAAAAAAAAAAAAAAAAAYAAAAAAAAAAAAJgAAADkAAAAAAAAAAAADAAAAAAAAABUAAAAAAAAAAAAAAAAAAAAAAAAAOQAAAAAAAAAMAAAAAAAFABEAAAAAAAAAAgAAAAMAKgArACAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABMAHAAAABQAAAAuAAAAAAAAAAAAAAAeABoAAAAAAAAAAAA2AB0AAAAAACUAOQAAAAoAMgAAAAAANAAAAAAAAAAAAA8AAQAhABUAEQAbAAAAAAAAAAAAAAA5ABcAAAAAAAAAAAAoAAAAAAAAAAAAAAAAAC8AAAAxAAAAAAAAAAAAAAAjAAAAAAAAAAAAAAAQAAAAAAAiAAAACwA5AAgANgAAAAYADAAyABgAAAAAAAAAAAAAADYAAAAAAAAAAAAAAAAAKQAAAAAAJQAAAAAAAAAAAAAAAAAvAAAAJAAHAA4ALQAAAAAANAAAAAAAHwAAACwACQAAAAAAAAAAAAAAAAAZAAAAAAAAAAAAJwAAADkAAAAAAAAAAAAEAAAAAAAAABYAAAAAAAAAAAAAAAAAAAAAAAAAOQAAAAAAAAANAAAAAAAFABIAAAAAAAAAAgAAABUAKQArAB0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABEAHAAAABMAAAAtAAAAAAAAAAAAAAAeABgAAAAAAAAAAAA2ABsAAAAAACMANgAAAAcAMQAAAAAAMwAAAAAAAAAAAAwAAQAgABIADwAaAAAAAAAAAAAAAAAAABYAAAAAAAAAAAAnAAAAAAAAAAAAAAAAAAAAAAAuAAAAAAAAAAAAAAAiAAAAAAAAAAAAAAAOAAAAAAAhAAAACQAAAAYANAAAADgACgAxABcAAAAAAAAAAAAAADQAAAAAAAAAAAAAAAAAKAAAAAAAJQAAAAAAAAAAAAAAAAAuAAAAJQAFAAsAKwAAAAAAMAAAAAAAHwAAACoACAAAAAAAAAAAAAAAAAAZAAAAAAAAAAAAIwAAADgAAAAAAAAAAAADAAAAAAAAABQAAAAAAAAAAAAAAAAAAAAAAAAAOAAAAAAAAAANAAAAAAAEABAAAAAAAAAABQAAAAIAKAArAB0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABMAHAAAABIAAAAsAAAAAAAAAAAAAAAeABgAAAAAAAAAAAA0ABsAAAAAACMANAAAAAgAMAAAAAAAMgAAAAAAAAAAAAwAAQAgABMAEAAaAAAAAAAAAAAAAAAAABYAAAAAAAAAAAAmAAAAAAAAAAAAAAAAAAAAAAAtAAAAAAAAAAAAAAAiAAAAAAAAAAAAAAAPAAAAAAAhAAAACwA4AAcAAAAAADgACgAxABcAAAAAAAAAAAAAADIAAAAAAAAAAAAAAAAAJwAAAAAAJQAAAAAAAAAAAAAAAAAvAAAANAAGAA0AKQAAAAAALgAAAAAAHgAAACoACQAAAAAAAAAAAAAAAAAZAAAAAAAAAAAAJAAAADgAAAAAAAAAAAADAAAAAAAAABUAAAAAAAAAAAAAAAAAAAAAAAAANAAAAAAAAAAOAAAAAAAEABEAAAAAAAAAAwAAAAIAJwAqABwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABMAGwAAABIAAAArAAAAAAAAAAAAAAAcABcAAAAAAAAAAAAzABoAAAAAACMAMwAAAAgALgAAAAAAMQAAAAAAAAAAAAsAAQAeABQAEAAZAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAlAAAAAAAAAAAAAAAAAAAAAAAsAAAAAAAAAAAAAAAhAAAAAAAAAAAAAAAPAAAAAAAgAAAADAAzADMAMwAAAAYACgAwABYAAAAAAAAAAAAAADEAAAAAAAAAAAAAAAAAJgAAAAAAJAAAAAAAAAAAAAAAAAAuAAAAMwAHAA0AKAAAAAAALQAAAAAAHwAAACkACQAAAAAAAAAAAAAAAAAYAAAAAAAAAAAAIgAAADoAAAAAAAAAAAAEAAAAAAAAABUAAAAAAAAAAAAAAAAAAAAAAAAAMwAAAAAAAAAOAAAAAAAFABEAAAAAAAAABAAAAAIAJwAqABwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABMAGwAAABIAAAArAAAAAAAAAAAAAAAdABcAAAAAAAAAAAAzABoAAAAAACMAMwAAAAgALgAAAAAAMQAAAAAAAAAAAAsAAQAeABQAEAAZAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAlAAAAAAAAADgAAAAAAAAAAAAtAAAAAAAAAAAAAAAgAAAAAAAAAAAAAAAPAAAAAAAhAAAADAA4ADgAMwAAAAYACgAwABYAAAAAAAAAAAAAADEAAAAAAAAAAAAAAAAAJgAAAAAAJAAAAAAAAAAAAAAAAAAuAAAAMwAHAA0AKAAAAAAALAAAAAAAHgAAACkACQAAAAAAAAAAAAAAAAAYAAAAAAAAAAAAIgAAADgAAAAAAAAAAAADAAAAAAAAABUAAAAAAAAAAAAAAAAAAAAAAAAAMwAAAAAAAAAOAAAAAAAFABEAAAAAAAAABgAAAAIAJwAqAB4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABMAHAAAABQAAAArAAAAAAAAAAAAAAAdABgAAAAAAAAAAAAzABsAAAAAADMAMAAAAAgALgAAAAAAMAAAAAAAAAAAAAsAAQAgABUAEAAZAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAkAAAAAAAAADkAAAAAAAAAAAAtAAAAAAAAAAAAAAAhAAAAAAAAAAAAAAARAAAAAAAjAAAADAAzADkAMwAAAAUACQAvABcAAAAAAAAAAAAAADAAAAAAAAAAAAAAAAAAJgAAAAAAJAAAAAAAAAAAAAAAAAAPAAAAMwAHAA0AKAAAAAAALAAAAAAAHwAAACgACgAAAAAAAAAAAAAAAAAZAAAAAAAAAAAAIgAAADkAAAAAAAAAAAADAAAAAAAAABYAAAAAAAAAAAAAAAAAAAAAAAAAMwAAAAAAAAAOAAAAAAAEABIAAAAAAAAABgAAAAIAKQAsAB8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABQAHQAAABUAAAAtAAAAAAAAAAAAAAAdABkAAAAAAAAAAAA1ABwAAAAAACUAMgAAAAkAMAAAAAAAMgAAAAAAAAAAAAwAAQAhABYAEQAbAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAmAAAAAAAAAAAAAAAAAAAAAAAvAAAAAAAAAAAAAAAiAAAAAAAAAAAAAAASAAAAAAAiAAAADQA1AAgAMgAAAAUACgAxABgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKAAAAAAAJwAAAAAAAAAAAAAAAAAQAAAANQAHAA4AKgAAAAAALgAAAAAAIAAAACsACwAAAAAAAAAAAAAAAAAaAAAAAAAAAAAAJAAAADgAAAAAAAAAAAADAAAAAAAAABcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPAAAAAAAEABMAAAAAAAAABgAAAAIAAAArAB0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABQAHQAAABUAAAAsAAAAAAAAAAAAAAAdABkAAAAAAAAAAAAyABwAAAAAAAAAJgAAAAgALwAAAAAAAAAAAAAAAAAAAAwAAQAhABYAEgAaAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAnAAAAAAAAAAAAAAAAAAAAAAAuAAAAAAAAAAAAAAAiAAAAAAAAAAAAAAAQAAAAAAAjAAAADgAAAAgAMQAAAAQACgAwABgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKAAAAAAAAAAAAAAAAAAAAAAAAAARAAAAJAAHAA0AKQAAAAAALQAAAAAAIAAAACoACwAAAAAAAAAAAAAAAAAbAAAAAAAAAAAAJQAAADQAAAAAAAAAAAADAAAAAAAAABcAAAAAAAAAAAAAAAAAAAAAAAAAMgAAAAAAAAAPAAAAAAAFABMAAAAAAAAABAAAAAIAAAAqAB4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABQAHQAAABUAAAArAAAAAAAAAAAAAAAfABkAAAAAAAAAAAAxABwAAAAAAAAAMQAAAAgALgAAAAAAAAAAAAAAAAAAAAwAAQAhABYAEQAaAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAmAAAAAAAAADYAAAAAAAAAAAAtAAAAAAAAAAAAAAAjAAAAAAAAAAAAAAAQAAAAAAAiAAAADgAxAAkAMAAAAAUACgAvABgAAAAAAAAAAAAAADEAAAAAAAAAAAAAAAAAJwAAAAAAAAAAAAAAAAAAAAAAAAASAAAAJAAHAA0AKAAAAAAALAAAAAAAIAAAACkACwAAAAAAAAAAAAAAAAAbAAAAAAAAAAAAJQAAADYAAAAAAAAAAAADAAAAAAAAABcAAAAAAAAAAAAAAAAAAAAAAAAAMQAAAAAAAAAPAAAAAAAGABMAAAAAAAAAAwAAAAEAKAAtAB0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABMAHgAAABQAAAAuAAAAAAAAAAAAAAAgABkAAAAAAAAAAAA1ABwAAAAAACUAJgAAAAcAMQAAAAAAMwAAAAAAAAAAAAoAAAAhABUAEAAaAAAAAAAAAAAAAAAAABcAAAAAAAAAAAAnAAAAAAAAADkAAAAAAAAAAAAwAAAAAAAAAAAAAAAiAAAAAAAAAAAAAAAPAAAAAAAjAAAADQAAAAgAMwAAAAQACQAyABgAAAAAAAAAAAAAADUAAAAAAAAAAAAAAAAAKAAAAAAAKgAAAAAAAAAAAAAAAAASAAAANQAGAAwAKwAAAAAALwAAAAAAHwAAACsACwAAAAAAAAAAAAAAAAAbAAAAAAAAAAAAIwAAADkAAAAAAAAAAAACAAAAAAAAABYAAAAAAAAAAAAAAAAAAAAAAAAANQAAAAAAAAAOAAAAAAAFABEAAAAAAAAAAwAAAAEAKAAtAB0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABMAHgAAABQAAAAuAAAAAAAAAAAAAAAgABkAAAAAAAAAAAA4ABwAAAAAACYANQAAAAcAMQAAAAAAMgAAAAAAAAAAAAoAAAAhABUAEQAaAAAAAAAAAAAAAAAAABcAAAAAAAAAAAAnAAAAAAAAAAAAAAAAAAAAAAAwAAAAAAAAAAAAAAAiAAAAAAAAAAAAAAAPAAAAAAAlAAAADQAAAAgANAAAAAQACQAyABgAAAAAAAAAAAAAADUAAAAAAAAAAAAAAAAAKAAAAAAAKgAAAAAAAAAAAAAAAAASAAAAIgAGAAwAKwAAAAAALwAAAAAAHwAAACsACwAAAAAAAAAAAAAAAAAbAAAAAAAAAAAAJAAAADgAAAAAAAAAAAACAAAAAAAAABYAAAAAAAAAAAAAAAAAAAAAAAAANQAAAAAAAAAOAAAAAAAFABAAAAAAAAAAAQAAAAIAIwAuABwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA8AHwAAABMAAAAvAAAAAAAAAAAAAAAeABkAAAAAAAAAAAAAABsAAAAAACQAOAAAAAcANQAAAAAAKwAAAAAAAAAAAAgAAAAhABQAEgAYAAAAAAAAAAAAAAAAABYAAAAAAAAAAAApAAAAAAAAAAAAAAAAAAAAAAAwAAAAAAAAAAAAAAAmAAAAAAAAAAAAAAAOAAAAAAAgAAAACwAAAAoANgAAAAYACQAxABcAAAAAAAAAAAAAADcAAAAAAAAAAAAAAAAAKAAAAAAAJQAAAAAAAAAAAAAAAAA0AAAAIgAFABEAKgAAAAAALQAAAAAAHQAAACsADAAAAAAAAAAAAAAAAAAaAAAAAAAAAAAAJwAAADEAAAAAAAAAAAADAAAAAAAAABUAAAAAAAAAAAAAAAAAAAAAAAAAMQAAAAAAAAANAAAAAAAEABAAAAAAAAAAAQAAAAIAIgAtABoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA8AHgAAABIAAAAuAAAAAAAAAAAAAAAdABgAAAAAAAAAAAA4ABsAAAAAACMANgAAAAYANAAAAAAAKQAAAAAAAAAAAAcAAAAfABMAEQAXAAAAAAAAAAAAAAAAABUAAAAAAAAAAAAoAAAAAAAAADQAAAAAAAAAAAAvAAAAAAAAAAAAAAAlAAAAAAAAAAAAAAANAAAAAAAgAAAACgA4AAkAMQAAADgACAAwABYAAAAAAAAAAAAAADYAAAAAAAAAAAAAAAAAJwAAAAAAJAAAAAAAAAAAAAAAAAAxAAAAIQAFAA4AKgAAAAAALAAAAAAAHAAAACsACwAAAAAAAAAAAAAAAAAZAAAAAAAAAAAAJQAAADEAAAAAAAAAAAADAAAAAAAAABQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMAAAAAAAEABAAAAAAAAAAAQAAAAIAIwAuABwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAHwAAABMAAAAvAAAAAAAAAAAAAAAeABkAAAAAAAAAAAA7AB0AAAAAACIANwAAAAcANQAAAAAAKgAAAAAAAAAAAAgAAAAgABQAEgAYAAAAAAAAAAAAAAAAABYAAAAAAAAAAAAoAAAAAAAAADcAAAAAAAAAAAAwAAAAAAAAAAAAAAAnAAAAAAAAAAAAAAAOAAAAAAAlAAAACwA3AAoAMQAAAAYACQAxABcAAAAAAAAAAAAAADcAAAAAAAAAAAAAAAAAKQAAAAAAJAAAAAAAAAAAAAAAAAAxAAAAIQAFAA8AKwAAAAAALAAAAAAAGwAAACwADAAAAAAAAAAAAAAAAAAaAAAAAAAAAAAAJgAAADQAAAAAAAAAAAADAAAAAAAAABUAAAAAAAAAAAAAAAAAAAAAAAAANQAAAAAAAAANAAAAAAAEABEAAAAAAAAAAQAAAAIAIgAtABsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAHgAAABIAAAAuAAAAAAAAAAAAAAAdABgAAAAAAAAAAAA6ABwAAAAAACAANgAAAAYAMwAAAAAAKQAAAAAAAAAAAAgAAAAfABMAEQAYAAAAAAAAAAAAAAAAABUAAAAAAAAAAAAmAAAAAAAAADYAAAAAAAAAAAAvAAAAAAAAAAAAAAAkAAAAAAAAAAAAAAANAAAAAAAmAAAACgA2AAkAMAAAADoABwAwABYAAAAAAAAAAAAAADYAAAAAAAAAAAAAAAAAJgAAAAAAIwAAAAAAAAAAAAAAAAAyAAAAIQAFAA4AKgAAAAAALAAAAAAAGgAAACsACwAAAAAAAAAAAAAAAAAXAAAAAAAAAAAAJQAAADMAAAAAAAAAAAADAAAAAAAAABQAAAAAAAAAAAAAAAAAAAAAAAAAMwAAAAAAAAAMAAAAAAAEAA8AAAAAAAAAAQAAAAIAIgAtABsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAHgAAABIAAAAtAAAAAAAAAAAAAAAdABkAAAAAAAAAAAA6ABwAAAAAACEANgAAAAYANgAAAAAAKQAAAAAAAAAAAAgAAAAfABMAEQAYAAAAAAAAAAAAAAA9ABUAAAAAAAAAAAAmAAAAAAAAADQAAAAAAAAAAAAwAAAAAAAAAAAAAAAkAAAAAAAAAAAAAAANAAAAAAAoAAAACwA4AAkAMgAAAD0ABwAzABYAAAAAAAAAAAAAADoAAAA6AAAAAAAAAAAAJgAvAAAAIwAAAAAAAAAAAAAAAAA0AAAAIAAFAA4AKgAAAAAALAAAAAAAGgAAACsACgAAAAAAAAAAAAAAAAAXAAAAAAAAAAAAJQAAADEAAAAAAAAAAAADAAAAAAAAABQAAAAAAAAAAAAAAAAAAAAAAAAAOAAAAAAAAAAMAAAAAAAEAA8AAAAAAAAAAQAAAAMAIAAtABkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwAGgAAABAAAAAsAAAAAAAAADEAAAAbABUAAAAAAAAAAAA+ABcAAAAAAB8ANgAAAAYANgAAAAAAJgAAAAAAAAAAAAgAAAAcAA8AOwAWAAAAOAAzAAAAAABAABIAAAAAAAAAAAAnAAAAAAAAAC4AJQAAAAAAAAAuAAAAAAAAAAAAAAAhAAAAAAAAAAAAAAANAAAAAAAhAAAACgA7AD4AMQAAAEAABwA0ABMAAAAAAAAAAAAAADgAKgAwAAAAAAAAAAAAJAA7AAAAHgAAAAAAAAAAAAAAAAA0AAAAHQAFAA4AKQAAAAAAQAAAAAAAGAAAACgACQAAAAAAAAAAAAAAAAAUAAAAAAAAAAAAIwAAACsAAAAAAAAAAAACAAAAAAAAABEAAAAAAAAAAAAAAAAAAAAAAAAAOAAAAAAAAAALAAAAAAAEAEAAAAAAAAAAAQAAAAMAIwA1ABsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwAHAAAABIAAAAvAAAAAAAAACsAAAAdABcAAAAAAAAAAABFABkAPwAAACIAPQAAAAcAPQAAAAAAKAAAAAAAAAAAAAkAOQAeABEAMQAYAAAAOgA2AAAAAABGABQAAAAAAAAAAAAqAAAAOAAAADIAJAAAAAAAAAA0AAAAAAAAAAAAAAAlAAAAAAAAAAAAAAAOAAAAAAAfAAAACwA/AA8ANwAAAAYACAA8ABUAAAAAAAAAAAAAAD8AJwAzAAAAAAAAAAAAKAA/AAAAIQAAAAAAAAAAAAAAAAA6AAAAIAAFAA8ALgAAAAAALwAAAAAAGgAAACwACgAAAAAAAAAAAAAAAAAWAAAAAAAAAAAAJgAAAC0AAAAAAAAAAAACAAAAAAAAABMAAAAAAAAAAAAAAAAAAAAAAAAAPwAAAAAAAAANAAAAAAAEAD8AAAAAAAAAAQAAAAMAJAA5ABsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwAHAAAABIAAAAyAAAAAAAAACcAAAAdABcAAAAAAAAAAABFABkAOwAAACMAPgAAAAcAPgAAAAAAKQAAAAAAAAAAAAkAMgAfAA8AKwAYAAAAPAA5AAAAAAAAABQAAAAAAAAAAAAuAAAALQAAADAAIgAAADYAAAA4AAAAAABFAAAAAAAlAAAAAAAAAAAAAAAQAAAAAAAeAAAACwBCAA0ANwAAAAUACAA+ABYAAAAAAAAAAAAAAEIAJQA0AAAAAAAAAAAAKgBFAAAAIQAAAAAAAAAAAAAAAAA9AAAAIAAGABEAMQAAAAAANQAAAAAAGgAAAC8ACgAAAAAAAABIAAAAAAAVAAAAAAAAAAAAKAAAACsAAAAAAAAAAAACAAAAAAAAABMAAAAAAAAAAAAAAAAAAAAAAAAAQgAAAAAAAAAOAAAAAAAEAD4AAAAAAAAAAQAAAAMAKAA7ABsASAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwAHAAAABIAAAA1AEoAAAAAACMAAAAdABcAAAAAAAAAAABIABkAOQAAACYAQwAAAAcAQAAAAAAALgAAAAAAAAAAAAkAJwAfAA4AHwAYAAAAPgA4AAAAAAAyABQAAAAAAAAAAAAxAAAAKgAAADAAIQAAACMAAAA5AAAAAABAAAAAAAApAAAAAAAAAAAAAAARAAAAAAArAAAACwBDAA0APAAAAAUACABAABYAAAAAAAAAAAAAAEMAJQAzAAAAAAAAAAAALABGAEwAIgAAAAAAAAAAAAAAAAA/AAAAHgAGAA8ANgAAAAAANwAAAAAAGgAAADMACgAAAAAAAABKAAAAAAAVAAAAAAAAAAAALAAAAC8AAAAAAAAAAAACAAAAAAAAABMAAAAAAAAAAAAAAAAAAAAAAAAARgAAAAAAAAAQAAAAAAAEAD0AAAAAAAAAAQAAAAMAKQA5ABsARAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAsAHQAAABEAAAAwAEQAAAAAACAAAAAeABYAAAAAAAAAAABEABgANwAAACgAQgAAAAYAPwAAAAAALAAAAAAAAAAAAAgAIgAkAAwAHAAXAAAAPAA0AAAAAABLABMAAAAAAAAAAAAwAAAAJwAAACwAIQAAAB8AAAA5AAAAAAA+AAAAAAAqAAAAAAAAAAAAAAAQAAAAAAAZAAAACQBCAA0AOAAAAEsABwA/ABUAAAAAAAAAAAAAAEEANAAvAAAAAAAAAAAAJgBEAEoAJQAAAEsAAAAAAAAAAAA9AAAAIwAFAA4AMwAAAAAANgAAAAAAGgAAADAACQAAAAAAAABJAAAAAAAUAAAAAAAAAAAAKwAAAC4AAAAAAAAAAAACAAAAAAAAABIAAAAAAAAAAAAAAAAAAAAAAAAARAAAAAAAAAAPAAAAAAAEADsAAAAAAAAAAQAAAAMAKgA6AB0ASQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAsAHgBOABEAAAAxAEQAAAAAACEAAAAfABYAAAAAAAAAAABIABgANgAAACkARAAAAAYAQAAAAAAALwAAAAAAAAAAAAcAIAAmAA0AQQAXAAAAPAA0AAAAAABLABMAPAAAAAAAAAAzAAAAJwAAACwAIgAAABwAAAA7AAAAAAA+AAAAAAArAAAAAAAAAAAAAAAQAAAAAAAaAAAACgBEAAwAOAAAAE4ACABBABUAAAAAAEsAAAAAAEEAJQAwAAAAAAAAAAAAJAAZAEsAKAAAAE4AAAAAAAAAAAA+AAAAIwAFAA4ANQAAAAAANgAAAAAAGwAAADIACQAAAAAAAABEAAAAAAAUAAAAAAAAAAAALQAAAC4AAAAAAAAAAAACAAAAAAAAABIAAAAAAAAAAAAAAAAAAAAAAAAASQAAAAAAAAAPAAAAAAAEADkAAAAAAAAAAQAAAAMAKgA8AB4ASgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwAHwBKABMAAAAxAEQAAAAAACIAAAAgABgAAAAAAAAAAABJABwANwAAACkARgAAAAcAQAAAAAAALwAAAAAAAAAAAAgAIQAnAA4AEgAZAAAAPgAzAAAAAAAAABUAOgAAAAAAAAAzAAAAJgAAACwAIwAAAE8AAAA9AAAAAAA/AAAAAAArAAAAAAAAAAAAAAARAAAAAAAbAAAACwBGAA0AOQAAAAUACABDABcAAAAAAEwAAAAAAEIANQAwAAAAAAAAAAAAJAAaAEwAKAAAAEwAAAAAAAAAAABAAAAAJQAGAA8ANgAAAAAAOAAAAAAAHQAAADIACgAAAAAAAABEAAAAAAAWAAAAAAAAAAAALgAAAC0AAAAAAAAAAAACAAAAAAAAABQAAAAAAAAAAAAAAAAAAAAAAAAARgAAAAAAAAAQAAAAAAAEADsAAAAAAAAA","pct":"URAAABsjVA/hClcOAAAAAAAAAAAAAAAAAAAAAAAArhwAAAAAAAAAAAAATBJfC6IgAADmCAAAAAAAAE4RAABGFL8WAAB2AwAAAAAAALMaAAAAAFoNawcAAB4ifAEAAAAAfAEAAAAAAADyBEAWAADNESQgoCG5GAAAAAA7GAAAAADyBCwdAADkCQAAAADYDQAAqx0AAAAAAAAAANMPAAAAAAAAAABaDQAAAADCFQAAAAAAAAAAAACaI6geAADQEJ0ipR/sBkMV8gQAAG4GlCUAADUaAAAAAAAAAAAAAG4GOxgAAD0XAAAAAAAAMhsAAAAA1Q4AAHYDXQzhCgAAdgORJgAAxxOXJBkk6QcAAAAAaAgAAAAAxBQAAGUJEyYAAAAAAAAAAAAAAAAvHAAAAAAAAAAA3gsAADgZAAAWJQAAAAAQJ8oSAAAAACcfAAC2GQAAAAAAAAAAAAAAAAAAdgMAAAAAfAEhIQAAAAAqHrEbSRMAAG4GaSUAAFwfNA1aCfUPAAAAAAAAAAAAAAAAAAAAAAAAGxcAAAAAAAAAAPUamxEAAEIeAADOCAAAAAAAACgSAABbFGkaAAAAAAAAAAAAAMENAAAAANsODQYAAOgUgAUAAAAAMwIAAAAAAAAAAM4TAAAOESkd6R91FQAAAAACFgAAAABnBA8cAAAnBwAAAACOCwAAth0AAAAAAAAAAE4OAAAzAgAAAAAbDAAAAAAbFwAAAAAAAAAAAAB2IDUYAAAzAhwiAyFnBE8ZAAAAAGcE9iUAAKgXAAAAAAAAAAAAAGcEAAAzAsIYAAAAAAAAghsAAAAApwwAALQHdArnCQAAAADDIwAAtRJQJKkiAAAAAAAAmgYAAAAAzhMAAEEINiMAAAAAAAAAAAAAAABoDwAAAAAAAAAAAQsAANwZAADdJAAAAAAQJwAAAAAAAJwcAAAAAAAAAAAAAAAAAAAAAAAA9AQAAAAAAACQIQAAAACDJs8egRAAAAAAbyUAAO0ekA05CTEPAAAAAAAAAAAAAAAAAAAAAAAAyRYAAAAAAAAAAJYaXBEAANcdAAA5CQAAAAAAAOcRAAATFAsaAAAAAAAAAAAAAAUNAAAAAKYO+AUAAJ4UbQUAAAAAoQEAAAAAAAAAAIgTAADSEMEceB8pFQAAAAC0FQAAAABXBKsbAAAOBwAAAABlCwAATB0AAAAAAAAAABsOAAChAQAAAAB6DAAAAADJFgAAAAAAAAAAAAACIN8XAADiBLkiGCFXBPUYVwQAAI0g+iUAAFQXAAAAAAAAAAAAAFcEAAAAAGoYAAAAAAAAIBsAAAAA8AsAAJgHTwrECQAAoQFaJAAAchLPI7kiAAAAAAAAgwYAAAAA/RIAADkJRCMAAAAAAAAAAAAAAAC8DwAAAAAAAAAA2goAAIAZAADkJAAAAAAQJwAAAAAAADYcAAAAAAAAAAAAAAAAAAAAAAAAVwQAAAAAAACjIQAAAACFJmIeRxAAAAAA5CQAAO0eiBOuCEEDAAAAAAAAAAAAAAAAAAAAAAAAeB8AAAAAAAAAAG8lPhYAAEQjAADaCgAAAAAAAPUYAACWGkwdAAAAAAAAAAAAAAAAAAAAAD4WIwgAAJ4U+AUAAAAAIwgAAAAAAAAAAHISAADfF40gLiKrGwAAQQMLGgAAAABBA4AZAABlCwAAAAC8DwAAGCEAAAAAAAAAAJANAABtBQAAAABHEAAAAAAgGwAAAAAAAAAAAADXHWoYAABcEc8joyFBA0EDAAAAAEEDhSbiBN8XAAAAAAAAAAAAAOIEAADiBDYcAAAAAAAA5xEAAAAATwoAAPALegw5CQAAAABaJAAAExS5IgIgAAAAAAAAxAkAAAAA/RIAABsOIwgAAAAAAAAAAAAAAADSEAAAAAAAAAAAMQ8AAMkWAADBHAAAAAAQJwAAAAAAACkVAAAAAAAAAAAAAAAAAAAAAAAAIwgAAAAAAACmDgAAAAD6JWIeBQ0AAAAA2iMAAIAezBOiCVoFAAAAAAAAAAAAAAAAAAAAAAAA9x0AAAAAAAAAAHUlZxUAAGMkAAA9CwAAAAAAAJ0YAAA4GlwcAAAAAAAAAAAAAAAAAAAAAIsXkAgAALsSfgcAAAAAkAgAAAAAAAAAACARAAACF6QgPyLTGwAAAACvGQAAAABaBSYZAADGCwAAAAD8DgAAtiEAAAAAAAAAAOoNAAB+BwAAAAAOEAAAAABKGwAAAAAAAAAAAAAJHxQYAABEE1EjGyBaBVoFAAAAAFoFhyZaBfAVAAAAAAAAAAAAAGwGAAAAAMEaAAAAAAAAqREAAAAAKwoAANgM2AyiCQAAWgXsJAAAVRTIIpIfbAYAAAAAtAoAAAAAMhIAAHMOWgUAAAAAAAAAAAAAAACXEAAAAAAAAAAAhQ8AAHkWAADlHAAAAAAQJwAAAAAAAN4UAAAAAAAAAAAAAAAAAAAAAAAAWgUAAAAAWgUtIQAAAAD+JW4dYQ0AAAAAjyMAAI4hCRcFDQMHAAAAAAAAAAAAAAAAAAAAAAAAjSAAAAMHAAAAAI8lihgAAA8lAAAGDwAAAAAAAAscAAAMHQ0fAAAAAAAAAAAAAIMIAAAAAIsaBQ0AAAUNAwcAAAAABAoAAAAAAAAAAAkVAACKGYQKAweNHgAAAweMHAAAAAADB4sbAAAHEgAAAACIEgAAjiIAAAAAAAAAAIcRAACECQAAAAAIFAAAAACNHgAAAAAAAAAAAACNIAsbAACJFo8kDiIDBwMHAAAAAAMHkCYDBwsaAAAAAAAAAAAAAIMIAACDCIwdAAAAAAAAiRUDBwAABg4AAIYPBxEHEQAAAwcPJAAAihcOIw4hhAkAAAAAhg4AAAAAiRYAAAgTAwcAAAAAAAAAAAAAhQuIFAAAAAAAAAAAiBMAAIoZAACNHwAAAAAQJwAAAAAAAAoYAAAAAAAAAAAAAAAAAAAAAAAAAwcAAAAAAAAGDgAAAAAQJoULBxAAAAAAeyEAALEeTREjBlkDAAAAAAAAAAAAAAAAAAAAAAAA5xsAAAAAAAAAAPIl2xEAAEYkAABfCAAAAAAAAOEWAACrGckaAAAAAAAAAAAAAAAAAAAAADUVsgYAAIIOBgUAAAAAAAAAAAAAAAAAAPMNAAAXFEAfCiIdGQAAWQP/FwAAAABZA1IWAAALCgAAAAC4CwAAXiAAAAAAAAAAACkLAADoAwAAAABlDQAAAAA6GgAAAAAAAAAAAAAiHjUVAAAvELcjkx0AAHAXAAAAAO0ggSYAAMMVAAAAAAAAAAAAAFkDAAAAAI4YAAAAAAAAEQ8AAAAAQQcAAO4ImgojBgAAAAAoIwAAahKZIgUdBgUAAAAA0AcAAAAAoA8AAEcM1SQAAAAAAAAAAAAAAABNEQAAAAAAAAAA1gwAAIgTAAB2HAAAAAAQJwAAAAAAAPkSAAAAAAAAAAAAAFkDAAAAAAAAWQMAAAAAAADPHwAAAADyJVgbfQkAAAAAvR8AAEwdpg5GBHECAAAAAAAAAAAAAAAAAAAAAAAAPxoAAAAAAAAAADslQg8AAMoiAAC3BgAAAAAAAF0VAABqGNsaAAAAAAAAAAAAAAAAAAAAACQU4gQAAPwKDQMAAAAAAAAAAAAAAAAAADUMAACzEYQeLiIyFwAAAAD5FQAAAABxAogTAADvBwAAAAAoCQAAIR8AAAAAAAAAAIwIAAAAAAAAAACZCwAAAAAGGQAAAAAAAAAAAAAUHFASAAAKDi4idxsAAJUWAAAAAGYjdCYAAMAUAAAAAAAAAAAAAAAAAAAAAM4XAAAAAAAAbg0AAAAAfgUAAAAAAAAAAAAAAABZIAAAsxEDJLAcRgQAAAAAGgYAAAAAbg0AAGAK2CUAAAAAAAAAAAAAAACIEwAAAAAAAAAAYAoAAN4PAADoHQAAAAAQJwAAAAAAALMRAAAAAAAAAAAAAHECAAAAAAAAcQIAAAAAAAD2IAAAAACfJKIZUwcAAAAASCMAAJ0dOw0AAMAPAAAAAAAAAAAAAAAAAAAAAAAAdhoAAAAAAAAAACwlfg4AAKciAACsBQAAAAAAAMsUAACSGBcbAAAAAAAAAAAAAAAAAAAAAIgTyAMAABUKhQIAAAAAAAAAAAAAAAAAAFcLAAADET4eZCGuFgAAAAANFgAAAADkAecSAACPBwAAAAAxCAAA3x4AAAAAAAAAAI8HAAAAAAAAAAC2CgAAAAA0GQAAAAAAAAAAAAD7HEUSAADcDcMguRsAAPEXAAAAAOQBbyYAAGwVAAAAAAAAAAAAAOQBAAAAAFAXAAAAAAAAmgwAAAAAaQQAAAAAAAAAAAAAAAAiIAAAAxHqI1ocyAMAAAAACgUAAAAAmgwAAHMJzSUAAAAAAAAAAAAAAAApFAAAAAAAAAAAcwkAAMAPAACBHwAAAAAQJwAAAAAAAEUSAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGIgAAAACLJNUZTQYAAAAApyEAAKYeoA9pBQEDAAAAAAAAAAAAAAAAAAAAAAAApRsAAAAAAAAAANwl1BAAAA8kAADQBwAAAAAAADwWAAA+GQsbAAAAAAAAAAAAAAAAAAAAAAkVAgYAAJ8MaQUAAAAAAAAAAAAAAAAAADkNAAChEkAfaQUKGAAAAABwFwAAAAABA9UTAAAECQAAAAA3CgAA2h8AAAAAAAAAAJ4JAAAAAAAAAAAFDAAAAADXGQAAAAAAAAAAAAByHTsTAAAGD3UjPxwBA9YWAAAAAA4hdiYAAKIVAAAAAAAAAAAAAAEDAAAAAKQYAAAAAAAA0g0AAAAAnAYAAAAAAAAAAAAAAABBIgAAbhHbItkcaQUAAAAANgcAAAAAbA4AAGsLQiUAAAAAAAAAAAAAAAA6EAAAAAAAAAAAawsAAAcSAAAMHgAAAAAQJwAAAAAAAAkVAAAAAAAAAAAAAAAAAAAAAAAAAQMAAAAAAAB0IAAAAACpJHEaaggAAAAAdCYAABQcpg5GBN4PAAAAAAAAAAAAAAAAAAAAAAAAPxoAAAAAAAAAAMoiexAAAJIhAABTBwAAAAAAACQUAADAFNsaAAAAAAAAAAAAAA0DAAAAAIgT4gQAAPwKRgQAAAAA1QEAAAAAAAAAAG4NAABQEugd9iBqGAAAAABdFQAAAAAAALMRAAAAAAAAAACMCAAAdxsAAAAAAAAAACgJAADVAQAAAACZCwAAAAAyFwAAAAAAAAAAAACwHBcRAABuDVkgIR8AAKIZAAAAANUB2CUAAAYZAAAAAAAAAAAAAAAAAAAAAM4XAAAAAAAACg4AAAAAGgYAAAAAAAAAAAAAAAC9HwAA7BJmI4QefgUAAAAAtwYAAAAAbg0AAMQJnyQAAAAAAAAAAAAAAAAyFwAAAAAAAAAAYAoAAEIPAAADJAAAAAAQJwAAAAAAAPkVAAAAAAAAAAAAAAAAAAAAAAAADQMAAAAAAAAuIgAAAAA7JUwdjAgAAAAAcSYAAEgbQw72BNwBAAAAAAAAAAAAAAAAAAAAAAAAzRgAAAAAAAAAALkivhAAAJ8fAAAPCAAAAAAAAAAAAADXEwsaAAAAAAAAAAAAAHEHAAAAADkT9gQAAGcM9gQAAAAAAAAAAAAAAAAAAOIOAABcEYYc3SDxFgAAAAB2FAAAAADcAfsRAAAAAAAAAABNCQAAqRoAAAAAAAAAAE0JAAAAAAAAAADICwAAAAAVFQAAAAAAAAAAAADnGx8QAAB7IWIePiAAAGwZAAAAANwBNCUAAC4YAAAAAAAAAAAAAAAAAAB7ApAXAAAAAAAApA0AAAAAMwYAAAAAAAAAAAAAAAABHwAAmhJYIyQdlQUAAAAA0gYAAAAABQ0AAIoK9iMAAAAAAAAAAAAAAAC0FQAAAAAAAAAAKQsAAIAPAACVJAAAAAAQJwAAAAAAAPEWAAAAAAAAAAAAAAAAAAAAAAAAGgMAAAAAAAAaIgAAAADTJcMd7AkAAAAAbyYAABcb3A1pBOQBAAAAAAAAAAAAAAAAAAAAAAAA8RcAAAAAAAAAAAYiYhAAAN8eAADuBgAAAAAAAAAAAADnEtUZAAAAAAAAAAAAAI8HAAAAAEUSaQQAADsNaQQAAAAAAAAAAAAAAAAAAB8PAAADEVocgR9sFQAAAADLFAAAAADkAYgTAAAAAAAAAADSCAAAdhoAAAAAAAAAANIIAAAAAAAAAAAAAAAAAADLFAAAAAAAAAAAAAC5G8APAABXC/scwyAAADQZAAAAAM0liyTkAZIYAAAAAAAAAAAAAAAAAAAAAFAXAAAAAAAAOw0AAAAArAUAAAAAAAAAAAAAAAAiIAAARRKnIp0dCgUAAAAATQYAAAAAOw0AABUKSCMAAAAAAAAAAAAAAAANFgAAAAAAAAAAtgoAAH4OAADqIwAAAAAQJwAAAAAAAK4WAAAAAAAAAAAAAAAAAAAAAAAAhQIAAAAAAABkIQAAAAAsJd8ecwkAAAAAaSYAAFgbrA1BA00BAAAAAAAAAAAAAAAAAAAAAAAAIxYAAAAAAAAAAIEiRxAAAJkeAACDBgAAAAAAAAAAAAA7EgsaAAAAAAAAAAAAACkHAAAAADsS6AMAAF8MQQMAAAAAAAAAAAAAAAAAAKAPAADtEKUcQB98FQAAAADVFAAAAAAAAIgTAAAAAAAAAAB3CAAAsRoAAAAAAAAAAHcIAAAAAAAAAAAAAAAAAAAvFAAAAAAAAAAAAAD/G/kOAACsDUwd2yEAAGQZAAAAAE0BHCUAAL0YAAAAAAAAAAAAAAAAAAAAAHAXAAAAAAAAuAsAAAAA3AUAAAAAAAAAAAAAAACNIAAA4RLPI/MdjwQAAAAANQUAAAAAEQsAAB0JKCMAAAAAAAAAAAAAAADJFgAAAAAAAAAAawoAAFMOAAB1JAAAAAAQJwAAAAAAABcYAAAAAAAAAAAAAAAAAAAAAAAA9AEAAAAAAAA0IQAAAADDJecfxAkAAAAAdiYAANkcbA7PBAEDAAAAAAAAAAAAAAAAAAAAAAAAChgAAAAAAAAAAEEiBxIAANofAABqCAAAAAAAAAkVAAA7EwsbAAAAAAAAAAAAAGsLAAAAANUTAgYAAKAPAgYAAAAAAAAAAAAAAAAAAAcSAAChEgwezwTWFgAAAAAKGAAAAAABAzwWAAAAAAAAAACeCQAAPxwAAAAAAAAAAAQJAAABAwAAAACfDAAAAACiFQAAAAAAAAAAAAByHdQQAAAGD6Ye2yIAAKUbAAAAAEIlqSQAAHEaAAAAAAAAAAAAAAEDAAAAAD4ZAAAAAAAA0g0AAAAA0AcAAAAAAAAAAAAAAAAOIQAAbxQBA0AfnAYAAAAANgcAAAAAOQ0AADcKdSMAAAAAAAAAAAAAAACkGAAAAAAAAAAABQwAADoQAAAPJAAAAAAQJwAAAAAAANcZAAAAAAAAAAAAAAAAAAAAAAAAmwMAAAAAAACnIQAAAADcJXQgawsAAAAAsSUAAHMQVgx8Ba8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGobIhEAAMgcAADMBAAAAAAAAAAAAABkDlsZAAAAAAAAAAAAANERAAAAAMMPbQMAAIESHQQAAAAAAAAAAAAAAAAAAE0XAAC1DRkchh8wEwAAAACPFAAAAAAAAD8VAAAAAAAAAAA5CAAAnRYAAAAAAAAAADkIAAAAAAAAAAAAAAAAAACmCwAAAAAAAAAAAAC6GgAAAACmCwAAoyMAAAsaAAAAAFIklCEAAKwYAAAAAAAAAAAAAAAAAAAAAOATAAAAAAAAFA8AAAAASAoAAAAAAAAAAAAAAAA2IAAA7hUCJfMivgIAAAAADgIAAAAAmAkAANoGRCIAAAAAAAAAAAAAAAD8FwAAAAAAAAAABQ0AANoGAADXHgAAAAAQJwAAAAAAAHgdAAAAAAAAAAAAAAAAAAAAAAAAXwEAAAAAAAAnHgAAAABhJuUg6QgAAAAAtyUAANYQxwq8BjoWAAAAAAAAAAAAAAAAAAAAAAAAtwQAAAAAAAAAAPEaLxIAAKIdAAAKBAAAAAAAAAAAAAAlDusYAAAAAAAAAAAAAIMRAAAAAH4PAAAAACoQXgMAAAAAAAAAAAAAAAAAALIjAADMDEkc+x6IEwAAAACNFQAAAABZAeEUAAAAAAAAAAAVCAAANBQAAAAAAAAAAGkHAAAAAAAAAAAAAAAAAABzCwAAAAAAAAAAAACYGQAAAAB4DQAAWSIAAEQaAAAAAF4krSFZAZIXAAAAAAAAAAAAAAAAAAAAANwSAAAAAAAAfg8AAAAAbgkAAAAAAAAAAAAAAACnHwAA5hYLJQYjsgIAAAAABQIAAAAAGgoAAGMFACEAAAAAAAAAAAAAAAA/GAAAAAAAAAAAHwwAALwGAABPHgAAAAAQJwAAAAAAAJ0bAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD2HAAAAABkJlQgwQgAAAAAvSUAAOAR6wtIB9kVAAAAAAAAAAAAAAAAAAAAAAAA9QUAAAAAAAAAACId3RMAAHUeAAD1BQAAAAAAAAAAAAA6D9IZAAAAAAAAAAAAAIoSAAAAADoPAAAAADcRogQAAAAAAAAAAAAAAAAAAGokAADnDXgcHh+GFAAAAACDFgAAAABPAywXAAAAAAAAAADuCQAAMBUAAAAAAAAAAO4JAAAAAAAAAAAAAAAAAACUDAAAAAAAAAAAAAB8GgAAAACNEAAAxCEAACUbAAAAAE8DFyNPA38YAAAAAAAAAAAAAAAAAABPA90TAAAAAAAA5A8AAAAAmAoAAAAAAAAAAAAAAABxIAAA1hcUJcEj+QMAAAAAAAAAAAAA6wsAAJ8GbiIAAAAAAAAAAAAAAAApGQAAAAAAAAAAPg0AAPIHAADIHwAAAAAQJwAAAAAAAHgcAAAAAAAAAAAAAAAAAAAAAAAATwMAAAAAAADLHQAAAABnJhsh7gkAAAAAZyYAAI0QQQufBvwBAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAATwMAAM8bihIAAHUeAACfBgAAAAAAAAAAAAA6D9IZAAAAAAAAAAAAADMTAAAAAJEOpgIAANkVogQAAAAAAAAAAAAAAAAAAOARAADnDSUbGyEwFQAAAACDFgAAAAD8ASwXAAAAAAAAAABFCQAAhhQAAAAAAAAAAO4JAAD5AwAAAAAAAAAAAADrCwAAAAAAAAAAAAB8GgAAAADdEwAAHh8AAMsdAAAAABQlxCH8AX8YAAAAAAAAAAAAAAAAAAAAAOARAAAAAAAA5A8AAAAAmAoAAAAAAAAAAAAAAABxIAAA1he9JcEjTAUAAAAAAAAAAAAAPg0AAPIHbiIAAAAAAAAAAAAAAAApGQAAAAAAAAAAlAwAAPIHAAAXIwAAAAAQJwAAAAAAACIdAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAB4HAAAAABqJMgfmwgAAAAACyUAACoQxwoQBjoWAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAtwQAAJ0b3BIAAPYcAAC8BgAAAAAAAAAAAADRDpgZAAAAAAAAAAAAAC8SAAAAACUOsgIAAI0VCgQAAAAAAAAAAAAAAAAAANYQAADMDEQarSE0FAAAAADhFAAAAACsAJIXAAAAAAAAAADBCAAAgxEAAAAAAAAAAG4JAABeAwAAAAAAAAAAAABzCwAAAAAAAAAAAADxGrICAACIEwAATx4AAKIdAAAAAGQmACEAAD8YAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAfg8AAAAAGgoAAAAAAAAAAAAAAABUIAAA5ha3JQYjYwUAAAAAAAAAAAAAeA0AABUIWSIAAAAAAAAAAAAAAADrGAAAAAAAAAAAHwwAABUIAACyIwAAAAAQJwAAAAAAAEkcAAAAAAAAAAAAAAAAAAAAAAAAWQEAAAAAAAD7HgAAAABeJKcfAAAAAAAAUiQAAHMQ9wrMBOATAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKwYAALoa0REAAMgcAADaBgAAAAAAAAAAAADDD6wYAAAAAAAAAAAAACIRAAAAALUNHQQAAD8VHQQAAAAAAAAAAAAAAAAAAPMiAAAFDVsZNiAwEwAAAACPFAAAAABfAZ0WAAAAAAAAAADpCAAAAAAAAAAAAAAAAJgJAAAAAAAAAAAAAAAAAABWDAAAAAAAAAAAAABqGwAAAACBEgAAGRwAACceAAAAAGEm5SC+Ak0XAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFA8AAAAASAoAAAAAAAAAAAAAAACGHwAA7hWxJZQhKwYAAAAAvgIAAAAAZA4AADkIRCIAAAAAAAAAAAAAAAD8FwAAAAAAAAAAVgwAADkIAAACJQAAAAAQJwAAAAAAAAsaAAAAAAAAAAAAAAAAAAAAAAAAXwEAAAAAAADXHgAAAACjI3gdAAAAAAAARiQAAL4Q3Av6BsoCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA+gYAAIIa1RIAADQbAACsBwAAAAAAAAAAAABwEWoYAAAAAAAAAAAAACMSAAAAAFkPlQUAAKAV4gQAAAAAAAAAAAAAAAAAAC4iAABBDR0ZFiA7FAAAAAAAAAAAAADKArcXAAAAAAAAAAApCwAAAAAAAAAAAAAAACkLAAAAAAAAAAAAAAAAAACmDgAAAAAAAAAAAABMHQAAAACIEwAA5xsAAGQfAAAAAF0mySB9AwUXAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAvhAAAAAAjgwAAAAAAAAAAAAAAACxHgAA7RT4JHshxAkAAAAALwQAAAAAygIAAMQJ4SIAAAAAAAAAAAAAAABSFgAAAAAAAAAA8w0AAMQJAACrJQAAAAAQJwAAAAAAAM8ZAAAAAAAAAAAAAAAAAAAAAAAAygIAAAAAAABMHQAAAACTI/8dAAAAAAAAqyUAAKYOdwriBDsUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAXwgAADQbIxIAAIIaAACVBQAAAAAAAAAAAAC+EGoYAAAAAAAAAAAAAHARAAAAAPMNLwQAAFIWfQMAAAAAAAAAAAAAAAAAAC4iAADcCx0ZFiCIEwAAAAAAAAAAAAAAALcXAAAAAAAAAADECQAAAAAAAAAAAAAAABEJAADKAgAAAAAAAAAAAABBDQAAAAAAAAAAAABMHQAAAACIEwAAmRwAAGQfAAAAAPgkySBlAQUXAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAWQ8AAAAAKQsAAAAAAAAAAAAAAACxHgAA7RRGJHshrAcAAAAAGAIAAAAACxAAAPoG4SIAAAAAAAAAAAAAAACgFQAAAAAAAAAAjgwAAPoGAABdJgAAAAAQJwAAAAAAAM8ZAAAAAAAAAAAAAAAAAAAAAAAAswAAAAAAAADnGwAAAACTI/8dAAAAAAAAZyYAAI0QlAxIBzAVAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQQsAAHgchhQAACUbAADyBwAAAAAAAAAAAACKEikZAAAAAAAAAAAAADMTAAAAAOQPnwYAANYX9QUAAAAAAAAAAAAAAAAAABcjpgLnDdIZcSCGFAAAAAAAAAAAAACmAn8YAAAAAAAAAADrCwAAAAAAAAAAAAAAAJgKAAD1BQAAAAAAAAAAAAA6DwAAAAAAAAAAAAAiHQAAAADEIQAAHh8AAMgfpgIAAKYCGyH5AywXAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANxEAAAAAPg0AAAAAAAAAAAAAAAB1HgAA2RUUJW4i7gkAAAAAogQAAAAA4BEAAEUJwSMAAAAAAAAAAAAAAACDFgAAAAAAAAAAkQ4AAJsIAAC9JQAAAAAQJwAAAAAAAHwaAAAAAAAAAAAAAAAAAAAAAAAA+QMAAAAAAADPGwAAAABqJMsdAAAAAAAAqyUAAF0mKQuVBTsUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAdwoAAOcbiBMAAM8ZAABHBgAAAAAAAAAAAAC+ELcXAAAAAAAAAAAAAHARAAAAAKYOlQUAAOEiLwQAAAAAAAAAAAAAAAAAAHshAACODM8ZZB+IEwAAAAAAAAAAAABlAQUXAAAAAAAAAAB3CgAAAAAAAAAAAAAAABEJAAAvBAAAAAAAAAAAAADzDQAAAAAAAAAAAAA0GwAAAAAjEgAAsR4AAP8dAAAAAGUBFiDKAlIWAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAWQ8AAAAA3AsAAAAAAAAAAAAAAABMHQAA7RRGJMkgXwgAAAAAAAAAAAAACxAAAKwHLiIAAAAAAAAAAAAAAACgFQAAAAAAAAAAQQ0AAPoGAAD4JAAAAAAQJwAAAAAAAGoYAAAAAAAAAAAAAAAAAAAAAAAAygIAAAAAAACCGgAAAACTI0wdAAAAAAAAyCUAABAncw1TCMYVAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAcw0AANEcfhQAAOUaAAD3CAAAAAAAAAAAAACSEvkYAAAAAAAAAAAAADYTAAAAAKYQUwgAADgjCwcAAAAA2AMAAAAAAAAAAE0h2ANeD0EaYR8iFQAAAAAAAAAAAADYA1YYAAAAAAAAAAArDAAAAAAAAAAAAAAAAIcLAAALBwAAAAAAAAAAAAACEAAAAAAAAAAAAAAtHAAAAADaEwAABSAAAHUd2AMAANgD8SEfBbIXAAAAAAAAAAAAANgDAAAAAAAAAAAAAAAAShEAAAAAFw4AAAAAAAAAAAAAAACJGwAAahbcI6kg4woAAAAAwwUAAAAA7hEAAOMKlCIAAAAAAAAAAAAAAAAOFwAAAAAAAAAAXg8AAJsJAAAkJQAAAABsJgAAAAAAAJ0ZAAAAAAAAAAAAAAAAAAAAAAAAHwUAAAAAAAAZHgAAAACAJL0eAAAAAAAAdSQAAMMluAsdCSMWAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoA8AAOcf1RQAAPMdAAApBwAAAAAAAAAAAAA7EskWAAAAAAAAAAAAAEcQAAAAAFMOKQcAAIEipwAAAAAAQQMAAAAAAAAAAEAfAACIE2QZCxojFgAAAAAAAAAAAAAAABcYAAAAAAAAAAARCwAAAAAAAAAAAAAAAGsKAADQBwAAAAAAAAAAAADtEAAAAAAAAAAAAAClHAAAAAAvFAAA2yFBA88jQQMAANwFNCHcBb0YAAAAAAAAAAAAAEEDAAAAAAAAAAAAAAAArA0AAAAAxAkAAAAAAAAAAAAAAAD/GwAAlBEoI7EaBQ0AAAAA3AUAAAAA4RIAAF8MjSAAAAAAAAAAAAAAAAAXGAAAAAAAAAAA+Q4AANwFAAAQJwAAAAAcJQAAAAAAAFgbAAAAAAAAAAAAAAAAAAAAAAAAHQkAAAAAAABMHQAAAABpJpkeAAAAAAAALCUAANwNmgy2ClAXAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAxEAAMMgDRYAAPscAAAxCAAAAAAAAAAAAAApFPEXAACFAgAAAACFAqQRAAAAAB8PjwcAABcbhQIAAAAAjwcAAAAAAAAAACIgAABsFXYaWhyuFgAAAAAAAAAAAACFApIYAAAAAAAAAAD5CwAAAAAAAAAAAAAAAFcLAADSCAAAAAAAAAAAAADnEgAAAAAAAAAAAACdHQAAAACIEwAApyJpBEgjaQQAAOojBiKPB9UZAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwA8AAAAAtgoAAAAAAAAAAAAAAACPBwAA5xKLJD4efg4AAAAAaQQAAAAAyxQAANwNZCEAAAAAAAAAAAAAAAA0GQAAAAAAAAAAYhAAAI8HAAAQJwAAAADNJQAAAAAAALkbAAAAAAAAAAAAAAAAAAAAAAAAcwkAAAAAAACBHwAAAABvJt8eAAAAAAAANCUAAEMOpA3IC/EWAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAHxAAAN0gkBcAAGIeAAApCwAAAAAAAAAAAAB2FM0YAAAaAwAAAAAaA5oSAAAAAFwRDwgAAOcbGgMAAAAADwgAAAAAAAAAAHshAABSFkgbwx0uGAAAAAAAAAAAAAAaA2wZAAAAAAAAAAAFDQAAAAAAABoDAAAAAGcMAABNCQAAAAAAAAAAAAA5EwAAAAAAAAAAAAAkHQAAAAC0FQAAuSIAAFgjMwYAADMG9iMPCKkaAAAAAAAAAAAAADMGAAAAAAAAAAAAAAAAvhAAAAAAKQsAAAAAAAAAAAAAAABNCQAA1xOVJJ8fgA8AAAAAMwYAAAAAFRUAAOIOGiIAAAAAAAAAAAAAAAALGgAAAAAAAAAA+xEAADMGAAAQJwAAAADTJQAAAAAAAIYcAAAAAAAAAAAAAAAAAAAAAAAAKQsAAAAAAAA+IAAAAABxJgEfAAAAAAAAOyUAAKYOCg41DPkVAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAexAAAPYgzhcAACEfAACZCwAAAAAAAAAAAAAkFAYZAADiBAAAAADiBFASAAAAALMRjAgAABQc4gQAAAAAjAgAAAAAAAAAAMoiAACVFncbTB1qGAAA4gQAAAAAAADiBKIZAAAAAAAAAABuDQAAAAAAAOIEAAAAANEMAABgCgAAAAAAAAAAAACIEwAAAAAAAAAAAADoHQAAAAAyFwAAkiHiBC4ijAgAAIwIAyTECdsaAAAAAAAAAAAAAIwIAAAAAAAAAAAAAAAAFxEAAAAAAAAAAAAAAAAAAAAAAADECQAAwBSfJL0f3g8AAAAA4gQAAAAAXRUAAEIPZiMAAAAAAAAAAAAAAAA/GgAAAAAAAAAA7BIAAIwIAAAQJwAAAADYJQAAAAAAALAcAAAAAAAAAAAAAAAAAAAAAAAAmQsAAAAAAABZIAAAAAB0JoQeAAAAAAAAzyMAABAnuAvECTsSAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJke1RQAAFgbAAAdCQAAAAAAAAAAAADtECMWAACbAgAAAAAAAKAPAAAAAFMO0AcAAHUkmwIAAAAA0AcAAAAAAAAAAI0gAACIE2QZCxp8FQAAAAAAAAAAAAAAAMkWAAAAAAAAAAC4CwAAAAAAAJsCAAAAAGsKAAB3CAAAAAAAAAAAAABHEAAAAAAAAAAAAAD/GwAAAAAvFAAAQB81BecfNQUAAIEi2yHQBxcYAAAAAAAAAAAAANAHAAAAAAAAAAAAAAAArA0AAAAAAAAAAAAAAAAAAAAAAABMHQAAlBEoI6UcBQ0AAAAANQUAAAAA4RIAAF8MNCEAAAAAAAAAAAAAAABwFwAAAAAAAAAA+Q4AADUFAABpJgAAAADDJQAAAAAAAL0YAAAAAAAAAAAAAAAAAAAAAAAAmwIAAAAAAADzHQAAAAAcJbEaAAAAAAAAHCUAAAUNrA0RCy8UAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOcfcBcAAEwdAABrCgAAAAAAAAAAAADhEhcYAACbAgAAAAAAAJQRAAAAAEcQHQkAAFgbmwIAAAAAHQkAAAAAAAAAANshAAB8FbEapRzJFgAAAAAAAAAAAACbAr0YAAAAAAAAAAAFDQAAAAAAAAAAAAAAALgLAADECQAAAAAAAAAAAAA7EgAAAAAAAAAAAACZHgAAAAAjFgAANCHcBYEi3AUAANwFzyMdCQsaAAAAAAAAAAAAAB0JAAAAAAAAAAAAAAAAoA8AAAAAAAAAAAAAAAAAAAAAAAAdCQAAiBN1JEAf+Q4AAAAA3AUAAAAA1RQAAFMOKCMAAAAAAAAAAAAAAABkGQAAAAAAAAAA7RAAANwFAAAQJwAAAABpJgAAAAAAAP8bAAAAAAAAAAAAAAAAAAAAAAAAmwIAAAAAAACNIAAAAADDJfMdAAAAAAAAiyQAABAn3A35CykUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIEfUBcAAPscAABXCwAAAAAAAAAAAADnEvEXAADIAwAAAADIA0USAAAAAGIQcwkAALkbyAMAAAAAcwkAAAAAAAAAAGQhAAANFnYaWhxQFwAAAAAAAAAAAADIA5IYAAAAAAAAAAA7DQAAAAAAAMgDAAAAAJoMAAC2CgAAAAAAAAAAAACkEQAAAAAAAAAAAADfHgAAAAANFgAAwyDuBgYi7gYAAO4GSCNzCdUZAAAAAAAAAAAAABUKAAAAAAAAAAAAAAAAwA8AAAAAAAAAAAAAAAAAAAAAAABzCQAAiBPqIz4eHw8AAAAA7gYAAAAAyxQAAH4OpyIAAAAAAAAAAAAAAAA0GQAAAAAAAAAAAxEAAO4GAABvJgAAAAAsJQAAAAAAABcbAAAAAAAAAAAAAAAAAAAAAAAAyAMAAAAAAAAiIAAAAADNJZ0dAAAAAAAAWCMAABAnpA3ICzkTAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMMdtBUAAOcbAACKCgAAAAAAAAAAAABcEZAXAAAaAwAAAAAaA5oSAAAAAIAP0gYAAJUkGgMAAAAA0gYAAAAAAAAAAN0gAAAVFUgbCxpSFgAAAAAAAAAAAAAaAy4YAAAAAAAAAABnDAAAAAAAABoDAAAAAMgLAABNCQAAAAAAAAAAAAC+EAAAAAAAAAAAAAAkHQAAAAB2FAAAYh6VBT4glQUAALkiGiIPCM0YAAAAAAAAAAAAAA8IAAAAAAAAAAAAAAAA4g4AAAAAigoAAAAAAAAAAAAAAAABHwAAmhL2I4YcQw4AAAAAlQUAAAAA1xMAAAUNeyEAAAAAAAAAAAAAAACQFwAAAAAAAAAAHxAAAJUFAABxJgAAAADTJQAAAAAAAGwZAAAAAAAAAAAAAAAAAAAAAAAATQkAAAAAAACfHwAAAAA0JakaAAAAAAAAWCMAABAnQw5nDNcTAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGIeUhYAAIYcAACKCgAAAAAAAAAAAAD7ES4YAAC4AwAAAAC4AzkTAAAAAB8QDwgAAJUk0gYAAAAADwgAAAAAAAAAAN0gAAC0FecbSBvxFgAAAAAAAAAAAAC4A2wZAAAAAAAAAAAFDQAAAAAAALgDAAAAAMgLAADsCQAAAAAAAAAAAABcEQAAAAAAAAAAAADDHQAAAAAVFQAAnx/SBnsh0gYAALgDuSJNCc0YAAAAAAAAAAAAAE0JAAAAAAAAAAAAAAAAgA8AAAAAKQsAAAAAAAAAAAAAAACfHwAAmhL2IyQd4g4AAAAA0gYAAAAAdhQAAKQNGiIAAAAAAAAAAAAAAACQFwAAAAAAAAAAvhAAANIGAABxJgAAAADTJQAAAAAAAAsaAAAAAAAAAAAAAAAAAAAAAAAAuAMAAAAAAAA+IAAAAAA0JakaAAAAAAAAlSQAAAUNHxAFDRUVAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEfkBcAACQdAAApCwAAAAAAAAAAAADXE2wZAAC4AwAAAAC4A3YUAAAAAFwRrggAAGIe0gYAAAAArggAAAAAAAAAABoiAADxFkgbwx0uGAAAAAAAAAAAAAC4A6kaAAAAAAAAAABDDgAAAAAAALgDAAAAAMgLAACKCgAAAAAAAAAAAACaEgAAAAAAAAAAAADdIAAAAABSFgAAPiDSBrki0gYAALgD9iPsCQsaAAAAAAAAAAAAAOwJAAAAAAAAAAAAAAAAvhAAAAAApA0AAAAAAAAAAAAAAACuCAAAORM0JZ8fHxAAAAAA0gYAAAAAtBUAAOIOWCMAAAAAAAAAAAAAAADNGAAAAAAAAAAA+xEAANIGAABxJgAAAAAQJwAAAAAAAOcbAAAAAAAAAAAAAAAAAAAAAAAAuAMAAAAAAAB7IQAAAADTJYYcAAAAAAAAgCQAAIcLXg8rDH4UAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAHUdDhcAANEcAAA/CgAAAAAAAAAAAAA2E/kYAAA0AwAAAAA0A9oTAAAAAKYQAAAAAGEfZwYAAAAArwcAAAAAAAAAAPEhAABqFuUaGR6yFwAAAAAAAAAAAAAAAEEaAAAAAAAAAABzDQAAAAAAADQDAAAAAOMKAACbCQAAAAAAAAAAAADuEQAAAAAAAAAAAACpIAAAAADGFQAAvR5nBpQiZwYAADQD3CP3CJ0ZAAAAAAAAAAAAAPcIAAAAAAAAAAAAAAAAAhAAAAAAzwwAAAAAAAAAAAAAAACvBwAAkhIkJQUgXg8AAAAAZwYAAAAAIhUAABcOOCMAAAAAAAAAAAAAAABWGAAAAAAAAAAAShEAAGcGAADIJQAAAAAQJwAAAAAAAIkbAAAAAAAAAAAAAAAAAAAAAAAANAMAAAAAAABNIQAAAABsJi0cAAAAAAAAWCMAAIoKQw4pCxUVAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIYcUhYAAOcbAABNCQAAAAAAAAAAAACaEi4YAAAaAwAAAAAaAzkTAAAAAIAPAAAAAMMd+xEAAAAAMwYAAAAAAAAAAN0g0yW0FQsaJB3xFgAAAAAAAAAAAAAaA2wZAAAAAAAAAABnDAAAAAAAABoDAAAAAOwJAACuCAAAAAAAAAAAAAC+EAAAAAAAAAAAAACfHwAAAADXEwAAAR+VBXshlQUAAJUkuSIPCM0YAAAAAAAAAAAAAA8IAAAAAAAAAAAAAAAA4g4AAAAABQ0AAAAAAAAAAAAAAAAPCAAAXBH2I2IepA0AAAAAlQUAAAAAdhQAAGcMGiIAAAAAAAAAAAAAAACQFwAAAAAAAAAAHxAAAJUFAAA0JQAAAAAQJwAAAAAAAKkaAAAAAAAAAAAAAAAAAAAAAAAAGgMAAAAAAAA+IAAAAABxJkgbAAAAAAAAZyYAABAnlAzrC90TAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAM8b2RUAACUbAADuCQAAAAAAAAAAAACGFCwXAAD8AQAAAABMBd0TAAAAAI0QAAAAABsh8gcAAAAAogQAAAAAAAAAAMsdTwPgEXwaIh2DFgAAAAAAAAAAAAAAACkZAAAAAAAAAADnDQAAAAAAAAAAAAAAAEUJAADyBwAAAAAAAAAAAADkDwAAAAAAAAAAAABxIAAAAACKEgAAxCEAAMEjTwMAABQlHh+fBikZAAAAAAAAAAAAAKIEAAAAAAAAAAAAAAAAPg0AAAAAOg8AAAAAAAAAAAAAAACbCAAANxEXI3UemAoAAAAAnwYAAAAAMBUAAOsLbiIAAAAAAAAAAAAAAADWFwAAAAAAAAAAkQ4AAPwBAAAAAAAAAAC9JQAAAAAAANIZAAAAAAAAAAAAAAAAAAAAAAAA/AEAAAAAAADIHwAAAABqJHgcAAAAAAAAbCYAAMglzwwrDDYTAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIkbxhUAAOUaAAA/CgAAAAAAAAAAAAB+FA4XAAAAAAAAAAAfBSIVAAAAAAIQNAMAAE0hrwcAAAAAZwYAAAAAAAAAABkeECeSEkEa0RxqFgAAAAAAAAAAAAA0A/kYAAAAAAAAAAAXDgAAAAAAAAAAAAAAAJsJAABTCAAAAAAAAAAAAABKEQAAAAAAAAAAAAB1HQAAAADuEQAAqSA0A5QiHwUAANwjBSCvB1YYAAAAAAAAAAAAAB8FAAAAAAAAAAAAAAAAcw0AAAAAAhAAAAAAAAAAAAAAAACbCQAAphA4I70e4woAAAAAZwYAAAAA2hMAAIcL8SEAAAAAAAAAAAAAAACyFwAAAAAAAAAAug4AADQDAAAAAAAAAAAkJQAAAAAAAJ0ZAAAAAAAAAAAAAAAAAAAAAAAANAMAAAAAAABhHwAAAACAJC0cAAAAAAAAZCYAAJgZHwzHCjQUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEkc4RQAAPEaAABuCQAAAAAAAAAAAACIE5IXAAAAAAAAAABeA40VAAAAACoQXgMAAAYjvAYAAAAAYwUAAAAAAAAAAKcfECcvEp0boh06FgAAAAAAAAAAAAAAAOsYAAAAAAAAAAB4DQAAAAAAAAAAAAAAAAAAAADBCAAAAAAAAAAAAADWEAAAAAAAAAAAAABPHgAAAACDEQAArSEAALIjtwQAAAUCACG8Bj8YAAAAAAAAAAAAALcEAAAAAAAAAAAAAAAAzAwAAAAA0Q4AAAAAAAAAAAAAAADBCAAA0Q5eJFQgxwoAAAAAaQcAAAAA3BIAAHMLWSIAAAAAAAAAAAAAAADmFgAAAAAAAAAAKhAAAAUCAAAAAAAAAAC3JQAAAAAAAEQaAAAAAAAAAAAAAAAAAAAAAAAABQIAAAAAAAD7HgAAAAALJfYcAAAAAAAAXiQAAGQmzAzHCjQUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPEa4RQAAJ0bAAAaCgAAAAAAAAAAAACIE5IXAAAAAAAAAAC3BI0VAAAAACoQtwQAAFkiaQcAAAAAEAYAAAAAAAAAAKcfECcvEvEa9hw6FgAAAAAAAAAAAAAAAOsYAAAAAAAAAAAlDgAAAAAAAAAAAAAAAAAAAABuCQAAAAAAAAAAAADWEAAAAAAAAAAAAACiHQAAAACDEQAAVCAFAgYjAAAAAAUCACG8Bj8YAAAAAAAAAAAAABAGAAAAAAAAAAAAAAAAeA0AAAAA0Q4AAAAAAAAAAAAAAAAVCAAAtwSyI/seHwwAAAAAwQgAAAAAiBMAAHMLrSEAAAAAAAAAAAAAAADmFgAAAAAAAAAAfg8AAAUCAAAAAAAAAAC3JQAAAAAAAJgZAAAAAAAAAAAAAAAAAAAAAAAAtwQAAAAAAABPHgAAAAALJUkcAAAAAAAAtyUAAGQmeA1zC+EUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPEajRUAAJ0bAADHCgAAAAAAAAAAAADhFD8YAAAAAAAAAABjBToWAAAAACoQYwUAAFkiwQgAAAAAvAYAAAAAAAAAAFQgECeIE0Qa9hzmFgAAAAAAAAAAAAAAAAAAAAAAAAAAAADRDgAAAAAAAAAAAAAAAAAAAAAaCgAAAAAAAAAAAACDEQAAAAAAAAAAAACiHQAAAAAvEgAApx9jBWMFYwUAALIjACFpB+sYAAAAAAAAAAAAALwGAAAAAAAAAAAAAAAAJQ4AAAAAfg8AAAAAAAAAAAAAAADBCAAAYwUGI/sezAwAAAAAbgkAAAAA3BIAAB8MrSEAAAAAAAAAAAAAAACSFwAAAAAAAAAA1hAAAKwAAAAAAAAAAAALJQAAAAAAAJgZAAAAAAAAAAAAAAAAAAAAAAAAYwUAAAAAAABPHgAAAABeJEkcAAAAAAAAFCUAAGcm5w3rCzAVAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACUb2RUAAM8bAABBCwAAAAAAAAAAAACGFH8YAAAAAAAAAAD1BYMWAAAAAI0Q9QUAAG4iRQkAAAAASAcAAAAAAAAAAHEgECfdE3waIh0sFwAAAAAAAAAAAAAAAAAAAAAAAAAAAAA6DwAAAAAAAKYCAAAAAAAAAADuCQAAAAAAAAAAAACKEgAAAAAAAAAAAADLHQAAAADgEQAAyB+mAqYC9QUAAMEjGyHyBykZAAAAAAAAAAAAAEgHAAAAAAAAAAAAAAAAkQ4AAAAA5A8AAAAAAAAAAAAAAABFCQAA9QUXIx4fPg0AAAAAmAoAAAAA3RMAAJQMxCEAAAAAAAAAAAAAAADWFwAAAAAAAAAANxEAAKYCAAAAAAAAAAC9JQAAAAAAANIZAAAAAAAAAAAAAAAAAAAAAAAA9QUAAAAAAAB1HgAAAABqJHgcAAAAAAAAwSMAAGcm5w3rC90TAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACUbMBUAAHwaAABBCwAAAAAAAAAAAACGFNYXAAAAAAAAAAD1BdkVAAAAAPUF8gcAAG4iRQkAAAAA8gcAAAAAAAAAAHEgECeKEtIZIh0sFwAAAAAAAAAAAAAAAAAAAAAAAAAAAADkDwAAAAAAAPwBAAAAAAAAAADuCQAAAAAAAAAAAADgEQAAAAAAAAAAAAB4HAAAAACNEAAAyB/1BfwB9QUAAGokxCGbCH8YAAAAAAAAAAAAAPIHAAAAAAAAAAAAAAAAkQ4AAAAA5A8AAAAAAAAAAAAAAADLHQAA9QUXIx4fPg0AAAAAmAoAAAAAMxMAAD4NGyEAAAAAAAAAAAAAAAAsFwAAAAAAAAAANxEAAPwBAAAAAAAAAAC9JQAAAAAAACkZAAAAAAAAAAAAAAAAAAAAAAAA9QUAAAAAAAB1HgAAAAAUJc8bAAAAAAAAkyMAAF0mKQsRCSMSAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAM8ZiBMAAB0ZAABfCAAAAAAAAAAAAACIE1IWAAAAAAAAAADKAjsUAAAAAPMN4gQAAHshRwYAAAAA4gQAAAAAAAAAAGQfECe+EGoY5xvtFAAAAAAAAAAAAAAAAAAAAAAAAAAAAABBDQAAAAAAAAAAAAAAAAAAAAD6BgAAAAAAAAAAAAALEAAAAAAAAAAAAAA0GwAAAAALEAAAsR7KAi4i4gQAAEYkySCVBQUXAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA3AsAAAAAjgwAAAAAAAAAAAAAAACZHAAAygLhIv8ddwoAAAAArAcAAAAAcBEAAMQJFiAAAAAAAAAAAAAAAACgFQAAAAAAAAAApg4AALMAAAAAAAAAAACrJQAAAAAAALcXAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABMHQAAAAD4JIIaAAAAAAAATiMAAFAmAACDBwcSAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMoYBxIAAAoYAADDBgAAAAAAAAAAAAAHEgkVAAAAAAAAAABBAsgSAAAAAAAARQsAAM4hggQAAAAAAAAAAAAAAAAAAM0eECcGD0oXSxpIFAAAAAAAAAAAAAAAAAAAAAAAAAAAAACECgAAAAAAAAAAAAAAAAAAAABCBQAAAAAAAAAAAABGDgAAAAAAAAAAAADLGwAAAACGDQAATB0AAM4hAQMAAM8kTSDCA8kVAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAxAkAAAAAAAAAAAAAAAAAAAAAAAALGwAAxQyOIgweBAkAAAAAAgYAAAAAxg8AAEMIjR8AAAAAAAAAAAAAAACIEwAAAAAAAAAABQwAAMAAAAAAAAAAAACPJQAAAAAAAIkWAAAAAAAAAAAAAAAAAAAAAAAAQQIAAAAAAACMHAAAAAAPJIoZAAAAAAAA7yQAAFomAADxCXcSAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJEZLRMAANwYAAA8CQAAAAAAAAAAAADBEQQWAAAAAAAAAAD5BOMTAAAAAAAA+QQAABciGgcAAAAAAAAAAAAAAAAAAEAfECdWECYYsxtPFQAAAAAAAAAAAAAAAAAAAAAAAAAAAADJDAAAAAAAAGwBAAAAAAAAAADQBwAAAAAAAAAAAADqDgAAAAAAAAAAAABpHAAAAACgDwAA1B35BGEhrwUAADkkrCBkBroWAAAAAAAAAAAAAPkEAAAAAAAAAAAAAAAAEwwAAAAAAAAAAAAAAAAAAAAAAAD9GgAANA7NIooeXQsAAAAAhggAAAAADBEAAKcK9h8AAAAAAAAAAAAAAACZFAAAAAAAAAAAfw0AAGwBAAAAAAAAAACkJQAAAAAAAHAXAAAAAAAAAAAAAAAAAAAAAAAA+QQAAAAAAAAfHQAAAACDI0caAAAAAAAAtyUAABAnzAxuCTQUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPEaiBMAAEQaAADBCAAAAAAAAAAAAAAvEuYWAAAAAAAAAAAKBOEUAAAAANEOJQ4AAAYjvAYAAAAAYwUAAAAAAAAAAAAhAACDEZgZ9hw6FgAAAAAAAAAAAAAAAD8YAAAAAAAAAAB4DQAAAAAAAFkBAAAAAAAAAABpBwAAAAAAAAAAAADWEAAAAAAAAAAAAACiHQAAAAAqEAAA+x4AAFkiYwUAAAslrSEQBpIXAAAAAAAAAAAAAAoEAAAAAAAAAAAAAAAAzAwAAAAAcwsAAAAAAAAAAAAAAACdGwAACgSyI6cfxwoAAAAAFQgAAAAA3BIAAMcKVCAAAAAAAAAAAAAAAACNFQAAAAAAAAAAKhAAAFkBAAAAAAAAAABkJgAAAAAAAOsYAAAAAAAAAAAAAAAAAAAAAAAACgQAAAAAAABPHgAAAABeJEkcAAAAAAAAsSUAABAnVgzpCOATAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAALoaMBMAAAsaAAA5CAAAAAAAAAAAAADREZ0WAAAAAAAAAABfAY8UAAAAALUNbQMAAPMiKwYAAAAAfAUAAAAAAAAAAOUgAAAiEVsZGRzuFQAAAAAAAAAAAAAAAPwXAAAAAAAAAAAFDQAAAAAAAAAAAAAAAAAAAADaBgAAAAAAAAAAAABzEAAAAAAAAAAAAAB4HQAAAABkDgAA1x4AAEQiHQQAAAIllCF8BU0XAAAAAAAAAAAAAG0DAAAAAAAAAAAAAAAAVgwAAAAA9woAAAAAAAAAAAAAAABqGwAAcxCjI4YfSAoAAAAAigcAAAAAgRIAAEgKNiAAAAAAAAAAAAAAAAA/FQAAAAAAAAAAFA8AAF8BAAAAAAAAAABhJgAAAAAAAKwYAAAAAAAAAAAAAAAAAAAAAAAAbQMAAAAAAAAnHgAAAABSJMgcAAAAAAAAECcAAF0mWQ+sBzsUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEwdIxIAAIIaAAD6BgAAAAAAAAAAAADVElIWAAAAAAAAAAAAAO0UAAAAAKYOswAAAOEiygIAAAAAxAkAAAAAAAAAAC4iAAC+EM8ZNBsFFwAAAAAAAAAAAAAAAGoYAAAAAAAAAAApCwAAAAAAAAAAAAAAAAAAAABHBgAAAAAAAAAAAABBDQAAAAAAAAAAAAD/HQAAAABwEQAAFiAAAMkgGAIAAJMjeyGVBbcXAAAAAAAAAAAAAGUBAAAAAAAAAAAAAAAA3AsAAAAA8w0AAAAAAAAAAAAAAAB9AwAACxBGJOcbdwoAAAAAXwgAAAAAiBMAAMQJZB8AAAAAAAAAAAAAAACgFQAAAAAAAAAAjgwAAJUFAAAAAAAAAACrJQAAAAAAAB0ZAAAAAAAAAAAAAAAAAAAAAAAAlQUAAAAAAACxHgAAAAD4JJkcAAAAAAAAECcAAGQm1hBuCToWAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKIdiBMAAJ0bAADBCAAAAAAAAAAAAAA0FJIXAAAAAAAAAAAFAo0VAAAAACoQXgMAALIjtwQAAAAAHwwAAAAAAAAAAAYjAADcEvEaSRw/GAAAAAAAAAAAAAAAAJgZAAAAAAAAAADMDAAAAAAAALcEAAAAAAAAAAAVCAAAAAAAAAAAAADRDgAAAAAAAAAAAAD7HgAAAAAvEgAAACEFAq0hvAYAAAUCWSJpB+sYAAAAAAAAAAAAAF4DAAAAAAAAAAAAAAAAeA0AAAAAfg8AAAAAAAAAAAAAAAC8BgAAgxFeJE8ecwsAAAAAGgoAAAAA4RQAAMcKVCAAAAAAAAAAAAAAAADmFgAAAAAAAAAA0Q4AALwGAAAAAAAAAAC3JQAAAAAAAEQaAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACnHwAAAAALJfYcAAAAAAAAECcAAGcmjRBFCTAVAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACIdMxMAACUbAACbCAAAAAAAAAAAAADdEywXAAAAAAAAAACpAIYUAAAAADcRTwMAABcjogQAAAAA6wsAAAAAAAAAAG4iAACKEnwazxvWFwAAAAAAAAAAAAAAACkZAAAAAAAAAAA+DQAAAAAAAE8DAAAAAAAAAADyBwAAAAAAAAAAAADnDQAAAAAAAAAAAAB1HgAAAAA6DwAAcSBPAxshSAcAAMEjxCFIB38YAAAAAAAAAAAAAE8DAAAAAAAAAAAAAAAAlAwAAAAA5A8AAAAAAAAAAAAAAABIBwAA4BFqJMsdQQsAAAAAmAoAAAAA2RUAAJgKyB8AAAAAAAAAAAAAAACDFgAAAAAAAAAAkQ4AAEwFAAAAAAAAAAC9JQAAAAAAANIZAAAAAAAAAAAAAAAAAAAAAAAAogQAAAAAAAAeHwAAAAAUJXgcAAAAAAAAECcAAGcmNxHuCdkVAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACId3RMAAM8bAABFCQAAAAAAAAAAAACGFNYXAAAAAAAAAABTATAVAAAAAIoS+QMAAMEj9QUAAAAAlAwAAAAAAAAAAG4iAAAzEyUbeBzWFwAAAAAAAAAAAAAAANIZAAAAAAAAAACRDgAAAAAAAPkDAAAAAAAAAACbCAAAAAAAAAAAAADkDwAAAAAAAAAAAAAeHwAAAACRDgAAGyH5A8Qh8gcAAFMBFyPyBykZAAAAAAAAAAAAAPkDAAAAAAAAAAAAAAAAkQ4AAAAAjRAAAAAAAAAAAAAAAACfBgAA4BFqJHUe6wsAAAAAmAoAAAAAgxYAAEELcSAAAAAAAAAAAAAAAAB/GAAAAAAAAAAAOg8AAPUFAAAAAAAAAAC9JQAAAAAAAHwaAAAAAAAAAAAAAAAAAAAAAAAA9QUAAAAAAADIHwAAAAAUJcsdAAAAAAAAECcAAG8mRRJXC64WAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJ0dyxQAAFocAABXCwAAAAAAAAAAAABsFfEXAAAAAAAAAAAmAw0WAAAAAOcSrAUAAOojrAUAAAAA3A0AAAAAAAAAAKciAAApFLkb+xySGAAAAAAAAAAAAABDAXYaAAAAAAAAAADADwAAAAAAAO4GAAAAAAAAAABzCQAAAAAAAAAAAAADEQAAAAAAAAAAAACBHwAAAAB+DgAAwyBpBAYiMQgAAEMBSCOPB9UZAAAAAAAAAAAAACYDAAAmAwAAAAAAAAAAwA8VCgAApBEAAAAAAAAAAAAAAADuBgAAiBOLJN8eOw0AAAAA+QsAAAAAUBcAAJoMZCEAAAAAAAAAAAAAAAA0GQAAAAAAAAAAYhAAANIIAAAAAAAAAADNJQAAAAAAABcbAAAAAAAAAAAAAAAAAAAAAAAAaQQAAAAAAAAiIAAAAAAsJT4eAAAAAAAAECcAAOUl/RRpDRIZAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKYgfRgAAFEeAAD+DQAAAAAAABQLAADnF2cbAAAAAAAAAACAAzwaAAAAAJIVKggAACYkKggAAAAAfhEAAAAAAAAAAPsiAABSF+YePwXSGgAA/wbpCQAAAABVAicdAAAAAAAAAADoEAAAAAAAANQMExIAAAAAAADUDAAAAAAAAAAAAABoFAAAAAAAAAAAAAARIAAAAABoFAAA0SE/BYADFAsAAFUCkCNUCZEcAAAAAAAAAAAAAP8GKQ+pCwAAAAAAAAAAqBI/BQAAKBYAAAAAAAAAAAAAAABUCQAAvRa7JHwfvg8AAAAAVQIAAAAApxkAAFMQZiIAAAAAAAAAAAAAAAD8GwAAAAAAAAAAPRMAAJMOAAAAAAAAAAB7JgAAAAAAALwdAAAAAAAAAAAAAAAAAAAAAAAA/wYAAAAAAAA7IQAAAABQJVUCAAAAAAAAECcAAPIlFxQLCo4YAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAO0g/xcAAJMdAABlDQAAAAAAAKAPAABwF8kaAAAAAAAAAAAeAasZdwQAAKYUlQUAALcjlQUAAAAATREAAAAAAAAAAJki0AfhFiIeRww6GgAAQQd9CQAAAACPAHYcAAAAAAAAAAAvEAAAXwgAALgLiBMAAAAAAACaCgAAAAAAAAAAAAD5EgAAAAAAAAAAAADPHwAAAABSFgAAeyF3BEAf7ggAAEYkKCMjBucbAAAAAAAAAAAAAHcE2xEpCwAAAAAAAAAATRF3BAAANRUAAAAAAAAAAAAAAABBBwAAwxXVJEAf8w0AAAAAZQ0AAAAAHRkAABEPCiIAAAAAAAAAAAAAAABYGwAAAAAAAAAAahIAAIIOAAAAAAAAAACBJgAAAAAAAAUdAAAAAAAAAAAAAAAAAAAAAAAAdwQAAAAAAABeIAAAAABjJXcEAAAAAAAAECcAAPolExSuCPUYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABghahgAANcdAAB6DAAAAAAAAHISAADfFyAbAAAAAAAAAAAsAgsamAcAAJ4U+AUAAM8j+AUAAAAAXBEAAAAAAAAAALkiegzJFngfRxCWGgAADgeuCAAAAAAAAMEcAAAAAAAAAACmDgAAMQ8AAJANKRUAAE8KAAA5CQAAAAAsAgAAAACIEwAAAAAAAAAAAADtHgAAAABUFwAAoyHMA40gxAkAAOQkRCP4BasbAAAAAAAAAAAAAMwDiBNlCwAAAAAAAAAA0hAsAgAAtBUAAAAAAAAAAAAAAACDBgAAPhZaJGIeBQ0AAAAA2goAAAAAgBkAABsOLiIAAAAAAACLAAAAAAA2HAAAAAAAAAAA5xEAAEcQAAAAAAAAAACFJgAAAAAAAEwdAAAAAAAAAAAAAAAAAAAAAAAAzAMAAAAAAAACIAAAAABvJfgFAAAAAAAAECcAAAkmBBNACbMZkgIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGkhLxkAAFMeAABWDIsBAAAAAJYVAACsGMEbAAAAAAAAAACSAroaSAoAAAwUJAUAAPsjrwYAAAAA7w8AAAAAAAAAAPMiiBOlF2EgpRc+GwAAtgfLCgAAAADhDUwdAAAAAAAAAABkDgAA/REAAOgOnRYAAJYVAABICgAAAACvBgAAAACBEgAAAAAAAAAAAADXHgAAAAB6EQAA7CEkBeUgvQgAAAIldyOvBkUcAAAAAAAAAAAAACQFjxRdDQAAAAAAAAAA9hCZA4QAGhYAAAAAAAAAAAAAAAAyBwAAKBh+JN4f0gsAAAAATwsAAAAANxoAAF0NcCIAAAAAAACLAQAAAADIHAAAAAAAAAAA9hAAAGsPAAAAAAAAAACMJgAAAAAAANAdAAAAAAAAAAAAAAAAAAAAAAAAmQMAAAAAAABaHwAAAACFJTkIAAAAAAAAECcAAAwmxRKnCt8ZEwUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP0h3BgAAPIeAAA4DxMFAAAAAFYXAABaGGkcAAAAAAAAAAATBWUbqwsAAEcTFgYAAIcknAcAAAAAQBEAAAAAAAAAAIMjUhZPFXshXhnnGwAAIgkxDQAAAACGAe4dAAAAAAAAAAA4DwAAyRMAAEAR1BYAANgXAACnCgAAAAAeCAAAAABDEgAAAAAAAAAAAAB0HwAAAADjGgAAASMWBvogKQsAAIYBBSScB+scAAAAAAAAAAAAAJgGMQ26DwAAAAAAAAAASxQTBQcCzRQAAIYBAAAAAAAAAACgCAAA0BUJJXggsg0AAAAALQwAAAAAYRoAADgPASMAAAAAAACJAgAAAABsHQAAAAAAAAAAwREAADwQAAAAAAAAAACOJgAAAAAAAHAeAAAAAAAAAAAAAAAAAAAAAAAAEwUAAAAAAAD2HwAAAACKJaQJAAAAAAAAECcAABYmCxM7C2QZ6AMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC4i5xh3AUAfAACgD1kGAAAAAHAXAABqGM8cAAAAAAAAAABlBNUbLw0AAIgTWQYAAJ8kTQgAAAAAmhAAAAAAAAAAACIk7Rf/FDQh0AdSHAAAQQopDgAAAADuAkYeQQoAAAAAAACmDgAAghQAABES8xYAAOEZAAC+CgAAAABHCQAAAACOEgAAAAAAAAAAAAC9HwAAAADbGgAAqyJZBrEhNQwAAHcBpSPQB0wdAAAAAO4CAAAAANAHfBUdEAAAAAAAAAAA+RVYG+4CBRQAAHcBAAAAAAAAAABHCQAAdhYcJbcgrA0AAAAALw0AAAAAXhoAACMPKCMAAAAAAABZBgAAAADJHQAAAAAAAAAAlBEAABcRAAAAAAAAAACTJgAAAAAAAMMeAAAAAAAAAAAAAAAAAAAAAAAA6AMAAAAAAAA6IAAAAACZJbgLAAAAAAAAECcAABMmyhLkCbkY9wIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKAhOxj3AioeAABUD+8FAAAAAL8WAAC8F7EbAAAAAAAAAAB2A7YZXQwAAEkT8gQAABkk6QcAAAAAURAAAAAAAAAAAJojPRdGFKIgqB4yGwAA5ghXDgAAAAAAACwd4QoAAAAAAABXDgAAxBQAAM0RQBYAAH8AAABlCQAAAABoCAAAAABMEgAAAAAAAAAAAAAnHwAAAAA1GgAAHiLyBCEhXwsAABYlmiNuBi8cAAAAAPoBAAAAAOwGWg3TDwAAAAAAAAAAwhWzGvoBxxMAAPoBAAAAAAAAAADpBwAAQxWXJCQg2wwAAAAA3gsAAAAAOBkAANUOnSIAAAAAAADvBQAAAACuHAAAAAAAAAAA0BAAAE4RAAAAAAAAAACRJgAAAAAAAKsdAAAAAAAAAAAAAAAAAAAAAAAA8gQAAAAAAAClHwAAAACUJWIKAAAAAAAA"};
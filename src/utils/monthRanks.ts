@@ -0,0 +1,120 @@
+/**
+ * Per-month rank and percentile tables precomputed at build time
+ * (src/data/monthlyRanks.ts, generated by `python3 -m sitegen ranks`)
+ *
+ * Every table is a month-major Uint16Array: entry `month * facilityCount + position`,
+ * where position is the facility's index in OptimizedMonthlyData.facilities.
+ */
+
+import type { OptimizedMonthlyData, MonthlyFacilityData } from './monthlyDataUtils';
+
+export interface MonthRankData {
+  v: number;        // version
+  m: string[];      // months, same order as OptimizedMonthlyData.meta.m
+  ids: number[];    // facility ids, same order as OptimizedMonthlyData.facilities
+  order: string;    // base64 uint16: facility positions by population, largest first
+  rank: string;     // base64 uint16: 1-based rank, 0 when the facility was empty
+  pct: string;      // base64 uint16: percentile in basis points, 0 when empty
+}
+
+export interface MonthRankTables {
+  months: string[];
+  facilityCount: number;
+  order: Uint16Array;
+  rank: Uint16Array;
+  pct: Uint16Array;
+}
+
+export interface FacilityMonthRank {
+  rank: number;       // 1 = largest population that month
+  percentile: number; // 0-100
+}
+
+/**
+ * Decode a base64 little-endian uint16 array
+ */
+function decodeUint16(encoded: string): Uint16Array {
+  const binary = atob(encoded);
+  const values = new Uint16Array(binary.length >> 1);
+  for (let i = 0; i < values.length; i++) {
+    values[i] = binary.charCodeAt(2 * i) | (binary.charCodeAt(2 * i + 1) << 8);
+  }
+  return values;
+}
+
+const decoded = new WeakMap<MonthRankData, MonthRankTables>();
+
+/**
+ * Decoded tables (decoded once per data object)
+ */
+export function getMonthRankTables(data: MonthRankData): MonthRankTables {
+  let tables = decoded.get(data);
+  if (!tables) {
+    tables = {
+      months: data.m,
+      facilityCount: data.ids.length,
+      order: decodeUint16(data.order),
+      rank: decodeUint16(data.rank),
+      pct: decodeUint16(data.pct)
+    };
+    decoded.set(data, tables);
+  }
+  return tables;
+}
+
+/**
+ * Rank and percentile of a facility (by position) in a month, or null if it was empty
+ */
+export function getFacilityRankForMonth(
+  ranks: MonthRankData,
+  monthYear: string,
+  position: number
+): FacilityMonthRank | null {
+  const tables = getMonthRankTables(ranks);
+  const monthIndex = tables.months.indexOf(monthYear);
+  if (monthIndex === -1 || position < 0 || position >= tables.facilityCount) {
+    return null;
+  }
+
+  const k = monthIndex * tables.facilityCount + position;
+  if (tables.rank[k] === 0) {
+    return null;
+  }
+  return { rank: tables.rank[k], percentile: tables.pct[k] / 100 };
+}
+
+/**
+ * Top facilities for a month, read straight from the precomputed order table
+ */
+export function getTopFacilitiesFromRanks(
+  data: OptimizedMonthlyData,
+  ranks: MonthRankData,
+  monthYear: string,
+  limit: number = 10
+): MonthlyFacilityData[] {
+  const tables = getMonthRankTables(ranks);
+  const monthIndex = tables.months.indexOf(monthYear);
+  if (monthIndex === -1) {
+    console.warn(`Month ${monthYear} not found in rank tables`);
+    return [];
+  }
+
+  const base = monthIndex * tables.facilityCount;
+  const top: MonthlyFacilityData[] = [];
+  for (let i = 0; i < tables.facilityCount && top.length < limit; i++) {
+    const position = tables.order[base + i];
+    if (tables.rank[base + position] === 0) {
+      break; // the rest of the month's order is empty facilities
+    }
+    const facility = data.facilities[position];
+    top.push({
+      id: facility.i,
+      name: facility.n,
+      latitude: facility.lat,
+      longitude: facility.lng,
+      address: facility.a,
+      population_count: data.data[facility.x][monthIndex]
+    });
+  }
+  return top;
+}
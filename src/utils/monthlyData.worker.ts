@@ -0,0 +1,19 @@
+/**
+ * Web Worker that owns the monthly dataset: the data module is evaluated and
+ * decoded here, and per-month buffers are transferred back to the page
+ */
+
+import { handleMonthlyDataRequest } from './monthlyDataHandler';
+import type { MonthlyDataRequest, MonthlyDataResponse } from './monthlyDataClient';
+
+self.onmessage = (event: MessageEvent<MonthlyDataRequest>) => {
+  const request = event.data;
+  try {
+    const { result, transfer } = handleMonthlyDataRequest(request);
+    const response: MonthlyDataResponse = { id: request.id, result };
+    self.postMessage(response, { transfer });
+  } catch (err) {
+    const response: MonthlyDataResponse = { id: request.id, error: (err as Error).message };
+    self.postMessage(response);
+  }
+};
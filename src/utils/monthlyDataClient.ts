@@ -0,0 +1,188 @@
+/**
+ * Async facade over the monthly dataset. The data is loaded and decoded in a
+ * dedicated worker (src/utils/monthlyData.worker.ts) so parsing it never
+ * blocks first input; per-month typed arrays arrive as transferred buffers.
+ */
+
+import {
+  lruGet,
+  type MonthAttributes,
+  type MonthlyFacilityData,
+  type OptimizedMonthlyData
+} from './monthlyDataUtils';
+
+export interface MonthSnapshot {
+  month: string;
+  facilities: MonthlyFacilityData[];
+  topFacilities: MonthlyFacilityData[];
+  totalPopulation: number;
+  attributes: MonthAttributes;
+}
+
+export type MonthlyDataRequest =
+  | { id: number; type: 'meta' }
+  | { id: number; type: 'data' }
+  | { id: number; type: 'month'; month: string; topLimit: number };
+
+export interface MonthlyDataResponse {
+  id: number;
+  result?: unknown;
+  error?: string;
+}
+
+type RequestBody<T> = T extends unknown ? Omit<T, 'id'> : never;
+
+interface PendingRequest {
+  resolve: (result: unknown) => void;
+  reject: (error: Error) => void;
+}
+
+export class MonthlyDataClient {
+  private worker: Worker | null;
+  private readonly pending = new Map<number, PendingRequest>();
+  private readonly snapshots = new Map<string, Promise<MonthSnapshot>>();
+  private readonly cacheSize: number;
+  private nextId = 0;
+  private meta: Promise<OptimizedMonthlyData['meta']> | null = null;
+  private data: Promise<OptimizedMonthlyData> | null = null;
+
+  constructor(cacheSize: number = 12) {
+    this.cacheSize = cacheSize;
+    this.worker = typeof Worker === 'undefined'
+      ? null
+      : new Worker(new URL('./monthlyData.worker.ts', import.meta.url), { type: 'module' });
+    this.worker?.addEventListener('message', (event: MessageEvent<MonthlyDataResponse>) => {
+      this.settle(event.data);
+    });
+    this.worker?.addEventListener('error', (event: Event) => {
+      this.fail(event instanceof ErrorEvent && event.message ? `failed: ${event.message}` : 'failed to load');
+    });
+    this.worker?.addEventListener('messageerror', () => {
+      this.fail('sent a message that could not be deserialized');
+    });
+  }
+
+  /**
+   * The worker failed to load, threw or sent an unreadable message: reject
+   * what is in flight (the caches drop failed entries, so callers can retry)
+   * and serve later requests on the main thread
+   */
+  private fail(reason: string): void {
+    this.worker?.terminate();
+    this.worker = null;
+    this.rejectPending(`Monthly data worker ${reason}`);
+  }
+
+  private rejectPending(message: string): void {
+    for (const request of this.pending.values()) {
+      request.reject(new Error(message));
+    }
+    this.pending.clear();
+  }
+
+  private settle(response: MonthlyDataResponse): void {
+    const request = this.pending.get(response.id);
+    if (!request) {
+      return;
+    }
+    this.pending.delete(response.id);
+    if (response.error !== undefined) {
+      request.reject(new Error(response.error));
+    } else {
+      request.resolve(response.result);
+    }
+  }
+
+  private request<T>(body: RequestBody<MonthlyDataRequest>): Promise<T> {
+    const request = { ...body, id: this.nextId++ } as MonthlyDataRequest;
+    if (!this.worker) {
+      // No worker support: decode on the main thread, still loaded lazily
+      return import('./monthlyDataHandler').then(({ handleMonthlyDataRequest }) =>
+        handleMonthlyDataRequest(request).result as T
+      );
+    }
+    const worker = this.worker;
+    return new Promise<unknown>((resolve, reject) => {
+      this.pending.set(request.id, { resolve, reject });
+      worker.postMessage(request);
+    }) as Promise<T>;
+  }
+
+  /**
+   * Dataset metadata (months, latest month, facility count)
+   */
+  getMeta(): Promise<OptimizedMonthlyData['meta']> {
+    if (!this.meta) {
+      this.meta = this.request({ type: 'meta' });
+      this.meta.catch(() => {
+        this.meta = null;
+      });
+    }
+    return this.meta;
+  }
+
+  /**
+   * Facilities, top facilities, total and deck.gl attributes for one month.
+   * Recently viewed months are kept, so scrubbing back costs no round trip.
+   */
+  getMonth(monthYear: string, topLimit: number = 8): Promise<MonthSnapshot> {
+    const key = `${monthYear}:${topLimit}`;
+    return lruGet(this.snapshots, key, this.cacheSize, () => {
+      const snapshot = this.request<MonthSnapshot>({ type: 'month', month: monthYear, topLimit });
+      // A failed month should be retried next time, not served from cache
+      snapshot.catch(() => this.snapshots.delete(key));
+      return snapshot;
+    });
+  }
+
+  /**
+   * The full dataset, for the synchronous helpers in monthlyDataUtils.ts
+   * (structured-cloned out of the worker once)
+   */
+  getData(): Promise<OptimizedMonthlyData> {
+    if (!this.data) {
+      this.data = this.request({ type: 'data' });
+      this.data.catch(() => {
+        this.data = null;
+      });
+    }
+    return this.data;
+  }
+
+  terminate(): void {
+    this.worker?.terminate();
+    this.rejectPending('Monthly data worker terminated');
+  }
+}
+
+let sharedClient: MonthlyDataClient | null = null;
+
+/**
+ * Client shared by every component (one worker per page)
+ */
+export function getMonthlyDataClient(): MonthlyDataClient {
+  sharedClient ??= new MonthlyDataClient();
+  return sharedClient;
+}
+
+/**
+ * Async counterparts of the monthlyDataUtils.ts month helpers
+ */
+export async function getFacilitiesForMonthAsync(monthYear: string): Promise<MonthlyFacilityData[]> {
+  return (await getMonthlyDataClient().getMonth(monthYear)).facilities;
+}
+
+export async function getTopFacilitiesForMonthAsync(
+  monthYear: string,
+  limit: number = 10
+): Promise<MonthlyFacilityData[]> {
+  return (await getMonthlyDataClient().getMonth(monthYear, limit)).topFacilities;
+}
+
+export async function getTotalPopulationForMonthAsync(monthYear: string): Promise<number> {
+  return (await getMonthlyDataClient().getMonth(monthYear)).totalPopulation;
+}
+
+export async function getAvailableMonthsAsync(): Promise<string[]> {
+  return (await getMonthlyDataClient().getMeta()).m;
+}
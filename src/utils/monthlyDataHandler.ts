@@ -0,0 +1,55 @@
+/**
+ * Request handling for the monthly dataset. Runs inside the monthly data
+ * worker (or, where workers are unavailable, lazily on the main thread), so
+ * the embedded data module is parsed and decoded off the critical path.
+ */
+
+import { monthlyFacilitiesData } from '../data/monthlyFacilitiesData';
+import { monthlyRanks } from '../data/monthlyRanks';
+import { MonthlyDataAccessor } from './monthlyDataUtils';
+import { getTopFacilitiesFromRanks } from './monthRanks';
+import type { MonthlyDataRequest, MonthSnapshot } from './monthlyDataClient';
+
+const accessor = new MonthlyDataAccessor(monthlyFacilitiesData);
+
+export interface HandledRequest {
+  result: unknown;
+  transfer: Transferable[];
+}
+
+/**
+ * Everything the map needs for one month. Typed arrays are copied out of
+ * the accessor's cache so their buffers can be transferred.
+ */
+function monthSnapshot(month: string, topLimit: number): HandledRequest {
+  const attributes = accessor.getAttributes(month);
+  if (!attributes) {
+    throw new Error(`Month ${month} not found in available months`);
+  }
+
+  const snapshot: MonthSnapshot = {
+    month,
+    facilities: accessor.getFacilities(month),
+    topFacilities: getTopFacilitiesFromRanks(monthlyFacilitiesData, monthlyRanks, month, topLimit),
+    totalPopulation: accessor.getTotalPopulation(month),
+    attributes: {
+      length: attributes.length,
+      positions: attributes.positions.slice(),
+      weights: attributes.weights.slice(),
+      facilityIndex: attributes.facilityIndex.slice()
+    }
+  };
+  const { positions, weights, facilityIndex } = snapshot.attributes;
+  return { result: snapshot, transfer: [positions.buffer, weights.buffer, facilityIndex.buffer] };
+}
+
+export function handleMonthlyDataRequest(request: MonthlyDataRequest): HandledRequest {
+  switch (request.type) {
+    case 'meta':
+      return { result: monthlyFacilitiesData.meta, transfer: [] };
+    case 'data':
+      return { result: monthlyFacilitiesData, transfer: [] };
+    case 'month':
+      return monthSnapshot(request.month, request.topLimit);
+  }
+}
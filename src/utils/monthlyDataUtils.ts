@@ -8,6 +8,7 @@ export interface OptimizedFacility {
   lat: number;  // latitude
   lng: number;  // longitude
   a: string;    // address
+  x: number;    // dense index into data, stable across exports (sitegen/ids.py)
 }
 
 export interface OptimizedMonthlyData {
@@ -18,9 +19,236 @@ export interface OptimizedMonthlyData {
     m: string[];         // available months
     l: string;           // latest month
     d: string;           // description
+    s?: MonthScale[];    // per-month color scales, same order as m
+    o?: string;          // facility order ('hilbert' or 'zorder'), absent for source order
+    g?: TileRanges;      // tile -> facility position ranges, for curve-ordered data
   };
   facilities: OptimizedFacility[];
-  data: Record<number, number[]>; // facility_id -> population array
+  data: number[][];     // dense index (facility.x) -> population array
+  csr?: MonthCsrData;   // month-major copy of the non-zero populations
+}
+
+/**
+ * Color-scale summary of one month's non-zero populations, precomputed by
+ * sitegen/scales.py
+ */
+export interface MonthScale {
+  n: number;      // facilities with a non-zero population
+  min: number;
+  max: number;
+  q: number[];    // quantile breakpoints between the heatmap's color classes
+  h: number[];    // log2 histogram: h[k] counts populations in [2^k, 2^(k+1))
+}
+
+/**
+ * Coarse spatial index of curve-ordered facilities (sitegen/spatial.py):
+ * t is a flat [x, y, start, end, ...] list of the Web Mercator tiles at zoom
+ * z that hold facilities, with the range [start, end) of their positions in
+ * `facilities`
+ */
+export interface TileRanges {
+  z: number;
+  t: number[];
+}
+
+/**
+ * Month-major compressed sparse rows, as exported by sitegen/series.py.
+ * Entries for month m are f[o[m]..o[m + 1]) (facility positions in
+ * `facilities`, ascending) and p[o[m]..o[m + 1]) (populations). In encoded
+ * data f and p are base64 varint streams (position gaps within each month,
+ * zig-zag populations).
+ */
+export interface MonthCsrData {
+  o: number[];
+  f: number[] | string;
+  p: number[] | string;
+}
+
+export interface MonthCsr {
+  offsets: number[];
+  positions: Uint32Array;
+  populations: Int32Array;
+}
+
+export interface MonthSlice {
+  positions: Uint32Array;   // facility positions with a non-zero population
+  populations: Int32Array;  // their populations
+}
+
+/**
+ * Optimized data with each series delta encoded (meta.e === 'zz-delta-varint'):
+ * base64 of zig-zag LEB128 varint month-to-month deltas, trailing zero deltas
+ * dropped. Produced by sitegen/series.py.
+ */
+export interface EncodedMonthlyData {
+  meta: OptimizedMonthlyData['meta'] & { e: string };
+  facilities: OptimizedFacility[];
+  data: string[];   // dense index (facility.x) -> encoded series
+  csr?: MonthCsrData;
+}
+
+const DELTA_ENCODING = 'zz-delta-varint';
+
+const BASE64_ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/';
+const BASE64_VALUES = new Int8Array(128).fill(-1);
+for (let i = 0; i < BASE64_ALPHABET.length; i++) {
+  BASE64_VALUES[BASE64_ALPHABET.charCodeAt(i)] = i;
+}
+
+/**
+ * Stream unsigned varints straight from base64 text: sextets feed a varint
+ * state machine byte by byte, with no intermediate byte buffer
+ */
+function readVarints(encoded: string, emit: (value: number) => void): void {
+  let varint = 0;
+  let shift = 0;
+  let bits = 0;
+  let bitCount = 0;
+
+  for (let i = 0; i < encoded.length; i++) {
+    const sextet = BASE64_VALUES[encoded.charCodeAt(i)];
+    if (sextet < 0) {
+      break; // '=' padding
+    }
+    bits = ((bits << 6) | sextet) & 0xffff;
+    bitCount += 6;
+    if (bitCount < 8) {
+      continue;
+    }
+    bitCount -= 8;
+    const byte = (bits >> bitCount) & 0xff;
+
+    varint += (byte & 0x7f) * 2 ** shift;
+    if (byte & 0x80) {
+      shift += 7;
+      continue;
+    }
+    emit(varint);
+    varint = 0;
+    shift = 0;
+  }
+}
+
+/**
+ * Zig-zag: even -> non-negative, odd -> negative
+ */
+function unzigzag(value: number): number {
+  return value % 2 === 0 ? value / 2 : -(value + 1) / 2;
+}
+
+/**
+ * Decode one delta-encoded series to `length` monthly values
+ */
+export function decodeSeries(encoded: string, length: number): number[] {
+  const values = new Array<number>(length);
+  let count = 0;
+  let value = 0;
+  readVarints(encoded, delta => {
+    value += unzigzag(delta);
+    if (count < length) {
+      values[count++] = value;
+    }
+  });
+
+  // Trailing months without a change repeat the last value
+  values.fill(value, count);
+  return values;
+}
+
+/**
+ * Expand delta-encoded series into plain arrays (plain data passes through)
+ */
+export function decodeMonthlyData(data: OptimizedMonthlyData | EncodedMonthlyData): OptimizedMonthlyData {
+  if ((data.meta as EncodedMonthlyData['meta']).e !== DELTA_ENCODING) {
+    return data as OptimizedMonthlyData;
+  }
+
+  const length = data.meta.m.length;
+  const series = (data as EncodedMonthlyData).data.map(encoded => decodeSeries(encoded, length));
+  return { meta: data.meta, facilities: data.facilities, data: series, csr: data.csr };
+}
+
+/**
+ * Unpack the exported month-major layout
+ */
+function unpackCsr(csr: MonthCsrData): MonthCsr {
+  const offsets = csr.o;
+  const total = offsets[offsets.length - 1];
+  const positions = new Uint32Array(total);
+  const populations = new Int32Array(total);
+
+  if (typeof csr.f === 'string') {
+    // Position gaps restart at every month boundary
+    let n = 0;
+    let month = 0;
+    let position = 0;
+    readVarints(csr.f, gap => {
+      while (n === offsets[month + 1]) {
+        month++;
+        position = 0;
+      }
+      position += gap;
+      positions[n++] = position;
+    });
+  } else {
+    positions.set(csr.f);
+  }
+
+  if (typeof csr.p === 'string') {
+    let n = 0;
+    readVarints(csr.p, value => {
+      populations[n++] = unzigzag(value);
+    });
+  } else {
+    populations.set(csr.p);
+  }
+
+  return { offsets, positions, populations };
+}
+
+/**
+ * Build the month-major layout from the per-facility series (data exported
+ * without one)
+ */
+function buildCsr(data: OptimizedMonthlyData): MonthCsr {
+  const offsets = [0];
+  const positions: number[] = [];
+  const populations: number[] = [];
+  for (let month = 0; month < data.meta.m.length; month++) {
+    data.facilities.forEach((facility, position) => {
+      const population = data.data[facility.x]?.[month];
+      if (population) {
+        positions.push(position);
+        populations.push(population);
+      }
+    });
+    offsets.push(positions.length);
+  }
+  return { offsets, positions: Uint32Array.from(positions), populations: Int32Array.from(populations) };
+}
+
+const csrCache = new WeakMap<OptimizedMonthlyData, MonthCsr>();
+
+/**
+ * Month-major layout of the non-zero populations (unpacked once per data object)
+ */
+export function getMonthCsr(data: OptimizedMonthlyData): MonthCsr {
+  let csr = csrCache.get(data);
+  if (!csr) {
+    csr = data.csr ? unpackCsr(data.csr) : buildCsr(data);
+    csrCache.set(data, csr);
+  }
+  return csr;
+}
+
+/**
+ * Non-zero entries of one month as contiguous views (no copying)
+ */
+export function getMonthSlice(data: OptimizedMonthlyData, monthIndex: number): MonthSlice {
+  const { offsets, positions, populations } = getMonthCsr(data);
+  const start = offsets[monthIndex];
+  const end = offsets[monthIndex + 1];
+  return { positions: positions.subarray(start, end), populations: populations.subarray(start, end) };
 }
 
 export interface MonthlyFacilityData {
@@ -45,25 +273,91 @@ export function getFacilitiesForMonth(
     return [];
   }
 
-  const facilities: MonthlyFacilityData[] = [];
-  
-  for (const facility of data.facilities) {
-    const populationData = data.data[facility.i];
-    if (populationData && populationData[monthIndex] > 0) {
-      facilities.push({
-        id: facility.i,
-        name: facility.n,
-        latitude: facility.lat,
-        longitude: facility.lng,
-        address: facility.a,
-        population_count: populationData[monthIndex]
-      });
-    }
+  const { positions, populations } = getMonthSlice(data, monthIndex);
+  const facilities = new Array<MonthlyFacilityData>(positions.length);
+  for (let i = 0; i < positions.length; i++) {
+    const facility = data.facilities[positions[i]];
+    facilities[i] = {
+      id: facility.i,
+      name: facility.n,
+      latitude: facility.lat,
+      longitude: facility.lng,
+      address: facility.a,
+      population_count: populations[i]
+    };
   }
 
   return facilities;
 }
 
+/**
+ * Precomputed color scale for a month (null for data exported without scales)
+ */
+export function getMonthScale(meta: OptimizedMonthlyData['meta'], monthYear: string): MonthScale | null {
+  const monthIndex = meta.m.indexOf(monthYear);
+  return monthIndex === -1 ? null : meta.s?.[monthIndex] ?? null;
+}
+
+/**
+ * [min, max] of a month's facility populations without scanning them: a
+ * domain for per-facility color scales. It does not fit HeatmapLayer's
+ * colorDomain, which applies to aggregated per-pixel weights.
+ */
+export function getColorDomain(
+  meta: OptimizedMonthlyData['meta'],
+  monthYear: string
+): [number, number] | undefined {
+  const scale = getMonthScale(meta, monthYear);
+  return scale && scale.n > 0 ? [scale.min, scale.max] : undefined;
+}
+
+/**
+ * Web Mercator tile containing a coordinate at a zoom level
+ */
+function tileOf(lng: number, lat: number, zoom: number): [number, number] {
+  const size = 2 ** zoom;
+  const clamped = Math.max(-85.05112878, Math.min(85.05112878, lat));
+  const sinLat = Math.sin(clamped * Math.PI / 180);
+  const x = (lng + 180) / 360;
+  const y = 0.5 - Math.log((1 + sinLat) / (1 - sinLat)) / (4 * Math.PI);
+  return [
+    Math.min(size - 1, Math.max(0, Math.floor(x * size))),
+    Math.min(size - 1, Math.max(0, Math.floor(y * size)))
+  ];
+}
+
+/**
+ * Facility position ranges [start, end) for the tiles overlapping a
+ * [west, south, east, north] view, or null for data without a tile table
+ * (every facility then has to be checked)
+ */
+export function getFacilityRangesInView(
+  meta: OptimizedMonthlyData['meta'],
+  bounds: [number, number, number, number]
+): [number, number][] | null {
+  if (!meta.g) {
+    return null;
+  }
+  const [west, south, east, north] = bounds;
+  const [minX, minY] = tileOf(west, north, meta.g.z);
+  const [maxX, maxY] = tileOf(east, south, meta.g.z);
+  const ranges: [number, number][] = [];
+  const tiles = meta.g.t;
+  for (let i = 0; i < tiles.length; i += 4) {
+    const x = tiles[i];
+    const y = tiles[i + 1];
+    if (x >= minX && x <= maxX && y >= minY && y <= maxY) {
+      const last = ranges[ranges.length - 1];
+      if (last && last[1] === tiles[i + 2]) {
+        last[1] = tiles[i + 3];  // adjacent runs along the curve merge
+      } else {
+        ranges.push([tiles[i + 2], tiles[i + 3]]);
+      }
+    }
+  }
+  return ranges;
+}
+
 /**
  * Get all available months from optimized data
  */
@@ -85,7 +379,23 @@ export function getFacilityCountForMonth(
   data: OptimizedMonthlyData,
   monthYear: string
 ): number {
-  return getFacilitiesForMonth(data, monthYear).length;
+  const monthIndex = data.meta.m.indexOf(monthYear);
+  return monthIndex === -1 ? 0 : getMonthSlice(data, monthIndex).positions.length;
+}
+
+const denseIndexCache = new WeakMap<OptimizedMonthlyData, Map<number, number>>();
+
+/**
+ * Dense index of a facility id, or -1 (use facility.x when the facility
+ * record is at hand)
+ */
+export function getDenseIndex(data: OptimizedMonthlyData, facilityId: number): number {
+  let indices = denseIndexCache.get(data);
+  if (!indices) {
+    indices = new Map(data.facilities.map(facility => [facility.i, facility.x]));
+    denseIndexCache.set(data, indices);
+  }
+  return indices.get(facilityId) ?? -1;
 }
 
 /**
@@ -95,7 +405,7 @@ export function getFacilityTrend(
   data: OptimizedMonthlyData,
   facilityId: number
 ): { month: string; population: number }[] {
-  const populationData = data.data[facilityId];
+  const populationData = data.data[getDenseIndex(data, facilityId)];
   if (!populationData) {
     return [];
   }
@@ -136,7 +446,7 @@ export function getFacilitiesWithChanges(
   }[] = [];
 
   for (const facility of data.facilities) {
-    const populationData = data.data[facility.i];
+    const populationData = data.data[facility.x];
     if (populationData) {
       const fromPopulation = populationData[fromIndex] || 0;
       const toPopulation = populationData[toIndex] || 0;
@@ -202,8 +512,16 @@ export function getTotalPopulationForMonth(
   data: OptimizedMonthlyData,
   monthYear: string
 ): number {
-  const facilities = getFacilitiesForMonth(data, monthYear);
-  return facilities.reduce((total, facility) => total + facility.population_count, 0);
+  const monthIndex = data.meta.m.indexOf(monthYear);
+  if (monthIndex === -1) {
+    return 0;
+  }
+  const { populations } = getMonthSlice(data, monthIndex);
+  let total = 0;
+  for (let i = 0; i < populations.length; i++) {
+    total += populations[i];
+  }
+  return total;
 }
 
 /**
@@ -219,6 +537,135 @@ export function validateOptimizedData(data: any): data is OptimizedMonthlyData {
     Array.isArray(data.meta.m) &&
     typeof data.meta.l === 'string' &&
     Array.isArray(data.facilities) &&
-    typeof data.data === 'object'
+    Array.isArray(data.data)
   );
 }
+
+/**
+ * Per-month binary attributes for deck.gl layers (structure of arrays)
+ */
+export interface MonthAttributes {
+  length: number;
+  positions: Float32Array;     // [lng, lat] pairs, for getPosition (size 2)
+  weights: Float32Array;       // populations, for getWeight (size 1)
+  facilityIndex: Uint32Array;  // positions in data.facilities, for picking
+}
+
+/**
+ * Read-through LRU lookup: Map iteration order doubles as recency order
+ */
+export function lruGet<K, V>(cache: Map<K, V>, key: K, capacity: number, build: () => V): V {
+  let value = cache.get(key);
+  if (value !== undefined) {
+    cache.delete(key);
+  } else {
+    value = build();
+    if (cache.size >= capacity) {
+      cache.delete(cache.keys().next().value as K);
+    }
+  }
+  cache.set(key, value);
+  return value;
+}
+
+/**
+ * Prepared, memoized access to one monthly dataset for scrubbing through
+ * months: month lookup is a map hit and recently viewed months are served
+ * from an LRU cache instead of being rebuilt on every slider tick. Cached
+ * results are shared between callers and must not be mutated.
+ */
+export class MonthlyDataAccessor {
+  readonly data: OptimizedMonthlyData;
+  private readonly cacheSize: number;
+  private readonly monthIndices: Map<string, number>;
+  private readonly coordinates: Float32Array;
+  private readonly facilityCache = new Map<number, MonthlyFacilityData[]>();
+  private readonly attributeCache = new Map<number, MonthAttributes>();
+  private readonly totalCache = new Map<number, number>();
+
+  constructor(data: OptimizedMonthlyData, cacheSize: number = 12) {
+    this.data = data;
+    this.cacheSize = Math.max(1, cacheSize);
+    this.monthIndices = new Map(data.meta.m.map((month, index) => [month, index]));
+
+    // Facility coordinates, laid out once so per-month attributes are a gather
+    this.coordinates = new Float32Array(data.facilities.length * 2);
+    data.facilities.forEach((facility, position) => {
+      this.coordinates[2 * position] = facility.lng;
+      this.coordinates[2 * position + 1] = facility.lat;
+    });
+  }
+
+  /**
+   * Index of a month in meta.m, or -1
+   */
+  monthIndex(monthYear: string): number {
+    return this.monthIndices.get(monthYear) ?? -1;
+  }
+
+  /**
+   * Facilities with a non-zero population in a month (cached)
+   */
+  getFacilities(monthYear: string): MonthlyFacilityData[] {
+    const monthIndex = this.monthIndex(monthYear);
+    if (monthIndex === -1) {
+      return [];
+    }
+    return lruGet(this.facilityCache, monthIndex, this.cacheSize,
+      () => getFacilitiesForMonth(this.data, monthYear));
+  }
+
+  /**
+   * Total population in a month (cached)
+   */
+  getTotalPopulation(monthYear: string): number {
+    const monthIndex = this.monthIndex(monthYear);
+    if (monthIndex === -1) {
+      return 0;
+    }
+    return lruGet(this.totalCache, monthIndex, this.data.meta.m.length,
+      () => getTotalPopulationForMonth(this.data, monthYear));
+  }
+
+  /**
+   * Positions and weights of a month's facilities as typed arrays, ready to
+   * pass to deck.gl as binary attributes (cached). Facilities without valid
+   * coordinates are left out.
+   */
+  getAttributes(monthYear: string): MonthAttributes | null {
+    const monthIndex = this.monthIndex(monthYear);
+    if (monthIndex === -1) {
+      return null;
+    }
+    return lruGet(this.attributeCache, monthIndex, this.cacheSize, () => this.buildAttributes(monthIndex));
+  }
+
+  private buildAttributes(monthIndex: number): MonthAttributes {
+    const slice = getMonthSlice(this.data, monthIndex);
+    const positions = new Float32Array(slice.positions.length * 2);
+    const weights = new Float32Array(slice.positions.length);
+    const facilityIndex = new Uint32Array(slice.positions.length);
+
+    let length = 0;
+    for (let i = 0; i < slice.positions.length; i++) {
+      const position = slice.positions[i];
+      const lng = this.coordinates[2 * position];
+      const lat = this.coordinates[2 * position + 1];
+      if (lng === 0 || lat === 0 || Number.isNaN(lng) || Number.isNaN(lat)) {
+        continue;
+      }
+      positions[2 * length] = lng;
+      positions[2 * length + 1] = lat;
+      weights[length] = slice.populations[i];
+      facilityIndex[length] = position;
+      length++;
+    }
+
+    return {
+      length,
+      positions: positions.subarray(0, 2 * length),
+      weights: weights.subarray(0, length),
+      facilityIndex: facilityIndex.subarray(0, length)
+    };
+  }
+}
@@ -0,0 +1,76 @@
+/**
+ * Fetch single months from the Range-friendly binary monthly file
+ * (public/monthly.bin plus its offset table public/monthly-index.json,
+ * generated by `python3 -m sitegen binary`)
+ */
+
+import type { TileRanges } from './monthlyDataUtils';
+
+export interface MonthlyBinaryIndex {
+  v: number;           // version
+  hash: string;        // content hash of monthly.bin, for cache busting
+  size: number;        // file size in bytes
+  valueSize: number;   // bytes per population (2 or 4)
+  alignment: number;   // every column offset is a multiple of this
+  months: string[];
+  ids: number[];       // facility ids, in column order
+  offsets: number[];   // byte offset of each month's column
+  length: number;      // bytes per column (without padding)
+  tiles?: TileRanges;  // tile -> column index ranges, for curve-ordered exports
+}
+
+export interface MonthColumn {
+  month: string;
+  ids: number[];
+  populations: Uint16Array | Uint32Array;  // one value per facility, same order as ids
+}
+
+/**
+ * Fetch the offset table
+ */
+export async function fetchMonthlyBinaryIndex(url: string = '/monthly-index.json'): Promise<MonthlyBinaryIndex> {
+  const response = await fetch(url);
+  if (!response.ok) {
+    throw new Error(`Failed to load monthly index: ${response.status}`);
+  }
+  return response.json();
+}
+
+/**
+ * Fetch one month's column with a single Range request. Servers that ignore
+ * Range answer 200 with the whole file; the column is sliced out of that.
+ */
+export async function fetchMonthColumn(
+  index: MonthlyBinaryIndex,
+  monthYear: string,
+  url: string = '/monthly.bin'
+): Promise<MonthColumn> {
+  const monthIndex = index.months.indexOf(monthYear);
+  if (monthIndex === -1) {
+    throw new Error(`Month ${monthYear} not found in monthly index`);
+  }
+
+  const start = index.offsets[monthIndex];
+  const end = start + index.length - 1;
+  const response = await fetch(`${url}?v=${index.hash}`, { headers: { Range: `bytes=${start}-${end}` } });
+  if (!response.ok) {
+    throw new Error(`Failed to load ${monthYear} from monthly data: ${response.status}`);
+  }
+
+  let buffer = await response.arrayBuffer();
+  if (response.status !== 206) {
+    buffer = buffer.slice(start, end + 1);
+  }
+
+  // Values are little-endian regardless of the host byte order
+  const count = index.length / index.valueSize;
+  const populations = index.valueSize === 2 ? new Uint16Array(count) : new Uint32Array(count);
+  const view = new DataView(buffer);
+  for (let i = 0; i < count; i++) {
+    populations[i] = index.valueSize === 2
+      ? view.getUint16(2 * i, true)
+      : view.getUint32(4 * i, true);
+  }
+
+  return { month: monthYear, ids: index.ids, populations };
+}
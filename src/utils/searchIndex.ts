@@ -0,0 +1,144 @@
+/**
+ * Search-as-you-type over the build-time facility search index
+ * (public/search-index.json, generated by `python3 -m sitegen search`)
+ */
+
+export interface SearchIndexData {
+  v: number;                          // version
+  docs: [string, string, string, string][]; // [name, city, state, slug ('' without a page)]
+  grams: Record<string, number[]>;    // gram -> delta-encoded document numbers
+}
+
+export interface FacilitySearchResult {
+  name: string;
+  city: string;
+  state: string;
+  slug: string;   // facility page, '' when the facility has none
+}
+
+export interface SearchIndex {
+  docs: SearchIndexData['docs'];
+  postings: Map<string, Int32Array>;
+  tokens: string[][];                 // lowercase tokens per document, for verification
+}
+
+const TOKEN_RE = /[a-z0-9]+/g;
+
+function tokenize(text: string): string[] {
+  return text.toLowerCase().match(TOKEN_RE) ?? [];
+}
+
+/**
+ * Grams a query token must match (mirrors token_grams in sitegen/search.py)
+ */
+function queryGrams(token: string): string[] {
+  const padded = ' ' + token;
+  if (padded.length === 2) {
+    return [padded];
+  }
+  const grams: string[] = [];
+  for (let i = 0; i + 3 <= padded.length; i++) {
+    grams.push(padded.slice(i, i + 3));
+  }
+  return grams;
+}
+
+/**
+ * Decode the delta-encoded posting lists once, up front
+ */
+export function loadSearchIndex(data: SearchIndexData): SearchIndex {
+  const postings = new Map<string, Int32Array>();
+  for (const gram in data.grams) {
+    const deltas = data.grams[gram];
+    const ids = new Int32Array(deltas.length);
+    let value = 0;
+    for (let i = 0; i < deltas.length; i++) {
+      value += deltas[i];
+      ids[i] = value;
+    }
+    postings.set(gram, ids);
+  }
+
+  const tokens = data.docs.map(([name, city, state]) => tokenize(`${name} ${city} ${state}`));
+  return { docs: data.docs, postings, tokens };
+}
+
+/**
+ * Fetch and decode the search index
+ */
+export async function fetchSearchIndex(url: string = '/search-index.json'): Promise<SearchIndex> {
+  const response = await fetch(url);
+  if (!response.ok) {
+    throw new Error(`Failed to load search index: ${response.status}`);
+  }
+  return loadSearchIndex(await response.json());
+}
+
+/**
+ * Intersect two sorted posting lists
+ */
+function intersect(a: Int32Array, b: Int32Array): Int32Array {
+  const out = new Int32Array(Math.min(a.length, b.length));
+  let i = 0;
+  let j = 0;
+  let n = 0;
+  while (i < a.length && j < b.length) {
+    if (a[i] === b[j]) {
+      out[n++] = a[i];
+      i++;
+      j++;
+    } else if (a[i] < b[j]) {
+      i++;
+    } else {
+      j++;
+    }
+  }
+  return out.subarray(0, n);
+}
+
+/**
+ * Find facilities whose name, city or state has a word starting with every
+ * query word. Results keep index order (largest population first).
+ */
+export function searchFacilities(
+  index: SearchIndex,
+  query: string,
+  limit: number = 20
+): FacilitySearchResult[] {
+  const queryTokens = tokenize(query);
+  if (queryTokens.length === 0) {
+    return [];
+  }
+
+  // Gather every gram's postings and intersect shortest-first
+  const lists: Int32Array[] = [];
+  for (const token of queryTokens) {
+    for (const gram of queryGrams(token)) {
+      const ids = index.postings.get(gram);
+      if (!ids) {
+        return [];
+      }
+      lists.push(ids);
+    }
+  }
+  lists.sort((a, b) => a.length - b.length);
+
+  let candidates = lists[0];
+  for (let i = 1; i < lists.length && candidates.length > 0; i++) {
+    candidates = intersect(candidates, lists[i]);
+  }
+
+  // Grams can co-occur without forming the word prefix; verify candidates
+  const results: FacilitySearchResult[] = [];
+  for (let i = 0; i < candidates.length && results.length < limit; i++) {
+    const docId = candidates[i];
+    const docTokens = index.tokens[docId];
+    const matches = queryTokens.every(q => docTokens.some(t => t.startsWith(q)));
+    if (matches) {
+      const [name, city, state, slug] = index.docs[docId];
+      results.push({ name, city, state, slug });
+    }
+  }
+
+  return results;
+}
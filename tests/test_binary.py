@@ -0,0 +1,91 @@
+"""Offset table and column layout of monthly.bin (sitegen/binary.py)"""
+
+import unittest
+
+from sitegen.binary import (
+    DEFAULT_ALIGNMENT, append_monthly_binary, build_monthly_binary, read_header, read_month, verify_monthly_binary,
+)
+
+
+def monthly_data(series, months):
+    """Optimized monthly data with one facility per series"""
+    return {
+        'meta': {'v': 1, 'm': months, 'l': months[-1]},
+        'facilities': [{'i': 100 + k, 'n': f'Facility {k}', 'a': 'Somewhere, TX'} for k in range(len(series))],
+        'data': {str(100 + k): values for k, values in enumerate(series)},
+    }
+
+
+MONTHS = ['2024-01', '2024-02', '2024-03']
+SERIES = [[5, 0, 7], [0, 0, 0], [1200, 1300, 1250], [3]]
+
+
+class BuildTest(unittest.TestCase):
+
+    def setUp(self):
+        self.monthly = monthly_data(SERIES, MONTHS)
+        self.content, self.table = build_monthly_binary(self.monthly)
+
+    def test_columns_are_aligned(self):
+        header = read_header(self.content)
+        self.assertEqual(header['headerLength'] % DEFAULT_ALIGNMENT, 0)
+        for offset in self.table['offsets']:
+            self.assertEqual(offset % DEFAULT_ALIGNMENT, 0)
+        self.assertEqual(len(self.content) % DEFAULT_ALIGNMENT, 0)
+
+    def test_offset_table_matches_header(self):
+        header = read_header(self.content)
+        self.assertEqual(header['offsets'], self.table['offsets'])
+        self.assertEqual(header['months'], MONTHS)
+        self.assertEqual(header['ids'], [100, 101, 102, 103])
+        self.assertEqual(self.table['length'], 4 * self.table['valueSize'])
+        self.assertEqual(self.table['size'], len(self.content))
+
+    def test_round_trip(self):
+        header = read_header(self.content)
+        self.assertEqual([read_month(self.content, header, month) for month in MONTHS],
+                         [[5, 0, 1200, 3], [0, 0, 1300, 0], [7, 0, 1250, 0]])
+        verify_monthly_binary(self.content, self.table, self.monthly)
+
+    def test_value_size_follows_largest_population(self):
+        self.assertEqual(self.table['valueSize'], 2)
+        _, table = build_monthly_binary(monthly_data([[70000]], ['2024-01']))
+        self.assertEqual(table['valueSize'], 4)
+
+    def test_custom_alignment(self):
+        content, table = build_monthly_binary(self.monthly, alignment=4096)
+        self.assertEqual([offset % 4096 for offset in table['offsets']], [0, 0, 0])
+        verify_monthly_binary(content, table, self.monthly)
+
+    def test_alignment_must_be_a_power_of_two(self):
+        with self.assertRaises(ValueError):
+            build_monthly_binary(self.monthly, alignment=48)
+
+    def test_verify_catches_a_changed_value(self):
+        header = read_header(self.content)
+        corrupted = bytearray(self.content)
+        corrupted[header['offsets'][1]] = 9
+        with self.assertRaises(ValueError):
+            verify_monthly_binary(bytes(corrupted), self.table, self.monthly)
+
+
+class AppendTest(unittest.TestCase):
+
+    def test_matches_a_full_build(self):
+        earlier = monthly_data([values[:2] for values in SERIES], MONTHS[:2])
+        content, _ = build_monthly_binary(earlier)
+        monthly = monthly_data(SERIES, MONTHS)
+        self.assertEqual(append_monthly_binary(content, monthly), build_monthly_binary(monthly))
+
+    def test_wider_values_need_a_full_build(self):
+        content, _ = build_monthly_binary(monthly_data([[5]], MONTHS[:1]))
+        self.assertIsNone(append_monthly_binary(content, monthly_data([[5, 70000]], MONTHS[:2])))
+
+    def test_rejects_other_data(self):
+        content, _ = build_monthly_binary(monthly_data([[5]], ['2023-12']))
+        with self.assertRaises(ValueError):
+            append_monthly_binary(content, monthly_data([[5, 6]], MONTHS[:2]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""FlatGeobuf export and its packed Hilbert R-tree (sitegen/geo.py)"""
+
+import math
+import unittest
+
+from sitegen.geo import (
+    INDEX_NODE_SIZE, NODE_ITEM, build_flatgeobuf, build_rtree, facility_features, level_bounds,
+    read_feature, read_flatgeobuf_header, search_rtree, verify_flatgeobuf,
+)
+
+EVERYWHERE = (-math.inf, -math.inf, math.inf, math.inf)
+
+
+def grid_monthly(width, height):
+    """Monthly data with one facility on every point of a lng/lat grid"""
+    months = ['2024-01', '2024-02']
+    facilities, data = [], {}
+    for k in range(width * height):
+        facility_id = 1000 + k
+        facilities.append({'i': facility_id, 'n': f'Facility {k}', 'a': f'{k} Main St, Town, TX 7{k:04d}',
+                           'lng': -120.0 + k % width, 'lat': 30.0 + k // width})
+        data[str(facility_id)] = [k, k * 2]
+    return {'meta': {'v': 1, 'm': months, 'l': months[-1]}, 'facilities': facilities, 'data': data}
+
+
+def nodes(content, header):
+    """Every R-tree node as (min x, min y, max x, max y, offset)"""
+    count = level_bounds(header['count'], header['nodeSize'])[0][1]
+    return [NODE_ITEM.unpack_from(content, header['indexStart'] + NODE_ITEM.size * k) for k in range(count)]
+
+
+class LevelBoundsTest(unittest.TestCase):
+
+    def test_root_first_leaves_last(self):
+        self.assertEqual(level_bounds(40), [(4, 44), (1, 4), (0, 1)])
+
+    def test_single_leaf_still_has_a_root(self):
+        self.assertEqual(level_bounds(1), [(1, 2), (0, 1)])
+
+    def test_full_nodes(self):
+        self.assertEqual(level_bounds(INDEX_NODE_SIZE * INDEX_NODE_SIZE)[-2:], [(1, 1 + INDEX_NODE_SIZE), (0, 1)])
+
+
+class RtreeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.features = facility_features(grid_monthly(8, 5))
+        self.content = build_flatgeobuf(self.features)
+        self.header = read_flatgeobuf_header(self.content)
+
+    def test_parents_cover_their_children(self):
+        tree = nodes(self.content, self.header)
+        bounds = level_bounds(self.header['count'])
+        for (child_start, child_end), (start, end) in zip(bounds, bounds[1:]):
+            for parent in tree[start:end]:
+                children = tree[parent[4]:min(parent[4] + INDEX_NODE_SIZE, child_end)]
+                self.assertTrue(children)
+                self.assertEqual(parent[:4], (min(c[0] for c in children), min(c[1] for c in children),
+                                              max(c[2] for c in children), max(c[3] for c in children)))
+
+    def test_leaves_keep_feature_order(self):
+        offsets = search_rtree(self.content, self.header, EVERYWHERE)
+        decoded = [read_feature(self.content, self.header, offset) for offset in offsets]
+        self.assertEqual([feature['properties'] for feature in decoded],
+                         [feature['properties'] for feature in self.features])
+
+    def test_box_search_matches_a_scan(self):
+        box = (-117.5, 31.0, -114.0, 33.5)
+        offsets = search_rtree(self.content, self.header, box)
+        found = [read_feature(self.content, self.header, offset)['properties']['id'] for offset in offsets]
+        expected = [feature['id'] for feature in self.features
+                    if box[0] <= feature['coordinates'][0] <= box[2] and box[1] <= feature['coordinates'][1] <= box[3]]
+        self.assertEqual(sorted(found), sorted(expected))
+        self.assertEqual(len(found), 4 * 3)
+
+    def test_empty_box_finds_nothing(self):
+        self.assertEqual(search_rtree(self.content, self.header, (0.0, 0.0, 1.0, 1.0)), [])
+
+    def test_verify_round_trip(self):
+        verify_flatgeobuf(self.content, self.features)
+        self.assertEqual(self.header['count'], 40)
+        self.assertEqual(self.header['envelope'], [-120.0, 30.0, -113.0, 34.0])
+
+    def test_build_rtree_directly(self):
+        boxes = [(float(k), 0.0, float(k), 0.0) for k in range(3)]
+        tree = build_rtree(boxes, [0, 10, 20])
+        root = NODE_ITEM.unpack_from(tree, 0)
+        self.assertEqual(root, (0.0, 0.0, 2.0, 0.0, 1))
+        self.assertEqual(len(tree), NODE_ITEM.size * 4)
+
+
+class FlatgeobufTest(unittest.TestCase):
+
+    def test_single_feature(self):
+        features = facility_features(grid_monthly(1, 1))
+        content = build_flatgeobuf(features)
+        verify_flatgeobuf(content, features)
+
+    def test_needs_a_feature(self):
+        with self.assertRaises(ValueError):
+            build_flatgeobuf([])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+"""Stage ordering and the incremental (--since) stage skip (sitegen/scheduler.py)"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from sitegen.manifest import file_digest
+from sitegen.scheduler import Scheduler, Stage
+from sitegen.stages import BuildContext
+
+
+class SchedulerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.source = os.path.join(self.directory, 'source.txt')
+        with open(self.source, 'w') as f:
+            f.write('v1')
+        self.runs = []
+
+    def context(self):
+        return BuildContext(out_dir=os.path.join(self.directory, 'out'),
+                            manifest_path=os.path.join(self.directory, 'manifest.json'), cache=False)
+
+    def stages(self, params=None):
+        def copy(ctx):
+            self.runs.append('copy')
+            path = ctx.output_path('copy.txt')
+            inputs = file_digest(self.source)
+            if ctx.is_stale(path, inputs):
+                with open(self.source) as f:
+                    ctx.write(path, f.read(), inputs)
+
+        def pages(ctx):
+            self.runs.append('pages')
+            for name in ('a.html', 'b.html'):
+                path = ctx.output_path(name)
+                if ctx.is_stale(path, 'pages'):
+                    ctx.write(path, name, 'pages')
+
+        def summary(ctx):
+            self.runs.append('summary')
+            path = ctx.output_path('summary.txt')
+            if ctx.is_stale(path, 'summary'):
+                ctx.write(path, 'summary', 'summary')
+
+        return [
+            Stage('copy', copy, inputs=[self.source], outputs=['copied'], params=params),
+            Stage('pages', pages, inputs=['copied'], outputs=['pages']),
+            Stage('summary', summary, inputs=['pages'], outputs=['summary']),
+        ]
+
+    def build(self, params=None):
+        """Run every stage in a fresh context, as one `--since` invocation does"""
+        self.runs = []
+        ctx = self.context()
+        scheduler = Scheduler(self.stages(params))
+        scheduler.run(ctx, jobs=2)
+        ctx.finish()
+        ctx.writer.close()
+        return scheduler, ctx
+
+    def test_dependencies_run_first(self):
+        self.build()
+        self.assertEqual(self.runs, ['copy', 'pages', 'summary'])
+
+    def test_unchanged_build_skips_every_stage(self):
+        self.build()
+        scheduler, ctx = self.build()
+        self.assertEqual(self.runs, [])
+        self.assertEqual(sorted(scheduler.skipped), ['copy', 'pages', 'summary'])
+        self.assertEqual(ctx.written, [])
+
+    def test_deleted_output_reruns_its_stage(self):
+        self.build()
+        os.remove(os.path.join(self.directory, 'out', 'b.html'))
+        scheduler, ctx = self.build()
+        self.assertEqual(self.runs, ['pages'])
+        self.assertEqual(ctx.written, [os.path.join(self.directory, 'out', 'b.html')])
+        self.assertTrue(os.path.exists(os.path.join(self.directory, 'out', 'b.html')))
+
+    def test_changed_source_reruns_downstream(self):
+        self.build()
+        with open(self.source, 'w') as f:
+            f.write('v2')
+        _, ctx = self.build()
+        self.assertEqual(self.runs, ['copy', 'pages', 'summary'])
+        self.assertEqual(ctx.written, [os.path.join(self.directory, 'out', 'copy.txt')])
+
+    def test_changed_params_rerun_the_stage(self):
+        self.build(params='one')
+        self.build(params='two')
+        self.assertEqual(self.runs, ['copy', 'pages', 'summary'])
+
+    def test_targets_run_with_their_dependencies_only(self):
+        self.runs = []
+        ctx = self.context()
+        Scheduler(self.stages()).run(ctx, ['pages'])
+        ctx.writer.close()
+        self.assertEqual(self.runs, ['copy', 'pages'])
+
+    def test_cycles_are_rejected(self):
+        with self.assertRaises(ValueError):
+            Scheduler([Stage('a', lambda ctx: None, inputs=['y'], outputs=['x']),
+                       Stage('b', lambda ctx: None, inputs=['x'], outputs=['y'])])
+
+
+if __name__ == '__main__':
+    unittest.main()
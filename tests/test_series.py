@@ -0,0 +1,107 @@
+"""Round trips of the zig-zag varint series codec and the month-major CSR
+layout (sitegen/series.py)"""
+
+import unittest
+
+from sitegen.series import (
+    decode_csr, decode_monthly, decode_series, decode_varints, encode_csr, encode_monthly, encode_series,
+    month_csr, unzigzag, zigzag,
+)
+
+
+def monthly_data(series):
+    """Optimized monthly data with one facility per series"""
+    months = [f'2024-{m:02d}' for m in range(1, max((len(values) for values in series), default=0) + 1)]
+    facilities = [{'i': k + 1, 'n': f'Facility {k + 1}', 'a': 'Somewhere, TX'} for k in range(len(series))]
+    return {
+        'meta': {'v': 1, 'm': months, 'l': months[-1] if months else None},
+        'facilities': facilities,
+        'data': {str(k + 1): values for k, values in enumerate(series)},
+    }
+
+
+class ZigzagTest(unittest.TestCase):
+
+    def test_small_magnitudes_interleave(self):
+        self.assertEqual([zigzag(n) for n in (0, -1, 1, -2, 2)], [0, 1, 2, 3, 4])
+
+    def test_round_trip(self):
+        for n in (0, 1, -1, 63, -64, 64, 1 << 40, -(1 << 40)):
+            self.assertEqual(unzigzag(zigzag(n)), n)
+
+
+class SeriesCodecTest(unittest.TestCase):
+
+    def assertRoundTrip(self, values):
+        self.assertEqual(decode_series(encode_series(values), len(values)), values)
+
+    def test_empty_series(self):
+        self.assertEqual(encode_series([]), '')
+        self.assertEqual(decode_series('', 0), [])
+
+    def test_never_populated_series_encodes_empty(self):
+        self.assertEqual(encode_series([0, 0, 0]), '')
+        self.assertRoundTrip([0, 0, 0])
+
+    def test_negative_deltas(self):
+        self.assertRoundTrip([900, 850, 851, 0, 12, 3])
+
+    def test_large_deltas(self):
+        self.assertRoundTrip([0, 70000, 5, 1 << 33])
+
+    def test_trailing_repeats_are_dropped_and_restored(self):
+        values = [4, 7, 7, 7, 7]
+        self.assertEqual(len(decode_varints(encode_series(values))), 2)
+        self.assertRoundTrip(values)
+
+    def test_too_many_values_is_an_error(self):
+        with self.assertRaises(ValueError):
+            decode_series(encode_series([1, 2, 3]), 2)
+
+
+class MonthlyCodecTest(unittest.TestCase):
+
+    def test_round_trip(self):
+        monthly = monthly_data([[5, 3, 0, 9], [], [0, 0, 0, 0], [120, 120, 80, 81]])
+        decoded = decode_monthly(encode_monthly(monthly))
+        # A missing series decodes to zeros over every month
+        self.assertEqual(decoded['data'], {'1': [5, 3, 0, 9], '2': [0, 0, 0, 0], '3': [0, 0, 0, 0],
+                                           '4': [120, 120, 80, 81]})
+        self.assertEqual(decoded['meta'], monthly['meta'])
+
+    def test_plain_data_passes_through(self):
+        monthly = monthly_data([[1, 2]])
+        self.assertIs(decode_monthly(monthly), monthly)
+
+
+class CsrTest(unittest.TestCase):
+
+    def test_month_major_layout(self):
+        monthly = monthly_data([[5, 0, 2], [0, 0, 0], [1, 7]])
+        self.assertEqual(month_csr(monthly), {'o': [0, 2, 3, 4], 'f': [0, 2, 2, 0], 'p': [5, 1, 7, 2]})
+
+    def test_list_data_uses_dense_index(self):
+        monthly = monthly_data([[5, 0], [0, 3]])
+        monthly['facilities'][0]['x'], monthly['facilities'][1]['x'] = 1, 0
+        monthly['data'] = [[0, 3], [5, 0]]
+        self.assertEqual(month_csr(monthly), {'o': [0, 1, 2], 'f': [0, 1], 'p': [5, 3]})
+
+    def test_round_trip(self):
+        monthly = monthly_data([[300, 0, 2, 0], [0, 0, 0, 0], [1, 70000, 0, 9], [0, 4, 4, 4]])
+        csr = month_csr(monthly)
+        self.assertEqual(decode_csr(encode_csr(csr)), csr)
+
+    def test_positions_restart_every_month(self):
+        # Gaps are relative to the month's first entry, so a later month can start low again
+        csr = {'o': [0, 2, 3], 'f': [3, 9, 1], 'p': [1, 1, 1]}
+        self.assertEqual(decode_varints(encode_csr(csr)['f']), [3, 6, 1])
+        self.assertEqual(decode_csr(encode_csr(csr)), csr)
+
+    def test_empty(self):
+        csr = month_csr(monthly_data([]))
+        self.assertEqual(csr, {'o': [0], 'f': [], 'p': []})
+        self.assertEqual(decode_csr(encode_csr(csr)), csr)
+
+
+if __name__ == '__main__':
+    unittest.main()